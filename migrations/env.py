@@ -51,6 +51,21 @@ def get_metadata():
     return target_db.metadata
 
 
+# Objetos de busqueda creados a mano en la migracion d4b8e2f61a93 (no estan en los modelos):
+# autogenerate no debe proponer borrarlos. En SQLite la tabla FTS5 classes_search, su fts5vocab
+# y sus tablas internas (classes_search_data, _idx, ...); en Postgres la columna generada
+# search_vector y su indice GIN. Los triggers de SQLite no los compara alembic
+SEARCH_INDEX_OBJECTS = {('column', 'search_vector'), ('index', 'ix_trainers_classes_search_vector')}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == 'table' and name.startswith('classes_search'):
+        return False
+    if reflected and compare_to is None and (type_, name) in SEARCH_INDEX_OBJECTS:
+        return False
+    return True
+
+
 def run_migrations_offline():
     """Run migrations in 'offline' mode.
 
@@ -65,7 +80,8 @@ def run_migrations_offline():
     """
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url, target_metadata=get_metadata(), literal_binds=True
+        url=url, target_metadata=get_metadata(), literal_binds=True,
+        include_object=include_object
     )
 
     with context.begin_transaction():
@@ -93,6 +109,8 @@ def run_migrations_online():
     conf_args = current_app.extensions['migrate'].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
+    if conf_args.get("include_object") is None:
+        conf_args["include_object"] = include_object
 
     connectable = get_engine()
 
@@ -0,0 +1,31 @@
+"""updated_at columns for conditional requests
+
+Revision ID: a41c6d8e2f17
+Revises: 7b3e9a51c2d4
+Create Date: 2026-10-17 12:40:03.551920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41c6d8e2f17'
+down_revision = '7b3e9a51c2d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite no permite ADD COLUMN con default no constante: se agrega nullable, se rellena y luego se ajusta
+    for table in ('specializations', 'trainers_classes', 'users_classes'):
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.execute(f"UPDATE {table} SET updated_at = CURRENT_TIMESTAMP")
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False, server_default=sa.func.now())
+
+
+def downgrade():
+    for table in ('users_classes', 'trainers_classes', 'specializations'):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column('updated_at')
@@ -1,2 +0,0 @@
-/*! For license information please see bundle.js.LICENSE.txt */
-(()=>{var e={757:(e,t,n)=>{e.exports=n(666)},406:(e,t,n)=>{"use strict";n.d(t,{Z:()=>i});var r=n(81),l=n.n(r),a=n(645),o=n.n(a)()(l());o.push([e.id,"/*\n    home.css: This website contains selectors only used in home.css\n\n    All pages share the styles on index.css but you should create \n    one more css for each page that will contain the selected used \n    on that page only (the ones not reused in other pages).\n*/",""]);const i=o},775:(e,t,n)=>{"use strict";n.d(t,{Z:()=>i});var r=n(81),l=n.n(r),a=n(645),o=n.n(a)()(l());o.push([e.id,"/* \n    General Styles used on every website (Don't Repeat Yourself)\n*/\n",""]);const i=o},645:e=>{"use strict";e.exports=function(e){var t=[];return t.toString=function(){return this.map((function(t){var n="",r=void 0!==t[5];return t[4]&&(n+="@supports (".concat(t[4],") {")),t[2]&&(n+="@media ".concat(t[2]," {")),r&&(n+="@layer".concat(t[5].length>0?" ".concat(t[5]):""," {")),n+=e(t),r&&(n+="}"),t[2]&&(n+="}"),t[4]&&(n+="}"),n})).join("")},t.i=function(e,n,r,l,a){"string"==typeof e&&(e=[[null,e,void 0]]);var o={};if(r)for(var i=0;i<this.length;i++){var u=this[i][0];null!=u&&(o[u]=!0)}for(var c=0;c<e.length;c++){var s=[].concat(e[c]);r&&o[s[0]]||(void 0!==a&&(void 0===s[5]||(s[1]="@layer".concat(s[5].length>0?" ".concat(s[5]):""," {").concat(s[1],"}")),s[5]=a),n&&(s[2]?(s[1]="@media ".concat(s[2]," {").concat(s[1],"}"),s[2]=n):s[2]=n),l&&(s[4]?(s[1]="@supports (".concat(s[4],") {").concat(s[1],"}"),s[4]=l):s[4]="".concat(l)),t.push(s))}},t}},81:e=>{"use strict";e.exports=function(e){return e[1]}},418:e=>{"use strict";var t=Object.getOwnPropertySymbols,n=Object.prototype.hasOwnProperty,r=Object.prototype.propertyIsEnumerable;function l(e){if(null==e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var t={},n=0;n<10;n++)t["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(t).map((function(e){return t[e]})).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach((function(e){r[e]=e})),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(e){return!1}}()?Object.assign:function(e,a){for(var o,i,u=l(e),c=1;c<arguments.length;c++){for(var s in o=Object(arguments[c]))n.call(o,s)&&(u[s]=o[s]);if(t){i=t(o);for(var f=0;f<i.length;f++)r.call(o,i[f])&&(u[i[f]]=o[i[f]])}}return u}},703:(e,t,n)=>{"use strict";var r=n(414);function l(){}function a(){}a.resetWarningCache=l,e.exports=function(){function e(e,t,n,l,a,o){if(o!==r){var i=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw i.name="Invariant Violation",i}}function t(){return e}e.isRequired=e;var n={array:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:a,resetWarningCache:l};return n.PropTypes=n,n}},697:(e,t,n)=>{e.exports=n(703)()},414:e=>{"use strict";e.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},448:(e,t,n)=>{"use strict";var r=n(294),l=n(418),a=n(840);function o(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}if(!r)throw Error(o(227));function i(e,t,n,r,l,a,o,i,u){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(e){this.onError(e)}}var u=!1,c=null,s=!1,f=null,d={onError:function(e){u=!0,c=e}};function p(e,t,n,r,l,a,o,s,f){u=!1,c=null,i.apply(d,arguments)}var h=null,m=null,v=null;function y(e,t,n){var r=e.type||"unknown-event";e.currentTarget=v(n),function(e,t,n,r,l,a,i,d,h){if(p.apply(this,arguments),u){if(!u)throw Error(o(198));var m=c;u=!1,c=null,s||(s=!0,f=m)}}(r,t,void 0,e),e.currentTarget=null}var g=null,b={};function w(){if(g)for(var e in b){var t=b[e],n=g.indexOf(e);if(!(-1<n))throw Error(o(96,e));if(!E[n]){if(!t.extractEvents)throw Error(o(97,e));for(var r in E[n]=t,n=t.eventTypes){var l=void 0,a=n[r],i=t,u=r;if(x.hasOwnProperty(u))throw Error(o(99,u));x[u]=a;var c=a.phasedRegistrationNames;if(c){for(l in c)c.hasOwnProperty(l)&&k(c[l],i,u);l=!0}else a.registrationName?(k(a.registrationName,i,u),l=!0):l=!1;if(!l)throw Error(o(98,r,e))}}}}function k(e,t,n){if(T[e])throw Error(o(100,e));T[e]=t,S[e]=t.eventTypes[n].dependencies}var E=[],x={},T={},S={};function C(e){var t,n=!1;for(t in e)if(e.hasOwnProperty(t)){var r=e[t];if(!b.hasOwnProperty(t)||b[t]!==r){if(b[t])throw Error(o(102,t));b[t]=r,n=!0}}n&&w()}var P=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),_=null,N=null,O=null;function z(e){if(e=m(e)){if("function"!=typeof _)throw Error(o(280));var t=e.stateNode;t&&(t=h(t),_(e.stateNode,e.type,t))}}function R(e){N?O?O.push(e):O=[e]:N=e}function M(){if(N){var e=N,t=O;if(O=N=null,z(e),t)for(e=0;e<t.length;e++)z(t[e])}}function I(e,t){return e(t)}function L(e,t,n,r,l){return e(t,n,r,l)}function F(){}var D=I,j=!1,A=!1;function U(){null===N&&null===O||(F(),M())}function W(e,t,n){if(A)return e(t,n);A=!0;try{return D(e,t,n)}finally{A=!1,U()}}var V=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,B=Object.prototype.hasOwnProperty,$={},Q={};function H(e,t,n,r,l,a){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=a}var K={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){K[e]=new H(e,0,!1,e,null,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var t=e[0];K[t]=new H(t,1,!1,e[1],null,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){K[e]=new H(e,2,!1,e.toLowerCase(),null,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){K[e]=new H(e,2,!1,e,null,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){K[e]=new H(e,3,!1,e.toLowerCase(),null,!1)})),["checked","multiple","muted","selected"].forEach((function(e){K[e]=new H(e,3,!0,e,null,!1)})),["capture","download"].forEach((function(e){K[e]=new H(e,4,!1,e,null,!1)})),["cols","rows","size","span"].forEach((function(e){K[e]=new H(e,6,!1,e,null,!1)})),["rowSpan","start"].forEach((function(e){K[e]=new H(e,5,!1,e.toLowerCase(),null,!1)}));var q=/[\-:]([a-z])/g;function Y(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var t=e.replace(q,Y);K[t]=new H(t,1,!1,e,null,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var t=e.replace(q,Y);K[t]=new H(t,1,!1,e,"http://www.w3.org/1999/xlink",!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var t=e.replace(q,Y);K[t]=new H(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1)})),["tabIndex","crossOrigin"].forEach((function(e){K[e]=new H(e,1,!1,e.toLowerCase(),null,!1)})),K.xlinkHref=new H("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0),["src","href","action","formAction"].forEach((function(e){K[e]=new H(e,1,!1,e.toLowerCase(),null,!0)}));var G=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED;function X(e,t,n,r){var l=K.hasOwnProperty(t)?K[t]:null;(null!==l?0===l.type:!r&&2<t.length&&("o"===t[0]||"O"===t[0])&&("n"===t[1]||"N"===t[1]))||(function(e,t,n,r){if(null==t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,l,r)&&(n=null),r||null===l?function(e){return!!B.call(Q,e)||!B.call($,e)&&(V.test(e)?Q[e]=!0:($[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=null===n?3!==l.type&&"":n:(t=l.attributeName,r=l.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(l=l.type)||4===l&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}G.hasOwnProperty("ReactCurrentDispatcher")||(G.ReactCurrentDispatcher={current:null}),G.hasOwnProperty("ReactCurrentBatchConfig")||(G.ReactCurrentBatchConfig={suspense:null});var Z=/^(.*)[\\\/]/,J="function"==typeof Symbol&&Symbol.for,ee=J?Symbol.for("react.element"):60103,te=J?Symbol.for("react.portal"):60106,ne=J?Symbol.for("react.fragment"):60107,re=J?Symbol.for("react.strict_mode"):60108,le=J?Symbol.for("react.profiler"):60114,ae=J?Symbol.for("react.provider"):60109,oe=J?Symbol.for("react.context"):60110,ie=J?Symbol.for("react.concurrent_mode"):60111,ue=J?Symbol.for("react.forward_ref"):60112,ce=J?Symbol.for("react.suspense"):60113,se=J?Symbol.for("react.suspense_list"):60120,fe=J?Symbol.for("react.memo"):60115,de=J?Symbol.for("react.lazy"):60116,pe=J?Symbol.for("react.block"):60121,he="function"==typeof Symbol&&Symbol.iterator;function me(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=he&&e[he]||e["@@iterator"])?e:null}function ve(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case ne:return"Fragment";case te:return"Portal";case le:return"Profiler";case re:return"StrictMode";case ce:return"Suspense";case se:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case oe:return"Context.Consumer";case ae:return"Context.Provider";case ue:var t=e.render;return t=t.displayName||t.name||"",e.displayName||(""!==t?"ForwardRef("+t+")":"ForwardRef");case fe:return ve(e.type);case pe:return ve(e.render);case de:if(e=1===e._status?e._result:null)return ve(e)}return null}function ye(e){var t="";do{e:switch(e.tag){case 3:case 4:case 6:case 7:case 10:case 9:var n="";break e;default:var r=e._debugOwner,l=e._debugSource,a=ve(e.type);n=null,r&&(n=ve(r.type)),r=a,a="",l?a=" (at "+l.fileName.replace(Z,"")+":"+l.lineNumber+")":n&&(a=" (created by "+n+")"),n="\n    in "+(r||"Unknown")+a}t+=n,e=e.return}while(e);return t}function ge(e){switch(typeof e){case"boolean":case"number":case"object":case"string":case"undefined":return e;default:return""}}function be(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function we(e){e._valueTracker||(e._valueTracker=function(e){var t=be(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&void 0!==n&&"function"==typeof n.get&&"function"==typeof n.set){var l=n.get,a=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(e){r=""+e,a.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function ke(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=be(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function Ee(e,t){var n=t.checked;return l({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function xe(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=ge(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function Te(e,t){null!=(t=t.checked)&&X(e,"checked",t,!1)}function Se(e,t){Te(e,t);var n=ge(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?Pe(e,t.type,n):t.hasOwnProperty("defaultValue")&&Pe(e,t.type,ge(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function Ce(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function Pe(e,t,n){"number"===t&&e.ownerDocument.activeElement===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}function _e(e,t){return e=l({children:void 0},t),(t=function(e){var t="";return r.Children.forEach(e,(function(e){null!=e&&(t+=e)})),t}(t.children))&&(e.children=t),e}function Ne(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ge(n),t=null,l=0;l<e.length;l++){if(e[l].value===n)return e[l].selected=!0,void(r&&(e[l].defaultSelected=!0));null!==t||e[l].disabled||(t=e[l])}null!==t&&(t.selected=!0)}}function Oe(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(o(91));return l({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function ze(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(o(92));if(Array.isArray(n)){if(!(1>=n.length))throw Error(o(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:ge(n)}}function Re(e,t){var n=ge(t.value),r=ge(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function Me(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}function Ie(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function Le(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?Ie(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var Fe,De,je=(De=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((Fe=Fe||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=Fe.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction((function(){return De(e,t)}))}:De);function Ae(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}function Ue(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var We={animationend:Ue("Animation","AnimationEnd"),animationiteration:Ue("Animation","AnimationIteration"),animationstart:Ue("Animation","AnimationStart"),transitionend:Ue("Transition","TransitionEnd")},Ve={},Be={};function $e(e){if(Ve[e])return Ve[e];if(!We[e])return e;var t,n=We[e];for(t in n)if(n.hasOwnProperty(t)&&t in Be)return Ve[e]=n[t];return e}P&&(Be=document.createElement("div").style,"AnimationEvent"in window||(delete We.animationend.animation,delete We.animationiteration.animation,delete We.animationstart.animation),"TransitionEvent"in window||delete We.transitionend.transition);var Qe=$e("animationend"),He=$e("animationiteration"),Ke=$e("animationstart"),qe=$e("transitionend"),Ye="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Ge=new("function"==typeof WeakMap?WeakMap:Map);function Xe(e){var t=Ge.get(e);return void 0===t&&(t=new Map,Ge.set(e,t)),t}function Ze(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!=(1026&(t=e).effectTag)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function Je(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&null!==(e=e.alternate)&&(t=e.memoizedState),null!==t)return t.dehydrated}return null}function et(e){if(Ze(e)!==e)throw Error(o(188))}function tt(e){if(e=function(e){var t=e.alternate;if(!t){if(null===(t=Ze(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(null===l)break;var a=l.alternate;if(null===a){if(null!==(r=l.return)){n=r;continue}break}if(l.child===a.child){for(a=l.child;a;){if(a===n)return et(l),e;if(a===r)return et(l),t;a=a.sibling}throw Error(o(188))}if(n.return!==r.return)n=l,r=a;else{for(var i=!1,u=l.child;u;){if(u===n){i=!0,n=l,r=a;break}if(u===r){i=!0,r=l,n=a;break}u=u.sibling}if(!i){for(u=a.child;u;){if(u===n){i=!0,n=a,r=l;break}if(u===r){i=!0,r=a,n=l;break}u=u.sibling}if(!i)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(e),!e)return null;for(var t=e;;){if(5===t.tag||6===t.tag)return t;if(t.child)t.child.return=t,t=t.child;else{if(t===e)break;for(;!t.sibling;){if(!t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}}return null}function nt(e,t){if(null==t)throw Error(o(30));return null==e?t:Array.isArray(e)?Array.isArray(t)?(e.push.apply(e,t),e):(e.push(t),e):Array.isArray(t)?[e].concat(t):[e,t]}function rt(e,t,n){Array.isArray(e)?e.forEach(t,n):e&&t.call(n,e)}var lt=null;function at(e){if(e){var t=e._dispatchListeners,n=e._dispatchInstances;if(Array.isArray(t))for(var r=0;r<t.length&&!e.isPropagationStopped();r++)y(e,t[r],n[r]);else t&&y(e,t,n);e._dispatchListeners=null,e._dispatchInstances=null,e.isPersistent()||e.constructor.release(e)}}function ot(e){if(null!==e&&(lt=nt(lt,e)),e=lt,lt=null,e){if(rt(e,at),lt)throw Error(o(95));if(s)throw e=f,s=!1,f=null,e}}function it(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}function ut(e){if(!P)return!1;var t=(e="on"+e)in document;return t||((t=document.createElement("div")).setAttribute(e,"return;"),t="function"==typeof t[e]),t}var ct=[];function st(e){e.topLevelType=null,e.nativeEvent=null,e.targetInst=null,e.ancestors.length=0,10>ct.length&&ct.push(e)}function ft(e,t,n,r){if(ct.length){var l=ct.pop();return l.topLevelType=e,l.eventSystemFlags=r,l.nativeEvent=t,l.targetInst=n,l}return{topLevelType:e,eventSystemFlags:r,nativeEvent:t,targetInst:n,ancestors:[]}}function dt(e){var t=e.targetInst,n=t;do{if(!n){e.ancestors.push(n);break}var r=n;if(3===r.tag)r=r.stateNode.containerInfo;else{for(;r.return;)r=r.return;r=3!==r.tag?null:r.stateNode.containerInfo}if(!r)break;5!==(t=n.tag)&&6!==t||e.ancestors.push(n),n=Nn(r)}while(n);for(n=0;n<e.ancestors.length;n++){t=e.ancestors[n];var l=it(e.nativeEvent);r=e.topLevelType;var a=e.nativeEvent,o=e.eventSystemFlags;0===n&&(o|=64);for(var i=null,u=0;u<E.length;u++){var c=E[u];c&&(c=c.extractEvents(r,t,a,l,o))&&(i=nt(i,c))}ot(i)}}function pt(e,t,n){if(!n.has(e)){switch(e){case"scroll":Kt(t,"scroll",!0);break;case"focus":case"blur":Kt(t,"focus",!0),Kt(t,"blur",!0),n.set("blur",null),n.set("focus",null);break;case"cancel":case"close":ut(e)&&Kt(t,e,!0);break;case"invalid":case"submit":case"reset":break;default:-1===Ye.indexOf(e)&&Ht(e,t)}n.set(e,null)}}var ht,mt,vt,yt=!1,gt=[],bt=null,wt=null,kt=null,Et=new Map,xt=new Map,Tt=[],St="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput close cancel copy cut paste click change contextmenu reset submit".split(" "),Ct="focus blur dragenter dragleave mouseover mouseout pointerover pointerout gotpointercapture lostpointercapture".split(" ");function Pt(e,t,n,r,l){return{blockedOn:e,topLevelType:t,eventSystemFlags:32|n,nativeEvent:l,container:r}}function _t(e,t){switch(e){case"focus":case"blur":bt=null;break;case"dragenter":case"dragleave":wt=null;break;case"mouseover":case"mouseout":kt=null;break;case"pointerover":case"pointerout":Et.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":xt.delete(t.pointerId)}}function Nt(e,t,n,r,l,a){return null===e||e.nativeEvent!==a?(e=Pt(t,n,r,l,a),null!==t&&null!==(t=On(t))&&mt(t),e):(e.eventSystemFlags|=r,e)}function Ot(e){var t=Nn(e.target);if(null!==t){var n=Ze(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=Je(n)))return e.blockedOn=t,void a.unstable_runWithPriority(e.priority,(function(){vt(n)}))}else if(3===t&&n.stateNode.hydrate)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function zt(e){if(null!==e.blockedOn)return!1;var t=Xt(e.topLevelType,e.eventSystemFlags,e.container,e.nativeEvent);if(null!==t){var n=On(t);return null!==n&&mt(n),e.blockedOn=t,!1}return!0}function Rt(e,t,n){zt(e)&&n.delete(t)}function Mt(){for(yt=!1;0<gt.length;){var e=gt[0];if(null!==e.blockedOn){null!==(e=On(e.blockedOn))&&ht(e);break}var t=Xt(e.topLevelType,e.eventSystemFlags,e.container,e.nativeEvent);null!==t?e.blockedOn=t:gt.shift()}null!==bt&&zt(bt)&&(bt=null),null!==wt&&zt(wt)&&(wt=null),null!==kt&&zt(kt)&&(kt=null),Et.forEach(Rt),xt.forEach(Rt)}function It(e,t){e.blockedOn===t&&(e.blockedOn=null,yt||(yt=!0,a.unstable_scheduleCallback(a.unstable_NormalPriority,Mt)))}function Lt(e){function t(t){return It(t,e)}if(0<gt.length){It(gt[0],e);for(var n=1;n<gt.length;n++){var r=gt[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==bt&&It(bt,e),null!==wt&&It(wt,e),null!==kt&&It(kt,e),Et.forEach(t),xt.forEach(t),n=0;n<Tt.length;n++)(r=Tt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<Tt.length&&null===(n=Tt[0]).blockedOn;)Ot(n),null===n.blockedOn&&Tt.shift()}var Ft={},Dt=new Map,jt=new Map,At=["abort","abort",Qe,"animationEnd",He,"animationIteration",Ke,"animationStart","canplay","canPlay","canplaythrough","canPlayThrough","durationchange","durationChange","emptied","emptied","encrypted","encrypted","ended","ended","error","error","gotpointercapture","gotPointerCapture","load","load","loadeddata","loadedData","loadedmetadata","loadedMetadata","loadstart","loadStart","lostpointercapture","lostPointerCapture","playing","playing","progress","progress","seeking","seeking","stalled","stalled","suspend","suspend","timeupdate","timeUpdate",qe,"transitionEnd","waiting","waiting"];function Ut(e,t){for(var n=0;n<e.length;n+=2){var r=e[n],l=e[n+1],a="on"+(l[0].toUpperCase()+l.slice(1));a={phasedRegistrationNames:{bubbled:a,captured:a+"Capture"},dependencies:[r],eventPriority:t},jt.set(r,t),Dt.set(r,a),Ft[l]=a}}Ut("blur blur cancel cancel click click close close contextmenu contextMenu copy copy cut cut auxclick auxClick dblclick doubleClick dragend dragEnd dragstart dragStart drop drop focus focus input input invalid invalid keydown keyDown keypress keyPress keyup keyUp mousedown mouseDown mouseup mouseUp paste paste pause pause play play pointercancel pointerCancel pointerdown pointerDown pointerup pointerUp ratechange rateChange reset reset seeked seeked submit submit touchcancel touchCancel touchend touchEnd touchstart touchStart volumechange volumeChange".split(" "),0),Ut("drag drag dragenter dragEnter dragexit dragExit dragleave dragLeave dragover dragOver mousemove mouseMove mouseout mouseOut mouseover mouseOver pointermove pointerMove pointerout pointerOut pointerover pointerOver scroll scroll toggle toggle touchmove touchMove wheel wheel".split(" "),1),Ut(At,2);for(var Wt="change selectionchange textInput compositionstart compositionend compositionupdate".split(" "),Vt=0;Vt<Wt.length;Vt++)jt.set(Wt[Vt],0);var Bt=a.unstable_UserBlockingPriority,$t=a.unstable_runWithPriority,Qt=!0;function Ht(e,t){Kt(t,e,!1)}function Kt(e,t,n){var r=jt.get(t);switch(void 0===r?2:r){case 0:r=qt.bind(null,t,1,e);break;case 1:r=Yt.bind(null,t,1,e);break;default:r=Gt.bind(null,t,1,e)}n?e.addEventListener(t,r,!0):e.addEventListener(t,r,!1)}function qt(e,t,n,r){j||F();var l=Gt,a=j;j=!0;try{L(l,e,t,n,r)}finally{(j=a)||U()}}function Yt(e,t,n,r){$t(Bt,Gt.bind(null,e,t,n,r))}function Gt(e,t,n,r){if(Qt)if(0<gt.length&&-1<St.indexOf(e))e=Pt(null,e,t,n,r),gt.push(e);else{var l=Xt(e,t,n,r);if(null===l)_t(e,r);else if(-1<St.indexOf(e))e=Pt(l,e,t,n,r),gt.push(e);else if(!function(e,t,n,r,l){switch(t){case"focus":return bt=Nt(bt,e,t,n,r,l),!0;case"dragenter":return wt=Nt(wt,e,t,n,r,l),!0;case"mouseover":return kt=Nt(kt,e,t,n,r,l),!0;case"pointerover":var a=l.pointerId;return Et.set(a,Nt(Et.get(a)||null,e,t,n,r,l)),!0;case"gotpointercapture":return a=l.pointerId,xt.set(a,Nt(xt.get(a)||null,e,t,n,r,l)),!0}return!1}(l,e,t,n,r)){_t(e,r),e=ft(e,r,null,t);try{W(dt,e)}finally{st(e)}}}}function Xt(e,t,n,r){if(null!==(n=Nn(n=it(r)))){var l=Ze(n);if(null===l)n=null;else{var a=l.tag;if(13===a){if(null!==(n=Je(l)))return n;n=null}else if(3===a){if(l.stateNode.hydrate)return 3===l.tag?l.stateNode.containerInfo:null;n=null}else l!==n&&(n=null)}}e=ft(e,r,n,t);try{W(dt,e)}finally{st(e)}return null}var Zt={animationIterationCount:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},Jt=["Webkit","ms","Moz","O"];function en(e,t,n){return null==t||"boolean"==typeof t||""===t?"":n||"number"!=typeof t||0===t||Zt.hasOwnProperty(e)&&Zt[e]?(""+t).trim():t+"px"}function tn(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),l=en(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}Object.keys(Zt).forEach((function(e){Jt.forEach((function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Zt[t]=Zt[e]}))}));var nn=l({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function rn(e,t){if(t){if(nn[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(o(137,e,""));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(o(60));if("object"!=typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(o(61))}if(null!=t.style&&"object"!=typeof t.style)throw Error(o(62,""))}}function ln(e,t){if(-1===e.indexOf("-"))return"string"==typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var an="http://www.w3.org/1999/xhtml";function on(e,t){var n=Xe(e=9===e.nodeType||11===e.nodeType?e:e.ownerDocument);t=S[t];for(var r=0;r<t.length;r++)pt(t[r],e,n)}function un(){}function cn(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function sn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function fn(e,t){var n,r=sn(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=sn(r)}}function dn(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?dn(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function pn(){for(var e=window,t=cn();t instanceof e.HTMLIFrameElement;){try{var n="string"==typeof t.contentWindow.location.href}catch(e){n=!1}if(!n)break;t=cn((e=t.contentWindow).document)}return t}function hn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var mn="$?",vn="$!",yn=null,gn=null;function bn(e,t){switch(e){case"button":case"input":case"select":case"textarea":return!!t.autoFocus}return!1}function wn(e,t){return"textarea"===e||"option"===e||"noscript"===e||"string"==typeof t.children||"number"==typeof t.children||"object"==typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var kn="function"==typeof setTimeout?setTimeout:void 0,En="function"==typeof clearTimeout?clearTimeout:void 0;function xn(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break}return e}function Tn(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||n===vn||n===mn){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var Sn=Math.random().toString(36).slice(2),Cn="__reactInternalInstance$"+Sn,Pn="__reactEventHandlers$"+Sn,_n="__reactContainere$"+Sn;function Nn(e){var t=e[Cn];if(t)return t;for(var n=e.parentNode;n;){if(t=n[_n]||n[Cn]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=Tn(e);null!==e;){if(n=e[Cn])return n;e=Tn(e)}return t}n=(e=n).parentNode}return null}function On(e){return!(e=e[Cn]||e[_n])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function zn(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(o(33))}function Rn(e){return e[Pn]||null}function Mn(e){do{e=e.return}while(e&&5!==e.tag);return e||null}function In(e,t){var n=e.stateNode;if(!n)return null;var r=h(n);if(!r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!=typeof n)throw Error(o(231,t,typeof n));return n}function Ln(e,t,n){(t=In(e,n.dispatchConfig.phasedRegistrationNames[t]))&&(n._dispatchListeners=nt(n._dispatchListeners,t),n._dispatchInstances=nt(n._dispatchInstances,e))}function Fn(e){if(e&&e.dispatchConfig.phasedRegistrationNames){for(var t=e._targetInst,n=[];t;)n.push(t),t=Mn(t);for(t=n.length;0<t--;)Ln(n[t],"captured",e);for(t=0;t<n.length;t++)Ln(n[t],"bubbled",e)}}function Dn(e,t,n){e&&n&&n.dispatchConfig.registrationName&&(t=In(e,n.dispatchConfig.registrationName))&&(n._dispatchListeners=nt(n._dispatchListeners,t),n._dispatchInstances=nt(n._dispatchInstances,e))}function jn(e){e&&e.dispatchConfig.registrationName&&Dn(e._targetInst,null,e)}function An(e){rt(e,Fn)}var Un=null,Wn=null,Vn=null;function Bn(){if(Vn)return Vn;var e,t,n=Wn,r=n.length,l="value"in Un?Un.value:Un.textContent,a=l.length;for(e=0;e<r&&n[e]===l[e];e++);var o=r-e;for(t=1;t<=o&&n[r-t]===l[a-t];t++);return Vn=l.slice(e,1<t?1-t:void 0)}function $n(){return!0}function Qn(){return!1}function Hn(e,t,n,r){for(var l in this.dispatchConfig=e,this._targetInst=t,this.nativeEvent=n,e=this.constructor.Interface)e.hasOwnProperty(l)&&((t=e[l])?this[l]=t(n):"target"===l?this.target=r:this[l]=n[l]);return this.isDefaultPrevented=(null!=n.defaultPrevented?n.defaultPrevented:!1===n.returnValue)?$n:Qn,this.isPropagationStopped=Qn,this}function Kn(e,t,n,r){if(this.eventPool.length){var l=this.eventPool.pop();return this.call(l,e,t,n,r),l}return new this(e,t,n,r)}function qn(e){if(!(e instanceof this))throw Error(o(279));e.destructor(),10>this.eventPool.length&&this.eventPool.push(e)}function Yn(e){e.eventPool=[],e.getPooled=Kn,e.release=qn}l(Hn.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=$n)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=$n)},persist:function(){this.isPersistent=$n},isPersistent:Qn,destructor:function(){var e,t=this.constructor.Interface;for(e in t)this[e]=null;this.nativeEvent=this._targetInst=this.dispatchConfig=null,this.isPropagationStopped=this.isDefaultPrevented=Qn,this._dispatchInstances=this._dispatchListeners=null}}),Hn.Interface={type:null,target:null,currentTarget:function(){return null},eventPhase:null,bubbles:null,cancelable:null,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:null,isTrusted:null},Hn.extend=function(e){function t(){}function n(){return r.apply(this,arguments)}var r=this;t.prototype=r.prototype;var a=new t;return l(a,n.prototype),n.prototype=a,n.prototype.constructor=n,n.Interface=l({},r.Interface,e),n.extend=r.extend,Yn(n),n},Yn(Hn);var Gn=Hn.extend({data:null}),Xn=Hn.extend({data:null}),Zn=[9,13,27,32],Jn=P&&"CompositionEvent"in window,er=null;P&&"documentMode"in document&&(er=document.documentMode);var tr=P&&"TextEvent"in window&&!er,nr=P&&(!Jn||er&&8<er&&11>=er),rr=String.fromCharCode(32),lr={beforeInput:{phasedRegistrationNames:{bubbled:"onBeforeInput",captured:"onBeforeInputCapture"},dependencies:["compositionend","keypress","textInput","paste"]},compositionEnd:{phasedRegistrationNames:{bubbled:"onCompositionEnd",captured:"onCompositionEndCapture"},dependencies:"blur compositionend keydown keypress keyup mousedown".split(" ")},compositionStart:{phasedRegistrationNames:{bubbled:"onCompositionStart",captured:"onCompositionStartCapture"},dependencies:"blur compositionstart keydown keypress keyup mousedown".split(" ")},compositionUpdate:{phasedRegistrationNames:{bubbled:"onCompositionUpdate",captured:"onCompositionUpdateCapture"},dependencies:"blur compositionupdate keydown keypress keyup mousedown".split(" ")}},ar=!1;function or(e,t){switch(e){case"keyup":return-1!==Zn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"blur":return!0;default:return!1}}function ir(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var ur=!1,cr={eventTypes:lr,extractEvents:function(e,t,n,r){var l;if(Jn)e:{switch(e){case"compositionstart":var a=lr.compositionStart;break e;case"compositionend":a=lr.compositionEnd;break e;case"compositionupdate":a=lr.compositionUpdate;break e}a=void 0}else ur?or(e,n)&&(a=lr.compositionEnd):"keydown"===e&&229===n.keyCode&&(a=lr.compositionStart);return a?(nr&&"ko"!==n.locale&&(ur||a!==lr.compositionStart?a===lr.compositionEnd&&ur&&(l=Bn()):(Wn="value"in(Un=r)?Un.value:Un.textContent,ur=!0)),a=Gn.getPooled(a,t,n,r),(l||null!==(l=ir(n)))&&(a.data=l),An(a),l=a):l=null,(e=tr?function(e,t){switch(e){case"compositionend":return ir(t);case"keypress":return 32!==t.which?null:(ar=!0,rr);case"textInput":return(e=t.data)===rr&&ar?null:e;default:return null}}(e,n):function(e,t){if(ur)return"compositionend"===e||!Jn&&or(e,t)?(e=Bn(),Vn=Wn=Un=null,ur=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return nr&&"ko"!==t.locale?null:t.data}}(e,n))?((t=Xn.getPooled(lr.beforeInput,t,n,r)).data=e,An(t)):t=null,null===l?t:null===t?l:[l,t]}},sr={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function fr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!sr[e.type]:"textarea"===t}var dr={change:{phasedRegistrationNames:{bubbled:"onChange",captured:"onChangeCapture"},dependencies:"blur change click focus input keydown keyup selectionchange".split(" ")}};function pr(e,t,n){return(e=Hn.getPooled(dr.change,e,t,n)).type="change",R(n),An(e),e}var hr=null,mr=null;function vr(e){ot(e)}function yr(e){if(ke(zn(e)))return e}function gr(e,t){if("change"===e)return t}var br=!1;function wr(){hr&&(hr.detachEvent("onpropertychange",kr),mr=hr=null)}function kr(e){if("value"===e.propertyName&&yr(mr))if(e=pr(mr,e,it(e)),j)ot(e);else{j=!0;try{I(vr,e)}finally{j=!1,U()}}}function Er(e,t,n){"focus"===e?(wr(),mr=n,(hr=t).attachEvent("onpropertychange",kr)):"blur"===e&&wr()}function xr(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return yr(mr)}function Tr(e,t){if("click"===e)return yr(t)}function Sr(e,t){if("input"===e||"change"===e)return yr(t)}P&&(br=ut("input")&&(!document.documentMode||9<document.documentMode));var Cr={eventTypes:dr,_isInputEventSupported:br,extractEvents:function(e,t,n,r){var l=t?zn(t):window,a=l.nodeName&&l.nodeName.toLowerCase();if("select"===a||"input"===a&&"file"===l.type)var o=gr;else if(fr(l))if(br)o=Sr;else{o=xr;var i=Er}else(a=l.nodeName)&&"input"===a.toLowerCase()&&("checkbox"===l.type||"radio"===l.type)&&(o=Tr);if(o&&(o=o(e,t)))return pr(o,n,r);i&&i(e,l,t),"blur"===e&&(e=l._wrapperState)&&e.controlled&&"number"===l.type&&Pe(l,"number",l.value)}},Pr=Hn.extend({view:null,detail:null}),_r={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Nr(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=_r[e])&&!!t[e]}function Or(){return Nr}var zr=0,Rr=0,Mr=!1,Ir=!1,Lr=Pr.extend({screenX:null,screenY:null,clientX:null,clientY:null,pageX:null,pageY:null,ctrlKey:null,shiftKey:null,altKey:null,metaKey:null,getModifierState:Or,button:null,buttons:null,relatedTarget:function(e){return e.relatedTarget||(e.fromElement===e.srcElement?e.toElement:e.fromElement)},movementX:function(e){if("movementX"in e)return e.movementX;var t=zr;return zr=e.screenX,Mr?"mousemove"===e.type?e.screenX-t:0:(Mr=!0,0)},movementY:function(e){if("movementY"in e)return e.movementY;var t=Rr;return Rr=e.screenY,Ir?"mousemove"===e.type?e.screenY-t:0:(Ir=!0,0)}}),Fr=Lr.extend({pointerId:null,width:null,height:null,pressure:null,tangentialPressure:null,tiltX:null,tiltY:null,twist:null,pointerType:null,isPrimary:null}),Dr={mouseEnter:{registrationName:"onMouseEnter",dependencies:["mouseout","mouseover"]},mouseLeave:{registrationName:"onMouseLeave",dependencies:["mouseout","mouseover"]},pointerEnter:{registrationName:"onPointerEnter",dependencies:["pointerout","pointerover"]},pointerLeave:{registrationName:"onPointerLeave",dependencies:["pointerout","pointerover"]}},jr={eventTypes:Dr,extractEvents:function(e,t,n,r,l){var a="mouseover"===e||"pointerover"===e,o="mouseout"===e||"pointerout"===e;if(a&&0==(32&l)&&(n.relatedTarget||n.fromElement)||!o&&!a)return null;if(a=r.window===r?r:(a=r.ownerDocument)?a.defaultView||a.parentWindow:window,o?(o=t,null!==(t=(t=n.relatedTarget||n.toElement)?Nn(t):null)&&(t!==Ze(t)||5!==t.tag&&6!==t.tag)&&(t=null)):o=null,o===t)return null;if("mouseout"===e||"mouseover"===e)var i=Lr,u=Dr.mouseLeave,c=Dr.mouseEnter,s="mouse";else"pointerout"!==e&&"pointerover"!==e||(i=Fr,u=Dr.pointerLeave,c=Dr.pointerEnter,s="pointer");if(e=null==o?a:zn(o),a=null==t?a:zn(t),(u=i.getPooled(u,o,n,r)).type=s+"leave",u.target=e,u.relatedTarget=a,(n=i.getPooled(c,t,n,r)).type=s+"enter",n.target=a,n.relatedTarget=e,s=t,(r=o)&&s)e:{for(c=s,o=0,e=i=r;e;e=Mn(e))o++;for(e=0,t=c;t;t=Mn(t))e++;for(;0<o-e;)i=Mn(i),o--;for(;0<e-o;)c=Mn(c),e--;for(;o--;){if(i===c||i===c.alternate)break e;i=Mn(i),c=Mn(c)}i=null}else i=null;for(c=i,i=[];r&&r!==c&&(null===(o=r.alternate)||o!==c);)i.push(r),r=Mn(r);for(r=[];s&&s!==c&&(null===(o=s.alternate)||o!==c);)r.push(s),s=Mn(s);for(s=0;s<i.length;s++)Dn(i[s],"bubbled",u);for(s=r.length;0<s--;)Dn(r[s],"captured",n);return 0==(64&l)?[u]:[u,n]}},Ar="function"==typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e==1/t)||e!=e&&t!=t},Ur=Object.prototype.hasOwnProperty;function Wr(e,t){if(Ar(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++)if(!Ur.call(t,n[r])||!Ar(e[n[r]],t[n[r]]))return!1;return!0}var Vr=P&&"documentMode"in document&&11>=document.documentMode,Br={select:{phasedRegistrationNames:{bubbled:"onSelect",captured:"onSelectCapture"},dependencies:"blur contextmenu dragend focus keydown keyup mousedown mouseup selectionchange".split(" ")}},$r=null,Qr=null,Hr=null,Kr=!1;function qr(e,t){var n=t.window===t?t.document:9===t.nodeType?t:t.ownerDocument;return Kr||null==$r||$r!==cn(n)?null:(n="selectionStart"in(n=$r)&&hn(n)?{start:n.selectionStart,end:n.selectionEnd}:{anchorNode:(n=(n.ownerDocument&&n.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:n.anchorOffset,focusNode:n.focusNode,focusOffset:n.focusOffset},Hr&&Wr(Hr,n)?null:(Hr=n,(e=Hn.getPooled(Br.select,Qr,e,t)).type="select",e.target=$r,An(e),e))}var Yr={eventTypes:Br,extractEvents:function(e,t,n,r,l,a){if(!(a=!(l=a||(r.window===r?r.document:9===r.nodeType?r:r.ownerDocument)))){e:{l=Xe(l),a=S.onSelect;for(var o=0;o<a.length;o++)if(!l.has(a[o])){l=!1;break e}l=!0}a=!l}if(a)return null;switch(l=t?zn(t):window,e){case"focus":(fr(l)||"true"===l.contentEditable)&&($r=l,Qr=t,Hr=null);break;case"blur":Hr=Qr=$r=null;break;case"mousedown":Kr=!0;break;case"contextmenu":case"mouseup":case"dragend":return Kr=!1,qr(n,r);case"selectionchange":if(Vr)break;case"keydown":case"keyup":return qr(n,r)}return null}},Gr=Hn.extend({animationName:null,elapsedTime:null,pseudoElement:null}),Xr=Hn.extend({clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Zr=Pr.extend({relatedTarget:null});function Jr(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}var el={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},tl={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},nl=Pr.extend({key:function(e){if(e.key){var t=el[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=Jr(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?tl[e.keyCode]||"Unidentified":""},location:null,ctrlKey:null,shiftKey:null,altKey:null,metaKey:null,repeat:null,locale:null,getModifierState:Or,charCode:function(e){return"keypress"===e.type?Jr(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?Jr(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),rl=Lr.extend({dataTransfer:null}),ll=Pr.extend({touches:null,targetTouches:null,changedTouches:null,altKey:null,metaKey:null,ctrlKey:null,shiftKey:null,getModifierState:Or}),al=Hn.extend({propertyName:null,elapsedTime:null,pseudoElement:null}),ol=Lr.extend({deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:null,deltaMode:null}),il={eventTypes:Ft,extractEvents:function(e,t,n,r){var l=Dt.get(e);if(!l)return null;switch(e){case"keypress":if(0===Jr(n))return null;case"keydown":case"keyup":e=nl;break;case"blur":case"focus":e=Zr;break;case"click":if(2===n.button)return null;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":e=Lr;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":e=rl;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":e=ll;break;case Qe:case He:case Ke:e=Gr;break;case qe:e=al;break;case"scroll":e=Pr;break;case"wheel":e=ol;break;case"copy":case"cut":case"paste":e=Xr;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":e=Fr;break;default:e=Hn}return An(t=e.getPooled(l,t,n,r)),t}};if(g)throw Error(o(101));g=Array.prototype.slice.call("ResponderEventPlugin SimpleEventPlugin EnterLeaveEventPlugin ChangeEventPlugin SelectEventPlugin BeforeInputEventPlugin".split(" ")),w(),h=Rn,m=On,v=zn,C({SimpleEventPlugin:il,EnterLeaveEventPlugin:jr,ChangeEventPlugin:Cr,SelectEventPlugin:Yr,BeforeInputEventPlugin:cr});var ul=[],cl=-1;function sl(e){0>cl||(e.current=ul[cl],ul[cl]=null,cl--)}function fl(e,t){cl++,ul[cl]=e.current,e.current=t}var dl={},pl={current:dl},hl={current:!1},ml=dl;function vl(e,t){var n=e.type.contextTypes;if(!n)return dl;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l,a={};for(l in n)a[l]=t[l];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=a),a}function yl(e){return null!=e.childContextTypes}function gl(){sl(hl),sl(pl)}function bl(e,t,n){if(pl.current!==dl)throw Error(o(168));fl(pl,t),fl(hl,n)}function wl(e,t,n){var r=e.stateNode;if(e=t.childContextTypes,"function"!=typeof r.getChildContext)return n;for(var a in r=r.getChildContext())if(!(a in e))throw Error(o(108,ve(t)||"Unknown",a));return l({},n,{},r)}function kl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||dl,ml=pl.current,fl(pl,e),fl(hl,hl.current),!0}function El(e,t,n){var r=e.stateNode;if(!r)throw Error(o(169));n?(e=wl(e,t,ml),r.__reactInternalMemoizedMergedChildContext=e,sl(hl),sl(pl),fl(pl,e)):sl(hl),fl(hl,n)}var xl=a.unstable_runWithPriority,Tl=a.unstable_scheduleCallback,Sl=a.unstable_cancelCallback,Cl=a.unstable_requestPaint,Pl=a.unstable_now,_l=a.unstable_getCurrentPriorityLevel,Nl=a.unstable_ImmediatePriority,Ol=a.unstable_UserBlockingPriority,zl=a.unstable_NormalPriority,Rl=a.unstable_LowPriority,Ml=a.unstable_IdlePriority,Il={},Ll=a.unstable_shouldYield,Fl=void 0!==Cl?Cl:function(){},Dl=null,jl=null,Al=!1,Ul=Pl(),Wl=1e4>Ul?Pl:function(){return Pl()-Ul};function Vl(){switch(_l()){case Nl:return 99;case Ol:return 98;case zl:return 97;case Rl:return 96;case Ml:return 95;default:throw Error(o(332))}}function Bl(e){switch(e){case 99:return Nl;case 98:return Ol;case 97:return zl;case 96:return Rl;case 95:return Ml;default:throw Error(o(332))}}function $l(e,t){return e=Bl(e),xl(e,t)}function Ql(e,t,n){return e=Bl(e),Tl(e,t,n)}function Hl(e){return null===Dl?(Dl=[e],jl=Tl(Nl,ql)):Dl.push(e),Il}function Kl(){if(null!==jl){var e=jl;jl=null,Sl(e)}ql()}function ql(){if(!Al&&null!==Dl){Al=!0;var e=0;try{var t=Dl;$l(99,(function(){for(;e<t.length;e++){var n=t[e];do{n=n(!0)}while(null!==n)}})),Dl=null}catch(t){throw null!==Dl&&(Dl=Dl.slice(e+1)),Tl(Nl,Kl),t}finally{Al=!1}}}function Yl(e,t,n){return 1073741821-(1+((1073741821-e+t/10)/(n/=10)|0))*n}function Gl(e,t){if(e&&e.defaultProps)for(var n in t=l({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}var Xl={current:null},Zl=null,Jl=null,ea=null;function ta(){ea=Jl=Zl=null}function na(e){var t=Xl.current;sl(Xl),e.type._context._currentValue=t}function ra(e,t){for(;null!==e;){var n=e.alternate;if(e.childExpirationTime<t)e.childExpirationTime=t,null!==n&&n.childExpirationTime<t&&(n.childExpirationTime=t);else{if(!(null!==n&&n.childExpirationTime<t))break;n.childExpirationTime=t}e=e.return}}function la(e,t){Zl=e,ea=Jl=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(e.expirationTime>=t&&(Ro=!0),e.firstContext=null)}function aa(e,t){if(ea!==e&&!1!==t&&0!==t)if("number"==typeof t&&1073741823!==t||(ea=e,t=1073741823),t={context:e,observedBits:t,next:null},null===Jl){if(null===Zl)throw Error(o(308));Jl=t,Zl.dependencies={expirationTime:0,firstContext:t,responders:null}}else Jl=Jl.next=t;return e._currentValue}var oa=!1;function ia(e){e.updateQueue={baseState:e.memoizedState,baseQueue:null,shared:{pending:null},effects:null}}function ua(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,baseQueue:e.baseQueue,shared:e.shared,effects:e.effects})}function ca(e,t){return(e={expirationTime:e,suspenseConfig:t,tag:0,payload:null,callback:null,next:null}).next=e}function sa(e,t){if(null!==(e=e.updateQueue)){var n=(e=e.shared).pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}}function fa(e,t){var n=e.alternate;null!==n&&ua(n,e),null===(n=(e=e.updateQueue).baseQueue)?(e.baseQueue=t.next=t,t.next=t):(t.next=n.next,n.next=t)}function da(e,t,n,r){var a=e.updateQueue;oa=!1;var o=a.baseQueue,i=a.shared.pending;if(null!==i){if(null!==o){var u=o.next;o.next=i.next,i.next=u}o=i,a.shared.pending=null,null!==(u=e.alternate)&&null!==(u=u.updateQueue)&&(u.baseQueue=i)}if(null!==o){u=o.next;var c=a.baseState,s=0,f=null,d=null,p=null;if(null!==u)for(var h=u;;){if((i=h.expirationTime)<r){var m={expirationTime:h.expirationTime,suspenseConfig:h.suspenseConfig,tag:h.tag,payload:h.payload,callback:h.callback,next:null};null===p?(d=p=m,f=c):p=p.next=m,i>s&&(s=i)}else{null!==p&&(p=p.next={expirationTime:1073741823,suspenseConfig:h.suspenseConfig,tag:h.tag,payload:h.payload,callback:h.callback,next:null}),cu(i,h.suspenseConfig);e:{var v=e,y=h;switch(i=t,m=n,y.tag){case 1:if("function"==typeof(v=y.payload)){c=v.call(m,c,i);break e}c=v;break e;case 3:v.effectTag=-4097&v.effectTag|64;case 0:if(null==(i="function"==typeof(v=y.payload)?v.call(m,c,i):v))break e;c=l({},c,i);break e;case 2:oa=!0}}null!==h.callback&&(e.effectTag|=32,null===(i=a.effects)?a.effects=[h]:i.push(h))}if(null===(h=h.next)||h===u){if(null===(i=a.shared.pending))break;h=o.next=i.next,i.next=u,a.baseQueue=o=i,a.shared.pending=null}}null===p?f=c:p.next=d,a.baseState=f,a.baseQueue=p,su(s),e.expirationTime=s,e.memoizedState=c}}function pa(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(null!==l){if(r.callback=null,r=l,l=n,"function"!=typeof r)throw Error(o(191,r));r.call(l)}}}var ha=G.ReactCurrentBatchConfig,ma=(new r.Component).refs;function va(e,t,n,r){n=null==(n=n(r,t=e.memoizedState))?t:l({},t,n),e.memoizedState=n,0===e.expirationTime&&(e.updateQueue.baseState=n)}var ya={isMounted:function(e){return!!(e=e._reactInternalFiber)&&Ze(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternalFiber;var r=Gi(),l=ha.suspense;(l=ca(r=Xi(r,e,l),l)).payload=t,null!=n&&(l.callback=n),sa(e,l),Zi(e,r)},enqueueReplaceState:function(e,t,n){e=e._reactInternalFiber;var r=Gi(),l=ha.suspense;(l=ca(r=Xi(r,e,l),l)).tag=1,l.payload=t,null!=n&&(l.callback=n),sa(e,l),Zi(e,r)},enqueueForceUpdate:function(e,t){e=e._reactInternalFiber;var n=Gi(),r=ha.suspense;(r=ca(n=Xi(n,e,r),r)).tag=2,null!=t&&(r.callback=t),sa(e,r),Zi(e,n)}};function ga(e,t,n,r,l,a,o){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,a,o):!(t.prototype&&t.prototype.isPureReactComponent&&Wr(n,r)&&Wr(l,a))}function ba(e,t,n){var r=!1,l=dl,a=t.contextType;return"object"==typeof a&&null!==a?a=aa(a):(l=yl(t)?ml:pl.current,a=(r=null!=(r=t.contextTypes))?vl(e,l):dl),t=new t(n,a),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=ya,e.stateNode=t,t._reactInternalFiber=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=a),t}function wa(e,t,n,r){e=t.state,"function"==typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"==typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&ya.enqueueReplaceState(t,t.state,null)}function ka(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs=ma,ia(e);var a=t.contextType;"object"==typeof a&&null!==a?l.context=aa(a):(a=yl(t)?ml:pl.current,l.context=vl(e,a)),da(e,n,l,r),l.state=e.memoizedState,"function"==typeof(a=t.getDerivedStateFromProps)&&(va(e,t,a,n),l.state=e.memoizedState),"function"==typeof t.getDerivedStateFromProps||"function"==typeof l.getSnapshotBeforeUpdate||"function"!=typeof l.UNSAFE_componentWillMount&&"function"!=typeof l.componentWillMount||(t=l.state,"function"==typeof l.componentWillMount&&l.componentWillMount(),"function"==typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount(),t!==l.state&&ya.enqueueReplaceState(l,l.state,null),da(e,n,l,r),l.state=e.memoizedState),"function"==typeof l.componentDidMount&&(e.effectTag|=4)}var Ea=Array.isArray;function xa(e,t,n){if(null!==(e=n.ref)&&"function"!=typeof e&&"object"!=typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(o(309));var r=n.stateNode}if(!r)throw Error(o(147,e));var l=""+e;return null!==t&&null!==t.ref&&"function"==typeof t.ref&&t.ref._stringRef===l?t.ref:(t=function(e){var t=r.refs;t===ma&&(t=r.refs={}),null===e?delete t[l]:t[l]=e},t._stringRef=l,t)}if("string"!=typeof e)throw Error(o(284));if(!n._owner)throw Error(o(290,e))}return e}function Ta(e,t){if("textarea"!==e.type)throw Error(o(31,"[object Object]"===Object.prototype.toString.call(t)?"object with keys {"+Object.keys(t).join(", ")+"}":t,""))}function Sa(e){function t(t,n){if(e){var r=t.lastEffect;null!==r?(r.nextEffect=n,t.lastEffect=n):t.firstEffect=t.lastEffect=n,n.nextEffect=null,n.effectTag=8}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function l(e,t){return(e=Ou(e,t)).index=0,e.sibling=null,e}function a(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.effectTag=2,n):r:(t.effectTag=2,n):n}function i(t){return e&&null===t.alternate&&(t.effectTag=2),t}function u(e,t,n,r){return null===t||6!==t.tag?((t=Mu(n,e.mode,r)).return=e,t):((t=l(t,n)).return=e,t)}function c(e,t,n,r){return null!==t&&t.elementType===n.type?((r=l(t,n.props)).ref=xa(e,t,n),r.return=e,r):((r=zu(n.type,n.key,n.props,null,e.mode,r)).ref=xa(e,t,n),r.return=e,r)}function s(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Iu(n,e.mode,r)).return=e,t):((t=l(t,n.children||[])).return=e,t)}function f(e,t,n,r,a){return null===t||7!==t.tag?((t=Ru(n,e.mode,r,a)).return=e,t):((t=l(t,n)).return=e,t)}function d(e,t,n){if("string"==typeof t||"number"==typeof t)return(t=Mu(""+t,e.mode,n)).return=e,t;if("object"==typeof t&&null!==t){switch(t.$$typeof){case ee:return(n=zu(t.type,t.key,t.props,null,e.mode,n)).ref=xa(e,null,t),n.return=e,n;case te:return(t=Iu(t,e.mode,n)).return=e,t}if(Ea(t)||me(t))return(t=Ru(t,e.mode,n,null)).return=e,t;Ta(e,t)}return null}function p(e,t,n,r){var l=null!==t?t.key:null;if("string"==typeof n||"number"==typeof n)return null!==l?null:u(e,t,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case ee:return n.key===l?n.type===ne?f(e,t,n.props.children,r,l):c(e,t,n,r):null;case te:return n.key===l?s(e,t,n,r):null}if(Ea(n)||me(n))return null!==l?null:f(e,t,n,r,null);Ta(e,n)}return null}function h(e,t,n,r,l){if("string"==typeof r||"number"==typeof r)return u(t,e=e.get(n)||null,""+r,l);if("object"==typeof r&&null!==r){switch(r.$$typeof){case ee:return e=e.get(null===r.key?n:r.key)||null,r.type===ne?f(t,e,r.props.children,l,r.key):c(t,e,r,l);case te:return s(t,e=e.get(null===r.key?n:r.key)||null,r,l)}if(Ea(r)||me(r))return f(t,e=e.get(n)||null,r,l,null);Ta(t,r)}return null}function m(l,o,i,u){for(var c=null,s=null,f=o,m=o=0,v=null;null!==f&&m<i.length;m++){f.index>m?(v=f,f=null):v=f.sibling;var y=p(l,f,i[m],u);if(null===y){null===f&&(f=v);break}e&&f&&null===y.alternate&&t(l,f),o=a(y,o,m),null===s?c=y:s.sibling=y,s=y,f=v}if(m===i.length)return n(l,f),c;if(null===f){for(;m<i.length;m++)null!==(f=d(l,i[m],u))&&(o=a(f,o,m),null===s?c=f:s.sibling=f,s=f);return c}for(f=r(l,f);m<i.length;m++)null!==(v=h(f,l,m,i[m],u))&&(e&&null!==v.alternate&&f.delete(null===v.key?m:v.key),o=a(v,o,m),null===s?c=v:s.sibling=v,s=v);return e&&f.forEach((function(e){return t(l,e)})),c}function v(l,i,u,c){var s=me(u);if("function"!=typeof s)throw Error(o(150));if(null==(u=s.call(u)))throw Error(o(151));for(var f=s=null,m=i,v=i=0,y=null,g=u.next();null!==m&&!g.done;v++,g=u.next()){m.index>v?(y=m,m=null):y=m.sibling;var b=p(l,m,g.value,c);if(null===b){null===m&&(m=y);break}e&&m&&null===b.alternate&&t(l,m),i=a(b,i,v),null===f?s=b:f.sibling=b,f=b,m=y}if(g.done)return n(l,m),s;if(null===m){for(;!g.done;v++,g=u.next())null!==(g=d(l,g.value,c))&&(i=a(g,i,v),null===f?s=g:f.sibling=g,f=g);return s}for(m=r(l,m);!g.done;v++,g=u.next())null!==(g=h(m,l,v,g.value,c))&&(e&&null!==g.alternate&&m.delete(null===g.key?v:g.key),i=a(g,i,v),null===f?s=g:f.sibling=g,f=g);return e&&m.forEach((function(e){return t(l,e)})),s}return function(e,r,a,u){var c="object"==typeof a&&null!==a&&a.type===ne&&null===a.key;c&&(a=a.props.children);var s="object"==typeof a&&null!==a;if(s)switch(a.$$typeof){case ee:e:{for(s=a.key,c=r;null!==c;){if(c.key===s){if(7===c.tag){if(a.type===ne){n(e,c.sibling),(r=l(c,a.props.children)).return=e,e=r;break e}}else if(c.elementType===a.type){n(e,c.sibling),(r=l(c,a.props)).ref=xa(e,c,a),r.return=e,e=r;break e}n(e,c);break}t(e,c),c=c.sibling}a.type===ne?((r=Ru(a.props.children,e.mode,u,a.key)).return=e,e=r):((u=zu(a.type,a.key,a.props,null,e.mode,u)).ref=xa(e,r,a),u.return=e,e=u)}return i(e);case te:e:{for(c=a.key;null!==r;){if(r.key===c){if(4===r.tag&&r.stateNode.containerInfo===a.containerInfo&&r.stateNode.implementation===a.implementation){n(e,r.sibling),(r=l(r,a.children||[])).return=e,e=r;break e}n(e,r);break}t(e,r),r=r.sibling}(r=Iu(a,e.mode,u)).return=e,e=r}return i(e)}if("string"==typeof a||"number"==typeof a)return a=""+a,null!==r&&6===r.tag?(n(e,r.sibling),(r=l(r,a)).return=e,e=r):(n(e,r),(r=Mu(a,e.mode,u)).return=e,e=r),i(e);if(Ea(a))return m(e,r,a,u);if(me(a))return v(e,r,a,u);if(s&&Ta(e,a),void 0===a&&!c)switch(e.tag){case 1:case 0:throw e=e.type,Error(o(152,e.displayName||e.name||"Component"))}return n(e,r)}}var Ca=Sa(!0),Pa=Sa(!1),_a={},Na={current:_a},Oa={current:_a},za={current:_a};function Ra(e){if(e===_a)throw Error(o(174));return e}function Ma(e,t){switch(fl(za,t),fl(Oa,e),fl(Na,_a),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:Le(null,"");break;default:t=Le(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}sl(Na),fl(Na,t)}function Ia(){sl(Na),sl(Oa),sl(za)}function La(e){Ra(za.current);var t=Ra(Na.current),n=Le(t,e.type);t!==n&&(fl(Oa,e),fl(Na,n))}function Fa(e){Oa.current===e&&(sl(Na),sl(Oa))}var Da={current:0};function ja(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||n.data===mn||n.data===vn))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!=(64&t.effectTag))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function Aa(e,t){return{responder:e,props:t}}var Ua=G.ReactCurrentDispatcher,Wa=G.ReactCurrentBatchConfig,Va=0,Ba=null,$a=null,Qa=null,Ha=!1;function Ka(){throw Error(o(321))}function qa(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Ar(e[n],t[n]))return!1;return!0}function Ya(e,t,n,r,l,a){if(Va=a,Ba=t,t.memoizedState=null,t.updateQueue=null,t.expirationTime=0,Ua.current=null===e||null===e.memoizedState?bo:wo,e=n(r,l),t.expirationTime===Va){a=0;do{if(t.expirationTime=0,!(25>a))throw Error(o(301));a+=1,Qa=$a=null,t.updateQueue=null,Ua.current=ko,e=n(r,l)}while(t.expirationTime===Va)}if(Ua.current=go,t=null!==$a&&null!==$a.next,Va=0,Qa=$a=Ba=null,Ha=!1,t)throw Error(o(300));return e}function Ga(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===Qa?Ba.memoizedState=Qa=e:Qa=Qa.next=e,Qa}function Xa(){if(null===$a){var e=Ba.alternate;e=null!==e?e.memoizedState:null}else e=$a.next;var t=null===Qa?Ba.memoizedState:Qa.next;if(null!==t)Qa=t,$a=e;else{if(null===e)throw Error(o(310));e={memoizedState:($a=e).memoizedState,baseState:$a.baseState,baseQueue:$a.baseQueue,queue:$a.queue,next:null},null===Qa?Ba.memoizedState=Qa=e:Qa=Qa.next=e}return Qa}function Za(e,t){return"function"==typeof t?t(e):t}function Ja(e){var t=Xa(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=$a,l=r.baseQueue,a=n.pending;if(null!==a){if(null!==l){var i=l.next;l.next=a.next,a.next=i}r.baseQueue=l=a,n.pending=null}if(null!==l){l=l.next,r=r.baseState;var u=i=a=null,c=l;do{var s=c.expirationTime;if(s<Va){var f={expirationTime:c.expirationTime,suspenseConfig:c.suspenseConfig,action:c.action,eagerReducer:c.eagerReducer,eagerState:c.eagerState,next:null};null===u?(i=u=f,a=r):u=u.next=f,s>Ba.expirationTime&&(Ba.expirationTime=s,su(s))}else null!==u&&(u=u.next={expirationTime:1073741823,suspenseConfig:c.suspenseConfig,action:c.action,eagerReducer:c.eagerReducer,eagerState:c.eagerState,next:null}),cu(s,c.suspenseConfig),r=c.eagerReducer===e?c.eagerState:e(r,c.action);c=c.next}while(null!==c&&c!==l);null===u?a=r:u.next=i,Ar(r,t.memoizedState)||(Ro=!0),t.memoizedState=r,t.baseState=a,t.baseQueue=u,n.lastRenderedState=r}return[t.memoizedState,n.dispatch]}function eo(e){var t=Xa(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,a=t.memoizedState;if(null!==l){n.pending=null;var i=l=l.next;do{a=e(a,i.action),i=i.next}while(i!==l);Ar(a,t.memoizedState)||(Ro=!0),t.memoizedState=a,null===t.baseQueue&&(t.baseState=a),n.lastRenderedState=a}return[a,r]}function to(e){var t=Ga();return"function"==typeof e&&(e=e()),t.memoizedState=t.baseState=e,e=(e=t.queue={pending:null,dispatch:null,lastRenderedReducer:Za,lastRenderedState:e}).dispatch=yo.bind(null,Ba,e),[t.memoizedState,e]}function no(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=Ba.updateQueue)?(t={lastEffect:null},Ba.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function ro(){return Xa().memoizedState}function lo(e,t,n,r){var l=Ga();Ba.effectTag|=e,l.memoizedState=no(1|t,n,void 0,void 0===r?null:r)}function ao(e,t,n,r){var l=Xa();r=void 0===r?null:r;var a=void 0;if(null!==$a){var o=$a.memoizedState;if(a=o.destroy,null!==r&&qa(r,o.deps))return void no(t,n,a,r)}Ba.effectTag|=e,l.memoizedState=no(1|t,n,a,r)}function oo(e,t){return lo(516,4,e,t)}function io(e,t){return ao(516,4,e,t)}function uo(e,t){return ao(4,2,e,t)}function co(e,t){return"function"==typeof t?(e=e(),t(e),function(){t(null)}):null!=t?(e=e(),t.current=e,function(){t.current=null}):void 0}function so(e,t,n){return n=null!=n?n.concat([e]):null,ao(4,2,co.bind(null,t,e),n)}function fo(){}function po(e,t){return Ga().memoizedState=[e,void 0===t?null:t],e}function ho(e,t){var n=Xa();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&qa(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function mo(e,t){var n=Xa();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&qa(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function vo(e,t,n){var r=Vl();$l(98>r?98:r,(function(){e(!0)})),$l(97<r?97:r,(function(){var r=Wa.suspense;Wa.suspense=void 0===t?null:t;try{e(!1),n()}finally{Wa.suspense=r}}))}function yo(e,t,n){var r=Gi(),l=ha.suspense;l={expirationTime:r=Xi(r,e,l),suspenseConfig:l,action:n,eagerReducer:null,eagerState:null,next:null};var a=t.pending;if(null===a?l.next=l:(l.next=a.next,a.next=l),t.pending=l,a=e.alternate,e===Ba||null!==a&&a===Ba)Ha=!0,l.expirationTime=Va,Ba.expirationTime=Va;else{if(0===e.expirationTime&&(null===a||0===a.expirationTime)&&null!==(a=t.lastRenderedReducer))try{var o=t.lastRenderedState,i=a(o,n);if(l.eagerReducer=a,l.eagerState=i,Ar(i,o))return}catch(e){}Zi(e,r)}}var go={readContext:aa,useCallback:Ka,useContext:Ka,useEffect:Ka,useImperativeHandle:Ka,useLayoutEffect:Ka,useMemo:Ka,useReducer:Ka,useRef:Ka,useState:Ka,useDebugValue:Ka,useResponder:Ka,useDeferredValue:Ka,useTransition:Ka},bo={readContext:aa,useCallback:po,useContext:aa,useEffect:oo,useImperativeHandle:function(e,t,n){return n=null!=n?n.concat([e]):null,lo(4,2,co.bind(null,t,e),n)},useLayoutEffect:function(e,t){return lo(4,2,e,t)},useMemo:function(e,t){var n=Ga();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Ga();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e=(e=r.queue={pending:null,dispatch:null,lastRenderedReducer:e,lastRenderedState:t}).dispatch=yo.bind(null,Ba,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},Ga().memoizedState=e},useState:to,useDebugValue:fo,useResponder:Aa,useDeferredValue:function(e,t){var n=to(e),r=n[0],l=n[1];return oo((function(){var n=Wa.suspense;Wa.suspense=void 0===t?null:t;try{l(e)}finally{Wa.suspense=n}}),[e,t]),r},useTransition:function(e){var t=to(!1),n=t[0];return t=t[1],[po(vo.bind(null,t,e),[t,e]),n]}},wo={readContext:aa,useCallback:ho,useContext:aa,useEffect:io,useImperativeHandle:so,useLayoutEffect:uo,useMemo:mo,useReducer:Ja,useRef:ro,useState:function(){return Ja(Za)},useDebugValue:fo,useResponder:Aa,useDeferredValue:function(e,t){var n=Ja(Za),r=n[0],l=n[1];return io((function(){var n=Wa.suspense;Wa.suspense=void 0===t?null:t;try{l(e)}finally{Wa.suspense=n}}),[e,t]),r},useTransition:function(e){var t=Ja(Za),n=t[0];return t=t[1],[ho(vo.bind(null,t,e),[t,e]),n]}},ko={readContext:aa,useCallback:ho,useContext:aa,useEffect:io,useImperativeHandle:so,useLayoutEffect:uo,useMemo:mo,useReducer:eo,useRef:ro,useState:function(){return eo(Za)},useDebugValue:fo,useResponder:Aa,useDeferredValue:function(e,t){var n=eo(Za),r=n[0],l=n[1];return io((function(){var n=Wa.suspense;Wa.suspense=void 0===t?null:t;try{l(e)}finally{Wa.suspense=n}}),[e,t]),r},useTransition:function(e){var t=eo(Za),n=t[0];return t=t[1],[ho(vo.bind(null,t,e),[t,e]),n]}},Eo=null,xo=null,To=!1;function So(e,t){var n=_u(5,null,null,0);n.elementType="DELETED",n.type="DELETED",n.stateNode=t,n.return=e,n.effectTag=8,null!==e.lastEffect?(e.lastEffect.nextEffect=n,e.lastEffect=n):e.firstEffect=e.lastEffect=n}function Co(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,!0);default:return!1}}function Po(e){if(To){var t=xo;if(t){var n=t;if(!Co(e,t)){if(!(t=xn(n.nextSibling))||!Co(e,t))return e.effectTag=-1025&e.effectTag|2,To=!1,void(Eo=e);So(Eo,n)}Eo=e,xo=xn(t.firstChild)}else e.effectTag=-1025&e.effectTag|2,To=!1,Eo=e}}function _o(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;Eo=e}function No(e){if(e!==Eo)return!1;if(!To)return _o(e),To=!0,!1;var t=e.type;if(5!==e.tag||"head"!==t&&"body"!==t&&!wn(t,e.memoizedProps))for(t=xo;t;)So(e,t),t=xn(t.nextSibling);if(_o(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){xo=xn(e.nextSibling);break e}t--}else"$"!==n&&n!==vn&&n!==mn||t++}e=e.nextSibling}xo=null}}else xo=Eo?xn(e.stateNode.nextSibling):null;return!0}function Oo(){xo=Eo=null,To=!1}var zo=G.ReactCurrentOwner,Ro=!1;function Mo(e,t,n,r){t.child=null===e?Pa(t,null,n,r):Ca(t,e.child,n,r)}function Io(e,t,n,r,l){n=n.render;var a=t.ref;return la(t,l),r=Ya(e,t,n,r,a,l),null===e||Ro?(t.effectTag|=1,Mo(e,t,r,l),t.child):(t.updateQueue=e.updateQueue,t.effectTag&=-517,e.expirationTime<=l&&(e.expirationTime=0),Go(e,t,l))}function Lo(e,t,n,r,l,a){if(null===e){var o=n.type;return"function"!=typeof o||Nu(o)||void 0!==o.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=zu(n.type,null,r,null,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=o,Fo(e,t,o,r,l,a))}return o=e.child,l<a&&(l=o.memoizedProps,(n=null!==(n=n.compare)?n:Wr)(l,r)&&e.ref===t.ref)?Go(e,t,a):(t.effectTag|=1,(e=Ou(o,r)).ref=t.ref,e.return=t,t.child=e)}function Fo(e,t,n,r,l,a){return null!==e&&Wr(e.memoizedProps,r)&&e.ref===t.ref&&(Ro=!1,l<a)?(t.expirationTime=e.expirationTime,Go(e,t,a)):jo(e,t,n,r,a)}function Do(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.effectTag|=128)}function jo(e,t,n,r,l){var a=yl(n)?ml:pl.current;return a=vl(t,a),la(t,l),n=Ya(e,t,n,r,a,l),null===e||Ro?(t.effectTag|=1,Mo(e,t,n,l),t.child):(t.updateQueue=e.updateQueue,t.effectTag&=-517,e.expirationTime<=l&&(e.expirationTime=0),Go(e,t,l))}function Ao(e,t,n,r,l){if(yl(n)){var a=!0;kl(t)}else a=!1;if(la(t,l),null===t.stateNode)null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),ba(t,n,r),ka(t,n,r,l),r=!0;else if(null===e){var o=t.stateNode,i=t.memoizedProps;o.props=i;var u=o.context,c=n.contextType;c="object"==typeof c&&null!==c?aa(c):vl(t,c=yl(n)?ml:pl.current);var s=n.getDerivedStateFromProps,f="function"==typeof s||"function"==typeof o.getSnapshotBeforeUpdate;f||"function"!=typeof o.UNSAFE_componentWillReceiveProps&&"function"!=typeof o.componentWillReceiveProps||(i!==r||u!==c)&&wa(t,o,r,c),oa=!1;var d=t.memoizedState;o.state=d,da(t,r,o,l),u=t.memoizedState,i!==r||d!==u||hl.current||oa?("function"==typeof s&&(va(t,n,s,r),u=t.memoizedState),(i=oa||ga(t,n,i,r,d,u,c))?(f||"function"!=typeof o.UNSAFE_componentWillMount&&"function"!=typeof o.componentWillMount||("function"==typeof o.componentWillMount&&o.componentWillMount(),"function"==typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount()),"function"==typeof o.componentDidMount&&(t.effectTag|=4)):("function"==typeof o.componentDidMount&&(t.effectTag|=4),t.memoizedProps=r,t.memoizedState=u),o.props=r,o.state=u,o.context=c,r=i):("function"==typeof o.componentDidMount&&(t.effectTag|=4),r=!1)}else o=t.stateNode,ua(e,t),i=t.memoizedProps,o.props=t.type===t.elementType?i:Gl(t.type,i),u=o.context,c="object"==typeof(c=n.contextType)&&null!==c?aa(c):vl(t,c=yl(n)?ml:pl.current),(f="function"==typeof(s=n.getDerivedStateFromProps)||"function"==typeof o.getSnapshotBeforeUpdate)||"function"!=typeof o.UNSAFE_componentWillReceiveProps&&"function"!=typeof o.componentWillReceiveProps||(i!==r||u!==c)&&wa(t,o,r,c),oa=!1,u=t.memoizedState,o.state=u,da(t,r,o,l),d=t.memoizedState,i!==r||u!==d||hl.current||oa?("function"==typeof s&&(va(t,n,s,r),d=t.memoizedState),(s=oa||ga(t,n,i,r,u,d,c))?(f||"function"!=typeof o.UNSAFE_componentWillUpdate&&"function"!=typeof o.componentWillUpdate||("function"==typeof o.componentWillUpdate&&o.componentWillUpdate(r,d,c),"function"==typeof o.UNSAFE_componentWillUpdate&&o.UNSAFE_componentWillUpdate(r,d,c)),"function"==typeof o.componentDidUpdate&&(t.effectTag|=4),"function"==typeof o.getSnapshotBeforeUpdate&&(t.effectTag|=256)):("function"!=typeof o.componentDidUpdate||i===e.memoizedProps&&u===e.memoizedState||(t.effectTag|=4),"function"!=typeof o.getSnapshotBeforeUpdate||i===e.memoizedProps&&u===e.memoizedState||(t.effectTag|=256),t.memoizedProps=r,t.memoizedState=d),o.props=r,o.state=d,o.context=c,r=s):("function"!=typeof o.componentDidUpdate||i===e.memoizedProps&&u===e.memoizedState||(t.effectTag|=4),"function"!=typeof o.getSnapshotBeforeUpdate||i===e.memoizedProps&&u===e.memoizedState||(t.effectTag|=256),r=!1);return Uo(e,t,n,r,a,l)}function Uo(e,t,n,r,l,a){Do(e,t);var o=0!=(64&t.effectTag);if(!r&&!o)return l&&El(t,n,!1),Go(e,t,a);r=t.stateNode,zo.current=t;var i=o&&"function"!=typeof n.getDerivedStateFromError?null:r.render();return t.effectTag|=1,null!==e&&o?(t.child=Ca(t,e.child,null,a),t.child=Ca(t,null,i,a)):Mo(e,t,i,a),t.memoizedState=r.state,l&&El(t,n,!0),t.child}function Wo(e){var t=e.stateNode;t.pendingContext?bl(0,t.pendingContext,t.pendingContext!==t.context):t.context&&bl(0,t.context,!1),Ma(e,t.containerInfo)}var Vo,Bo,$o,Qo={dehydrated:null,retryTime:0};function Ho(e,t,n){var r,l=t.mode,a=t.pendingProps,o=Da.current,i=!1;if((r=0!=(64&t.effectTag))||(r=0!=(2&o)&&(null===e||null!==e.memoizedState)),r?(i=!0,t.effectTag&=-65):null!==e&&null===e.memoizedState||void 0===a.fallback||!0===a.unstable_avoidThisFallback||(o|=1),fl(Da,1&o),null===e){if(void 0!==a.fallback&&Po(t),i){if(i=a.fallback,(a=Ru(null,l,0,null)).return=t,0==(2&t.mode))for(e=null!==t.memoizedState?t.child.child:t.child,a.child=e;null!==e;)e.return=a,e=e.sibling;return(n=Ru(i,l,n,null)).return=t,a.sibling=n,t.memoizedState=Qo,t.child=a,n}return l=a.children,t.memoizedState=null,t.child=Pa(t,null,l,n)}if(null!==e.memoizedState){if(l=(e=e.child).sibling,i){if(a=a.fallback,(n=Ou(e,e.pendingProps)).return=t,0==(2&t.mode)&&(i=null!==t.memoizedState?t.child.child:t.child)!==e.child)for(n.child=i;null!==i;)i.return=n,i=i.sibling;return(l=Ou(l,a)).return=t,n.sibling=l,n.childExpirationTime=0,t.memoizedState=Qo,t.child=n,l}return n=Ca(t,e.child,a.children,n),t.memoizedState=null,t.child=n}if(e=e.child,i){if(i=a.fallback,(a=Ru(null,l,0,null)).return=t,a.child=e,null!==e&&(e.return=a),0==(2&t.mode))for(e=null!==t.memoizedState?t.child.child:t.child,a.child=e;null!==e;)e.return=a,e=e.sibling;return(n=Ru(i,l,n,null)).return=t,a.sibling=n,n.effectTag|=2,a.childExpirationTime=0,t.memoizedState=Qo,t.child=a,n}return t.memoizedState=null,t.child=Ca(t,e,a.children,n)}function Ko(e,t){e.expirationTime<t&&(e.expirationTime=t);var n=e.alternate;null!==n&&n.expirationTime<t&&(n.expirationTime=t),ra(e.return,t)}function qo(e,t,n,r,l,a){var o=e.memoizedState;null===o?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailExpiration:0,tailMode:l,lastEffect:a}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailExpiration=0,o.tailMode=l,o.lastEffect=a)}function Yo(e,t,n){var r=t.pendingProps,l=r.revealOrder,a=r.tail;if(Mo(e,t,r.children,n),0!=(2&(r=Da.current)))r=1&r|2,t.effectTag|=64;else{if(null!==e&&0!=(64&e.effectTag))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Ko(e,n);else if(19===e.tag)Ko(e,n);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(fl(Da,r),0==(2&t.mode))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;null!==n;)null!==(e=n.alternate)&&null===ja(e)&&(l=n),n=n.sibling;null===(n=l)?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),qo(t,!1,l,n,a,t.lastEffect);break;case"backwards":for(n=null,l=t.child,t.child=null;null!==l;){if(null!==(e=l.alternate)&&null===ja(e)){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}qo(t,!0,n,null,a,t.lastEffect);break;case"together":qo(t,!1,null,null,void 0,t.lastEffect);break;default:t.memoizedState=null}return t.child}function Go(e,t,n){null!==e&&(t.dependencies=e.dependencies);var r=t.expirationTime;if(0!==r&&su(r),t.childExpirationTime<n)return null;if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=Ou(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Ou(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function Xo(e,t){switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Zo(e,t,n){var r=t.pendingProps;switch(t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return null;case 1:case 17:return yl(t.type)&&gl(),null;case 3:return Ia(),sl(hl),sl(pl),(n=t.stateNode).pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||!No(t)||(t.effectTag|=4),null;case 5:Fa(t),n=Ra(za.current);var a=t.type;if(null!==e&&null!=t.stateNode)Bo(e,t,a,r,n),e.ref!==t.ref&&(t.effectTag|=128);else{if(!r){if(null===t.stateNode)throw Error(o(166));return null}if(e=Ra(Na.current),No(t)){r=t.stateNode,a=t.type;var i=t.memoizedProps;switch(r[Cn]=t,r[Pn]=i,a){case"iframe":case"object":case"embed":Ht("load",r);break;case"video":case"audio":for(e=0;e<Ye.length;e++)Ht(Ye[e],r);break;case"source":Ht("error",r);break;case"img":case"image":case"link":Ht("error",r),Ht("load",r);break;case"form":Ht("reset",r),Ht("submit",r);break;case"details":Ht("toggle",r);break;case"input":xe(r,i),Ht("invalid",r),on(n,"onChange");break;case"select":r._wrapperState={wasMultiple:!!i.multiple},Ht("invalid",r),on(n,"onChange");break;case"textarea":ze(r,i),Ht("invalid",r),on(n,"onChange")}for(var u in rn(a,i),e=null,i)if(i.hasOwnProperty(u)){var c=i[u];"children"===u?"string"==typeof c?r.textContent!==c&&(e=["children",c]):"number"==typeof c&&r.textContent!==""+c&&(e=["children",""+c]):T.hasOwnProperty(u)&&null!=c&&on(n,u)}switch(a){case"input":we(r),Ce(r,i,!0);break;case"textarea":we(r),Me(r);break;case"select":case"option":break;default:"function"==typeof i.onClick&&(r.onclick=un)}n=e,t.updateQueue=n,null!==n&&(t.effectTag|=4)}else{switch(u=9===n.nodeType?n:n.ownerDocument,e===an&&(e=Ie(a)),e===an?"script"===a?((e=u.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=u.createElement(a,{is:r.is}):(e=u.createElement(a),"select"===a&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,a),e[Cn]=t,e[Pn]=r,Vo(e,t),t.stateNode=e,u=ln(a,r),a){case"iframe":case"object":case"embed":Ht("load",e),c=r;break;case"video":case"audio":for(c=0;c<Ye.length;c++)Ht(Ye[c],e);c=r;break;case"source":Ht("error",e),c=r;break;case"img":case"image":case"link":Ht("error",e),Ht("load",e),c=r;break;case"form":Ht("reset",e),Ht("submit",e),c=r;break;case"details":Ht("toggle",e),c=r;break;case"input":xe(e,r),c=Ee(e,r),Ht("invalid",e),on(n,"onChange");break;case"option":c=_e(e,r);break;case"select":e._wrapperState={wasMultiple:!!r.multiple},c=l({},r,{value:void 0}),Ht("invalid",e),on(n,"onChange");break;case"textarea":ze(e,r),c=Oe(e,r),Ht("invalid",e),on(n,"onChange");break;default:c=r}rn(a,c);var s=c;for(i in s)if(s.hasOwnProperty(i)){var f=s[i];"style"===i?tn(e,f):"dangerouslySetInnerHTML"===i?null!=(f=f?f.__html:void 0)&&je(e,f):"children"===i?"string"==typeof f?("textarea"!==a||""!==f)&&Ae(e,f):"number"==typeof f&&Ae(e,""+f):"suppressContentEditableWarning"!==i&&"suppressHydrationWarning"!==i&&"autoFocus"!==i&&(T.hasOwnProperty(i)?null!=f&&on(n,i):null!=f&&X(e,i,f,u))}switch(a){case"input":we(e),Ce(e,r,!1);break;case"textarea":we(e),Me(e);break;case"option":null!=r.value&&e.setAttribute("value",""+ge(r.value));break;case"select":e.multiple=!!r.multiple,null!=(n=r.value)?Ne(e,!!r.multiple,n,!1):null!=r.defaultValue&&Ne(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof c.onClick&&(e.onclick=un)}bn(a,r)&&(t.effectTag|=4)}null!==t.ref&&(t.effectTag|=128)}return null;case 6:if(e&&null!=t.stateNode)$o(0,t,e.memoizedProps,r);else{if("string"!=typeof r&&null===t.stateNode)throw Error(o(166));n=Ra(za.current),Ra(Na.current),No(t)?(n=t.stateNode,r=t.memoizedProps,n[Cn]=t,n.nodeValue!==r&&(t.effectTag|=4)):((n=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[Cn]=t,t.stateNode=n)}return null;case 13:return sl(Da),r=t.memoizedState,0!=(64&t.effectTag)?(t.expirationTime=n,t):(n=null!==r,r=!1,null===e?void 0!==t.memoizedProps.fallback&&No(t):(r=null!==(a=e.memoizedState),n||null===a||null!==(a=e.child.sibling)&&(null!==(i=t.firstEffect)?(t.firstEffect=a,a.nextEffect=i):(t.firstEffect=t.lastEffect=a,a.nextEffect=null),a.effectTag=8)),n&&!r&&0!=(2&t.mode)&&(null===e&&!0!==t.memoizedProps.unstable_avoidThisFallback||0!=(1&Da.current)?zi===Ti&&(zi=Si):(zi!==Ti&&zi!==Si||(zi=Ci),0!==Fi&&null!==_i&&(Du(_i,Oi),ju(_i,Fi)))),(n||r)&&(t.effectTag|=4),null);case 4:return Ia(),null;case 10:return na(t),null;case 19:if(sl(Da),null===(r=t.memoizedState))return null;if(a=0!=(64&t.effectTag),null===(i=r.rendering)){if(a)Xo(r,!1);else if(zi!==Ti||null!==e&&0!=(64&e.effectTag))for(i=t.child;null!==i;){if(null!==(e=ja(i))){for(t.effectTag|=64,Xo(r,!1),null!==(a=e.updateQueue)&&(t.updateQueue=a,t.effectTag|=4),null===r.lastEffect&&(t.firstEffect=null),t.lastEffect=r.lastEffect,r=t.child;null!==r;)i=n,(a=r).effectTag&=2,a.nextEffect=null,a.firstEffect=null,a.lastEffect=null,null===(e=a.alternate)?(a.childExpirationTime=0,a.expirationTime=i,a.child=null,a.memoizedProps=null,a.memoizedState=null,a.updateQueue=null,a.dependencies=null):(a.childExpirationTime=e.childExpirationTime,a.expirationTime=e.expirationTime,a.child=e.child,a.memoizedProps=e.memoizedProps,a.memoizedState=e.memoizedState,a.updateQueue=e.updateQueue,i=e.dependencies,a.dependencies=null===i?null:{expirationTime:i.expirationTime,firstContext:i.firstContext,responders:i.responders}),r=r.sibling;return fl(Da,1&Da.current|2),t.child}i=i.sibling}}else{if(!a)if(null!==(e=ja(i))){if(t.effectTag|=64,a=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.effectTag|=4),Xo(r,!0),null===r.tail&&"hidden"===r.tailMode&&!i.alternate)return null!==(t=t.lastEffect=r.lastEffect)&&(t.nextEffect=null),null}else 2*Wl()-r.renderingStartTime>r.tailExpiration&&1<n&&(t.effectTag|=64,a=!0,Xo(r,!1),t.expirationTime=t.childExpirationTime=n-1);r.isBackwards?(i.sibling=t.child,t.child=i):(null!==(n=r.last)?n.sibling=i:t.child=i,r.last=i)}return null!==r.tail?(0===r.tailExpiration&&(r.tailExpiration=Wl()+500),n=r.tail,r.rendering=n,r.tail=n.sibling,r.lastEffect=t.lastEffect,r.renderingStartTime=Wl(),n.sibling=null,t=Da.current,fl(Da,a?1&t|2:1&t),n):null}throw Error(o(156,t.tag))}function Jo(e){switch(e.tag){case 1:yl(e.type)&&gl();var t=e.effectTag;return 4096&t?(e.effectTag=-4097&t|64,e):null;case 3:if(Ia(),sl(hl),sl(pl),0!=(64&(t=e.effectTag)))throw Error(o(285));return e.effectTag=-4097&t|64,e;case 5:return Fa(e),null;case 13:return sl(Da),4096&(t=e.effectTag)?(e.effectTag=-4097&t|64,e):null;case 19:return sl(Da),null;case 4:return Ia(),null;case 10:return na(e),null;default:return null}}function ei(e,t){return{value:e,source:t,stack:ye(t)}}Vo=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Bo=function(e,t,n,r,a){var o=e.memoizedProps;if(o!==r){var i,u,c=t.stateNode;switch(Ra(Na.current),e=null,n){case"input":o=Ee(c,o),r=Ee(c,r),e=[];break;case"option":o=_e(c,o),r=_e(c,r),e=[];break;case"select":o=l({},o,{value:void 0}),r=l({},r,{value:void 0}),e=[];break;case"textarea":o=Oe(c,o),r=Oe(c,r),e=[];break;default:"function"!=typeof o.onClick&&"function"==typeof r.onClick&&(c.onclick=un)}for(i in rn(n,r),n=null,o)if(!r.hasOwnProperty(i)&&o.hasOwnProperty(i)&&null!=o[i])if("style"===i)for(u in c=o[i])c.hasOwnProperty(u)&&(n||(n={}),n[u]="");else"dangerouslySetInnerHTML"!==i&&"children"!==i&&"suppressContentEditableWarning"!==i&&"suppressHydrationWarning"!==i&&"autoFocus"!==i&&(T.hasOwnProperty(i)?e||(e=[]):(e=e||[]).push(i,null));for(i in r){var s=r[i];if(c=null!=o?o[i]:void 0,r.hasOwnProperty(i)&&s!==c&&(null!=s||null!=c))if("style"===i)if(c){for(u in c)!c.hasOwnProperty(u)||s&&s.hasOwnProperty(u)||(n||(n={}),n[u]="");for(u in s)s.hasOwnProperty(u)&&c[u]!==s[u]&&(n||(n={}),n[u]=s[u])}else n||(e||(e=[]),e.push(i,n)),n=s;else"dangerouslySetInnerHTML"===i?(s=s?s.__html:void 0,c=c?c.__html:void 0,null!=s&&c!==s&&(e=e||[]).push(i,s)):"children"===i?c===s||"string"!=typeof s&&"number"!=typeof s||(e=e||[]).push(i,""+s):"suppressContentEditableWarning"!==i&&"suppressHydrationWarning"!==i&&(T.hasOwnProperty(i)?(null!=s&&on(a,i),e||c===s||(e=[])):(e=e||[]).push(i,s))}n&&(e=e||[]).push("style",n),a=e,(t.updateQueue=a)&&(t.effectTag|=4)}},$o=function(e,t,n,r){n!==r&&(t.effectTag|=4)};var ti="function"==typeof WeakSet?WeakSet:Set;function ni(e,t){var n=t.source,r=t.stack;null===r&&null!==n&&(r=ye(n)),null!==n&&ve(n.type),t=t.value,null!==e&&1===e.tag&&ve(e.type);try{console.error(t)}catch(e){setTimeout((function(){throw e}))}}function ri(e){var t=e.ref;if(null!==t)if("function"==typeof t)try{t(null)}catch(t){Eu(e,t)}else t.current=null}function li(e,t){switch(t.tag){case 0:case 11:case 15:case 22:case 3:case 5:case 6:case 4:case 17:return;case 1:if(256&t.effectTag&&null!==e){var n=e.memoizedProps,r=e.memoizedState;t=(e=t.stateNode).getSnapshotBeforeUpdate(t.elementType===t.type?n:Gl(t.type,n),r),e.__reactInternalSnapshotBeforeUpdate=t}return}throw Error(o(163))}function ai(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.destroy;n.destroy=void 0,void 0!==r&&r()}n=n.next}while(n!==t)}}function oi(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function ii(e,t,n){switch(n.tag){case 0:case 11:case 15:case 22:return void oi(3,n);case 1:if(e=n.stateNode,4&n.effectTag)if(null===t)e.componentDidMount();else{var r=n.elementType===n.type?t.memoizedProps:Gl(n.type,t.memoizedProps);e.componentDidUpdate(r,t.memoizedState,e.__reactInternalSnapshotBeforeUpdate)}return void(null!==(t=n.updateQueue)&&pa(n,t,e));case 3:if(null!==(t=n.updateQueue)){if(e=null,null!==n.child)switch(n.child.tag){case 5:case 1:e=n.child.stateNode}pa(n,t,e)}return;case 5:return e=n.stateNode,void(null===t&&4&n.effectTag&&bn(n.type,n.memoizedProps)&&e.focus());case 6:case 4:case 12:case 19:case 17:case 20:case 21:return;case 13:return void(null===n.memoizedState&&(n=n.alternate,null!==n&&(n=n.memoizedState,null!==n&&(n=n.dehydrated,null!==n&&Lt(n)))))}throw Error(o(163))}function ui(e,t,n){switch("function"==typeof Cu&&Cu(t),t.tag){case 0:case 11:case 14:case 15:case 22:if(null!==(e=t.updateQueue)&&null!==(e=e.lastEffect)){var r=e.next;$l(97<n?97:n,(function(){var e=r;do{var n=e.destroy;if(void 0!==n){var l=t;try{n()}catch(e){Eu(l,e)}}e=e.next}while(e!==r)}))}break;case 1:ri(t),"function"==typeof(n=t.stateNode).componentWillUnmount&&function(e,t){try{t.props=e.memoizedProps,t.state=e.memoizedState,t.componentWillUnmount()}catch(t){Eu(e,t)}}(t,n);break;case 5:ri(t);break;case 4:hi(e,t,n)}}function ci(e){var t=e.alternate;e.return=null,e.child=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.alternate=null,e.firstEffect=null,e.lastEffect=null,e.pendingProps=null,e.memoizedProps=null,e.stateNode=null,null!==t&&ci(t)}function si(e){return 5===e.tag||3===e.tag||4===e.tag}function fi(e){e:{for(var t=e.return;null!==t;){if(si(t)){var n=t;break e}t=t.return}throw Error(o(160))}switch(t=n.stateNode,n.tag){case 5:var r=!1;break;case 3:case 4:t=t.containerInfo,r=!0;break;default:throw Error(o(161))}16&n.effectTag&&(Ae(t,""),n.effectTag&=-17);e:t:for(n=e;;){for(;null===n.sibling;){if(null===n.return||si(n.return)){n=null;break e}n=n.return}for(n.sibling.return=n.return,n=n.sibling;5!==n.tag&&6!==n.tag&&18!==n.tag;){if(2&n.effectTag)continue t;if(null===n.child||4===n.tag)continue t;n.child.return=n,n=n.child}if(!(2&n.effectTag)){n=n.stateNode;break e}}r?di(e,n,t):pi(e,n,t)}function di(e,t,n){var r=e.tag,l=5===r||6===r;if(l)e=l?e.stateNode:e.stateNode.instance,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!=(n=n._reactRootContainer)||null!==t.onclick||(t.onclick=un));else if(4!==r&&null!==(e=e.child))for(di(e,t,n),e=e.sibling;null!==e;)di(e,t,n),e=e.sibling}function pi(e,t,n){var r=e.tag,l=5===r||6===r;if(l)e=l?e.stateNode:e.stateNode.instance,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(pi(e,t,n),e=e.sibling;null!==e;)pi(e,t,n),e=e.sibling}function hi(e,t,n){for(var r,l,a=t,i=!1;;){if(!i){i=a.return;e:for(;;){if(null===i)throw Error(o(160));switch(r=i.stateNode,i.tag){case 5:l=!1;break e;case 3:case 4:r=r.containerInfo,l=!0;break e}i=i.return}i=!0}if(5===a.tag||6===a.tag){e:for(var u=e,c=a,s=n,f=c;;)if(ui(u,f,s),null!==f.child&&4!==f.tag)f.child.return=f,f=f.child;else{if(f===c)break e;for(;null===f.sibling;){if(null===f.return||f.return===c)break e;f=f.return}f.sibling.return=f.return,f=f.sibling}l?(u=r,c=a.stateNode,8===u.nodeType?u.parentNode.removeChild(c):u.removeChild(c)):r.removeChild(a.stateNode)}else if(4===a.tag){if(null!==a.child){r=a.stateNode.containerInfo,l=!0,a.child.return=a,a=a.child;continue}}else if(ui(e,a,n),null!==a.child){a.child.return=a,a=a.child;continue}if(a===t)break;for(;null===a.sibling;){if(null===a.return||a.return===t)return;4===(a=a.return).tag&&(i=!1)}a.sibling.return=a.return,a=a.sibling}}function mi(e,t){switch(t.tag){case 0:case 11:case 14:case 15:case 22:return void ai(3,t);case 1:case 12:case 17:return;case 5:var n=t.stateNode;if(null!=n){var r=t.memoizedProps,l=null!==e?e.memoizedProps:r;e=t.type;var a=t.updateQueue;if(t.updateQueue=null,null!==a){for(n[Pn]=r,"input"===e&&"radio"===r.type&&null!=r.name&&Te(n,r),ln(e,l),t=ln(e,r),l=0;l<a.length;l+=2){var i=a[l],u=a[l+1];"style"===i?tn(n,u):"dangerouslySetInnerHTML"===i?je(n,u):"children"===i?Ae(n,u):X(n,i,u,t)}switch(e){case"input":Se(n,r);break;case"textarea":Re(n,r);break;case"select":t=n._wrapperState.wasMultiple,n._wrapperState.wasMultiple=!!r.multiple,null!=(e=r.value)?Ne(n,!!r.multiple,e,!1):t!==!!r.multiple&&(null!=r.defaultValue?Ne(n,!!r.multiple,r.defaultValue,!0):Ne(n,!!r.multiple,r.multiple?[]:"",!1))}}}return;case 6:if(null===t.stateNode)throw Error(o(162));return void(t.stateNode.nodeValue=t.memoizedProps);case 3:return void((t=t.stateNode).hydrate&&(t.hydrate=!1,Lt(t.containerInfo)));case 13:if(n=t,null===t.memoizedState?r=!1:(r=!0,n=t.child,ji=Wl()),null!==n)e:for(e=n;;){if(5===e.tag)a=e.stateNode,r?"function"==typeof(a=a.style).setProperty?a.setProperty("display","none","important"):a.display="none":(a=e.stateNode,l=null!=(l=e.memoizedProps.style)&&l.hasOwnProperty("display")?l.display:null,a.style.display=en("display",l));else if(6===e.tag)e.stateNode.nodeValue=r?"":e.memoizedProps;else{if(13===e.tag&&null!==e.memoizedState&&null===e.memoizedState.dehydrated){(a=e.child.sibling).return=e,e=a;continue}if(null!==e.child){e.child.return=e,e=e.child;continue}}if(e===n)break;for(;null===e.sibling;){if(null===e.return||e.return===n)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}return void vi(t);case 19:return void vi(t)}throw Error(o(163))}function vi(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new ti),t.forEach((function(t){var r=Tu.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}}var yi="function"==typeof WeakMap?WeakMap:Map;function gi(e,t,n){(n=ca(n,null)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Ui||(Ui=!0,Wi=r),ni(e,t)},n}function bi(e,t,n){(n=ca(n,null)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var l=t.value;n.payload=function(){return ni(e,t),r(l)}}var a=e.stateNode;return null!==a&&"function"==typeof a.componentDidCatch&&(n.callback=function(){"function"!=typeof r&&(null===Vi?Vi=new Set([this]):Vi.add(this),ni(e,t));var n=t.stack;this.componentDidCatch(t.value,{componentStack:null!==n?n:""})}),n}var wi,ki=Math.ceil,Ei=G.ReactCurrentDispatcher,xi=G.ReactCurrentOwner,Ti=0,Si=3,Ci=4,Pi=0,_i=null,Ni=null,Oi=0,zi=Ti,Ri=null,Mi=1073741823,Ii=1073741823,Li=null,Fi=0,Di=!1,ji=0,Ai=null,Ui=!1,Wi=null,Vi=null,Bi=!1,$i=null,Qi=90,Hi=null,Ki=0,qi=null,Yi=0;function Gi(){return 0!=(48&Pi)?1073741821-(Wl()/10|0):0!==Yi?Yi:Yi=1073741821-(Wl()/10|0)}function Xi(e,t,n){if(0==(2&(t=t.mode)))return 1073741823;var r=Vl();if(0==(4&t))return 99===r?1073741823:1073741822;if(0!=(16&Pi))return Oi;if(null!==n)e=Yl(e,0|n.timeoutMs||5e3,250);else switch(r){case 99:e=1073741823;break;case 98:e=Yl(e,150,100);break;case 97:case 96:e=Yl(e,5e3,250);break;case 95:e=2;break;default:throw Error(o(326))}return null!==_i&&e===Oi&&--e,e}function Zi(e,t){if(50<Ki)throw Ki=0,qi=null,Error(o(185));if(null!==(e=Ji(e,t))){var n=Vl();1073741823===t?0!=(8&Pi)&&0==(48&Pi)?ru(e):(tu(e),0===Pi&&Kl()):tu(e),0==(4&Pi)||98!==n&&99!==n||(null===Hi?Hi=new Map([[e,t]]):(void 0===(n=Hi.get(e))||n>t)&&Hi.set(e,t))}}function Ji(e,t){e.expirationTime<t&&(e.expirationTime=t);var n=e.alternate;null!==n&&n.expirationTime<t&&(n.expirationTime=t);var r=e.return,l=null;if(null===r&&3===e.tag)l=e.stateNode;else for(;null!==r;){if(n=r.alternate,r.childExpirationTime<t&&(r.childExpirationTime=t),null!==n&&n.childExpirationTime<t&&(n.childExpirationTime=t),null===r.return&&3===r.tag){l=r.stateNode;break}r=r.return}return null!==l&&(_i===l&&(su(t),zi===Ci&&Du(l,Oi)),ju(l,t)),l}function eu(e){var t=e.lastExpiredTime;if(0!==t)return t;if(!Fu(e,t=e.firstPendingTime))return t;var n=e.lastPingedTime;return 2>=(e=n>(e=e.nextKnownPendingLevel)?n:e)&&t!==e?0:e}function tu(e){if(0!==e.lastExpiredTime)e.callbackExpirationTime=1073741823,e.callbackPriority=99,e.callbackNode=Hl(ru.bind(null,e));else{var t=eu(e),n=e.callbackNode;if(0===t)null!==n&&(e.callbackNode=null,e.callbackExpirationTime=0,e.callbackPriority=90);else{var r=Gi();if(r=1073741823===t?99:1===t||2===t?95:0>=(r=10*(1073741821-t)-10*(1073741821-r))?99:250>=r?98:5250>=r?97:95,null!==n){var l=e.callbackPriority;if(e.callbackExpirationTime===t&&l>=r)return;n!==Il&&Sl(n)}e.callbackExpirationTime=t,e.callbackPriority=r,t=1073741823===t?Hl(ru.bind(null,e)):Ql(r,nu.bind(null,e),{timeout:10*(1073741821-t)-Wl()}),e.callbackNode=t}}}function nu(e,t){if(Yi=0,t)return Au(e,t=Gi()),tu(e),null;var n=eu(e);if(0!==n){if(t=e.callbackNode,0!=(48&Pi))throw Error(o(327));if(bu(),e===_i&&n===Oi||ou(e,n),null!==Ni){var r=Pi;Pi|=16;for(var l=uu();;)try{du();break}catch(t){iu(e,t)}if(ta(),Pi=r,Ei.current=l,1===zi)throw t=Ri,ou(e,n),Du(e,n),tu(e),t;if(null===Ni)switch(l=e.finishedWork=e.current.alternate,e.finishedExpirationTime=n,r=zi,_i=null,r){case Ti:case 1:throw Error(o(345));case 2:Au(e,2<n?2:n);break;case Si:if(Du(e,n),n===(r=e.lastSuspendedTime)&&(e.nextKnownPendingLevel=mu(l)),1073741823===Mi&&10<(l=ji+500-Wl())){if(Di){var a=e.lastPingedTime;if(0===a||a>=n){e.lastPingedTime=n,ou(e,n);break}}if(0!==(a=eu(e))&&a!==n)break;if(0!==r&&r!==n){e.lastPingedTime=r;break}e.timeoutHandle=kn(vu.bind(null,e),l);break}vu(e);break;case Ci:if(Du(e,n),n===(r=e.lastSuspendedTime)&&(e.nextKnownPendingLevel=mu(l)),Di&&(0===(l=e.lastPingedTime)||l>=n)){e.lastPingedTime=n,ou(e,n);break}if(0!==(l=eu(e))&&l!==n)break;if(0!==r&&r!==n){e.lastPingedTime=r;break}if(1073741823!==Ii?r=10*(1073741821-Ii)-Wl():1073741823===Mi?r=0:(r=10*(1073741821-Mi)-5e3,0>(r=(l=Wl())-r)&&(r=0),(n=10*(1073741821-n)-l)<(r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*ki(r/1960))-r)&&(r=n)),10<r){e.timeoutHandle=kn(vu.bind(null,e),r);break}vu(e);break;case 5:if(1073741823!==Mi&&null!==Li){a=Mi;var i=Li;if(0>=(r=0|i.busyMinDurationMs)?r=0:(l=0|i.busyDelayMs,r=(a=Wl()-(10*(1073741821-a)-(0|i.timeoutMs||5e3)))<=l?0:l+r-a),10<r){Du(e,n),e.timeoutHandle=kn(vu.bind(null,e),r);break}}vu(e);break;default:throw Error(o(329))}if(tu(e),e.callbackNode===t)return nu.bind(null,e)}}return null}function ru(e){var t=e.lastExpiredTime;if(t=0!==t?t:1073741823,0!=(48&Pi))throw Error(o(327));if(bu(),e===_i&&t===Oi||ou(e,t),null!==Ni){var n=Pi;Pi|=16;for(var r=uu();;)try{fu();break}catch(t){iu(e,t)}if(ta(),Pi=n,Ei.current=r,1===zi)throw n=Ri,ou(e,t),Du(e,t),tu(e),n;if(null!==Ni)throw Error(o(261));e.finishedWork=e.current.alternate,e.finishedExpirationTime=t,_i=null,vu(e),tu(e)}return null}function lu(e,t){var n=Pi;Pi|=1;try{return e(t)}finally{0===(Pi=n)&&Kl()}}function au(e,t){var n=Pi;Pi&=-2,Pi|=8;try{return e(t)}finally{0===(Pi=n)&&Kl()}}function ou(e,t){e.finishedWork=null,e.finishedExpirationTime=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,En(n)),null!==Ni)for(n=Ni.return;null!==n;){var r=n;switch(r.tag){case 1:null!=(r=r.type.childContextTypes)&&gl();break;case 3:Ia(),sl(hl),sl(pl);break;case 5:Fa(r);break;case 4:Ia();break;case 13:case 19:sl(Da);break;case 10:na(r)}n=n.return}_i=e,Ni=Ou(e.current,null),Oi=t,zi=Ti,Ri=null,Ii=Mi=1073741823,Li=null,Fi=0,Di=!1}function iu(e,t){for(;;){try{if(ta(),Ua.current=go,Ha)for(var n=Ba.memoizedState;null!==n;){var r=n.queue;null!==r&&(r.pending=null),n=n.next}if(Va=0,Qa=$a=Ba=null,Ha=!1,null===Ni||null===Ni.return)return zi=1,Ri=t,Ni=null;e:{var l=e,a=Ni.return,o=Ni,i=t;if(t=Oi,o.effectTag|=2048,o.firstEffect=o.lastEffect=null,null!==i&&"object"==typeof i&&"function"==typeof i.then){var u=i;if(0==(2&o.mode)){var c=o.alternate;c?(o.updateQueue=c.updateQueue,o.memoizedState=c.memoizedState,o.expirationTime=c.expirationTime):(o.updateQueue=null,o.memoizedState=null)}var s=0!=(1&Da.current),f=a;do{var d;if(d=13===f.tag){var p=f.memoizedState;if(null!==p)d=null!==p.dehydrated;else{var h=f.memoizedProps;d=void 0!==h.fallback&&(!0!==h.unstable_avoidThisFallback||!s)}}if(d){var m=f.updateQueue;if(null===m){var v=new Set;v.add(u),f.updateQueue=v}else m.add(u);if(0==(2&f.mode)){if(f.effectTag|=64,o.effectTag&=-2981,1===o.tag)if(null===o.alternate)o.tag=17;else{var y=ca(1073741823,null);y.tag=2,sa(o,y)}o.expirationTime=1073741823;break e}i=void 0,o=t;var g=l.pingCache;if(null===g?(g=l.pingCache=new yi,i=new Set,g.set(u,i)):void 0===(i=g.get(u))&&(i=new Set,g.set(u,i)),!i.has(o)){i.add(o);var b=xu.bind(null,l,u,o);u.then(b,b)}f.effectTag|=4096,f.expirationTime=t;break e}f=f.return}while(null!==f);i=Error((ve(o.type)||"A React component")+" suspended while rendering, but no fallback UI was specified.\n\nAdd a <Suspense fallback=...> component higher in the tree to provide a loading indicator or placeholder to display."+ye(o))}5!==zi&&(zi=2),i=ei(i,o),f=a;do{switch(f.tag){case 3:u=i,f.effectTag|=4096,f.expirationTime=t,fa(f,gi(f,u,t));break e;case 1:u=i;var w=f.type,k=f.stateNode;if(0==(64&f.effectTag)&&("function"==typeof w.getDerivedStateFromError||null!==k&&"function"==typeof k.componentDidCatch&&(null===Vi||!Vi.has(k)))){f.effectTag|=4096,f.expirationTime=t,fa(f,bi(f,u,t));break e}}f=f.return}while(null!==f)}Ni=hu(Ni)}catch(e){t=e;continue}break}}function uu(){var e=Ei.current;return Ei.current=go,null===e?go:e}function cu(e,t){e<Mi&&2<e&&(Mi=e),null!==t&&e<Ii&&2<e&&(Ii=e,Li=t)}function su(e){e>Fi&&(Fi=e)}function fu(){for(;null!==Ni;)Ni=pu(Ni)}function du(){for(;null!==Ni&&!Ll();)Ni=pu(Ni)}function pu(e){var t=wi(e.alternate,e,Oi);return e.memoizedProps=e.pendingProps,null===t&&(t=hu(e)),xi.current=null,t}function hu(e){Ni=e;do{var t=Ni.alternate;if(e=Ni.return,0==(2048&Ni.effectTag)){if(t=Zo(t,Ni,Oi),1===Oi||1!==Ni.childExpirationTime){for(var n=0,r=Ni.child;null!==r;){var l=r.expirationTime,a=r.childExpirationTime;l>n&&(n=l),a>n&&(n=a),r=r.sibling}Ni.childExpirationTime=n}if(null!==t)return t;null!==e&&0==(2048&e.effectTag)&&(null===e.firstEffect&&(e.firstEffect=Ni.firstEffect),null!==Ni.lastEffect&&(null!==e.lastEffect&&(e.lastEffect.nextEffect=Ni.firstEffect),e.lastEffect=Ni.lastEffect),1<Ni.effectTag&&(null!==e.lastEffect?e.lastEffect.nextEffect=Ni:e.firstEffect=Ni,e.lastEffect=Ni))}else{if(null!==(t=Jo(Ni)))return t.effectTag&=2047,t;null!==e&&(e.firstEffect=e.lastEffect=null,e.effectTag|=2048)}if(null!==(t=Ni.sibling))return t;Ni=e}while(null!==Ni);return zi===Ti&&(zi=5),null}function mu(e){var t=e.expirationTime;return t>(e=e.childExpirationTime)?t:e}function vu(e){var t=Vl();return $l(99,yu.bind(null,e,t)),null}function yu(e,t){do{bu()}while(null!==$i);if(0!=(48&Pi))throw Error(o(327));var n=e.finishedWork,r=e.finishedExpirationTime;if(null===n)return null;if(e.finishedWork=null,e.finishedExpirationTime=0,n===e.current)throw Error(o(177));e.callbackNode=null,e.callbackExpirationTime=0,e.callbackPriority=90,e.nextKnownPendingLevel=0;var l=mu(n);if(e.firstPendingTime=l,r<=e.lastSuspendedTime?e.firstSuspendedTime=e.lastSuspendedTime=e.nextKnownPendingLevel=0:r<=e.firstSuspendedTime&&(e.firstSuspendedTime=r-1),r<=e.lastPingedTime&&(e.lastPingedTime=0),r<=e.lastExpiredTime&&(e.lastExpiredTime=0),e===_i&&(Ni=_i=null,Oi=0),1<n.effectTag?null!==n.lastEffect?(n.lastEffect.nextEffect=n,l=n.firstEffect):l=n:l=n.firstEffect,null!==l){var a=Pi;Pi|=32,xi.current=null,yn=Qt;var i=pn();if(hn(i)){if("selectionStart"in i)var u={start:i.selectionStart,end:i.selectionEnd};else e:{var c=(u=(u=i.ownerDocument)&&u.defaultView||window).getSelection&&u.getSelection();if(c&&0!==c.rangeCount){u=c.anchorNode;var s=c.anchorOffset,f=c.focusNode;c=c.focusOffset;try{u.nodeType,f.nodeType}catch(e){u=null;break e}var d=0,p=-1,h=-1,m=0,v=0,y=i,g=null;t:for(;;){for(var b;y!==u||0!==s&&3!==y.nodeType||(p=d+s),y!==f||0!==c&&3!==y.nodeType||(h=d+c),3===y.nodeType&&(d+=y.nodeValue.length),null!==(b=y.firstChild);)g=y,y=b;for(;;){if(y===i)break t;if(g===u&&++m===s&&(p=d),g===f&&++v===c&&(h=d),null!==(b=y.nextSibling))break;g=(y=g).parentNode}y=b}u=-1===p||-1===h?null:{start:p,end:h}}else u=null}u=u||{start:0,end:0}}else u=null;gn={activeElementDetached:null,focusedElem:i,selectionRange:u},Qt=!1,Ai=l;do{try{gu()}catch(e){if(null===Ai)throw Error(o(330));Eu(Ai,e),Ai=Ai.nextEffect}}while(null!==Ai);Ai=l;do{try{for(i=e,u=t;null!==Ai;){var w=Ai.effectTag;if(16&w&&Ae(Ai.stateNode,""),128&w){var k=Ai.alternate;if(null!==k){var E=k.ref;null!==E&&("function"==typeof E?E(null):E.current=null)}}switch(1038&w){case 2:fi(Ai),Ai.effectTag&=-3;break;case 6:fi(Ai),Ai.effectTag&=-3,mi(Ai.alternate,Ai);break;case 1024:Ai.effectTag&=-1025;break;case 1028:Ai.effectTag&=-1025,mi(Ai.alternate,Ai);break;case 4:mi(Ai.alternate,Ai);break;case 8:hi(i,s=Ai,u),ci(s)}Ai=Ai.nextEffect}}catch(e){if(null===Ai)throw Error(o(330));Eu(Ai,e),Ai=Ai.nextEffect}}while(null!==Ai);if(E=gn,k=pn(),w=E.focusedElem,u=E.selectionRange,k!==w&&w&&w.ownerDocument&&dn(w.ownerDocument.documentElement,w)){null!==u&&hn(w)&&(k=u.start,void 0===(E=u.end)&&(E=k),"selectionStart"in w?(w.selectionStart=k,w.selectionEnd=Math.min(E,w.value.length)):(E=(k=w.ownerDocument||document)&&k.defaultView||window).getSelection&&(E=E.getSelection(),s=w.textContent.length,i=Math.min(u.start,s),u=void 0===u.end?i:Math.min(u.end,s),!E.extend&&i>u&&(s=u,u=i,i=s),s=fn(w,i),f=fn(w,u),s&&f&&(1!==E.rangeCount||E.anchorNode!==s.node||E.anchorOffset!==s.offset||E.focusNode!==f.node||E.focusOffset!==f.offset)&&((k=k.createRange()).setStart(s.node,s.offset),E.removeAllRanges(),i>u?(E.addRange(k),E.extend(f.node,f.offset)):(k.setEnd(f.node,f.offset),E.addRange(k))))),k=[];for(E=w;E=E.parentNode;)1===E.nodeType&&k.push({element:E,left:E.scrollLeft,top:E.scrollTop});for("function"==typeof w.focus&&w.focus(),w=0;w<k.length;w++)(E=k[w]).element.scrollLeft=E.left,E.element.scrollTop=E.top}Qt=!!yn,gn=yn=null,e.current=n,Ai=l;do{try{for(w=e;null!==Ai;){var x=Ai.effectTag;if(36&x&&ii(w,Ai.alternate,Ai),128&x){k=void 0;var T=Ai.ref;if(null!==T){var S=Ai.stateNode;Ai.tag,k=S,"function"==typeof T?T(k):T.current=k}}Ai=Ai.nextEffect}}catch(e){if(null===Ai)throw Error(o(330));Eu(Ai,e),Ai=Ai.nextEffect}}while(null!==Ai);Ai=null,Fl(),Pi=a}else e.current=n;if(Bi)Bi=!1,$i=e,Qi=t;else for(Ai=l;null!==Ai;)t=Ai.nextEffect,Ai.nextEffect=null,Ai=t;if(0===(t=e.firstPendingTime)&&(Vi=null),1073741823===t?e===qi?Ki++:(Ki=0,qi=e):Ki=0,"function"==typeof Su&&Su(n.stateNode,r),tu(e),Ui)throw Ui=!1,e=Wi,Wi=null,e;return 0!=(8&Pi)||Kl(),null}function gu(){for(;null!==Ai;){var e=Ai.effectTag;0!=(256&e)&&li(Ai.alternate,Ai),0==(512&e)||Bi||(Bi=!0,Ql(97,(function(){return bu(),null}))),Ai=Ai.nextEffect}}function bu(){if(90!==Qi){var e=97<Qi?97:Qi;return Qi=90,$l(e,wu)}}function wu(){if(null===$i)return!1;var e=$i;if($i=null,0!=(48&Pi))throw Error(o(331));var t=Pi;for(Pi|=32,e=e.current.firstEffect;null!==e;){try{var n=e;if(0!=(512&n.effectTag))switch(n.tag){case 0:case 11:case 15:case 22:ai(5,n),oi(5,n)}}catch(t){if(null===e)throw Error(o(330));Eu(e,t)}n=e.nextEffect,e.nextEffect=null,e=n}return Pi=t,Kl(),!0}function ku(e,t,n){sa(e,t=gi(e,t=ei(n,t),1073741823)),null!==(e=Ji(e,1073741823))&&tu(e)}function Eu(e,t){if(3===e.tag)ku(e,e,t);else for(var n=e.return;null!==n;){if(3===n.tag){ku(n,e,t);break}if(1===n.tag){var r=n.stateNode;if("function"==typeof n.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Vi||!Vi.has(r))){sa(n,e=bi(n,e=ei(t,e),1073741823)),null!==(n=Ji(n,1073741823))&&tu(n);break}}n=n.return}}function xu(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),_i===e&&Oi===n?zi===Ci||zi===Si&&1073741823===Mi&&Wl()-ji<500?ou(e,Oi):Di=!0:Fu(e,n)&&(0!==(t=e.lastPingedTime)&&t<n||(e.lastPingedTime=n,tu(e)))}function Tu(e,t){var n=e.stateNode;null!==n&&n.delete(t),0==(t=0)&&(t=Xi(t=Gi(),e,null)),null!==(e=Ji(e,t))&&tu(e)}wi=function(e,t,n){var r=t.expirationTime;if(null!==e){var l=t.pendingProps;if(e.memoizedProps!==l||hl.current)Ro=!0;else{if(r<n){switch(Ro=!1,t.tag){case 3:Wo(t),Oo();break;case 5:if(La(t),4&t.mode&&1!==n&&l.hidden)return t.expirationTime=t.childExpirationTime=1,null;break;case 1:yl(t.type)&&kl(t);break;case 4:Ma(t,t.stateNode.containerInfo);break;case 10:r=t.memoizedProps.value,l=t.type._context,fl(Xl,l._currentValue),l._currentValue=r;break;case 13:if(null!==t.memoizedState)return 0!==(r=t.child.childExpirationTime)&&r>=n?Ho(e,t,n):(fl(Da,1&Da.current),null!==(t=Go(e,t,n))?t.sibling:null);fl(Da,1&Da.current);break;case 19:if(r=t.childExpirationTime>=n,0!=(64&e.effectTag)){if(r)return Yo(e,t,n);t.effectTag|=64}if(null!==(l=t.memoizedState)&&(l.rendering=null,l.tail=null),fl(Da,Da.current),!r)return null}return Go(e,t,n)}Ro=!1}}else Ro=!1;switch(t.expirationTime=0,t.tag){case 2:if(r=t.type,null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),e=t.pendingProps,l=vl(t,pl.current),la(t,n),l=Ya(null,t,r,e,l,n),t.effectTag|=1,"object"==typeof l&&null!==l&&"function"==typeof l.render&&void 0===l.$$typeof){if(t.tag=1,t.memoizedState=null,t.updateQueue=null,yl(r)){var a=!0;kl(t)}else a=!1;t.memoizedState=null!==l.state&&void 0!==l.state?l.state:null,ia(t);var i=r.getDerivedStateFromProps;"function"==typeof i&&va(t,r,i,e),l.updater=ya,t.stateNode=l,l._reactInternalFiber=t,ka(t,r,e,n),t=Uo(null,t,r,!0,a,n)}else t.tag=0,Mo(null,t,l,n),t=t.child;return t;case 16:e:{if(l=t.elementType,null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),e=t.pendingProps,function(e){if(-1===e._status){e._status=0;var t=e._ctor;t=t(),e._result=t,t.then((function(t){0===e._status&&(t=t.default,e._status=1,e._result=t)}),(function(t){0===e._status&&(e._status=2,e._result=t)}))}}(l),1!==l._status)throw l._result;switch(l=l._result,t.type=l,a=t.tag=function(e){if("function"==typeof e)return Nu(e)?1:0;if(null!=e){if((e=e.$$typeof)===ue)return 11;if(e===fe)return 14}return 2}(l),e=Gl(l,e),a){case 0:t=jo(null,t,l,e,n);break e;case 1:t=Ao(null,t,l,e,n);break e;case 11:t=Io(null,t,l,e,n);break e;case 14:t=Lo(null,t,l,Gl(l.type,e),r,n);break e}throw Error(o(306,l,""))}return t;case 0:return r=t.type,l=t.pendingProps,jo(e,t,r,l=t.elementType===r?l:Gl(r,l),n);case 1:return r=t.type,l=t.pendingProps,Ao(e,t,r,l=t.elementType===r?l:Gl(r,l),n);case 3:if(Wo(t),r=t.updateQueue,null===e||null===r)throw Error(o(282));if(r=t.pendingProps,l=null!==(l=t.memoizedState)?l.element:null,ua(e,t),da(t,r,null,n),(r=t.memoizedState.element)===l)Oo(),t=Go(e,t,n);else{if((l=t.stateNode.hydrate)&&(xo=xn(t.stateNode.containerInfo.firstChild),Eo=t,l=To=!0),l)for(n=Pa(t,null,r,n),t.child=n;n;)n.effectTag=-3&n.effectTag|1024,n=n.sibling;else Mo(e,t,r,n),Oo();t=t.child}return t;case 5:return La(t),null===e&&Po(t),r=t.type,l=t.pendingProps,a=null!==e?e.memoizedProps:null,i=l.children,wn(r,l)?i=null:null!==a&&wn(r,a)&&(t.effectTag|=16),Do(e,t),4&t.mode&&1!==n&&l.hidden?(t.expirationTime=t.childExpirationTime=1,t=null):(Mo(e,t,i,n),t=t.child),t;case 6:return null===e&&Po(t),null;case 13:return Ho(e,t,n);case 4:return Ma(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=Ca(t,null,r,n):Mo(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,Io(e,t,r,l=t.elementType===r?l:Gl(r,l),n);case 7:return Mo(e,t,t.pendingProps,n),t.child;case 8:case 12:return Mo(e,t,t.pendingProps.children,n),t.child;case 10:e:{r=t.type._context,l=t.pendingProps,i=t.memoizedProps,a=l.value;var u=t.type._context;if(fl(Xl,u._currentValue),u._currentValue=a,null!==i)if(u=i.value,0==(a=Ar(u,a)?0:0|("function"==typeof r._calculateChangedBits?r._calculateChangedBits(u,a):1073741823))){if(i.children===l.children&&!hl.current){t=Go(e,t,n);break e}}else for(null!==(u=t.child)&&(u.return=t);null!==u;){var c=u.dependencies;if(null!==c){i=u.child;for(var s=c.firstContext;null!==s;){if(s.context===r&&0!=(s.observedBits&a)){1===u.tag&&((s=ca(n,null)).tag=2,sa(u,s)),u.expirationTime<n&&(u.expirationTime=n),null!==(s=u.alternate)&&s.expirationTime<n&&(s.expirationTime=n),ra(u.return,n),c.expirationTime<n&&(c.expirationTime=n);break}s=s.next}}else i=10===u.tag&&u.type===t.type?null:u.child;if(null!==i)i.return=u;else for(i=u;null!==i;){if(i===t){i=null;break}if(null!==(u=i.sibling)){u.return=i.return,i=u;break}i=i.return}u=i}Mo(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=(a=t.pendingProps).children,la(t,n),r=r(l=aa(l,a.unstable_observedBits)),t.effectTag|=1,Mo(e,t,r,n),t.child;case 14:return a=Gl(l=t.type,t.pendingProps),Lo(e,t,l,a=Gl(l.type,a),r,n);case 15:return Fo(e,t,t.type,t.pendingProps,r,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Gl(r,l),null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),t.tag=1,yl(r)?(e=!0,kl(t)):e=!1,la(t,n),ba(t,r,l),ka(t,r,l,n),Uo(null,t,r,!0,e,n);case 19:return Yo(e,t,n)}throw Error(o(156,t.tag))};var Su=null,Cu=null;function Pu(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.effectTag=0,this.lastEffect=this.firstEffect=this.nextEffect=null,this.childExpirationTime=this.expirationTime=0,this.alternate=null}function _u(e,t,n,r){return new Pu(e,t,n,r)}function Nu(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Ou(e,t){var n=e.alternate;return null===n?((n=_u(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.effectTag=0,n.nextEffect=null,n.firstEffect=null,n.lastEffect=null),n.childExpirationTime=e.childExpirationTime,n.expirationTime=e.expirationTime,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{expirationTime:t.expirationTime,firstContext:t.firstContext,responders:t.responders},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function zu(e,t,n,r,l,a){var i=2;if(r=e,"function"==typeof e)Nu(e)&&(i=1);else if("string"==typeof e)i=5;else e:switch(e){case ne:return Ru(n.children,l,a,t);case ie:i=8,l|=7;break;case re:i=8,l|=1;break;case le:return(e=_u(12,n,t,8|l)).elementType=le,e.type=le,e.expirationTime=a,e;case ce:return(e=_u(13,n,t,l)).type=ce,e.elementType=ce,e.expirationTime=a,e;case se:return(e=_u(19,n,t,l)).elementType=se,e.expirationTime=a,e;default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case ae:i=10;break e;case oe:i=9;break e;case ue:i=11;break e;case fe:i=14;break e;case de:i=16,r=null;break e;case pe:i=22;break e}throw Error(o(130,null==e?e:typeof e,""))}return(t=_u(i,n,t,l)).elementType=e,t.type=r,t.expirationTime=a,t}function Ru(e,t,n,r){return(e=_u(7,e,r,t)).expirationTime=n,e}function Mu(e,t,n){return(e=_u(6,e,null,t)).expirationTime=n,e}function Iu(e,t,n){return(t=_u(4,null!==e.children?e.children:[],e.key,t)).expirationTime=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Lu(e,t,n){this.tag=t,this.current=null,this.containerInfo=e,this.pingCache=this.pendingChildren=null,this.finishedExpirationTime=0,this.finishedWork=null,this.timeoutHandle=-1,this.pendingContext=this.context=null,this.hydrate=n,this.callbackNode=null,this.callbackPriority=90,this.lastExpiredTime=this.lastPingedTime=this.nextKnownPendingLevel=this.lastSuspendedTime=this.firstSuspendedTime=this.firstPendingTime=0}function Fu(e,t){var n=e.firstSuspendedTime;return e=e.lastSuspendedTime,0!==n&&n>=t&&e<=t}function Du(e,t){var n=e.firstSuspendedTime,r=e.lastSuspendedTime;n<t&&(e.firstSuspendedTime=t),(r>t||0===n)&&(e.lastSuspendedTime=t),t<=e.lastPingedTime&&(e.lastPingedTime=0),t<=e.lastExpiredTime&&(e.lastExpiredTime=0)}function ju(e,t){t>e.firstPendingTime&&(e.firstPendingTime=t);var n=e.firstSuspendedTime;0!==n&&(t>=n?e.firstSuspendedTime=e.lastSuspendedTime=e.nextKnownPendingLevel=0:t>=e.lastSuspendedTime&&(e.lastSuspendedTime=t+1),t>e.nextKnownPendingLevel&&(e.nextKnownPendingLevel=t))}function Au(e,t){var n=e.lastExpiredTime;(0===n||n>t)&&(e.lastExpiredTime=t)}function Uu(e,t,n,r){var l=t.current,a=Gi(),i=ha.suspense;a=Xi(a,l,i);e:if(n){t:{if(Ze(n=n._reactInternalFiber)!==n||1!==n.tag)throw Error(o(170));var u=n;do{switch(u.tag){case 3:u=u.stateNode.context;break t;case 1:if(yl(u.type)){u=u.stateNode.__reactInternalMemoizedMergedChildContext;break t}}u=u.return}while(null!==u);throw Error(o(171))}if(1===n.tag){var c=n.type;if(yl(c)){n=wl(n,c,u);break e}}n=u}else n=dl;return null===t.context?t.context=n:t.pendingContext=n,(t=ca(a,i)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),sa(l,t),Zi(l,a),a}function Wu(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function Vu(e,t){null!==(e=e.memoizedState)&&null!==e.dehydrated&&e.retryTime<t&&(e.retryTime=t)}function Bu(e,t){Vu(e,t),(e=e.alternate)&&Vu(e,t)}function $u(e,t,n){var r=new Lu(e,t,n=null!=n&&!0===n.hydrate),l=_u(3,null,null,2===t?7:1===t?3:0);r.current=l,l.stateNode=r,ia(l),e[_n]=r.current,n&&0!==t&&function(e,t){var n=Xe(t);St.forEach((function(e){pt(e,t,n)})),Ct.forEach((function(e){pt(e,t,n)}))}(0,9===e.nodeType?e:e.ownerDocument),this._internalRoot=r}function Qu(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Hu(e,t,n,r,l){var a=n._reactRootContainer;if(a){var o=a._internalRoot;if("function"==typeof l){var i=l;l=function(){var e=Wu(o);i.call(e)}}Uu(t,o,e,l)}else{if(a=n._reactRootContainer=function(e,t){if(t||(t=!(!(t=e?9===e.nodeType?e.documentElement:e.firstChild:null)||1!==t.nodeType||!t.hasAttribute("data-reactroot"))),!t)for(var n;n=e.lastChild;)e.removeChild(n);return new $u(e,0,t?{hydrate:!0}:void 0)}(n,r),o=a._internalRoot,"function"==typeof l){var u=l;l=function(){var e=Wu(o);u.call(e)}}au((function(){Uu(t,o,e,l)}))}return Wu(o)}function Ku(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:te,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}function qu(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Qu(t))throw Error(o(200));return Ku(e,t,null,n)}$u.prototype.render=function(e){Uu(e,this._internalRoot,null,null)},$u.prototype.unmount=function(){var e=this._internalRoot,t=e.containerInfo;Uu(null,e,null,(function(){t[_n]=null}))},ht=function(e){if(13===e.tag){var t=Yl(Gi(),150,100);Zi(e,t),Bu(e,t)}},mt=function(e){13===e.tag&&(Zi(e,3),Bu(e,3))},vt=function(e){if(13===e.tag){var t=Gi();Zi(e,t=Xi(t,e,null)),Bu(e,t)}},_=function(e,t,n){switch(t){case"input":if(Se(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=Rn(r);if(!l)throw Error(o(90));ke(r),Se(r,l)}}}break;case"textarea":Re(e,n);break;case"select":null!=(t=n.value)&&Ne(e,!!n.multiple,t,!1)}},I=lu,L=function(e,t,n,r,l){var a=Pi;Pi|=4;try{return $l(98,e.bind(null,t,n,r,l))}finally{0===(Pi=a)&&Kl()}},F=function(){0==(49&Pi)&&(function(){if(null!==Hi){var e=Hi;Hi=null,e.forEach((function(e,t){Au(t,e),tu(t)})),Kl()}}(),bu())},D=function(e,t){var n=Pi;Pi|=2;try{return e(t)}finally{0===(Pi=n)&&Kl()}};var Yu={Events:[On,zn,Rn,C,x,An,function(e){rt(e,jn)},R,M,Gt,ot,bu,{current:!1}]};!function(e){var t=e.findFiberByHostInstance;!function(e){if("undefined"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__)return!1;var t=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(t.isDisabled||!t.supportsFiber)return!0;try{var n=t.inject(e);Su=function(e){try{t.onCommitFiberRoot(n,e,void 0,64==(64&e.current.effectTag))}catch(e){}},Cu=function(e){try{t.onCommitFiberUnmount(n,e)}catch(e){}}}catch(e){}}(l({},e,{overrideHookState:null,overrideProps:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:G.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=tt(e))?null:e.stateNode},findFiberByHostInstance:function(e){return t?t(e):null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null}))}({findFiberByHostInstance:Nn,bundleType:0,version:"16.14.0",rendererPackageName:"react-dom"}),t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Yu,t.createPortal=qu,t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternalFiber;if(void 0===t){if("function"==typeof e.render)throw Error(o(188));throw Error(o(268,Object.keys(e)))}return null===(e=tt(t))?null:e.stateNode},t.flushSync=function(e,t){if(0!=(48&Pi))throw Error(o(187));var n=Pi;Pi|=1;try{return $l(99,e.bind(null,t))}finally{Pi=n,Kl()}},t.hydrate=function(e,t,n){if(!Qu(t))throw Error(o(200));return Hu(null,e,t,!0,n)},t.render=function(e,t,n){if(!Qu(t))throw Error(o(200));return Hu(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!Qu(e))throw Error(o(40));return!!e._reactRootContainer&&(au((function(){Hu(null,null,e,!1,(function(){e._reactRootContainer=null,e[_n]=null}))})),!0)},t.unstable_batchedUpdates=lu,t.unstable_createPortal=function(e,t){return qu(e,t,2<arguments.length&&void 0!==arguments[2]?arguments[2]:null)},t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Qu(n))throw Error(o(200));if(null==e||void 0===e._reactInternalFiber)throw Error(o(38));return Hu(e,t,n,!1,r)},t.version="16.14.0"},935:(e,t,n)=>{"use strict";!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=n(448)},408:(e,t,n)=>{"use strict";var r=n(418),l="function"==typeof Symbol&&Symbol.for,a=l?Symbol.for("react.element"):60103,o=l?Symbol.for("react.portal"):60106,i=l?Symbol.for("react.fragment"):60107,u=l?Symbol.for("react.strict_mode"):60108,c=l?Symbol.for("react.profiler"):60114,s=l?Symbol.for("react.provider"):60109,f=l?Symbol.for("react.context"):60110,d=l?Symbol.for("react.forward_ref"):60112,p=l?Symbol.for("react.suspense"):60113,h=l?Symbol.for("react.memo"):60115,m=l?Symbol.for("react.lazy"):60116,v="function"==typeof Symbol&&Symbol.iterator;function y(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var g={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},b={};function w(e,t,n){this.props=e,this.context=t,this.refs=b,this.updater=n||g}function k(){}function E(e,t,n){this.props=e,this.context=t,this.refs=b,this.updater=n||g}w.prototype.isReactComponent={},w.prototype.setState=function(e,t){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error(y(85));this.updater.enqueueSetState(this,e,t,"setState")},w.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},k.prototype=w.prototype;var x=E.prototype=new k;x.constructor=E,r(x,w.prototype),x.isPureReactComponent=!0;var T={current:null},S=Object.prototype.hasOwnProperty,C={key:!0,ref:!0,__self:!0,__source:!0};function P(e,t,n){var r,l={},o=null,i=null;if(null!=t)for(r in void 0!==t.ref&&(i=t.ref),void 0!==t.key&&(o=""+t.key),t)S.call(t,r)&&!C.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(1===u)l.children=n;else if(1<u){for(var c=Array(u),s=0;s<u;s++)c[s]=arguments[s+2];l.children=c}if(e&&e.defaultProps)for(r in u=e.defaultProps)void 0===l[r]&&(l[r]=u[r]);return{$$typeof:a,type:e,key:o,ref:i,props:l,_owner:T.current}}function _(e){return"object"==typeof e&&null!==e&&e.$$typeof===a}var N=/\/+/g,O=[];function z(e,t,n,r){if(O.length){var l=O.pop();return l.result=e,l.keyPrefix=t,l.func=n,l.context=r,l.count=0,l}return{result:e,keyPrefix:t,func:n,context:r,count:0}}function R(e){e.result=null,e.keyPrefix=null,e.func=null,e.context=null,e.count=0,10>O.length&&O.push(e)}function M(e,t,n,r){var l=typeof e;"undefined"!==l&&"boolean"!==l||(e=null);var i=!1;if(null===e)i=!0;else switch(l){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case a:case o:i=!0}}if(i)return n(r,e,""===t?"."+L(e,0):t),1;if(i=0,t=""===t?".":t+":",Array.isArray(e))for(var u=0;u<e.length;u++){var c=t+L(l=e[u],u);i+=M(l,c,n,r)}else if("function"==typeof(c=null===e||"object"!=typeof e?null:"function"==typeof(c=v&&e[v]||e["@@iterator"])?c:null))for(e=c.call(e),u=0;!(l=e.next()).done;)i+=M(l=l.value,c=t+L(l,u++),n,r);else if("object"===l)throw n=""+e,Error(y(31,"[object Object]"===n?"object with keys {"+Object.keys(e).join(", ")+"}":n,""));return i}function I(e,t,n){return null==e?0:M(e,"",t,n)}function L(e,t){return"object"==typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+(""+e).replace(/[=:]/g,(function(e){return t[e]}))}(e.key):t.toString(36)}function F(e,t){e.func.call(e.context,t,e.count++)}function D(e,t,n){var r=e.result,l=e.keyPrefix;e=e.func.call(e.context,t,e.count++),Array.isArray(e)?j(e,r,n,(function(e){return e})):null!=e&&(_(e)&&(e=function(e,t){return{$$typeof:a,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(e,l+(!e.key||t&&t.key===e.key?"":(""+e.key).replace(N,"$&/")+"/")+n)),r.push(e))}function j(e,t,n,r,l){var a="";null!=n&&(a=(""+n).replace(N,"$&/")+"/"),I(e,D,t=z(t,a,r,l)),R(t)}var A={current:null};function U(){var e=A.current;if(null===e)throw Error(y(321));return e}var W={ReactCurrentDispatcher:A,ReactCurrentBatchConfig:{suspense:null},ReactCurrentOwner:T,IsSomeRendererActing:{current:!1},assign:r};t.Children={map:function(e,t,n){if(null==e)return e;var r=[];return j(e,r,null,t,n),r},forEach:function(e,t,n){if(null==e)return e;I(e,F,t=z(null,null,t,n)),R(t)},count:function(e){return I(e,(function(){return null}),null)},toArray:function(e){var t=[];return j(e,t,null,(function(e){return e})),t},only:function(e){if(!_(e))throw Error(y(143));return e}},t.Component=w,t.Fragment=i,t.Profiler=c,t.PureComponent=E,t.StrictMode=u,t.Suspense=p,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=W,t.cloneElement=function(e,t,n){if(null==e)throw Error(y(267,e));var l=r({},e.props),o=e.key,i=e.ref,u=e._owner;if(null!=t){if(void 0!==t.ref&&(i=t.ref,u=T.current),void 0!==t.key&&(o=""+t.key),e.type&&e.type.defaultProps)var c=e.type.defaultProps;for(s in t)S.call(t,s)&&!C.hasOwnProperty(s)&&(l[s]=void 0===t[s]&&void 0!==c?c[s]:t[s])}var s=arguments.length-2;if(1===s)l.children=n;else if(1<s){c=Array(s);for(var f=0;f<s;f++)c[f]=arguments[f+2];l.children=c}return{$$typeof:a,type:e.type,key:o,ref:i,props:l,_owner:u}},t.createContext=function(e,t){return void 0===t&&(t=null),(e={$$typeof:f,_calculateChangedBits:t,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:s,_context:e},e.Consumer=e},t.createElement=P,t.createFactory=function(e){var t=P.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:d,render:e}},t.isValidElement=_,t.lazy=function(e){return{$$typeof:m,_ctor:e,_status:-1,_result:null}},t.memo=function(e,t){return{$$typeof:h,type:e,compare:void 0===t?null:t}},t.useCallback=function(e,t){return U().useCallback(e,t)},t.useContext=function(e,t){return U().useContext(e,t)},t.useDebugValue=function(){},t.useEffect=function(e,t){return U().useEffect(e,t)},t.useImperativeHandle=function(e,t,n){return U().useImperativeHandle(e,t,n)},t.useLayoutEffect=function(e,t){return U().useLayoutEffect(e,t)},t.useMemo=function(e,t){return U().useMemo(e,t)},t.useReducer=function(e,t,n){return U().useReducer(e,t,n)},t.useRef=function(e){return U().useRef(e)},t.useState=function(e){return U().useState(e)},t.version="16.14.0"},294:(e,t,n)=>{"use strict";e.exports=n(408)},666:e=>{var t=function(e){"use strict";var t,n=Object.prototype,r=n.hasOwnProperty,l="function"==typeof Symbol?Symbol:{},a=l.iterator||"@@iterator",o=l.asyncIterator||"@@asyncIterator",i=l.toStringTag||"@@toStringTag";function u(e,t,n){return Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}),e[t]}try{u({},"")}catch(e){u=function(e,t,n){return e[t]=n}}function c(e,t,n,r){var l=t&&t.prototype instanceof v?t:v,a=Object.create(l.prototype),o=new _(r||[]);return a._invoke=function(e,t,n){var r=f;return function(l,a){if(r===p)throw new Error("Generator is already running");if(r===h){if("throw"===l)throw a;return O()}for(n.method=l,n.arg=a;;){var o=n.delegate;if(o){var i=S(o,n);if(i){if(i===m)continue;return i}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(r===f)throw r=h,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);r=p;var u=s(e,t,n);if("normal"===u.type){if(r=n.done?h:d,u.arg===m)continue;return{value:u.arg,done:n.done}}"throw"===u.type&&(r=h,n.method="throw",n.arg=u.arg)}}}(e,n,o),a}function s(e,t,n){try{return{type:"normal",arg:e.call(t,n)}}catch(e){return{type:"throw",arg:e}}}e.wrap=c;var f="suspendedStart",d="suspendedYield",p="executing",h="completed",m={};function v(){}function y(){}function g(){}var b={};u(b,a,(function(){return this}));var w=Object.getPrototypeOf,k=w&&w(w(N([])));k&&k!==n&&r.call(k,a)&&(b=k);var E=g.prototype=v.prototype=Object.create(b);function x(e){["next","throw","return"].forEach((function(t){u(e,t,(function(e){return this._invoke(t,e)}))}))}function T(e,t){function n(l,a,o,i){var u=s(e[l],e,a);if("throw"!==u.type){var c=u.arg,f=c.value;return f&&"object"==typeof f&&r.call(f,"__await")?t.resolve(f.__await).then((function(e){n("next",e,o,i)}),(function(e){n("throw",e,o,i)})):t.resolve(f).then((function(e){c.value=e,o(c)}),(function(e){return n("throw",e,o,i)}))}i(u.arg)}var l;this._invoke=function(e,r){function a(){return new t((function(t,l){n(e,r,t,l)}))}return l=l?l.then(a,a):a()}}function S(e,n){var r=e.iterator[n.method];if(r===t){if(n.delegate=null,"throw"===n.method){if(e.iterator.return&&(n.method="return",n.arg=t,S(e,n),"throw"===n.method))return m;n.method="throw",n.arg=new TypeError("The iterator does not provide a 'throw' method")}return m}var l=s(r,e.iterator,n.arg);if("throw"===l.type)return n.method="throw",n.arg=l.arg,n.delegate=null,m;var a=l.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function C(e){var t={tryLoc:e[0]};1 in e&&(t.catchLoc=e[1]),2 in e&&(t.finallyLoc=e[2],t.afterLoc=e[3]),this.tryEntries.push(t)}function P(e){var t=e.completion||{};t.type="normal",delete t.arg,e.completion=t}function _(e){this.tryEntries=[{tryLoc:"root"}],e.forEach(C,this),this.reset(!0)}function N(e){if(e){var n=e[a];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var l=-1,o=function n(){for(;++l<e.length;)if(r.call(e,l))return n.value=e[l],n.done=!1,n;return n.value=t,n.done=!0,n};return o.next=o}}return{next:O}}function O(){return{value:t,done:!0}}return y.prototype=g,u(E,"constructor",g),u(g,"constructor",y),y.displayName=u(g,i,"GeneratorFunction"),e.isGeneratorFunction=function(e){var t="function"==typeof e&&e.constructor;return!!t&&(t===y||"GeneratorFunction"===(t.displayName||t.name))},e.mark=function(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,g):(e.__proto__=g,u(e,i,"GeneratorFunction")),e.prototype=Object.create(E),e},e.awrap=function(e){return{__await:e}},x(T.prototype),u(T.prototype,o,(function(){return this})),e.AsyncIterator=T,e.async=function(t,n,r,l,a){void 0===a&&(a=Promise);var o=new T(c(t,n,r,l),a);return e.isGeneratorFunction(n)?o:o.next().then((function(e){return e.done?e.value:o.next()}))},x(E),u(E,i,"Generator"),u(E,a,(function(){return this})),u(E,"toString",(function(){return"[object Generator]"})),e.keys=function(e){var t=[];for(var n in e)t.push(n);return t.reverse(),function n(){for(;t.length;){var r=t.pop();if(r in e)return n.value=r,n.done=!1,n}return n.done=!0,n}},e.values=N,_.prototype={constructor:_,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(P),!e)for(var n in this)"t"===n.charAt(0)&&r.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var e=this.tryEntries[0].completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function l(r,l){return i.type="throw",i.arg=e,n.next=r,l&&(n.method="next",n.arg=t),!!l}for(var a=this.tryEntries.length-1;a>=0;--a){var o=this.tryEntries[a],i=o.completion;if("root"===o.tryLoc)return l("end");if(o.tryLoc<=this.prev){var u=r.call(o,"catchLoc"),c=r.call(o,"finallyLoc");if(u&&c){if(this.prev<o.catchLoc)return l(o.catchLoc,!0);if(this.prev<o.finallyLoc)return l(o.finallyLoc)}else if(u){if(this.prev<o.catchLoc)return l(o.catchLoc,!0)}else{if(!c)throw new Error("try statement without catch or finally");if(this.prev<o.finallyLoc)return l(o.finallyLoc)}}}},abrupt:function(e,t){for(var n=this.tryEntries.length-1;n>=0;--n){var l=this.tryEntries[n];if(l.tryLoc<=this.prev&&r.call(l,"finallyLoc")&&this.prev<l.finallyLoc){var a=l;break}}a&&("break"===e||"continue"===e)&&a.tryLoc<=t&&t<=a.finallyLoc&&(a=null);var o=a?a.completion:{};return o.type=e,o.arg=t,a?(this.method="next",this.next=a.finallyLoc,m):this.complete(o)},complete:function(e,t){if("throw"===e.type)throw e.arg;return"break"===e.type||"continue"===e.type?this.next=e.arg:"return"===e.type?(this.rval=this.arg=e.arg,this.method="return",this.next="end"):"normal"===e.type&&t&&(this.next=t),m},finish:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var n=this.tryEntries[t];if(n.finallyLoc===e)return this.complete(n.completion,n.afterLoc),P(n),m}},catch:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var n=this.tryEntries[t];if(n.tryLoc===e){var r=n.completion;if("throw"===r.type){var l=r.arg;P(n)}return l}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:N(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}(e.exports);try{regeneratorRuntime=t}catch(e){"object"==typeof globalThis?globalThis.regeneratorRuntime=t:Function("r","regeneratorRuntime = r")(t)}},53:(e,t)=>{"use strict";var n,r,l,a,o;if("undefined"==typeof window||"function"!=typeof MessageChannel){var i=null,u=null,c=function(){if(null!==i)try{var e=t.unstable_now();i(!0,e),i=null}catch(e){throw setTimeout(c,0),e}},s=Date.now();t.unstable_now=function(){return Date.now()-s},n=function(e){null!==i?setTimeout(n,0,e):(i=e,setTimeout(c,0))},r=function(e,t){u=setTimeout(e,t)},l=function(){clearTimeout(u)},a=function(){return!1},o=t.unstable_forceFrameRate=function(){}}else{var f=window.performance,d=window.Date,p=window.setTimeout,h=window.clearTimeout;if("undefined"!=typeof console){var m=window.cancelAnimationFrame;"function"!=typeof window.requestAnimationFrame&&console.error("This browser doesn't support requestAnimationFrame. Make sure that you load a polyfill in older browsers. https://fb.me/react-polyfills"),"function"!=typeof m&&console.error("This browser doesn't support cancelAnimationFrame. Make sure that you load a polyfill in older browsers. https://fb.me/react-polyfills")}if("object"==typeof f&&"function"==typeof f.now)t.unstable_now=function(){return f.now()};else{var v=d.now();t.unstable_now=function(){return d.now()-v}}var y=!1,g=null,b=-1,w=5,k=0;a=function(){return t.unstable_now()>=k},o=function(){},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing framerates higher than 125 fps is not unsupported"):w=0<e?Math.floor(1e3/e):5};var E=new MessageChannel,x=E.port2;E.port1.onmessage=function(){if(null!==g){var e=t.unstable_now();k=e+w;try{g(!0,e)?x.postMessage(null):(y=!1,g=null)}catch(e){throw x.postMessage(null),e}}else y=!1},n=function(e){g=e,y||(y=!0,x.postMessage(null))},r=function(e,n){b=p((function(){e(t.unstable_now())}),n)},l=function(){h(b),b=-1}}function T(e,t){var n=e.length;e.push(t);e:for(;;){var r=n-1>>>1,l=e[r];if(!(void 0!==l&&0<P(l,t)))break e;e[r]=t,e[n]=l,n=r}}function S(e){return void 0===(e=e[0])?null:e}function C(e){var t=e[0];if(void 0!==t){var n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,l=e.length;r<l;){var a=2*(r+1)-1,o=e[a],i=a+1,u=e[i];if(void 0!==o&&0>P(o,n))void 0!==u&&0>P(u,o)?(e[r]=u,e[i]=n,r=i):(e[r]=o,e[a]=n,r=a);else{if(!(void 0!==u&&0>P(u,n)))break e;e[r]=u,e[i]=n,r=i}}}return t}return null}function P(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}var _=[],N=[],O=1,z=null,R=3,M=!1,I=!1,L=!1;function F(e){for(var t=S(N);null!==t;){if(null===t.callback)C(N);else{if(!(t.startTime<=e))break;C(N),t.sortIndex=t.expirationTime,T(_,t)}t=S(N)}}function D(e){if(L=!1,F(e),!I)if(null!==S(_))I=!0,n(j);else{var t=S(N);null!==t&&r(D,t.startTime-e)}}function j(e,n){I=!1,L&&(L=!1,l()),M=!0;var o=R;try{for(F(n),z=S(_);null!==z&&(!(z.expirationTime>n)||e&&!a());){var i=z.callback;if(null!==i){z.callback=null,R=z.priorityLevel;var u=i(z.expirationTime<=n);n=t.unstable_now(),"function"==typeof u?z.callback=u:z===S(_)&&C(_),F(n)}else C(_);z=S(_)}if(null!==z)var c=!0;else{var s=S(N);null!==s&&r(D,s.startTime-n),c=!1}return c}finally{z=null,R=o,M=!1}}function A(e){switch(e){case 1:return-1;case 2:return 250;case 5:return 1073741823;case 4:return 1e4;default:return 5e3}}var U=o;t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){I||M||(I=!0,n(j))},t.unstable_getCurrentPriorityLevel=function(){return R},t.unstable_getFirstCallbackNode=function(){return S(_)},t.unstable_next=function(e){switch(R){case 1:case 2:case 3:var t=3;break;default:t=R}var n=R;R=t;try{return e()}finally{R=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=U,t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=R;R=e;try{return t()}finally{R=n}},t.unstable_scheduleCallback=function(e,a,o){var i=t.unstable_now();if("object"==typeof o&&null!==o){var u=o.delay;u="number"==typeof u&&0<u?i+u:i,o="number"==typeof o.timeout?o.timeout:A(e)}else o=A(e),u=i;return e={id:O++,callback:a,priorityLevel:e,startTime:u,expirationTime:o=u+o,sortIndex:-1},u>i?(e.sortIndex=u,T(N,e),null===S(_)&&e===S(N)&&(L?l():L=!0,r(D,u-i))):(e.sortIndex=o,T(_,e),I||M||(I=!0,n(j))),e},t.unstable_shouldYield=function(){var e=t.unstable_now();F(e);var n=S(_);return n!==z&&null!==z&&null!==n&&null!==n.callback&&n.startTime<=e&&n.expirationTime<z.expirationTime||a()},t.unstable_wrapCallback=function(e){var t=R;return function(){var n=R;R=t;try{return e.apply(this,arguments)}finally{R=n}}}},840:(e,t,n)=>{"use strict";e.exports=n(53)},379:e=>{"use strict";var t=[];function n(e){for(var n=-1,r=0;r<t.length;r++)if(t[r].identifier===e){n=r;break}return n}function r(e,r){for(var a={},o=[],i=0;i<e.length;i++){var u=e[i],c=r.base?u[0]+r.base:u[0],s=a[c]||0,f="".concat(c," ").concat(s);a[c]=s+1;var d=n(f),p={css:u[1],media:u[2],sourceMap:u[3],supports:u[4],layer:u[5]};if(-1!==d)t[d].references++,t[d].updater(p);else{var h=l(p,r);r.byIndex=i,t.splice(i,0,{identifier:f,updater:h,references:1})}o.push(f)}return o}function l(e,t){var n=t.domAPI(t);return n.update(e),function(t){if(t){if(t.css===e.css&&t.media===e.media&&t.sourceMap===e.sourceMap&&t.supports===e.supports&&t.layer===e.layer)return;n.update(e=t)}else n.remove()}}e.exports=function(e,l){var a=r(e=e||[],l=l||{});return function(e){e=e||[];for(var o=0;o<a.length;o++){var i=n(a[o]);t[i].references--}for(var u=r(e,l),c=0;c<a.length;c++){var s=n(a[c]);0===t[s].references&&(t[s].updater(),t.splice(s,1))}a=u}}},569:e=>{"use strict";var t={};e.exports=function(e,n){var r=function(e){if(void 0===t[e]){var n=document.querySelector(e);if(window.HTMLIFrameElement&&n instanceof window.HTMLIFrameElement)try{n=n.contentDocument.head}catch(e){n=null}t[e]=n}return t[e]}(e);if(!r)throw new Error("Couldn't find a style target. This probably means that the value for the 'insert' parameter is invalid.");r.appendChild(n)}},216:e=>{"use strict";e.exports=function(e){var t=document.createElement("style");return e.setAttributes(t,e.attributes),e.insert(t,e.options),t}},565:(e,t,n)=>{"use strict";e.exports=function(e){var t=n.nc;t&&e.setAttribute("nonce",t)}},795:e=>{"use strict";e.exports=function(e){var t=e.insertStyleElement(e);return{update:function(n){!function(e,t,n){var r="";n.supports&&(r+="@supports (".concat(n.supports,") {")),n.media&&(r+="@media ".concat(n.media," {"));var l=void 0!==n.layer;l&&(r+="@layer".concat(n.layer.length>0?" ".concat(n.layer):""," {")),r+=n.css,l&&(r+="}"),n.media&&(r+="}"),n.supports&&(r+="}");var a=n.sourceMap;a&&"undefined"!=typeof btoa&&(r+="\n/*# sourceMappingURL=data:application/json;base64,".concat(btoa(unescape(encodeURIComponent(JSON.stringify(a))))," */")),t.styleTagTransform(r,e,t.options)}(t,e,n)},remove:function(){!function(e){if(null===e.parentNode)return!1;e.parentNode.removeChild(e)}(t)}}}},589:e=>{"use strict";e.exports=function(e,t){if(t.styleSheet)t.styleSheet.cssText=e;else{for(;t.firstChild;)t.removeChild(t.firstChild);t.appendChild(document.createTextNode(e))}}}},t={};function n(r){var l=t[r];if(void 0!==l)return l.exports;var a=t[r]={id:r,exports:{}};return e[r](a,a.exports,n),a.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),n.p="/",(()=>{"use strict";var e,t=n(294),r=n(935),l=n(379),a=n.n(l),o=n(795),i=n.n(o),u=n(569),c=n.n(u),s=n(565),f=n.n(s),d=n(216),p=n.n(d),h=n(589),m=n.n(h),v=n(775),y={};function g(){return g=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},g.apply(this,arguments)}y.styleTagTransform=m(),y.setAttributes=f(),y.insert=c().bind(null,"head"),y.domAPI=i(),y.insertStyleElement=p(),a()(v.Z,y),v.Z&&v.Z.locals&&v.Z.locals,function(e){e.Pop="POP",e.Push="PUSH",e.Replace="REPLACE"}(e||(e={}));var b="beforeunload";function w(e){e.preventDefault(),e.returnValue=""}function k(){var e=[];return{get length(){return e.length},push:function(t){return e.push(t),function(){e=e.filter((function(e){return e!==t}))}},call:function(t){e.forEach((function(e){return e&&e(t)}))}}}function E(e){var t=e.pathname,n=void 0===t?"/":t,r=e.search,l=void 0===r?"":r,a=e.hash,o=void 0===a?"":a;return l&&"?"!==l&&(n+="?"===l.charAt(0)?l:"?"+l),o&&"#"!==o&&(n+="#"===o.charAt(0)?o:"#"+o),n}function x(e){var t={};if(e){var n=e.indexOf("#");n>=0&&(t.hash=e.substr(n),e=e.substr(0,n));var r=e.indexOf("?");r>=0&&(t.search=e.substr(r),e=e.substr(0,r)),e&&(t.pathname=e)}return t}const T=(0,t.createContext)(null),S=(0,t.createContext)(null),C=(0,t.createContext)({outlet:null,matches:[]});function P(e,t){if(!e)throw new Error(t)}function _(e,t,n){void 0===n&&(n="/");let r=F(("string"==typeof t?x(t):t).pathname||"/",n);if(null==r)return null;let l=N(e);!function(e){e.sort(((e,t)=>e.score!==t.score?t.score-e.score:function(e,t){return e.length===t.length&&e.slice(0,-1).every(((e,n)=>e===t[n]))?e[e.length-1]-t[t.length-1]:0}(e.routesMeta.map((e=>e.childrenIndex)),t.routesMeta.map((e=>e.childrenIndex)))))}(l);let a=null;for(let e=0;null==a&&e<l.length;++e)a=M(l[e],r);return a}function N(e,t,n,r){return void 0===t&&(t=[]),void 0===n&&(n=[]),void 0===r&&(r=""),e.forEach(((e,l)=>{let a={relativePath:e.path||"",caseSensitive:!0===e.caseSensitive,childrenIndex:l,route:e};a.relativePath.startsWith("/")&&(a.relativePath.startsWith(r)||P(!1),a.relativePath=a.relativePath.slice(r.length));let o=D([r,a.relativePath]),i=n.concat(a);e.children&&e.children.length>0&&(!0===e.index&&P(!1),N(e.children,t,i,o)),(null!=e.path||e.index)&&t.push({path:o,score:R(o,e.index),routesMeta:i})})),t}const O=/^:\w+$/,z=e=>"*"===e;function R(e,t){let n=e.split("/"),r=n.length;return n.some(z)&&(r+=-2),t&&(r+=2),n.filter((e=>!z(e))).reduce(((e,t)=>e+(O.test(t)?3:""===t?1:10)),r)}function M(e,t){let{routesMeta:n}=e,r={},l="/",a=[];for(let e=0;e<n.length;++e){let o=n[e],i=e===n.length-1,u="/"===l?t:t.slice(l.length)||"/",c=I({path:o.relativePath,caseSensitive:o.caseSensitive,end:i},u);if(!c)return null;Object.assign(r,c.params);let s=o.route;a.push({params:r,pathname:D([l,c.pathname]),pathnameBase:j(D([l,c.pathnameBase])),route:s}),"/"!==c.pathnameBase&&(l=D([l,c.pathnameBase]))}return a}function I(e,t){"string"==typeof e&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=function(e,t,n){void 0===t&&(t=!1),void 0===n&&(n=!0);let r=[],l="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^$?{}|()[\]]/g,"\\$&").replace(/:(\w+)/g,((e,t)=>(r.push(t),"([^\\/]+)")));return e.endsWith("*")?(r.push("*"),l+="*"===e||"/*"===e?"(.*)$":"(?:\\/(.+)|\\/*)$"):l+=n?"\\/*$":"(?:(?=[.~-]|%[0-9A-F]{2})|\\b|\\/|$)",[new RegExp(l,t?void 0:"i"),r]}(e.path,e.caseSensitive,e.end),l=t.match(n);if(!l)return null;let a=l[0],o=a.replace(/(.)\/+$/,"$1"),i=l.slice(1);return{params:r.reduce(((e,t,n)=>{if("*"===t){let e=i[n]||"";o=a.slice(0,a.length-e.length).replace(/(.)\/+$/,"$1")}return e[t]=function(e,t){try{return decodeURIComponent(e)}catch(t){return e}}(i[n]||""),e}),{}),pathname:a,pathnameBase:o,pattern:e}}function L(e,t,n){let r,l="string"==typeof e?x(e):e,a=""===e||""===l.pathname?"/":l.pathname;if(null==a)r=n;else{let e=t.length-1;if(a.startsWith("..")){let t=a.split("/");for(;".."===t[0];)t.shift(),e-=1;l.pathname=t.join("/")}r=e>=0?t[e]:"/"}let o=function(e,t){void 0===t&&(t="/");let{pathname:n,search:r="",hash:l=""}="string"==typeof e?x(e):e,a=n?n.startsWith("/")?n:function(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach((e=>{".."===e?n.length>1&&n.pop():"."!==e&&n.push(e)})),n.length>1?n.join("/"):"/"}(n,t):t;return{pathname:a,search:A(r),hash:U(l)}}(l,r);return a&&"/"!==a&&a.endsWith("/")&&!o.pathname.endsWith("/")&&(o.pathname+="/"),o}function F(e,t){if("/"===t)return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=e.charAt(t.length);return n&&"/"!==n?null:e.slice(t.length)||"/"}const D=e=>e.join("/").replace(/\/\/+/g,"/"),j=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),A=e=>e&&"?"!==e?e.startsWith("?")?e:"?"+e:"",U=e=>e&&"#"!==e?e.startsWith("#")?e:"#"+e:"";function W(){return null!=(0,t.useContext)(S)}function V(){return W()||P(!1),(0,t.useContext)(S).location}function B(e){let{matches:n}=(0,t.useContext)(C),{pathname:r}=V(),l=JSON.stringify(n.map((e=>e.pathnameBase)));return(0,t.useMemo)((()=>L(e,JSON.parse(l),r)),[e,l,r])}function $(e){P(!1)}function Q(n){let{basename:r="/",children:l=null,location:a,navigationType:o=e.Pop,navigator:i,static:u=!1}=n;W()&&P(!1);let c=j(r),s=(0,t.useMemo)((()=>({basename:c,navigator:i,static:u})),[c,i,u]);"string"==typeof a&&(a=x(a));let{pathname:f="/",search:d="",hash:p="",state:h=null,key:m="default"}=a,v=(0,t.useMemo)((()=>{let e=F(f,c);return null==e?null:{pathname:e,search:d,hash:p,state:h,key:m}}),[c,f,d,p,h,m]);return null==v?null:(0,t.createElement)(T.Provider,{value:s},(0,t.createElement)(S.Provider,{children:l,value:{location:v,navigationType:o}}))}function H(e){let{children:n,location:r}=e;return function(e,n){W()||P(!1);let{matches:r}=(0,t.useContext)(C),l=r[r.length-1],a=l?l.params:{},o=(l&&l.pathname,l?l.pathnameBase:"/");l&&l.route;let i,u=V();if(n){var c;let e="string"==typeof n?x(n):n;"/"===o||(null==(c=e.pathname)?void 0:c.startsWith(o))||P(!1),i=e}else i=u;let s=i.pathname||"/",f=_(e,{pathname:"/"===o?s:s.slice(o.length)||"/"});return function(e,n){return void 0===n&&(n=[]),null==e?null:e.reduceRight(((r,l,a)=>(0,t.createElement)(C.Provider,{children:void 0!==l.route.element?l.route.element:r,value:{outlet:r,matches:n.concat(e.slice(0,a+1))}})),null)}(f&&f.map((e=>Object.assign({},e,{params:Object.assign({},a,e.params),pathname:D([o,e.pathname]),pathnameBase:"/"===e.pathnameBase?o:D([o,e.pathnameBase])}))),r)}(K(n),r)}function K(e){let n=[];return t.Children.forEach(e,(e=>{if(!(0,t.isValidElement)(e))return;if(e.type===t.Fragment)return void n.push.apply(n,K(e.props.children));e.type!==$&&P(!1);let r={caseSensitive:e.props.caseSensitive,element:e.props.element,index:e.props.index,path:e.props.path};e.props.children&&(r.children=K(e.props.children)),n.push(r)})),n}function q(){return q=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},q.apply(this,arguments)}const Y=["onClick","reloadDocument","replace","state","target","to"];function G(n){let{basename:r,children:l,window:a}=n,o=(0,t.useRef)();null==o.current&&(o.current=function(t){void 0===t&&(t={});var n=t.window,r=void 0===n?document.defaultView:n,l=r.history;function a(){var e=r.location,t=e.pathname,n=e.search,a=e.hash,o=l.state||{};return[o.idx,{pathname:t,search:n,hash:a,state:o.usr||null,key:o.key||"default"}]}var o=null;r.addEventListener("popstate",(function(){if(o)d.call(o),o=null;else{var t=e.Pop,n=a(),r=n[0],l=n[1];if(d.length){if(null!=r){var i=c-r;i&&(o={action:t,location:l,retry:function(){T(-1*i)}},T(i))}}else y(t)}}));var i=e.Pop,u=a(),c=u[0],s=u[1],f=k(),d=k();function p(e){return"string"==typeof e?e:E(e)}function h(e,t){return void 0===t&&(t=null),g({pathname:s.pathname,hash:"",search:""},"string"==typeof e?x(e):e,{state:t,key:Math.random().toString(36).substr(2,8)})}function m(e,t){return[{usr:e.state,key:e.key,idx:t},p(e)]}function v(e,t,n){return!d.length||(d.call({action:e,location:t,retry:n}),!1)}function y(e){i=e;var t=a();c=t[0],s=t[1],f.call({action:i,location:s})}function T(e){l.go(e)}null==c&&(c=0,l.replaceState(g({},l.state,{idx:c}),""));var S={get action(){return i},get location(){return s},createHref:p,push:function t(n,a){var o=e.Push,i=h(n,a);if(v(o,i,(function(){t(n,a)}))){var u=m(i,c+1),s=u[0],f=u[1];try{l.pushState(s,"",f)}catch(e){r.location.assign(f)}y(o)}},replace:function t(n,r){var a=e.Replace,o=h(n,r);if(v(a,o,(function(){t(n,r)}))){var i=m(o,c),u=i[0],s=i[1];l.replaceState(u,"",s),y(a)}},go:T,back:function(){T(-1)},forward:function(){T(1)},listen:function(e){return f.push(e)},block:function(e){var t=d.push(e);return 1===d.length&&r.addEventListener(b,w),function(){t(),d.length||r.removeEventListener(b,w)}}};return S}({window:a}));let i=o.current,[u,c]=(0,t.useState)({action:i.action,location:i.location});return(0,t.useLayoutEffect)((()=>i.listen(c)),[i]),(0,t.createElement)(Q,{basename:r,children:l,location:u.location,navigationType:u.action,navigator:i})}const X=(0,t.forwardRef)((function(e,n){let{onClick:r,reloadDocument:l,replace:a=!1,state:o,target:i,to:u}=e,c=function(e,t){if(null==e)return{};var n,r,l={},a=Object.keys(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)>=0||(l[n]=e[n]);return l}(e,Y),s=function(e){W()||P(!1);let{basename:n,navigator:r}=(0,t.useContext)(T),{hash:l,pathname:a,search:o}=B(e),i=a;if("/"!==n){let t=function(e){return""===e||""===e.pathname?"/":"string"==typeof e?x(e).pathname:e.pathname}(e),r=null!=t&&t.endsWith("/");i="/"===a?n+(r?"/":""):D([n,a])}return r.createHref({pathname:i,search:o,hash:l})}(u),f=function(e,n){let{target:r,replace:l,state:a}=void 0===n?{}:n,o=function(){W()||P(!1);let{basename:e,navigator:n}=(0,t.useContext)(T),{matches:r}=(0,t.useContext)(C),{pathname:l}=V(),a=JSON.stringify(r.map((e=>e.pathnameBase))),o=(0,t.useRef)(!1);(0,t.useEffect)((()=>{o.current=!0}));let i=(0,t.useCallback)((function(t,r){if(void 0===r&&(r={}),!o.current)return;if("number"==typeof t)return void n.go(t);let i=L(t,JSON.parse(a),l);"/"!==e&&(i.pathname=D([e,i.pathname])),(r.replace?n.replace:n.push)(i,r.state)}),[e,n,a,l]);return i}(),i=V(),u=B(e);return(0,t.useCallback)((t=>{if(!(0!==t.button||r&&"_self"!==r||function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(t))){t.preventDefault();let n=!!l||E(i)===E(u);o(e,{replace:n,state:a})}}),[i,o,u,l,a,r,e])}(u,{replace:a,state:o,target:i});return(0,t.createElement)("a",q({},c,{href:s,onClick:function(e){r&&r(e),e.defaultPrevented||l||f(e)},ref:n,target:i}))}));function Z(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function J(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function ee(e,t){return ee=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e},ee(e,t)}function te(e){return te="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},te(e)}function ne(e,t){if(t&&("object"===te(t)||"function"==typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}function re(e){return re=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},re(e)}var le=n(697),ae=n.n(le);var oe=function(e){!function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&ee(e,t)}(o,e);var t,n,r,l,a=(r=o,l=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}(),function(){var e,t=re(r);if(l){var n=re(this).constructor;e=Reflect.construct(t,arguments,n)}else e=t.apply(this,arguments);return ne(this,e)});function o(){return Z(this,o),a.apply(this,arguments)}return t=o,(n=[{key:"componentDidUpdate",value:function(e){this.props.location!==e.location&&window.scrollTo(0,0)}},{key:"render",value:function(){return this.props.children}}])&&J(t.prototype,n),o}(t.Component);const ie=oe;function ue(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ce(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function se(e,t,n,r,l,a,o){try{var i=e[a](o),u=i.value}catch(e){return void n(e)}i.done?t(u):Promise.resolve(u).then(r,l)}oe.propTypes={location:ae().object,children:ae().any};var fe=n(757),de=n.n(fe);function pe(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function he(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?pe(Object(n),!0).forEach((function(t){ue(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pe(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}var me=t.createContext(null);const ve=n.p+"rigo-baby.jpg";var ye=n(406),ge={};ge.styleTagTransform=m(),ge.setAttributes=f(),ge.insert=c().bind(null,"head"),ge.domAPI=i(),ge.insertStyleElement=p(),a()(ye.Z,ge),ye.Z&&ye.Z.locals&&ye.Z.locals;var be=function(){var e=(0,t.useContext)(me),n=e.store;return e.actions,t.createElement("div",{className:"text-center mt-5"},t.createElement("h1",null,"Hello Rigo!!"),t.createElement("p",null,t.createElement("img",{src:ve})),t.createElement("div",{className:"alert alert-info"},n.message||"Loading message from the backend (make sure your python backend is running)..."),t.createElement("p",null,"This boilerplate comes with lots of documentation:"," ",t.createElement("a",{href:"https://github.com/4GeeksAcademy/react-flask-hello/tree/95e0540bd1422249c3004f149825285118594325/docs"},"Read documentation")))},we=function(){var e=(0,t.useContext)(me),n=e.store,r=e.actions;return t.createElement("div",{className:"container"},t.createElement("ul",{className:"list-group"},n.demo.map((function(e,n){return t.createElement("li",{key:n,className:"list-group-item d-flex justify-content-between",style:{background:e.background}},t.createElement(X,{to:"/single/"+n},t.createElement("span",null,"Link to: ",e.title)),"orange"===e.background?t.createElement("p",{style:{color:e.initial}},"Check store/flux.js scroll to the actions to see the code"):null,t.createElement("button",{className:"btn btn-success",onClick:function(){return r.changeColor(n,"orange")}},"Change Color"))}))),t.createElement("br",null),t.createElement(X,{to:"/"},t.createElement("button",{className:"btn btn-primary"},"Back home")))},ke=function(e){var n=(0,t.useContext)(me),r=n.store,l=(n.actions,function(){let{matches:e}=(0,t.useContext)(C),n=e[e.length-1];return n?n.params:{}}());return t.createElement("div",{className:"jumbotron"},t.createElement("h1",{className:"display-4"},"This will show the demo element: ",r.demo[l.theid].title),t.createElement("img",{src:ve}),t.createElement("hr",{className:"my-4"}),t.createElement(X,{to:"/"},t.createElement("span",{className:"btn btn-primary btn-lg",href:"#",role:"button"},"Back home")))};ke.propTypes={match:ae().object};var Ee=function(){return t.createElement("nav",{className:"navbar navbar-light bg-light"},t.createElement("div",{className:"container"},t.createElement(X,{to:"/"},t.createElement("span",{className:"navbar-brand mb-0 h1"},"React Boilerplate")),t.createElement("div",{className:"ml-auto"},t.createElement(X,{to:"/demo"},t.createElement("button",{className:"btn btn-primary"},"Check the Context in action")))))},xe=function(){return t.createElement("footer",{className:"footer mt-auto py-3 text-center"},t.createElement("p",null,"Made with ",t.createElement("i",{className:"fa fa-heart text-danger"})," by"," ",t.createElement("a",{href:"http://www.4geeksacademy.com"},"4Geeks Academy")))};const Te=(Se=function(){return t.createElement("div",null,t.createElement(G,{basename:"/"},t.createElement(ie,null,t.createElement(Ee,null),t.createElement(H,null,t.createElement($,{element:t.createElement(be,null),path:"/"}),t.createElement($,{element:t.createElement(we,null),path:"/demo"}),t.createElement($,{element:t.createElement(ke,null),path:"/single/:theid"}),t.createElement($,{element:t.createElement("h1",null,"Not found!")})),t.createElement(xe,null))))},function(e){var n,r,l,a,o,i,u,c,s=(n=(0,t.useState)((i=(l={getStore:function(){return f.store},getActions:function(){return f.actions},setStore:function(e){return d({store:Object.assign(f.store,e),actions:he({},f.actions)})}}).getStore,u=l.getActions,c=l.setStore,{store:{message:null,demo:[{title:"FIRST",background:"white",initial:"white"},{title:"SECOND",background:"white",initial:"white"}]},actions:{exampleFunction:function(){u().changeColor(0,"green")},getMessage:(a=de().mark((function e(){var t,n;return de().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.prev=0,e.next=3,fetch("https://3001-alesanchezr-reactflaskh-ocoy53bvsw3.ws-us71.gitpod.io/api/hello");case 3:return t=e.sent,e.next=6,t.json();case 6:return n=e.sent,c({message:n.message}),e.abrupt("return",n);case 11:e.prev=11,e.t0=e.catch(0),console.log("Error loading message from backend",e.t0);case 14:case"end":return e.stop()}}),e,null,[[0,11]])})),o=function(){var e=this,t=arguments;return new Promise((function(n,r){var l=a.apply(e,t);function o(e){se(l,n,r,o,i,"next",e)}function i(e){se(l,n,r,o,i,"throw",e)}o(void 0)}))},function(){return o.apply(this,arguments)}),changeColor:function(e,t){var n=i().demo.map((function(n,r){return r===e&&(n.background=t),n}));c({demo:n})}}})),r=2,function(e){if(Array.isArray(e))return e}(n)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,l,a=[],o=!0,i=!1;try{for(n=n.call(e);!(o=(r=n.next()).done)&&(a.push(r.value),!t||a.length!==t);o=!0);}catch(e){i=!0,l=e}finally{try{o||null==n.return||n.return()}finally{if(i)throw l}}return a}}(n,r)||function(e,t){if(e){if("string"==typeof e)return ce(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?ce(e,t):void 0}}(n,r)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()),f=s[0],d=s[1];return(0,t.useEffect)((function(){f.actions.getMessage()}),[]),t.createElement(me.Provider,{value:f},t.createElement(Se,e))});var Se;r.render(t.createElement(Te,null),document.querySelector("#app"))})()})();
\ No newline at end of file
@@ -7,4 +7,7 @@ npm run build
 
 pipenv install
 
+# Variantes .gz / .br del bundle y demas estaticos
+pipenv run flask compress-static
+
 pipenv run upgrade
@@ -1,7 +1,22 @@
 import os
 from flask_admin import Admin
-from .models import db, Users, Trainers, Administrators, Specializations, TrainersClasses, UsersClasses, TrainersSpecializations
+from .models import db, Users, Trainers, Administrators, Specializations, TrainersClasses, UsersClasses, TrainersSpecializations, EmailOutbox, StripeEvents, GeoCache
 from flask_admin.contrib.sqla import ModelView
+from .search import refresh_search_documents
+from .cache import invalidate_response_cache
+
+
+# El nombre del trainer sale en el catalogo y en el texto de busqueda de sus clases: al editarlo se reescriben
+# sus documentos de busqueda, que cambia su updated_at y con el el ETag de /classes
+class TrainersView(ModelView):
+    def on_model_change(self, form, model, is_created):
+        state = db.inspect(model)
+        model._renamed = not is_created and (state.attrs.name.history.has_changes() or state.attrs.last_name.history.has_changes())
+
+    def after_model_change(self, form, model, is_created):
+        if getattr(model, '_renamed', False):
+            refresh_search_documents(TrainersClasses.trainer_id == model.id)
+            invalidate_response_cache('classes')
 
 
 def setup_admin(app):
@@ -10,9 +25,12 @@ def setup_admin(app):
     admin = Admin(app, name='4Geeks Admin', template_mode='bootstrap3')
     # Add your models here, for example this is how we add a the User model to the admin
     admin.add_view(ModelView(Users, db.session))
-    admin.add_view(ModelView(Trainers, db.session))
+    admin.add_view(TrainersView(Trainers, db.session))
     admin.add_view(ModelView(Administrators, db.session))
     admin.add_view(ModelView(Specializations, db.session))
     admin.add_view(ModelView(TrainersClasses, db.session))
     admin.add_view(ModelView(UsersClasses, db.session))
     admin.add_view(ModelView(TrainersSpecializations, db.session))
+    admin.add_view(ModelView(EmailOutbox, db.session))
+    admin.add_view(ModelView(StripeEvents, db.session))
+    admin.add_view(ModelView(GeoCache, db.session))
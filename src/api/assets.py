@@ -0,0 +1,134 @@
+"""
+Static files of the React build (public/). A manifest built at startup keeps, for every file, its
+mimetype, a content-hash ETag, its fresh .br / .gz variants and, for small files, the bytes themselves,
+so requests never touch the filesystem to check whether a file exists. Files whose name carries a
+webpack content hash are served as immutable for a year; everything else (index.html) revalidates
+"""
+import os
+import re
+import hashlib
+import mimetypes
+from flask import current_app, request, send_file, abort
+from werkzeug.security import safe_join
+from api.compression import STATIC_VARIANTS, negotiate_encoding
+
+
+STATIC_MEMORY_MAX_SIZE = int(os.getenv("STATIC_MEMORY_MAX_SIZE", 1024 * 1024))
+IMMUTABLE_MAX_AGE = 31536000
+INDEX_FILE = 'index.html'
+# bundle.3f2a9c1e.js, rigo-baby.1c0d7e2b.jpg o 9f8e7d6c5b4a39281706f5e4d3c2b1a0.woff (nombres de webpack con [contenthash])
+HASHED_NAME = re.compile(r"(^|\.)[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+
+
+class StaticAsset:
+    def __init__(self, path, name):
+        with open(path, 'rb') as file:
+            data = file.read()
+        self.mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        self.etag = hashlib.sha1(data).hexdigest()[:20]
+        self.last_modified = os.path.getmtime(path)
+        self.immutable = HASHED_NAME.search(os.path.basename(name)) is not None
+        # Fichero y bytes (None si es grande) de cada codificacion; None es el original
+        self.files = {None: path}
+        self.data = {None: data if len(data) <= STATIC_MEMORY_MAX_SIZE else None}
+        for encoding, extension in STATIC_VARIANTS.items():
+            variant = path + extension
+            if os.path.isfile(variant) and os.path.getmtime(variant) >= self.last_modified:
+                self.files[encoding] = variant
+                if os.path.getsize(variant) <= STATIC_MEMORY_MAX_SIZE:
+                    with open(variant, 'rb') as file:
+                        self.data[encoding] = file.read()
+                else:
+                    self.data[encoding] = None
+
+    @property
+    def encodings(self):
+        return [encoding for encoding in self.files if encoding is not None]
+
+
+# Manifiesto de public/ (ruta relativa -> StaticAsset). Con reload (desarrollo) cada peticion comprueba el
+# mtime y el tamaño de su fichero y solo vuelve a leer el que ha cambiado
+class StaticManifest:
+    def __init__(self, directory, reload=False):
+        self.directory = directory
+        self.reload = reload
+        self.signatures = {}
+        self.assets = self.scan()
+
+    def scan(self):
+        assets = {}
+        for root, dirs, files in os.walk(self.directory):
+            for name in files:
+                if self.skipped(name):
+                    continue
+                path = os.path.join(root, name)
+                relative_path = os.path.relpath(path, self.directory).replace(os.sep, '/')
+                if self.reload:
+                    self.signatures[relative_path] = self.signature(path)
+                assets[relative_path] = StaticAsset(path, name)
+        return assets
+
+    @staticmethod
+    def skipped(name):
+        return name.endswith(tuple(STATIC_VARIANTS.values())) or name.endswith('.tmp')
+
+    # (mtime, tamaño) del fichero y de sus variantes comprimidas: cambia si se reescribe cualquiera de ellos
+    @staticmethod
+    def signature(path):
+        signature = []
+        for file in [path] + [path + extension for extension in STATIC_VARIANTS.values()]:
+            try:
+                stat = os.stat(file)
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def refresh(self, path):
+        file_path = safe_join(self.directory, path)
+        if file_path is None or self.skipped(path) or not os.path.isfile(file_path):
+            self.assets.pop(path, None)
+            self.signatures.pop(path, None)
+            return None
+        signature = self.signature(file_path)
+        if self.signatures.get(path) != signature:
+            self.assets[path] = StaticAsset(file_path, os.path.basename(file_path))
+            self.signatures[path] = signature
+        return self.assets[path]
+
+    def get(self, path):
+        if self.reload:
+            return self.refresh(path)
+        return self.assets.get(path)
+
+
+# Sirve un fichero del manifiesto; las rutas que no existen devuelven index.html (rutas del front)
+def serve_asset(manifest, path):
+    asset = manifest.get(path)
+    if asset is None:
+        asset = manifest.get(INDEX_FILE)
+        if asset is None:
+            abort(404)
+    encoding = negotiate_encoding(asset.encodings) if asset.encodings else None
+    etag = f"{asset.etag}-{encoding}" if encoding else asset.etag
+    data = asset.data[encoding]
+    if data is None:
+        response = send_file(asset.files[encoding], mimetype=asset.mimetype, etag=etag, last_modified=asset.last_modified,
+                             max_age=IMMUTABLE_MAX_AGE if asset.immutable else None)
+    else:
+        response = current_app.response_class(data, mimetype=asset.mimetype)
+        response.set_etag(etag)
+        response.last_modified = asset.last_modified
+        response.make_conditional(request, accept_ranges=True, complete_length=len(data))
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if asset.encodings:
+        response.vary.add('Accept-Encoding')
+    if asset.immutable:
+        response.cache_control.public = True
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response
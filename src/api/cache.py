@@ -0,0 +1,248 @@
+"""
+Caches: in-process caches for small tables that rarely change (each gunicorn worker keeps its own copy)
+and a response cache for public GET endpoints. The memory backend is per process; class listings carry
+seat capacity, which the cart sweeper and the stripe worker change from other processes, so they are
+only cached when RESPONSE_CACHE_URL points at a shared Redis
+"""
+import os
+import time
+import json
+import threading
+from functools import wraps
+from collections import OrderedDict
+from urllib.parse import urlencode
+from flask import request, make_response, Response
+import redis
+from api.models import db, Specializations
+
+
+class TTLCache:
+    def __init__(self, maxsize=256, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            # LRU: la entrada usada pasa al final
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        return {'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses}
+
+
+specializations_cache = TTLCache(maxsize=int(os.getenv("SPECIALIZATIONS_CACHE_SIZE", 256)),
+                                 ttl=int(os.getenv("SPECIALIZATIONS_CACHE_TTL", 300)))
+ALL_SPECIALIZATIONS_KEY = "all"
+
+
+# Devuelve la especializacion serializada (o None si no existe)
+def get_specialization(id):
+    try:
+        id = int(id)
+    except (TypeError, ValueError):
+        return None
+    specialization = specializations_cache.get(id)
+    if specialization is None:
+        row = db.session.query(Specializations).filter_by(id=id).first()
+        if not row:
+            return None
+        specialization = row.serialize()
+        specializations_cache.set(id, specialization)
+    return specialization
+
+
+# Devuelve todas las especializaciones serializadas, y de paso llena la cache por id
+def get_specializations():
+    specializations = specializations_cache.get(ALL_SPECIALIZATIONS_KEY)
+    if specializations is None:
+        specializations = [row.serialize() for row in db.session.query(Specializations).order_by(Specializations.id).all()]
+        specializations_cache.set(ALL_SPECIALIZATIONS_KEY, specializations)
+        for specialization in specializations:
+            specializations_cache.set(specialization['id'], specialization)
+    return specializations
+
+
+def invalidate_specializations(id=None):
+    specializations_cache.invalidate(ALL_SPECIALIZATIONS_KEY)
+    if id is not None:
+        specializations_cache.invalidate(int(id))
+
+
+# Cache de respuestas en memoria (tests y un solo proceso). Cada entrada guarda sus etiquetas, y al
+# expulsarla (LRU, caducada o invalidada) su clave sale tambien de los conjuntos de esas etiquetas
+class MemoryResponseCache:
+    shared = False
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._tags = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] < time.monotonic():
+                self._discard(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value, tags):
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (value, time.monotonic() + self.ttl, tuple(tags))
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._discard(next(iter(self._entries)))
+
+    # Quita la entrada y su clave de sus etiquetas (los conjuntos vacios se borran). Con el lock tomado
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def invalidate_tags(self, tags):
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, set()):
+                    self._discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+
+# Cache de respuestas compartida entre workers, con cualquier servidor que hable el protocolo Redis
+class RedisResponseCache:
+    prefix = "response-cache:"
+    shared = True
+
+    def __init__(self, url, ttl=60):
+        self.ttl = ttl
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        raw = self._client.get(self.prefix + key)
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        return entry['body'].encode(), entry['status'], entry['mimetype'], entry['headers']
+
+    def set(self, key, value, tags):
+        body, status, mimetype, headers = value
+        pipe = self._client.pipeline()
+        pipe.set(self.prefix + key, json.dumps({'body': body.decode(), 'status': status, 'mimetype': mimetype, 'headers': headers}), ex=self.ttl)
+        for tag in tags:
+            pipe.sadd(self.prefix + "tag:" + tag, key)
+            pipe.expire(self.prefix + "tag:" + tag, self.ttl)
+        pipe.execute()
+
+    def invalidate_tags(self, tags):
+        tag_keys = [self.prefix + "tag:" + tag for tag in tags]
+        keys = set()
+        for tag_key in tag_keys:
+            keys |= {self.prefix + key.decode() for key in self._client.smembers(tag_key)}
+        if keys or tag_keys:
+            self._client.delete(*keys, *tag_keys)
+
+    def clear(self):
+        keys = list(self._client.scan_iter(self.prefix + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+def create_response_cache(url=None, ttl=60):
+    if url and url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisResponseCache(url, ttl=ttl)
+    return MemoryResponseCache(ttl=ttl)
+
+
+response_cache = create_response_cache(os.getenv("RESPONSE_CACHE_URL"),
+                                       ttl=int(os.getenv("RESPONSE_CACHE_TTL", 60)))
+
+
+# Cabeceras de la respuesta que se guardan junto al cuerpo
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control')
+
+
+# La clave es la ruta mas la query string normalizada (parametros ordenados)
+def response_cache_key():
+    query_string = urlencode(sorted(request.args.items(multi=True)))
+    return f"{request.path}?{query_string}"
+
+
+# Decorador para endpoints GET publicos. tags puede ser una lista o una funcion de los argumentos de la ruta.
+# Con shared=True solo se cachea si la cache es compartida (Redis): las respuestas con plazas libres las
+# invalidan otros procesos (sweeper de carritos, stripe-worker, otros workers de gunicorn) y una cache en
+# memoria de cada proceso no se enteraria
+def cached_response(tags, shared=False):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if shared and not response_cache.shared:
+                return view(*args, **kwargs)
+            key = response_cache_key()
+            cached = response_cache.get(key)
+            if cached is not None:
+                body, status, mimetype, headers = cached
+                response = Response(body, status=status, mimetype=mimetype, headers=headers)
+                response.headers['X-Cache'] = 'HIT'
+                # Responde 304 si el cliente ya tiene esta version (If-None-Match / If-Modified-Since)
+                return response.make_conditional(request)
+            response = make_response(view(*args, **kwargs))
+            # Solo se guardan respuestas completas; las de error o streaming no
+            if response.status_code == 200 and not response.is_streamed:
+                response_tags = tags(**kwargs) if callable(tags) else tags
+                headers = {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers}
+                response_cache.set(key, (response.get_data(), response.status_code, response.mimetype, headers), response_tags)
+            response.headers['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
+
+
+def invalidate_response_cache(*tags):
+    response_cache.invalidate_tags(tags)
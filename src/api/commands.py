@@ -3,8 +3,30 @@ In this file, you can add as many commands as you want using the @app.cli.comman
 Flask commands are usefull to run cronjobs or tasks outside of the API but sill in integration 
 with youy database, for example: Import the price of bitcoin every night as 12am
 """
+import os
+import time
+import json
 import click
-from api.models import db, Users
+import threading
+from sqlalchemy import create_engine, text, exc
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy.orm import joinedload
+from api.models import db, Users, TrainersClasses
+from api.serializers import catalog, orjson
+from api.compression import precompress_static
+from api.pool import InstrumentedQueuePool, DB_POOL_TIMEOUT
+from api.utils import APIException
+from api.emails import send_pending_emails, EMAIL_BATCH_SIZE
+from api.stripe_events import process_stripe_events, STRIPE_EVENTS_BATCH_SIZE
+from api.reservations import sweep_carts, SEAT_HOLDS_BATCH_SIZE, CART_TTL_HOURS
+from api.cache import invalidate_response_cache
+from api.spatial import class_location, GEOCODE_CLASSES_BATCH_SIZE
+from api.exports import export_filters, bookings_export_rows, export_bookings, EXPORT_FORMATS, EXPORT_CHUNK_SIZE, STRIPE_STATUSES, TRAINER_STATUSES
+from api.search import refresh_search_documents, rebuild_search_index, SEARCH_REINDEX_BATCH_SIZE
+
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), '../../public/')
 
 
 def setup_commands(app):
@@ -30,3 +52,250 @@ def setup_commands(app):
     @app.cli.command("insert-test-data")
     def insert_test_data():
         pass
+
+    """
+    Envia en lotes los correos pendientes de la tabla email_outbox: $ flask send-emails
+    Con --loop se queda vaciando la cola cada --interval segundos (worker en segundo plano)
+    """
+    @app.cli.command("send-emails")
+    @click.option("--batch-size", default=EMAIL_BATCH_SIZE, help="Emails sent per SMTP connection")
+    @click.option("--loop", is_flag=True, help="Keep draining the outbox")
+    @click.option("--interval", default=5, help="Seconds to wait when the outbox is empty")
+    def send_emails(batch_size, loop, interval):
+        while True:
+            try:
+                sent, failed = send_pending_emails(batch_size)
+            except Exception as e:
+                # Servidor SMTP caido: los correos siguen pendientes y se reintentan en la siguiente vuelta
+                db.session.rollback()
+                print("Error connecting to the mail server: " + str(e))
+                sent, failed = 0, 0
+            if sent or failed:
+                print(f"Emails sent: {sent}, failed: {failed}")
+            # Lote incompleto: la cola esta vacia
+            if sent + failed < batch_size:
+                if not loop:
+                    break
+                time.sleep(interval)
+
+    """
+    Aplica en orden los eventos de Stripe guardados por el webhook: $ flask process-stripe-events
+    Con --loop se queda procesando la cola cada --interval segundos
+    """
+    @app.cli.command("process-stripe-events")
+    @click.option("--batch-size", default=STRIPE_EVENTS_BATCH_SIZE, help="Events applied per run")
+    @click.option("--loop", is_flag=True, help="Keep processing new events")
+    @click.option("--interval", default=2, help="Seconds to wait when there are no pending events")
+    def process_events(batch_size, loop, interval):
+        while True:
+            try:
+                processed, failed = process_stripe_events(batch_size)
+            except Exception as e:
+                # Base de datos caida o error inesperado: los eventos siguen pendientes y se reintentan en la siguiente vuelta
+                db.session.rollback()
+                print("Error processing Stripe events: " + str(e))
+                processed, failed = 0, 0
+            if processed or failed:
+                print(f"Stripe events processed: {processed}, failed: {failed}")
+            if processed + failed < batch_size:
+                if not loop:
+                    break
+                time.sleep(interval)
+
+    """
+    Libera las plazas de reservas caducadas y elimina los carritos abandonados: $ flask sweep-carts
+    Pensado para ejecutarse periodicamente (cron / scheduler)
+    """
+    @app.cli.command("sweep-carts")
+    @click.option("--ttl-hours", default=CART_TTL_HOURS, help="Remove carts without activity for this many hours")
+    @click.option("--batch-size", default=SEAT_HOLDS_BATCH_SIZE, help="Rows handled per transaction")
+    def sweep_carts_command(ttl_hours, batch_size):
+        released, swept = sweep_carts(ttl_hours, batch_size)
+        if released or swept:
+            invalidate_response_cache('classes')
+        print(f"Seat holds released: {released}, stale carts removed: {swept}")
+
+    """
+    Geocodifica las clases que aun no tienen coordenadas (clases antiguas o creadas con Maps caido): $ flask geocode-classes
+    """
+    @app.cli.command("geocode-classes")
+    @click.option("--batch-size", default=GEOCODE_CLASSES_BATCH_SIZE, help="Classes geocoded per transaction")
+    def geocode_classes_command(batch_size):
+        located = missing = 0
+        last_id = 0
+        while True:
+            classes = db.session.query(TrainersClasses.id,
+                                       TrainersClasses.city,
+                                       TrainersClasses.postal_code,
+                                       TrainersClasses.street_name,
+                                       TrainersClasses.street_number).filter(TrainersClasses.geohash == None,
+                                                                             TrainersClasses.id > last_id).order_by(TrainersClasses.id).limit(batch_size).all()
+            if not classes:
+                break
+            locations = []
+            for trainer_class in classes:
+                location = class_location(trainer_class.city, trainer_class.postal_code, trainer_class.street_name, trainer_class.street_number)
+                if location['geohash']:
+                    locations.append(dict(location, id=trainer_class.id))
+                else:
+                    missing += 1
+            if locations:
+                db.session.bulk_update_mappings(TrainersClasses, locations)
+                db.session.commit()
+            located += len(locations)
+            last_id = classes[-1].id
+        if located:
+            invalidate_response_cache('classes')
+        print(f"Classes geocoded: {located}, not found: {missing}")
+
+    """
+    Recalcula el texto de busqueda de todas las clases y reconstruye el indice: $ flask reindex-search
+    Necesario una vez despues de la migracion de busqueda
+    """
+    @app.cli.command("reindex-search")
+    @click.option("--batch-size", default=SEARCH_REINDEX_BATCH_SIZE, help="Classes updated per transaction")
+    def reindex_search_command(batch_size):
+        refreshed = refresh_search_documents(batch_size=batch_size)
+        rebuild_search_index()
+        invalidate_response_cache('classes')
+        print(f"Classes indexed: {refreshed}")
+
+    """
+    Exporta las reservas (con clase, trainer y usuario) a CSV o NDJSON: $ flask export-bookings --format csv --output bookings.csv
+    Sin --output se escribe en la salida estandar. Las fechas filtran por el inicio de la clase
+    """
+    @app.cli.command("export-bookings")
+    @click.option("--format", "export_format", type=click.Choice(list(EXPORT_FORMATS)), default="csv", help="Output format")
+    @click.option("--output", type=click.File("w", encoding="utf-8"), default="-", help="Output file")
+    @click.option("--start-from", default=None, help="Classes starting at or after this ISO 8601 datetime")
+    @click.option("--start-to", default=None, help="Classes starting before this ISO 8601 datetime")
+    @click.option("--stripe-status", type=click.Choice(STRIPE_STATUSES), default=None)
+    @click.option("--trainer-status", type=click.Choice(TRAINER_STATUSES), default=None)
+    @click.option("--chunk-size", default=EXPORT_CHUNK_SIZE, help="Rows read from the cursor and written at a time")
+    def export_bookings_command(export_format, output, start_from, start_to, stripe_status, trainer_status, chunk_size):
+        try:
+            filters = export_filters(start_from, start_to, stripe_status, trainer_status)
+        except APIException as e:
+            raise click.BadParameter(e.message)
+        for chunk in export_bookings(bookings_export_rows(filters, chunk_size), export_format, chunk_size):
+            output.write(chunk)
+
+    """
+    Compara el serializador por columnas con Model.serialize() sobre el catalogo de clases: $ flask benchmark-serializers --limit 1000
+    Solo lee de la base de datos. Muestra el mejor tiempo de --repeat vueltas de cada camino
+    """
+    @app.cli.command("benchmark-serializers")
+    @click.option("--limit", default=1000, help="Classes serialized per run")
+    @click.option("--repeat", default=5, help="Runs per path")
+    def benchmark_serializers_command(limit, repeat):
+        def serialize_orm():
+            classes = db.session.query(TrainersClasses).options(joinedload(TrainersClasses.trainer),
+                                                                joinedload(TrainersClasses.specializations)).order_by(TrainersClasses.start_date, TrainersClasses.id).limit(limit).all()
+            return [{'class_details': cls.serialize(),
+                     'specialization': cls.specializations.serialize() if cls.specializations else None,
+                     'trainer': {'name': cls.trainer.name, 'last_name': cls.trainer.last_name} if cls.trainer else None} for cls in classes]
+
+        def serialize_rows():
+            return [catalog(row) for row in catalog.query().order_by(TrainersClasses.start_date, TrainersClasses.id).limit(limit)]
+
+        def encode_stdlib(results):
+            return json.dumps(results, default=DefaultJSONProvider.default, sort_keys=True, separators=(",", ":"))
+
+        def best_ms(fn, *args, **kwargs):
+            timings = []
+            for _ in range(repeat):
+                db.session.expunge_all()
+                started = time.perf_counter()
+                result = fn(*args, **kwargs)
+                timings.append((time.perf_counter() - started) * 1000)
+            return min(timings), result
+
+        orm_ms, orm_results = best_ms(serialize_orm)
+        rows_ms, rows_results = best_ms(serialize_rows)
+        stdlib_ms, stdlib_body = best_ms(encode_stdlib, orm_results)
+        fast_ms, fast_body = best_ms(current_app.json.dumps, rows_results, separators=(",", ":"))
+        print(f"Classes: {len(orm_results)}, identical output: {json.loads(stdlib_body) == json.loads(fast_body)}, encoder: {'orjson' if orjson else 'json'}")
+        print(f"Query + Model.serialize(): {orm_ms:.1f} ms, json.dumps: {stdlib_ms:.1f} ms, total: {orm_ms + stdlib_ms:.1f} ms")
+        print(f"Query + row serializers:   {rows_ms:.1f} ms, provider:   {fast_ms:.1f} ms, total: {rows_ms + fast_ms:.1f} ms")
+
+    """
+    Genera las variantes .gz y .br (si brotli esta instalado) de los estaticos de public/: $ flask compress-static
+    Se ejecuta en el build despues de npm run build; solo recomprime los ficheros que han cambiado
+    """
+    @app.cli.command("compress-static")
+    @click.option("--directory", default=STATIC_DIR, help="Static files directory")
+    def compress_static_command(directory):
+        written = precompress_static(directory)
+        print(f"Compressed files written: {written}")
+
+    """
+    Peticiones por segundo de las rutas de estaticos, con el cliente de pruebas de Flask (sin red): $ flask benchmark-static
+    Mide index.html, una ruta del front (que devuelve index.html) y cada .js del build
+    """
+    @app.cli.command("benchmark-static")
+    @click.option("--requests", "count", default=2000, help="Requests per path")
+    @click.option("--encoding", default="gzip, deflate, br", help="Accept-Encoding sent by the client")
+    def benchmark_static_command(count, encoding):
+        client = app.test_client()
+        paths = ['/', '/classes/1/details'] + sorted('/' + name for name in os.listdir(STATIC_DIR) if name.endswith('.js'))
+        for path in paths:
+            started = time.perf_counter()
+            for _ in range(count):
+                response = client.get(path, headers={'Accept-Encoding': encoding})
+                response.get_data()
+                response.close()
+            elapsed = time.perf_counter() - started
+            print(f"{path}: {count / elapsed:.0f} req/s, status {response.status_code}, {len(response.get_data())} bytes, "
+                  f"encoding {response.headers.get('Content-Encoding')}, cache-control {response.headers.get('Cache-Control')}")
+
+    """
+    Rendimiento segun el tamano del pool: $ flask load-test-pool --pool-sizes 1,2,5,10 --threads 20
+    Cada hilo pide una conexion, ejecuta la consulta y la retiene --hold-ms (el tiempo de una peticion real);
+    con menos conexiones que hilos el rendimiento lo marca el pool y crece la espera de los checkouts
+    """
+    @app.cli.command("load-test-pool")
+    @click.option("--pool-sizes", default="1,2,5,10", help="Comma separated pool sizes to test")
+    @click.option("--threads", default=20, help="Concurrent threads")
+    @click.option("--requests", "count", default=500, help="Requests per pool size")
+    @click.option("--hold-ms", default=20, help="Milliseconds each request keeps its connection")
+    @click.option("--query", default="SELECT 1", help="SQL executed by each request")
+    @click.option("--timeout", default=DB_POOL_TIMEOUT, help="Seconds to wait for a connection")
+    def load_test_pool_command(pool_sizes, threads, count, hold_ms, query, timeout):
+        url = current_app.config['SQLALCHEMY_DATABASE_URI']
+        connect_args = {'check_same_thread': False} if url.startswith("sqlite") else {}
+        for pool_size in [int(size) for size in pool_sizes.split(",")]:
+            engine = create_engine(url, poolclass=InstrumentedQueuePool, pool_size=pool_size, max_overflow=0,
+                                   pool_timeout=timeout, connect_args=connect_args)
+            pending = iter(range(count))
+            lock = threading.Lock()
+            errors = []
+
+            def worker():
+                while True:
+                    with lock:
+                        if next(pending, None) is None:
+                            return
+                    try:
+                        with engine.connect() as connection:
+                            connection.execute(text(query)).fetchall()
+                            time.sleep(hold_ms / 1000)
+                    # Los timeouts del checkout los cuenta el pool; cualquier otro error se cuenta aparte
+                    except exc.TimeoutError:
+                        pass
+                    except Exception as e:
+                        with lock:
+                            errors.append(e)
+
+            workers = [threading.Thread(target=worker) for _ in range(threads)]
+            started = time.perf_counter()
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+            elapsed = time.perf_counter() - started
+            wait = engine.pool.wait_stats.stats()
+            print(f"pool_size {pool_size}: {count / elapsed:.0f} req/s, checkout wait avg {wait['avg_ms']} ms, p50 {wait['p50_ms']} ms, "
+                  f"p95 {wait['p95_ms']} ms, max {wait['max_ms']} ms, timeouts {engine.pool.timeouts}, errors {len(errors)}")
+            if errors:
+                print(f"First error: {errors[0]}")
+            engine.dispose()
@@ -0,0 +1,105 @@
+"""
+Response compression. API responses (JSON, NDJSON, CSV) above a size threshold are compressed with the
+best encoding the client accepts: brotli when the brotli package is installed, gzip otherwise. Streamed
+responses are compressed chunk by chunk. Static files are precompressed once (flask compress-static, run
+at build time) and served from their .br / .gz variants by api.assets
+"""
+import os
+import gzip
+import zlib
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+# Nivel para respuestas dinamicas (rapido); los estaticos se comprimen una vez con el nivel maximo
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", 6))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", 5))
+COMPRESSIBLE_MIMETYPES = {'application/json', 'application/x-ndjson', 'text/csv', 'text/html', 'text/plain'}
+STATIC_EXTENSIONS = ('.js', '.css', '.html', '.json', '.svg', '.txt', '.map', '.ico')
+# Extension de la variante precomprimida de cada codificacion, por orden de preferencia del servidor
+STATIC_VARIANTS = {'br': '.br', 'gzip': '.gz'}
+
+
+def available_encodings():
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+
+# Mejor codificacion aceptada por el cliente (respeta los q= de Accept-Encoding); None si no acepta ninguna
+def negotiate_encoding(encodings=None):
+    return request.accept_encodings.best_match(encodings or available_encodings())
+
+
+def compress(data, encoding, gzip_level=GZIP_LEVEL, brotli_quality=BROTLI_QUALITY):
+    if encoding == 'br':
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+# Comprime un iterable de bytes sin tenerlo entero en memoria
+def compress_stream(chunks, encoding):
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        compress_chunk, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        compress_chunk, finish = compressor.compress, compressor.flush
+    for chunk in chunks:
+        data = compress_chunk(chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+# after_request: comprime las respuestas de la API que merecen la pena
+def compress_response(response):
+    if (response.status_code < 200 or response.status_code in (204, 206, 304)
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    if not response.is_streamed and response.content_length is not None and response.content_length < COMPRESSION_MIN_SIZE:
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding()
+    if encoding is None:
+        return response
+    if response.is_streamed:
+        response.response = compress_stream(response.iter_encoded(), encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        response.set_data(compress(response.get_data(), encoding))
+    response.headers['Content-Encoding'] = encoding
+    # El cuerpo comprimido es otra representacion: el ETag pasa a ser debil (If-None-Match compara en modo debil)
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+# Escribe las variantes .gz (y .br) de los estaticos que aun no las tienen o que han cambiado
+def precompress_static(directory, min_size=COMPRESSION_MIN_SIZE):
+    written = 0
+    for root, dirs, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            if not name.endswith(STATIC_EXTENSIONS) or os.path.getsize(path) < min_size:
+                continue
+            with open(path, 'rb') as source:
+                data = None
+                for encoding in available_encodings():
+                    variant = path + STATIC_VARIANTS[encoding]
+                    if os.path.exists(variant) and os.path.getmtime(variant) >= os.path.getmtime(path):
+                        continue
+                    data = data if data is not None else source.read()
+                    # Se escribe a un temporal y se renombra: otro proceso nunca ve un fichero a medias
+                    with open(variant + '.tmp', 'wb') as target:
+                        target.write(compress(data, encoding, gzip_level=9, brotli_quality=11))
+                    os.replace(variant + '.tmp', variant)
+                    written += 1
+    return written
+
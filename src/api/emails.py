@@ -0,0 +1,109 @@
+"""
+Outbound email: messages are rendered from templates compiled once at startup, written to the
+email_outbox table in the same transaction as the domain change and delivered later by the
+"send-emails" command, outside the request thread
+"""
+import os
+from datetime import datetime, timedelta
+from flask import current_app
+from flask_mail import Message
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from api.models import db, EmailOutbox
+
+
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", 50))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", 5))
+EMAIL_RETRY_BASE_SECONDS = int(os.getenv("EMAIL_RETRY_BASE_SECONDS", 30))
+
+
+EMAIL_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'templates', 'emails')
+EMAIL_TEMPLATE_NAMES = ['confirm_user', 'confirm_trainer', 'reset_password', 'specialization_request', 'specialization_result']
+
+
+# Plantillas de correo (HTML y texto plano) compiladas una sola vez al arrancar
+class EmailTemplates:
+    def __init__(self, directory, names):
+        self.env = Environment(loader=FileSystemLoader(directory),
+                               autoescape=select_autoescape(['html']),
+                               auto_reload=False)
+        self.templates = {name: (self.env.get_template(f"{name}.html"), self.env.get_template(f"{name}.txt")) for name in names}
+
+    # Devuelve (html, texto plano)
+    def render(self, name, **context):
+        html_template, text_template = self.templates[name]
+        return html_template.render(**context), text_template.render(**context)
+
+    # Renderiza muchos destinatarios con la misma plantilla compilada
+    def render_batch(self, name, contexts):
+        html_template, text_template = self.templates[name]
+        return [(html_template.render(**context), text_template.render(**context)) for context in contexts]
+
+
+email_templates = EmailTemplates(EMAIL_TEMPLATES_DIR, EMAIL_TEMPLATE_NAMES)
+
+
+# Agrega el correo a la sesion actual; se guarda con el commit del handler que lo llama
+def queue_email(subject, recipient, html, body=None, sender=None):
+    email = EmailOutbox(recipient=recipient,
+                        sender=sender,
+                        subject=subject,
+                        html=html,
+                        body=body,
+                        status="Pending",
+                        attempts=0,
+                        next_attempt_at=datetime.utcnow())
+    db.session.add(email)
+    return email
+
+
+def queue_template_email(template, subject, recipient, sender=None, **context):
+    html, body = email_templates.render(template, **context)
+    return queue_email(subject, recipient, html, body=body, sender=sender)
+
+
+# Encola el mismo correo para muchos destinatarios: recipients es una lista de (email, contexto)
+def queue_template_emails(template, subject, recipients, sender=None):
+    rendered = email_templates.render_batch(template, [context for recipient, context in recipients])
+    emails = [EmailOutbox(recipient=recipient,
+                          sender=sender,
+                          subject=subject,
+                          html=html,
+                          body=body,
+                          status="Pending",
+                          attempts=0,
+                          next_attempt_at=datetime.utcnow()) for (recipient, context), (html, body) in zip(recipients, rendered)]
+    db.session.add_all(emails)
+    return emails
+
+
+# Envia un lote de correos pendientes por una sola conexion SMTP. Devuelve (enviados, fallidos)
+def send_pending_emails(batch_size=EMAIL_BATCH_SIZE):
+    now = datetime.utcnow()
+    # skip_locked permite varios workers en Postgres sin enviar dos veces el mismo correo
+    emails = db.session.query(EmailOutbox).filter(EmailOutbox.status == "Pending",
+                                                  EmailOutbox.next_attempt_at <= now).order_by(EmailOutbox.id).limit(batch_size).with_for_update(skip_locked=True).all()
+    if not emails:
+        return 0, 0
+    sent = failed = 0
+    mail = current_app.extensions['mail']
+    with mail.connect() as connection:
+        for email in emails:
+            msg = Message(email.subject, recipients=[email.recipient], html=email.html, body=email.body, sender=email.sender)
+            try:
+                connection.send(msg)
+            except Exception as e:
+                email.attempts += 1
+                email.last_error = str(e)[:255]
+                if email.attempts >= EMAIL_MAX_ATTEMPTS:
+                    email.status = "Failed"
+                else:
+                    # Backoff exponencial: 30s, 60s, 120s...
+                    email.next_attempt_at = datetime.utcnow() + timedelta(seconds=EMAIL_RETRY_BASE_SECONDS * 2 ** (email.attempts - 1))
+                failed += 1
+                continue
+            email.status = "Sent"
+            email.attempts += 1
+            email.sent_at = datetime.utcnow()
+            sent += 1
+    db.session.commit()
+    return sent, failed
@@ -0,0 +1,93 @@
+"""
+Bookings export for reconciling payments: users_classes joined with the class, the trainer and the user,
+written as CSV or NDJSON. Rows are read through a server-side cursor and written in chunks, so an export
+of millions of bookings runs in constant memory (the endpoint streams it, the CLI writes it to a file)
+"""
+import os
+import io
+import csv
+import json
+from datetime import datetime
+from api.models import db, Users, Trainers, TrainersClasses, UsersClasses
+from api.utils import APIException, parse_datetime_param
+
+
+EXPORT_FORMATS = {'csv': 'text/csv', 'ndjson': 'application/x-ndjson'}
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", 2000))
+STRIPE_STATUSES = ("Cart", "Paid", "Reject")
+TRAINER_STATUSES = ("Paid", "Pending")
+
+
+# Columnas del export, en orden (nombre de la columna, expresion)
+EXPORT_COLUMNS = [('booking_id', UsersClasses.id),
+                  ('amount', UsersClasses.amount),
+                  ('stripe_status', UsersClasses.stripe_status),
+                  ('trainer_status', UsersClasses.trainer_status),
+                  ('updated_at', UsersClasses.updated_at),
+                  ('class_id', TrainersClasses.id),
+                  ('class_name', TrainersClasses.class_name),
+                  ('start_date', TrainersClasses.start_date),
+                  ('end_date', TrainersClasses.end_date),
+                  ('city', TrainersClasses.city),
+                  ('price', TrainersClasses.price),
+                  ('stripe_price_id', TrainersClasses.stripe_price_id),
+                  ('trainer_id', Trainers.id),
+                  ('trainer_name', Trainers.name),
+                  ('trainer_last_name', Trainers.last_name),
+                  ('trainer_email', Trainers.email),
+                  ('user_id', Users.id),
+                  ('user_name', Users.name),
+                  ('user_last_name', Users.last_name),
+                  ('user_email', Users.email)]
+EXPORT_FIELDS = [name for name, column in EXPORT_COLUMNS]
+
+
+# Valida los filtros (los mismos para el endpoint y el comando). Las fechas filtran por el inicio de la clase
+def export_filters(start_from=None, start_to=None, stripe_status=None, trainer_status=None):
+    filters = []
+    if start_from:
+        filters.append(TrainersClasses.start_date >= parse_datetime_param(start_from, 'start_from'))
+    if start_to:
+        filters.append(TrainersClasses.start_date < parse_datetime_param(start_to, 'start_to'))
+    if stripe_status:
+        if stripe_status not in STRIPE_STATUSES:
+            raise APIException("Invalid stripe_status", status_code=400, payload={"stripe_status available": list(STRIPE_STATUSES)})
+        filters.append(UsersClasses.stripe_status == stripe_status)
+    if trainer_status:
+        if trainer_status not in TRAINER_STATUSES:
+            raise APIException("Invalid trainer_status", status_code=400, payload={"trainer_status available": list(TRAINER_STATUSES)})
+        filters.append(UsersClasses.trainer_status == trainer_status)
+    return filters
+
+
+# Una sola consulta con los joins; stream_results abre un cursor de servidor en Postgres y yield_per lo lee por lotes
+def bookings_export_rows(filters, chunk_size=EXPORT_CHUNK_SIZE):
+    query = db.session.query(*[column.label(name) for name, column in EXPORT_COLUMNS]).select_from(UsersClasses).join(TrainersClasses, TrainersClasses.id == UsersClasses.class_id).join(Trainers, Trainers.id == TrainersClasses.trainer_id).join(Users, Users.id == UsersClasses.user_id).filter(*filters).order_by(UsersClasses.id)
+    return query.execution_options(stream_results=True).yield_per(chunk_size)
+
+
+def export_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+# Genera el export en trozos de texto de chunk_size filas (CSV con cabecera o una linea JSON por reserva)
+def export_bookings(rows, export_format, chunk_size=EXPORT_CHUNK_SIZE):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if export_format == 'csv' else None
+    if writer:
+        writer.writerow(EXPORT_FIELDS)
+    pending = 0
+    for row in rows:
+        values = [export_value(value) for value in row]
+        if writer:
+            writer.writerow(values)
+        else:
+            buffer.write(json.dumps(dict(zip(EXPORT_FIELDS, values))) + "\n")
+        pending += 1
+        if pending == chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,124 @@
+"""
+Geocoding and nearby-places lookups with a two-level cache: an in-process LRU in front of the
+geo_cache table, which survives restarts and is shared by every worker. Concurrent misses for the
+same key are coalesced so only one request goes to Google Maps
+"""
+import os
+import json
+import threading
+import unicodedata
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from api.models import db, GeoCache
+from api.cache import TTLCache
+from api.integrations import google_maps_client, google_maps_provider
+
+
+GEOCODE_CACHE_TTL_DAYS = int(os.getenv("GEOCODE_CACHE_TTL_DAYS", 30))
+PLACES_CACHE_TTL_DAYS = int(os.getenv("PLACES_CACHE_TTL_DAYS", 7))
+GYMS_RADIUS = 5000
+GYMS_MAX_RADIUS = 50000
+MISSING = object()
+
+
+geo_memory_cache = TTLCache(maxsize=int(os.getenv("GEO_CACHE_SIZE", 1024)),
+                            ttl=int(os.getenv("GEO_MEMORY_CACHE_TTL", 3600)))
+
+
+# Agrupa las llamadas concurrentes con la misma clave: la primera hace el trabajo y las demas esperan su resultado
+class SingleFlight:
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+        if not leader:
+            return call.result()
+        try:
+            result = fn()
+            call.set_result(result)
+            return result
+        except Exception as e:
+            call.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+geo_flight = SingleFlight()
+
+
+# "  Málaga " y "malaga" comparten entrada de cache
+def normalize_place(place):
+    place = unicodedata.normalize('NFKD', place).encode('ascii', 'ignore').decode()
+    return " ".join(place.lower().split())
+
+
+def read_geo_cache(key):
+    row = db.session.query(GeoCache.payload).filter(GeoCache.key == key, GeoCache.expires_at > datetime.utcnow()).first()
+    return MISSING if row is None else json.loads(row.payload)
+
+
+# Se escribe en su propia transaccion para no hacer commit de cambios pendientes del handler que llama
+def write_geo_cache(key, value, ttl):
+    now = datetime.utcnow()
+    try:
+        with db.engine.begin() as connection:
+            connection.execute(db.delete(GeoCache).where(GeoCache.key == key))
+            connection.execute(db.insert(GeoCache).values(key=key, payload=json.dumps(value), expires_at=now + ttl, updated_at=now))
+    except Exception as e:
+        # Otro worker ha guardado la misma clave a la vez; el valor es equivalente
+        print("Error saving geo cache: " + str(e))
+
+
+# Memoria -> tabla geo_cache -> Google Maps. Tambien se guardan los resultados vacios (None o [])
+def cached_lookup(key, ttl, fetch):
+    value = geo_memory_cache.get(key, MISSING)
+    if value is not MISSING:
+        return value
+
+    def load():
+        value = read_geo_cache(key)
+        if value is MISSING:
+            value = fetch()
+            write_geo_cache(key, value, ttl)
+        geo_memory_cache.set(key, value)
+        return value
+    return geo_flight.do(key, load)
+
+
+# Devuelve {'lat': ..., 'lng': ...} o None si la ciudad o direccion no existe
+def geocode(place):
+    def fetch():
+        geocode_result = google_maps_provider.call(google_maps_client().geocode, place)
+        if not geocode_result:
+            return None
+        location = geocode_result[0]['geometry']['location']
+        return {'lat': location['lat'], 'lng': location['lng']}
+    return cached_lookup(f"geocode:{normalize_place(place)}", timedelta(days=GEOCODE_CACHE_TTL_DAYS), fetch)
+
+
+def geocode_city(city):
+    return geocode(city)
+
+
+def geocode_address(city, postal_code, street_name, street_number):
+    return geocode(f"{street_name} {street_number}, {postal_code} {city}")
+
+
+# Devuelve la lista de gimnasios [(nombre, direccion)] cerca de la ciudad, o None si la ciudad no existe
+def find_gyms(city, radius=GYMS_RADIUS):
+    location = geocode_city(city)
+    if location is None:
+        return None
+
+    def fetch():
+        places_result = google_maps_provider.call(google_maps_client().places_nearby, location=(location['lat'], location['lng']), radius=radius, type='gym')
+        return [(place['name'], place['vicinity']) for place in places_result['results']]
+    return cached_lookup(f"places:gym:{normalize_place(city)}:{radius}", timedelta(days=PLACES_CACHE_TTL_DAYS), fetch)
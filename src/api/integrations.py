@@ -0,0 +1,185 @@
+"""
+External providers (Stripe, Cloudinary, Google Maps): pooled HTTP sessions, per-provider timeouts,
+a circuit breaker that fails fast while a provider is down and per-operation latency metrics. Base URLs
+can be overridden to point at local fake servers
+"""
+import os
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+import stripe
+import googlemaps
+import cloudinary
+import cloudinary.uploader
+import cloudinary.exceptions
+from api.utils import APIException
+from api.metrics import LatencyStats
+
+
+INTEGRATIONS_POOL_SIZE = int(os.getenv("INTEGRATIONS_POOL_SIZE", 10))
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", 5))
+CIRCUIT_RESET_SECONDS = float(os.getenv("CIRCUIT_RESET_SECONDS", 30))
+
+
+# El proveedor esta caido (circuito abierto): se responde 503 sin esperar al timeout
+class ProviderUnavailable(APIException):
+    def __init__(self, provider):
+        APIException.__init__(self, f"{provider} is temporarily unavailable, try again later", status_code=503)
+        self.provider = provider
+
+    def __str__(self):
+        return self.message
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, reset_seconds=CIRCUIT_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.reset_seconds:
+            return "open"
+        return "half-open"
+
+    # Devuelve False si la llamada debe rechazarse. En half-open solo pasa una llamada de prueba
+    def allow(self):
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self.trial_running:
+                self.trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.trial_running or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.trial_running = False
+
+
+# Un proveedor externo. failure_exceptions son los errores que cuentan como caida (red, 5xx, rate limit);
+# los errores del cliente (p.ej. 400 por datos invalidos) no abren el circuito
+class Provider:
+    def __init__(self, name, timeout, failure_exceptions):
+        self.name = name
+        self.timeout = timeout
+        self.failure_exceptions = failure_exceptions
+        self.breaker = CircuitBreaker()
+        self.metrics = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, operation):
+        with self._lock:
+            return self.metrics.setdefault(operation, LatencyStats())
+
+    def call(self, fn, *args, **kwargs):
+        operation = operation_name(fn)
+        stats = self._stats(operation)
+        if not self.breaker.allow():
+            stats.record_rejected()
+            raise ProviderUnavailable(self.name)
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except self.failure_exceptions:
+            stats.record((time.perf_counter() - started) * 1000, error=True)
+            self.breaker.record_failure()
+            raise
+        except Exception:
+            stats.record((time.perf_counter() - started) * 1000, error=True)
+            self.breaker.record_success()
+            raise
+        stats.record((time.perf_counter() - started) * 1000)
+        self.breaker.record_success()
+        return result
+
+    def stats(self):
+        with self._lock:
+            operations = {operation: stats.stats() for operation, stats in self.metrics.items()}
+        return {'timeout': self.timeout,
+                'circuit': self.breaker.state,
+                'failures': self.breaker.failures,
+                'operations': operations}
+
+
+# "Price.create", "geocode", "upload"...
+def operation_name(fn):
+    owner = getattr(fn, '__self__', None)
+    if isinstance(owner, type):
+        return f"{owner.__name__}.{fn.__name__}"
+    return getattr(fn, '__qualname__', getattr(fn, '__name__', repr(fn)))
+
+
+def pooled_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=INTEGRATIONS_POOL_SIZE, pool_maxsize=INTEGRATIONS_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Stripe: un cliente HTTP con sesion compartida (keep-alive) y timeout; la libreria ya reintenta los errores de red
+stripe_provider = Provider("stripe",
+                           timeout=float(os.getenv("STRIPE_TIMEOUT", 10)),
+                           failure_exceptions=(stripe.APIConnectionError, stripe.APIError, stripe.RateLimitError))
+stripe.default_http_client = stripe.RequestsClient(timeout=stripe_provider.timeout, session=pooled_session())
+stripe.max_network_retries = int(os.getenv("STRIPE_MAX_NETWORK_RETRIES", 1))
+if os.getenv("STRIPE_API_BASE"):
+    stripe.api_base = os.getenv("STRIPE_API_BASE")
+
+
+# Cloudinary ya usa un PoolManager de urllib3 por proceso; aqui solo se fija el timeout de subida
+cloudinary_provider = Provider("cloudinary",
+                               timeout=float(os.getenv("CLOUDINARY_TIMEOUT", 30)),
+                               failure_exceptions=(cloudinary.exceptions.GeneralError, cloudinary.exceptions.RateLimited))
+if os.getenv("CLOUDINARY_UPLOAD_PREFIX"):
+    cloudinary.config(upload_prefix=os.getenv("CLOUDINARY_UPLOAD_PREFIX"))
+
+
+def cloudinary_upload(file, **options):
+    return cloudinary_provider.call(cloudinary.uploader.upload, file, timeout=cloudinary_provider.timeout, **options)
+
+
+google_maps_provider = Provider("google_maps",
+                                timeout=float(os.getenv("GOOGLE_MAPS_TIMEOUT", 5)),
+                                failure_exceptions=(googlemaps.exceptions.Timeout, googlemaps.exceptions.TransportError))
+_google_maps_client = None
+_google_maps_lock = threading.Lock()
+
+
+# Un solo cliente de Google Maps por proceso (se crea al primer uso porque exige GOOGLE_API_KEY)
+def google_maps_client():
+    global _google_maps_client
+    if _google_maps_client is None:
+        with _google_maps_lock:
+            if _google_maps_client is None:
+                _google_maps_client = googlemaps.Client(key=os.getenv('GOOGLE_API_KEY'),
+                                                        timeout=google_maps_provider.timeout,
+                                                        retry_timeout=google_maps_provider.timeout * 2,
+                                                        requests_session=pooled_session(),
+                                                        base_url=os.getenv("GOOGLE_MAPS_BASE_URL", "https://maps.googleapis.com"))
+    return _google_maps_client
+
+
+PROVIDERS = [stripe_provider, cloudinary_provider, google_maps_provider]
+
+
+def integrations_stats():
+    return {provider.name: provider.stats() for provider in PROVIDERS}
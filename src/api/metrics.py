@@ -0,0 +1,53 @@
+"""
+Latency metrics shared by the external providers and the database pool: call and error counters plus a
+window of recent samples for percentiles. Safe to update and read from several threads at once
+"""
+import threading
+from collections import deque
+
+
+LATENCY_SAMPLES = 256
+
+
+# Cada actualizacion y cada lectura pasan por el lock: las usan a la vez los hilos de gunicorn (gthread)
+class LatencyStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rejected = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples = deque(maxlen=LATENCY_SAMPLES)
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms, error=False):
+        with self._lock:
+            self.calls += 1
+            self.errors += int(error)
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+            self.samples.append(elapsed_ms)
+
+    def record_rejected(self):
+        with self._lock:
+            self.rejected += 1
+
+    @staticmethod
+    def percentile(ordered, p):
+        if not ordered:
+            return None
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))], 2)
+
+    def stats(self):
+        # Copia bajo el lock; el orden y los percentiles se calculan fuera
+        with self._lock:
+            calls, errors, rejected, total_ms, max_ms = self.calls, self.errors, self.rejected, self.total_ms, self.max_ms
+            samples = list(self.samples)
+        ordered = sorted(samples)
+        return {'calls': calls,
+                'errors': errors,
+                'rejected': rejected,
+                'avg_ms': round(total_ms / calls, 2) if calls else None,
+                'p50_ms': self.percentile(ordered, 0.5),
+                'p95_ms': self.percentile(ordered, 0.95),
+                'max_ms': round(max_ms, 2)}
@@ -1,4 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
+from datetime import datetime
 
 
 db = SQLAlchemy()
@@ -96,6 +97,7 @@ class Specializations(db.Model):
         name = db.Column(db.String(100), unique=True, nullable=False)
         description = db.Column(db.String())
         logo_url = db.Column(db.String())
+        updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=db.func.now())
 
         def __repr__(self):
            return f'<Specialization: {self.id} - Name: {self.name}>'
@@ -109,6 +111,12 @@ class Specializations(db.Model):
 
 class TrainersClasses(db.Model):
         __tablename__= "trainers_classes"
+        __table_args__ = (db.Index("ix_trainers_classes_start_date_id", "start_date", "id"),
+                          db.Index("ix_trainers_classes_city_start_date", "city", "start_date", "id"),
+                          db.Index("ix_trainers_classes_postal_code_start_date", "postal_code", "start_date", "id"),
+                          db.Index("ix_trainers_classes_training_type_start_date", "training_type", "start_date", "id"),
+                          db.Index("ix_trainers_classes_trainer_id_start_date_end_date", "trainer_id", "start_date", "end_date"),
+                          db.Index("ix_trainers_classes_geohash", "geohash"))
         id = db.Column(db.Integer, primary_key=True)
         class_name = db.Column(db.String(120), unique=False, nullable=True)
         class_details = db.Column(db.String(200), unique=False, nullable=True)
@@ -126,8 +134,17 @@ class TrainersClasses(db.Model):
         specializations = db.relationship("Specializations", foreign_keys=[training_type])
         trainer_id = db.Column(db.Integer, db.ForeignKey("trainers.id"))
         trainer = db.relationship('Trainers', backref=db.backref('classes', lazy=True))
-        stripe_product_id = db.Column(db.String(), unique=True)
-        stripe_price_id = db.Column(db.String(), unique=True) 
+        # Las clases de una serie recurrente comparten producto y precio de Stripe
+        stripe_product_id = db.Column(db.String(), unique=False, index=True)
+        stripe_price_id = db.Column(db.String(), unique=False, index=True)
+        # Coordenadas de la direccion (geocodificada al crear o cambiar la clase) y su geohash para buscar por radio
+        latitude = db.Column(db.Float, unique=False, nullable=True)
+        longitude = db.Column(db.Float, unique=False, nullable=True)
+        geohash = db.Column(db.String(12), unique=False, nullable=True)
+        # Texto normalizado para la busqueda (ver api/search.py); la base de datos lo indexa
+        search_title = db.Column(db.Text, unique=False, nullable=True)
+        search_body = db.Column(db.Text, unique=False, nullable=True)
+        updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=db.func.now())
 
         def __repr__(self):
            return f'<Trainer Class: {self.id} - Trainer: {self.trainer_id}>'
@@ -148,12 +165,19 @@ class TrainersClasses(db.Model):
                     'price': self.price,
                     'training_type': self.training_type,
                     'training_level': self.training_level,
+                    'latitude': self.latitude,
+                    'longitude': self.longitude,
                     "stripe_product_id": self.stripe_product_id,
                     "stripe_price_id": self.stripe_price_id}
     
 
 class UsersClasses(db.Model):
         __tablename__ = "users_classes"
+        # Indices parciales: solo cubren carritos activos y reservas vigentes, que es lo que recorre el barrido
+        __table_args__ = (db.Index("ix_users_classes_active_carts", "updated_at",
+                                   postgresql_where=db.text("stripe_status = 'Cart'"), sqlite_where=db.text("stripe_status = 'Cart'")),
+                          db.Index("ix_users_classes_seat_holds", "hold_expires_at",
+                                   postgresql_where=db.text("hold_expires_at IS NOT NULL"), sqlite_where=db.text("hold_expires_at IS NOT NULL")))
         id = db.Column(db.Integer, primary_key=True)
         amount = db.Column(db.Integer, unique=False, nullable=False)
         stripe_status = db.Column(db.Enum("Cart", "Paid", "Reject", name="stripe_status"), nullable=False)
@@ -163,6 +187,8 @@ class UsersClasses(db.Model):
         user = db.relationship("Users", foreign_keys=[user_id])
         class_id = db.Column(db.Integer, db.ForeignKey("trainers_classes.id")) 
         training_class = db.relationship("TrainersClasses", foreign_keys=[class_id])
+        hold_expires_at = db.Column(db.DateTime, nullable=True)
+        updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=db.func.now())
 
         def __repr__(self):
            return f'<User Class: {self.id} - User: {self.user_id} - Class: {self.class_id}>'
@@ -197,4 +223,75 @@ class TrainersSpecializations(db.Model):
                     'status': self.status}
 
 
+class EmailOutbox(db.Model):
+        __tablename__ = "email_outbox"
+        __table_args__ = (db.Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),)
+        id = db.Column(db.Integer, primary_key=True)
+        recipient = db.Column(db.String(120), unique=False, nullable=False)
+        sender = db.Column(db.String(120), unique=False, nullable=True)
+        subject = db.Column(db.String(255), unique=False, nullable=False)
+        html = db.Column(db.Text, unique=False, nullable=False)
+        body = db.Column(db.Text, unique=False, nullable=True)
+        status = db.Column(db.Enum("Pending", "Sent", "Failed", name="email_status"), nullable=False, default="Pending")
+        attempts = db.Column(db.Integer, unique=False, nullable=False, default=0)
+        last_error = db.Column(db.String(255), unique=False, nullable=True)
+        next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+        created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+        sent_at = db.Column(db.DateTime, nullable=True)
+
+        def __repr__(self):
+           return f'<Email: {self.id} - Recipient: {self.recipient} - Status: {self.status}>'
+
+        def serialize(self):
+            return {'id': self.id,
+                    'recipient': self.recipient,
+                    'subject': self.subject,
+                    'status': self.status,
+                    'attempts': self.attempts,
+                    'last_error': self.last_error,
+                    'created_at': self.created_at,
+                    'sent_at': self.sent_at}
+
+
+class StripeEvents(db.Model):
+        __tablename__ = "stripe_events"
+        __table_args__ = (db.Index("ix_stripe_events_status_created", "status", "created"),)
+        id = db.Column(db.String(255), primary_key=True)
+        type = db.Column(db.String(100), unique=False, nullable=False)
+        payload = db.Column(db.Text, unique=False, nullable=False)
+        created = db.Column(db.Integer, unique=False, nullable=False)
+        status = db.Column(db.Enum("Pending", "Processed", "Failed", name="stripe_event_status"), nullable=False, default="Pending")
+        attempts = db.Column(db.Integer, unique=False, nullable=False, default=0)
+        last_error = db.Column(db.String(255), unique=False, nullable=True)
+        next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+        received_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+        processed_at = db.Column(db.DateTime, nullable=True)
+
+        def __repr__(self):
+           return f'<Stripe Event: {self.id} - Type: {self.type} - Status: {self.status}>'
+
+        def serialize(self):
+            return {'id': self.id,
+                    'type': self.type,
+                    'created': self.created,
+                    'status': self.status,
+                    'attempts': self.attempts,
+                    'last_error': self.last_error,
+                    'received_at': self.received_at,
+                    'processed_at': self.processed_at}
+
 
+class GeoCache(db.Model):
+        __tablename__ = "geo_cache"
+        key = db.Column(db.String(255), primary_key=True)
+        payload = db.Column(db.Text, unique=False, nullable=False)
+        expires_at = db.Column(db.DateTime, nullable=False)
+        updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+        def __repr__(self):
+           return f'<Geo Cache: {self.key} - Expires: {self.expires_at}>'
+
+        def serialize(self):
+            return {'key': self.key,
+                    'expires_at': self.expires_at,
+                    'updated_at': self.updated_at}
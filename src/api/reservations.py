@@ -0,0 +1,152 @@
+"""
+Seat reservations for TrainersClasses.capacity (remaining seats). Seats are taken with a conditional
+UPDATE, so concurrent bookings can never oversell a class, and are held for a limited time while
+the class is in the cart or the Stripe checkout is open
+"""
+import os
+import time
+import threading
+from datetime import datetime, timedelta
+from api.models import db, TrainersClasses, UsersClasses
+from api.cache import invalidate_response_cache
+
+
+# Stripe rechaza un expires_at a menos de 30 minutos o a mas de 24 horas de la creacion de la sesion.
+# Se deja un margen para el desfase de reloj y la latencia de la llamada
+STRIPE_CHECKOUT_MIN_SECONDS = 30 * 60
+STRIPE_CHECKOUT_MAX_SECONDS = 24 * 60 * 60
+CHECKOUT_EXPIRY_MARGIN_SECONDS = 5 * 60
+CHECKOUT_SESSION_MINUTES = int(os.getenv("CHECKOUT_SESSION_MINUTES", 35))
+SEAT_HOLDS_BATCH_SIZE = int(os.getenv("SEAT_HOLDS_BATCH_SIZE", 500))
+# Carritos sin actividad durante mas de CART_TTL_HOURS se eliminan
+CART_TTL_HOURS = int(os.getenv("CART_TTL_HOURS", 24))
+
+
+# Duracion de la sesion de checkout en segundos, dentro de los limites de Stripe con margen
+def checkout_session_seconds(minutes=CHECKOUT_SESSION_MINUTES):
+    return min(max(minutes * 60, STRIPE_CHECKOUT_MIN_SECONDS + CHECKOUT_EXPIRY_MARGIN_SECONDS),
+               STRIPE_CHECKOUT_MAX_SECONDS - CHECKOUT_EXPIRY_MARGIN_SECONDS)
+
+
+CHECKOUT_SESSION_SECONDS = checkout_session_seconds()
+# La plaza se retiene mas que la sesion de checkout (con margen): un pago al final de la sesion aun encuentra su plaza
+SEAT_HOLD_MINUTES = max(int(os.getenv("SEAT_HOLD_MINUTES", 45)), (CHECKOUT_SESSION_SECONDS + CHECKOUT_EXPIRY_MARGIN_SECONDS) // 60 + 1)
+
+
+# UPDATE ... SET capacity = capacity - 1 WHERE capacity > 0: devuelve False si la clase esta llena
+def reserve_seat(class_id):
+    result = db.session.execute(db.update(TrainersClasses).where(TrainersClasses.id == class_id,
+                                                                TrainersClasses.capacity > 0).values(capacity=TrainersClasses.capacity - 1))
+    return result.rowcount == 1
+
+
+def release_seats(class_id, seats=1):
+    db.session.execute(db.update(TrainersClasses).where(TrainersClasses.id == class_id).values(capacity=TrainersClasses.capacity + seats))
+
+
+# Reserva (o renueva) la plaza de una clase en el carrito. Devuelve False si no quedan plazas
+def hold_seat(user_class, minutes=SEAT_HOLD_MINUTES):
+    if user_class.stripe_status == "Paid":
+        return True
+    if user_class.hold_expires_at is None and not reserve_seat(user_class.class_id):
+        return False
+    user_class.hold_expires_at = datetime.utcnow() + timedelta(minutes=minutes)
+    return True
+
+
+# Libera la plaza retenida por una clase del carrito (p.ej. cuando el usuario la quita)
+def release_hold(user_class):
+    if user_class.stripe_status != "Paid" and user_class.hold_expires_at is not None:
+        release_seats(user_class.class_id)
+        user_class.hold_expires_at = None
+
+
+# Deshace hold_seat si falla la creacion del checkout: la plaza tomada para el checkout se libera y
+# la que ya retenia el carrito recupera su caducidad anterior
+def restore_hold(user_class, hold_expires_at):
+    if hold_expires_at is None:
+        release_hold(user_class)
+    elif user_class.stripe_status != "Paid":
+        user_class.hold_expires_at = hold_expires_at
+
+
+# Pago confirmado: la plaza retenida pasa a ser definitiva. Si la reserva ya habia caducado
+# se intenta tomar otra plaza; devuelve False si la clase ya estaba llena (sobreventa)
+def confirm_seat(user_class):
+    if user_class.stripe_status == "Paid":
+        return True
+    has_seat = user_class.hold_expires_at is not None or reserve_seat(user_class.class_id)
+    user_class.stripe_status = "Paid"
+    user_class.hold_expires_at = None
+    return has_seat
+
+
+# Libera en bloque las reservas caducadas. Devuelve el numero de plazas liberadas
+def release_expired_holds(batch_size=SEAT_HOLDS_BATCH_SIZE):
+    released = 0
+    while True:
+        expired_holds = db.session.query(UsersClasses.id, UsersClasses.class_id).filter(UsersClasses.stripe_status != "Paid",
+                                                                                        UsersClasses.hold_expires_at < datetime.utcnow()).limit(batch_size).with_for_update(skip_locked=True).all()
+        if not expired_holds:
+            break
+        seats_by_class = {}
+        for user_class_id, class_id in expired_holds:
+            seats_by_class[class_id] = seats_by_class.get(class_id, 0) + 1
+        db.session.execute(db.update(UsersClasses).where(UsersClasses.id.in_([user_class_id for user_class_id, class_id in expired_holds])).values(hold_expires_at=None))
+        for class_id, seats in seats_by_class.items():
+            release_seats(class_id, seats)
+        db.session.commit()
+        released += len(expired_holds)
+        if len(expired_holds) < batch_size:
+            break
+    return released
+
+
+# Elimina en bloque las clases en "Cart" sin actividad desde hace ttl_hours, liberando sus plazas.
+# Devuelve el numero de filas eliminadas
+def sweep_stale_carts(ttl_hours=CART_TTL_HOURS, batch_size=SEAT_HOLDS_BATCH_SIZE):
+    swept = 0
+    expires_before = datetime.utcnow() - timedelta(hours=ttl_hours)
+    while True:
+        stale_carts = db.session.query(UsersClasses.id, UsersClasses.class_id, UsersClasses.hold_expires_at).filter(UsersClasses.stripe_status == "Cart",
+                                                                                                                     UsersClasses.updated_at < expires_before).limit(batch_size).with_for_update(skip_locked=True).all()
+        if not stale_carts:
+            break
+        seats_by_class = {}
+        for user_class_id, class_id, hold_expires_at in stale_carts:
+            if hold_expires_at is not None:
+                seats_by_class[class_id] = seats_by_class.get(class_id, 0) + 1
+        db.session.execute(db.delete(UsersClasses).where(UsersClasses.id.in_([user_class_id for user_class_id, class_id, hold_expires_at in stale_carts])).execution_options(synchronize_session=False))
+        for class_id, seats in seats_by_class.items():
+            release_seats(class_id, seats)
+        db.session.commit()
+        swept += len(stale_carts)
+        if len(stale_carts) < batch_size:
+            break
+    return swept
+
+
+# Un barrido completo: reservas caducadas y carritos abandonados. Devuelve (plazas liberadas, carritos eliminados)
+def sweep_carts(ttl_hours=CART_TTL_HOURS, batch_size=SEAT_HOLDS_BATCH_SIZE):
+    return release_expired_holds(batch_size), sweep_stale_carts(ttl_hours, batch_size)
+
+
+# Barrido periodico en un hilo del propio proceso (alternativa a programar "flask sweep-carts")
+def start_cart_sweeper(app, interval):
+    def run():
+        while True:
+            time.sleep(interval)
+            with app.app_context():
+                try:
+                    released, swept = sweep_carts()
+                    if released or swept:
+                        invalidate_response_cache('classes')
+                        print(f"Seat holds released: {released}, stale carts removed: {swept}")
+                except Exception as e:
+                    db.session.rollback()
+                    print("Error sweeping carts: " + str(e))
+                finally:
+                    db.session.remove()
+    sweeper = threading.Thread(target=run, name="cart-sweeper", daemon=True)
+    sweeper.start()
+    return sweeper
@@ -2,21 +2,32 @@
 This module takes care of starting the API Server, Loading the DB and Adding the endpoints
 """
 import os
-from flask import Flask, request, jsonify, url_for, Blueprint, redirect
-from api.utils import generate_sitemap, APIException
+from flask import Flask, request, jsonify, url_for, Blueprint, redirect, Response, stream_with_context, current_app
+from api.cache import specializations_cache, get_specialization, get_specializations, invalidate_specializations, cached_response, invalidate_response_cache
+from api.emails import queue_template_email
+from api.stripe_events import store_stripe_event
+from api.reservations import hold_seat, release_hold, restore_hold, CHECKOUT_SESSION_SECONDS
+from api.schedule import find_conflicts, check_slots, expand_recurrence
+from api.integrations import stripe_provider, cloudinary_upload, integrations_stats, ProviderUnavailable
+from api.geo import find_gyms, geocode_city, GYMS_RADIUS, GYMS_MAX_RADIUS
+from api.spatial import classes_within, class_location, NEARBY_RADIUS_KM, NEARBY_MAX_RADIUS_KM
+from api.search import search_terms, correct_terms, apply_search, class_search_values, refresh_search_documents, SEARCH_PAGE_SIZE, SEARCH_MAX_PAGE_SIZE
+from api.serializers import user_fields, trainer_fields, administrator_fields, class_fields, user_class_fields, catalog, CatalogSerializer
+from api.pool import pool_status
+from api.exports import export_filters, bookings_export_rows, export_bookings, EXPORT_FORMATS
+from api.utils import generate_sitemap, APIException, parse_datetime_param, parse_number_param, encode_cursor, decode_cursor, conditional_headers, stream_json_results, peek_rows
 from flask_cors import CORS
 from api.models import db, Users, Trainers, Administrators, Specializations, TrainersClasses, UsersClasses, TrainersSpecializations
 from flask_jwt_extended import create_access_token, get_jwt_identity, jwt_required
 from flask_bcrypt import Bcrypt
-from flask_mail import Mail, Message
-from flask import render_template
 from datetime import timedelta, datetime
+from sqlalchemy.orm import load_only
+from sqlalchemy.exc import IntegrityError
 import secrets
+import time
 from itsdangerous import URLSafeTimedSerializer, SignatureExpired, BadSignature
 import stripe
-import cloudinary.uploader
 import cloudinary
-import googlemaps
 import json
 
 
@@ -34,8 +45,12 @@ stripe.api_key = os.environ.get("STRIPE_API_KEY")
 api = Blueprint('api', __name__)
 CORS(api) 
 bcrypt = Bcrypt()
-mail = Mail()
 endpoint_secret=os.environ.get("ENDPOINT_SECRET")
+CLASSES_PAGE_SIZE = 20
+CLASSES_MAX_PAGE_SIZE = 100
+ROSTER_PAGE_SIZE = 100
+ROSTER_STREAM_CHUNK_SIZE = 500
+ADMIN_LIST_CHUNK_SIZE = 1000
 
 
 # Ruta para crear una sesión de checkout con Stripe
@@ -43,11 +58,16 @@ endpoint_secret=os.environ.get("ENDPOINT_SECRET")
 def create_checkout_session():
     response_body = {}
     data = request.json
-    if not data or 'stripe_customer_id' not in data or 'product_id' not in data:
+    if not data or 'stripe_customer_id' not in data or ('product_id' not in data and 'class_id' not in data):
         response_body["message"] = "Missing required parameters"
         return jsonify(response_body), 400
+    checkout_hold = None
     try:
-        trainer_class = TrainersClasses.query.filter_by(stripe_product_id=data['product_id']).first()
+        # Las clases de una serie comparten producto de Stripe, asi que la clase se identifica por class_id
+        if 'class_id' in data:
+            trainer_class = TrainersClasses.query.get(data['class_id'])
+        else:
+            trainer_class = TrainersClasses.query.filter_by(stripe_product_id=data['product_id']).first()
         if not trainer_class:
             response_body["message"] = "Class not found"
             return jsonify(response_body), 404
@@ -55,113 +75,84 @@ def create_checkout_session():
         if not user:
             response_body["message"] = "User not found"
             return jsonify(response_body), 404
+        user_class = UsersClasses.query.filter_by(class_id=trainer_class.id, user_id=user.id).first()
+        if not user_class:
+            response_body["message"] = "Class not found in the cart"
+            return jsonify(response_body), 404
+        # La plaza queda retenida mientras la sesion de checkout esta abierta
+        previous_hold = user_class.hold_expires_at
+        if not hold_seat(user_class):
+            db.session.rollback()
+            response_body["message"] = "Class is full"
+            return jsonify(response_body), 409
+        db.session.commit()
+        checkout_hold = (user_class, previous_hold)
+        invalidate_response_cache('classes', f'class:{trainer_class.id}')
         # TODO: Cambiar url de confirmacion y de cancelacion
-        session = stripe.checkout.Session.create(payment_method_types=['card'],
-                                                 line_items=[{'price': trainer_class.stripe_price_id,
-                                                              'quantity': 1}],
-                                                 mode='payment',
-                                                 customer=user.stripe_customer_id,
-                                                 success_url=f"{os.environ['FRONT_URL']}checkout/success",
-                                                 cancel_url=f"{os.environ['FRONT_URL']}checkout/cancel",
-                                                 metadata={'class_id': trainer_class.id,
-                                                           'trainer_id': trainer_class.trainer_id,
-                                                           'start_date': trainer_class.start_date,
-                                                           'end_date': trainer_class.end_date,
-                                                           'training_level': trainer_class.training_level,
-                                                           'user': user.id})
+        session = stripe_provider.call(stripe.checkout.Session.create,
+                                       payment_method_types=['card'],
+                                       line_items=[{'price': trainer_class.stripe_price_id,
+                                                    'quantity': 1}],
+                                       mode='payment',
+                                       expires_at=int(time.time()) + CHECKOUT_SESSION_SECONDS,
+                                       customer=user.stripe_customer_id,
+                                       success_url=f"{os.environ['FRONT_URL']}checkout/success",
+                                       cancel_url=f"{os.environ['FRONT_URL']}checkout/cancel",
+                                       metadata={'class_id': trainer_class.id,
+                                                 'trainer_id': trainer_class.trainer_id,
+                                                 'start_date': trainer_class.start_date,
+                                                 'end_date': trainer_class.end_date,
+                                                 'training_level': trainer_class.training_level,
+                                                 'user': user.id})
         response_body["result"] = session
         response_body["sessionId"] = session.id
         response_body["sessionUrl"] = session.url
         return jsonify(response_body), 200
+    except ProviderUnavailable as e:
+        release_checkout_hold(checkout_hold)
+        response_body["message"] = e.message
+        return jsonify(response_body), 503
     except Exception as e:
+        release_checkout_hold(checkout_hold)
         response_body["message"] = str(e)
         return jsonify(response_body), 500
 
 
+# Sin sesion de Stripe nadie va a pagar la plaza: se deshace la retencion del checkout
+def release_checkout_hold(checkout_hold):
+    if checkout_hold is None:
+        return
+    db.session.rollback()
+    user_class, previous_hold = checkout_hold
+    restore_hold(user_class, previous_hold)
+    db.session.commit()
+    invalidate_response_cache('classes', f'class:{user_class.class_id}')
+
+
 # Manejo de eventos de la respuesta de checkout
+# Solo se verifica y se guarda el evento; lo aplica en orden el worker "process-stripe-events"
 @api.route('/webhook', methods=['POST'])
 def webhook():
-    response_body = {}
     payload = request.data
     try:
         event = json.loads(payload)
     except json.decoder.JSONDecodeError as e:
         print('⚠️  Error de Webhook al analizar la solicitud básica: ' + str(e))
-        return jsonify(success=False)
+        return jsonify(success=False), 400
     if endpoint_secret:
         sig_header = request.headers.get('Stripe-Signature')
         try:
-            event = stripe.Webhook.construct_event(
+            stripe.Webhook.construct_event(
                 payload, sig_header, endpoint_secret
             )
         except stripe.error.SignatureVerificationError as e:
             print('⚠️  Error de verificación de firma del webhook: ' + str(e))
-            return jsonify(success=False)
-    if event and event['type'] == 'payment_intent.succeeded':
-        payment_intent = event['data']['object']
-        class_id = int(payment_intent['metadata']["class_id"])
-        user_id = int(payment_intent['metadata']["user"])
-        print(f"ID de Clase: {class_id}, ID de Usuario: {user_id}")
-        user_class = db.session.query(UsersClasses).filter_by(class_id=class_id, user_id=user_id).first()
-        if user_class:
-            user_class.stripe_status = "Paid"
-            db.session.commit()
-            print(f"Clase de usuario actualizada: {user_class.serialize()}")
-            return jsonify(success=True)
-        response_body["message"] = "No se encontró la clase"
-        return jsonify(response_body), 400
-    elif event['type'] == 'payment_intent.payment_failed':
-        print('El pago ha fallado')   
-        checkout_session_data = event['data']['object']
-        payment_intent_id = checkout_session_data['payment_intent']
-        try: 
-            class_id = checkout_session_data['metadata']["class_id"]
-            if class_id is not None:
-                user_id = checkout_session_data['metadata']["user"]
-                user_class = db.session.query(UsersClasses).filter_by(class_id=class_id, user_id=user_id).first()
-                if user_class:
-                    user_class.stripe_status = "Reject" 
-                    db.session.commit()
-                    print(f"Clase de usuario actualizada: {user_class.serialize()}")
-                    return jsonify(success=True)
-                print("No se encontró la clave 'user_id' en los metadatos")
-            print('No se encontró la clave "class_id" en los metadatos')
-        except Exception as e:
-            print('Error al actualizar el estado de la clase: ' + str(e))
-            return jsonify(success=False)
-    elif event['type'] == 'checkout.session.completed':
-        print('La sesión de checkout ha sido completada')
-        checkout_session_data = event['data']['object']
-        payment_intent_id = checkout_session_data['payment_intent']
-        try:
-            payment_intent = stripe.PaymentIntent.retrieve(payment_intent_id)
-            if payment_intent.status == 'succeeded':
-                print('El PaymentIntent ya ha sido confirmado anteriormente')
-                class_id = checkout_session_data['metadata']["class_id"] 
-                if class_id is not None:
-                    trainer_id = checkout_session_data['metadata']["trainer_id"]
-                    if trainer_id is not None:
-                        trainer_class = db.session.query(TrainersClasses).filter_by(id=class_id, trainer_id=trainer_id).first()
-                        trainer_class.capacity -= 1
-                        db.session.commit()
-                        print(f"Capacidad clase actualizada: {trainer_class.serialize()}")
-                    user_id = checkout_session_data['metadata']["user"]
-                    user_class = db.session.query(UsersClasses).filter_by(class_id=class_id, user_id=user_id).first()
-                    if user_class:
-                        user_class.stripe_status = "Paid"
-                        db.session.commit()
-                        print(f"Clase de usuario actualizada: {user_class.serialize()}")
-                        return jsonify(success=True)
-                else:
-                    print('No se encontró la clave "class_id" en los metadatos')
-            else:
-                payment_intent.confirm()
-        except stripe.error.StripeError as e:
-            print('Error al confirmar el PaymentIntent: ' + str(e))
-            return jsonify(success=False)
-    else:
-        print('Tipo de evento no manejado: {}'.format(event['type']))
-    return jsonify(success=True)
+            return jsonify(success=False), 400
+    if 'id' not in event or 'type' not in event:
+        return jsonify(success=False), 400
+    if not store_stripe_event(event, payload):
+        print(f"Evento ya recibido: {event['id']}")
+    return jsonify(success=True), 200
 
 
 # TODO
@@ -184,62 +175,8 @@ def handle_forget_password(user_type):
                                                        'id': current_user.id
                                                        }, expires_delta=expires)
     subject = 'Reset Password'
-    html_content = f'''
-                <!DOCTYPE html>
-                <html lang="en">
-                <head>
-                    <meta charset="UTF-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                    <title>Email Confirmation</title>
-                    <style>
-                        body {{
-                            font-family: Arial, sans-serif;
-                            background-color: #f9f9f9;
-                            margin: 0;
-                            padding: 0;
-                        }}
-                        .container {{
-                            display: flex,
-                            flex-direction: column,
-                            align-items: center,
-                            max-width: 600px;
-                            margin: auto;
-                            padding: 20px;
-                            background-color: #fff;
-                            border-radius: 8px;
-                            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                        }}
-                        .message {{
-                            margin-bottom: 20px;
-                        }}
-                        .button {{
-                            display: inline-block;
-                            padding: 12px 24px;
-                            background-color: #007bff;
-                            color: #fff;
-                            text-decoration: none;
-                            border-radius: 5px;
-                            transition: background-color 0.3s ease;
-                        }}
-                        .button:hover {{
-                            background-color: #0056b3;
-                        }}
-                    </style>
-                </head>
-                <body>
-                    <div class="message">
-                        <p>¡Hola!</p>
-                        <p>Recibiste este correo electrónico porque solicitaste restablecer tu contraseña.</p>
-                        <p>Por favor, haz clic en el siguiente enlace para restablecer tu contraseña:</p>
-                    </div>
-                    <div class="action">
-                        <a class="button" href="www.google.com" target="_blank">¡Haz clic aquí para restablecer tu contraseña!</a>
-                    </div>
-                </body>
-                </html>
-                '''
-    msg = Message(subject, recipients=[current_user.email], html=html_content, sender=os.getenv('MAIL_DEFAULT_SENDER'))
-    mail.send(msg)
+    queue_template_email('reset_password', subject, current_user.email, sender=os.getenv('MAIL_DEFAULT_SENDER'), reset_url="www.google.com")
+    db.session.commit()
     response_body["message"] = "Password reset instructions have been sent to your email"
     response_body["token"] = confirmation_token
     response_body["id"] = current_user.id
@@ -257,6 +194,30 @@ def handle_current_available_account():
     return response_body, 200
 
 
+# limit y offset opcionales para los listados de admin (sin limit se devuelven todas las filas, en streaming)
+def paginate_admin_list(query):
+    if 'limit' in request.args:
+        limit = parse_number_param(request.args['limit'], 'limit')
+        if limit < 1:
+            raise APIException("Invalid value for 'limit'", status_code=400)
+        query = query.limit(limit)
+    if 'offset' in request.args:
+        offset = parse_number_param(request.args['offset'], 'offset')
+        if offset < 0:
+            raise APIException("Invalid value for 'offset'", status_code=400)
+        query = query.offset(offset)
+    return query
+
+
+# En GET solo se leen las columnas pedidas en ?fields= (load_only); el resto de metodos carga el registro completo.
+# Devuelve (registro, campos a serializar)
+def get_with_projection(model, serializer, id):
+    if request.method != "GET":
+        return model.query.get(id), serializer
+    fields = serializer.project(request.args.get('fields'))
+    return model.query.options(load_only(*fields.columns)).filter(model.id == id).first(), fields
+
+
 # Mirar los usuarios registrados
 @api.route('/users', methods=['GET'])
 @jwt_required()
@@ -266,13 +227,13 @@ def handle_users():
     if not current_user['role'] == 'administrators':
         response_body['message'] = 'Not allowed!'
         return response_body, 405
-    users = db.session.query(Users).all()
-    if not users:
+    fields = user_fields.project(request.args.get('fields'))
+    users = paginate_admin_list(db.session.query(*fields.columns).order_by(Users.id))
+    first_row, users = peek_rows(users.yield_per(ADMIN_LIST_CHUNK_SIZE))
+    if first_row is None:
         response_body['message'] = 'No users currently registered'
         return response_body, 404
-    response_body['message'] = 'Users currently registered'
-    response_body['results'] = [single_user.serialize() for single_user in users]
-    return response_body, 200
+    return stream_json_results('Users currently registered', users, fields)
 
 
 # Rechazar especializacion por correo, por parte del admin
@@ -304,46 +265,10 @@ def reject_specialization(token):
         response_body["message"] = 'La especialización ya ha sido rechazada anteriormente.'
         return response_body, 400
     specialization.status = 'Rejected'
-    db.session.commit()
-    token = s.dumps(specialization.id, salt='email-confirm')
     subject = 'Specialization Rejected'
-    html_content = f'''
-                    <!DOCTYPE html>
-                    <html lang="en">
-                    <head>
-                        <meta charset="UTF-8">
-                        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                        <title>Email Confirmation</title>
-                        <style>
-                        body {{
-                            font-family: Arial, sans-serif;
-                            background-color: #f9f9f9;
-                            margin: 0;
-                            padding: 0;
-                        }}
-                        .container {{
-                            display: flex;
-                            flex-direction: column;
-                            align-items: center;
-                            justify-content: center;
-                            max-width: 600px;
-                            margin: auto;
-                            padding: 20px;
-                            background-color: #fff;
-                            border-radius: 8px;
-                            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                        }}
-                    </style>
-                    </head>
-                    <body>
-                        <div class="container">
-                                <p>La peticion ha sido rechazada</p>
-                        </div>
-                    </body>
-                    </html>
-                    ''' 
-    msg = Message(subject, recipients=[specialization.trainer.email], html=html_content, sender=os.environ.get('MAIL_DEFAULT_SENDER'))
-    mail.send(msg)
+    # El cambio de estado y el correo se guardan en la misma transaccion
+    queue_template_email('specialization_result', subject, specialization.trainer.email, sender=os.environ.get('MAIL_DEFAULT_SENDER'), approved=False)
+    db.session.commit()
     response_body["message"] = 'Especialización rechazada por el admin'
     return response_body, 200
 
@@ -377,46 +302,10 @@ def confirm_specialization(token):
         response_body["message"] = 'La especialización ya ha sido rechazada anteriormente.'
         return response_body, 400
     specialization.status = 'Approved'
-    db.session.commit()
-    token = s.dumps(specialization.id, salt='email-confirm')
     subject = 'Specialization Approved'
-    html_content = f'''
-                    <!DOCTYPE html>
-                    <html lang="en">
-                    <head>
-                        <meta charset="UTF-8">
-                        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                        <title>Email Confirmation</title>
-                        <style>
-                        body {{
-                            font-family: Arial, sans-serif;
-                            background-color: #f9f9f9;
-                            margin: 0;
-                            padding: 0;
-                        }}
-                        .container {{
-                            display: flex;
-                            flex-direction: column;
-                            align-items: center;
-                            justify-content: center;
-                            max-width: 600px;
-                            margin: auto;
-                            padding: 20px;
-                            background-color: #fff;
-                            border-radius: 8px;
-                            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                        }}
-                    </style>
-                    </head>
-                    <body>
-                        <div class="container">
-                                <p>La peticion ha sido aprobada</p>
-                        </div>
-                    </body>
-                    </html>
-                    ''' 
-    msg = Message(subject, recipients=[specialization.trainer.email], html=html_content, sender=os.environ.get('MAIL_DEFAULT_SENDER'))
-    mail.send(msg)
+    # El cambio de estado y el correo se guardan en la misma transaccion
+    queue_template_email('specialization_result', subject, specialization.trainer.email, sender=os.environ.get('MAIL_DEFAULT_SENDER'), approved=True)
+    db.session.commit()
     response_body["message"] = 'Especialización aprobada exitosamente.'
     return response_body, 200
 
@@ -455,9 +344,10 @@ def confirm_email(token):
     if user:
         if user.is_active:
             return redirect(f"{os.environ['FRONT_URL']}account/already/confirmed")
-        stripe_customer = stripe.Customer.create(name=user.name,
-                                                 email=user.email,
-                                                 phone=user.phone_number)
+        stripe_customer = stripe_provider.call(stripe.Customer.create,
+                                               name=user.name,
+                                               email=user.email,
+                                               phone=user.phone_number)
         user.stripe_customer_id = stripe_customer.id        
         user.is_active = True
         db.session.add(user)
@@ -513,66 +403,11 @@ def handle_signup_user():
                      phone_number=data["phone_number"],
                      gender=data["gender"])
     db.session.add(new_user)
-    db.session.commit()
     token = s.dumps(new_user.email, salt='email-confirm')
     confirm_url = f"{os.environ['BACKEND_URL']}confirm/{token}"
     subject = 'Confirm Email'
-    html_content = f'''
-                    <!DOCTYPE html>
-                    <html lang="en">
-                    <head>
-                        <meta charset="UTF-8">
-                        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                        <title>Email Confirmation</title>
-                        <style>
-                            body {{
-                                font-family: Arial, sans-serif;
-                                background-color: #f9f9f9;
-                                margin: 0;
-                                padding: 0;
-                            }}
-                            .container {{
-                                display: flex,
-                                flex-direction: column,
-                                align-items: center,
-                                max-width: 600px;
-                                margin: auto;
-                                padding: 20px;
-                                background-color: #fff;
-                                border-radius: 8px;
-                                box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                            }}
-                            .message {{
-                                margin-bottom: 20px;
-                            }}
-                            .button {{
-                                display: inline-block;
-                                padding: 12px 24px;
-                                background-color: #007bff;
-                                color: #fff;
-                                text-decoration: none;
-                                border-radius: 5px;
-                                transition: background-color 0.3s ease;
-                            }}
-                            .button:hover {{
-                                background-color: #0056b3;
-                            }}
-                        </style>
-                    </head>
-                    <body>
-                        <div class="container">
-                            <div class="message">
-                                <p>Welcome! Thanks for signing up. Please follow this link to activate your account:</p>
-                            </div>
-                            <div class="action">
-                                <a class="button" href="{confirm_url}" target="_blank">Click here to confirm!</a>
-                            </div>
-                        </div>
-                    </body>
-                    </html>
-                    '''
-    msg = Message(subject, recipients=[new_user.email], html=html_content, sender=os.getenv('MAIL_DEFAULT_SENDER'))
-    mail.send(msg)
+    queue_template_email('confirm_user', subject, new_user.email, sender=os.getenv('MAIL_DEFAULT_SENDER'), confirm_url=confirm_url)
+    db.session.commit()
     response_body["message"] = "Email sent, wait for the confirmation!"
     return response_body, 200
 
@@ -586,13 +421,13 @@ def handle_trainers():
     if not current_user['role'] == 'administrators':
         response_body['message'] = 'Not allowed!'
         return response_body, 405
-    trainers = db.session.query(Trainers).all()
-    if not trainers:
+    fields = trainer_fields.project(request.args.get('fields'))
+    trainers = paginate_admin_list(db.session.query(*fields.columns).order_by(Trainers.id))
+    first_row, trainers = peek_rows(trainers.yield_per(ADMIN_LIST_CHUNK_SIZE))
+    if first_row is None:
         response_body['message'] = 'No trainers currently registered'
         return response_body, 404
-    response_body['message'] = 'Trainers currently registered'
-    response_body['results'] = [single_trainer.serialize() for single_trainer in trainers]
-    return response_body, 200
+    return stream_json_results('Trainers currently registered', trainers, fields)
 
 
 # Crear un entrenador
@@ -641,65 +476,11 @@ def handle_signup_trainer():
                            vote_user=0,
                            sum_value=0)
     db.session.add(new_trainer)
-    db.session.commit()
     token = s.dumps(new_trainer.email, salt='email-confirm')
     confirm_url = f"{os.environ['BACKEND_URL']}confirm/{token}"
     subject = 'Confirm Email'
-    html_content = f'''
-                    <!DOCTYPE html>
-                    <html lang="en">
-                    <head>
-                        <meta charset="UTF-8">
-                        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                        <title>Email Confirmation</title>
-                        <style>
-                            body {{
-                                font-family: Arial, sans-serif;
-                                background-color: #f9f9f9;
-                                margin: 0;
-                                padding: 0;
-                            }}
-                            .container {{
-                                max-width: 600px;
-                                margin: auto;
-                                padding: 20px;
-                                background-color: #fff;
-                                border-radius: 8px;
-                                box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                                text-align: center;
-                            }}
-                            .message {{
-                                margin-bottom: 20px;
-                            }}
-                            .button {{
-                                display: inline-block;
-                                padding: 12px 24px;
-                                background-color: #007bff;
-                                color: #fff;
-                                text-decoration: none;
-                                border-radius: 5px;
-                                transition: background-color 0.3s ease;
-                            }}
-                            .button:hover {{
-                                background-color: #0056b3;
-                            }}
-                        </style>
-                    </head>
-                    <body>
-                        <div class="container">
-                            <div class="message">
-                                <p>¡Bienvenido! Gracias por registrarte.</p>
-                                <p>Por favor, sigue este enlace para activar tu cuenta:</p>
-                            </div>
-                            <div class="action">
-                                <a class="button" href="{confirm_url}" target="_blank">¡Haz clic aquí para confirmar!</a>
-                            </div>
-                        </div>
-                    </body>
-                    </html>
-                    '''
-    msg = Message(subject, recipients=[new_trainer.email], html=html_content, sender=os.getenv('MAIL_DEFAULT_SENDER'))
-    mail.send(msg)
+    queue_template_email('confirm_trainer', subject, new_trainer.email, sender=os.getenv('MAIL_DEFAULT_SENDER'), confirm_url=confirm_url)
+    db.session.commit()
     response_body["message"] = "Email sent, wait for the confirmation!"
     return response_body, 200
 
@@ -713,13 +494,13 @@ def handle_admins():
     if not current_user['role'] == 'administrators':
         response_body['message'] = 'Not allowed!'
         return response_body, 405
-    admins = db.session.query(Administrators).all()
-    if not admins:
+    fields = administrator_fields.project(request.args.get('fields'))
+    admins = paginate_admin_list(db.session.query(*fields.columns).order_by(Administrators.id))
+    first_row, admins = peek_rows(admins.yield_per(ADMIN_LIST_CHUNK_SIZE))
+    if first_row is None:
         response_body['message'] = 'No administrators currently registered'
         return response_body,404
-    response_body['message'] = 'Administrators currently registered'
-    response_body['results'] = [single_admin.serialize() for single_admin in admins]
-    return response_body, 200
+    return stream_json_results('Administrators currently registered', admins, fields)
 
 
 # Crear un admin
@@ -780,8 +561,8 @@ def handle_add_specializations():
     if 'name' not in data:
         response_body["message"] = "The 'name' field is required."
         return response_body, 400
-    specializations = db.session.query(Specializations).all()
-    if any(specialization.name == data["name"].lower() for specialization in specializations):
+    specializations = get_specializations()
+    if any(specialization['name'] == data["name"].lower() for specialization in specializations):
         response_body["message"] = "Specialization already exists"
         return response_body, 400
     new_specialization = Specializations(name=data["name"].lower(), 
@@ -789,6 +570,8 @@ def handle_add_specializations():
                                          logo_url=data.get("logo_url"))
     db.session.add(new_specialization)
     db.session.commit()
+    invalidate_specializations()
+    invalidate_response_cache('specializations')
     response_body["message"] = "Specialization created"
     response_body["specialization"] = new_specialization.serialize()
     return response_body, 201
@@ -796,17 +579,82 @@ def handle_add_specializations():
 
 # Mostrar especializaciones
 @api.route('/specializations', methods=['GET'])
+@cached_response(tags=['specializations'])
 def handle_specializations():
     response_body = {}
-    specializations = db.session.query(Specializations).all()
+    specializations = get_specializations()
     if not specializations:
             response_body["message"] = "No specializations available"
             return response_body, 404
     response_body["message"] = "Specializations available"
-    response_body["specializations"] = [specialization.serialize() for specialization in specializations]
+    response_body["specializations"] = specializations
     return response_body, 200
 
 
+# Contadores de la cache de especializaciones (solo admin)
+@api.route('/specializations/cache', methods=['GET'])
+@jwt_required()
+def handle_specializations_cache():
+    response_body = {}
+    current_user = get_jwt_identity()
+    if not current_user['role'] == 'administrators':
+        response_body['message'] = 'Not allowed!'
+        return response_body, 405
+    response_body['message'] = 'Specializations cache stats'
+    response_body['results'] = specializations_cache.stats()
+    return response_body, 200
+
+
+# Latencia, errores y estado del circuito de cada proveedor externo (Stripe, Cloudinary, Google Maps)
+@api.route('/integrations/metrics', methods=['GET'])
+@jwt_required()
+def handle_integrations_metrics():
+    response_body = {}
+    current_user = get_jwt_identity()
+    if not current_user['role'] == 'administrators':
+        response_body['message'] = 'Not allowed!'
+        return response_body, 405
+    response_body['message'] = 'Integrations metrics'
+    response_body['results'] = integrations_stats()
+    return response_body, 200
+
+
+# Estado del pool de conexiones de este worker: conexiones en uso, overflow y espera de los checkouts
+@api.route('/database/pool', methods=['GET'])
+@jwt_required()
+def handle_database_pool():
+    response_body = {}
+    current_user = get_jwt_identity()
+    if not current_user['role'] == 'administrators':
+        response_body['message'] = 'Not allowed!'
+        return response_body, 405
+    response_body['message'] = 'Database pool'
+    response_body['results'] = pool_status(db.engine, current_app.config['SQLALCHEMY_ENGINE_OPTIONS'])
+    return response_body, 200
+
+
+# Export de reservas con clase, trainer y usuario para conciliar pagos (solo admin), en CSV o NDJSON y en streaming
+@api.route('/exports/bookings', methods=['GET'])
+@jwt_required()
+def handle_bookings_export():
+    response_body = {}
+    current_user = get_jwt_identity()
+    if not current_user['role'] == 'administrators':
+        response_body['message'] = 'Not allowed!'
+        return response_body, 405
+    export_format = request.args.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        raise APIException("Invalid export format", status_code=400, payload={"format available": list(EXPORT_FORMATS)})
+    filters = export_filters(request.args.get('start_from'),
+                             request.args.get('start_to'),
+                             request.args.get('stripe_status'),
+                             request.args.get('trainer_status'))
+    filename = f"bookings-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}.{export_format}"
+    return Response(stream_with_context(export_bookings(bookings_export_rows(filters), export_format)),
+                    mimetype=EXPORT_FORMATS[export_format],
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+
+
 # Login (user, trainer, admin)
 @api.route('/login/<user_type>', methods=['POST'])
 def handle_login(user_type):
@@ -897,7 +745,7 @@ def handle_login(user_type):
 @jwt_required()
 def handle_user(id):
     response_body = {}
-    user = Users.query.get(id)
+    user, fields = get_with_projection(Users, user_fields, id)
     current_user = get_jwt_identity()
     if not user:
         response_body["message"] = "User not found"
@@ -905,15 +753,24 @@ def handle_user(id):
     if (current_user['role'] == 'users' and current_user['id'] == id) or (current_user['role'] == 'administrators'):
         if request.method == "GET":
             response_body["message"] = "User found"
-            response_body["user"] = user.serialize()
+            response_body["user"] = fields.from_object(user)
             return response_body, 200
         if request.method == "DELETE":
             user_classes = UsersClasses.query.filter_by(user_id=id).all()
             if user_classes:
                 response_body["message"] = "Unable to cancel user, because he have class pending"
                 return response_body, 404
-            del_stripe_customer =stripe.Customer.delete(user.stripe_customer_id)
+            # Primero el borrado en la base de datos (flush): si falla, el cliente de Stripe no se toca.
+            # El commit solo se hace si Stripe tambien ha ido bien
+            stripe_customer_id = user.stripe_customer_id
             db.session.delete(user)
+            db.session.flush()
+            if stripe_customer_id:
+                try:
+                    stripe_provider.call(stripe.Customer.delete, stripe_customer_id)
+                except Exception:
+                    db.session.rollback()
+                    raise
             db.session.commit()
             response_body["message"] = "User delete"
             response_body["delete user"] = user.serialize()
@@ -946,7 +803,7 @@ def handle_user(id):
 @jwt_required()
 def handle_trainer(id):
     response_body= {}
-    trainer = Trainers.query.get(id)
+    trainer, fields = get_with_projection(Trainers, trainer_fields, id)
     current_user = get_jwt_identity()
     if not trainer:
         response_body["message"] = "Trainer not found"
@@ -954,11 +811,12 @@ def handle_trainer(id):
     if (current_user['role'] == 'trainers' and current_user['id'] == id) or (current_user['role'] == 'administrators'):
         if request.method == "GET":
             response_body["message"] = "Trainer found"
-            response_body["trainer"] = trainer.serialize()
+            response_body["trainer"] = fields.from_object(trainer)
             return response_body, 200
         if request.method == "DELETE":
             db.session.delete(trainer)
             db.session.commit()
+            invalidate_response_cache('classes')
             response_body["message"] = "Trainer delete"
             response_body["delete trainer"] = trainer.serialize()
             return response_body, 200
@@ -966,6 +824,7 @@ def handle_trainer(id):
             data = request.json
             if not data:
                 response_body["message"] = "No data provided for update"
+                return response_body, 400
             if 'password' in data:
                 hashed_password = bcrypt.generate_password_hash(data["password"]).decode('utf-8')
                 trainer.password = hashed_password
@@ -1000,14 +859,14 @@ def handle_trainer(id):
 def handle_administrator(id):
     response_body = {}
     current_user = get_jwt_identity()
-    administrator = Administrators.query.get(id)
+    administrator, fields = get_with_projection(Administrators, administrator_fields, id)
     if not administrator:
         response_body["message"] = "Admin not found"
         return response_body, 404
     if (current_user['role'] == 'administrators' and current_user['id'] == id) or (current_user['role'] == 'administrators'):
         if request.method == "GET":
             response_body["message"] = "Admin found"
-            response_body["administrator"] = administrator.serialize()
+            response_body["administrator"] = fields.from_object(administrator)
             return response_body, 200
         if request.method == "DELETE":
             db.session.delete(administrator)
@@ -1031,6 +890,13 @@ def handle_administrator(id):
     return response_body, 405 
 
 
+# Agenda de un usuario: sus clases con la clase del trainer, el trainer y la especializacion en una sola consulta por columnas
+def get_user_schedule(user_id, classes=catalog):
+    user_classes = classes.query().add_columns(*user_class_fields.columns).join(UsersClasses, UsersClasses.class_id == TrainersClasses.id).filter(UsersClasses.user_id == user_id).order_by(UsersClasses.id)
+    return [{'user_class': user_class_fields(row[len(classes):]),
+             'trainer_class': classes(row)} for row in user_classes]
+
+
 # Mostrar y crear classes user
 @api.route('/users/<int:id>/classes', methods=["GET", "POST"]) 
 @jwt_required()
@@ -1043,23 +909,21 @@ def handle_user_classes(id):
         return response_body, 404
     if (current_user['role'] == 'users' and current_user['id'] == user.id) or (current_user["role"] == "administrators"):
         if request.method == "GET":
-            user_classes = UsersClasses.query.filter_by(user_id=id).all()
-            if not user_classes:
+            classes = CatalogSerializer(class_fields.project(request.args.get('fields')))
+            user_classes_updated_at, classes_updated_at, user_classes_count, specializations_updated_at = db.session.query(db.func.max(UsersClasses.updated_at),
+                                                                                                                            db.func.max(TrainersClasses.updated_at),
+                                                                                                                            db.func.count(UsersClasses.id),
+                                                                                                                            specializations_version()).join(TrainersClasses, UsersClasses.class_id == TrainersClasses.id).filter(UsersClasses.user_id == id).one()
+            headers, not_modified = conditional_headers(request, latest_update(user_classes_updated_at, classes_updated_at, specializations_updated_at), user_classes_count)
+            if not_modified:
+                return '', 304, headers
+            classes_with_trainers = get_user_schedule(id, classes)
+            if not classes_with_trainers:
                 response_body["message"] = "No classes available"
                 return response_body, 400
-            classes_with_trainers = []
-            for user_cls in user_classes:
-                trainer_cls = TrainersClasses.query.filter_by(id=user_cls.class_id).first()
-                trainer = Trainers.query.filter_by(id=trainer_cls.trainer_id).first()
-                trainer_details = {'name': trainer.name, 'last_name': trainer.last_name} 
-                specialization = db.session.query(Specializations).filter_by(id=trainer_cls.training_type).first()
-                classes_with_trainers.append({'user_class': user_cls.serialize(),
-                                            'trainer_class': {'class_details': trainer_cls.serialize(),
-                                                              'specialization': specialization.serialize() if specialization else None,
-                                                              'trainer': trainer_details}})
             response_body['message'] = 'List of classes available.'
             response_body['results'] = classes_with_trainers
-            return response_body, 200
+            return response_body, 200, headers
         if request.method == "POST":
             data = request.json
             if not data:
@@ -1069,7 +933,7 @@ def handle_user_classes(id):
             if not request.json or not all(field in request.json for field in required_fields):
                 response_body["message"] = "Missing required fields in the request."
                 return response_body, 400
-            existing_class = db.session.query(UsersClasses).filter_by(class_id = data['class_id']).first()
+            existing_class = db.session.query(UsersClasses).filter_by(class_id = data['class_id'], user_id = id).first()
             if existing_class:
                 response_body["message"] = "User class already exist"
                 return response_body, 409
@@ -1083,32 +947,63 @@ def handle_user_classes(id):
                                      value=0,
                                      user_id=id,
                                      class_id=data["class_id"])
+            # Reserva atomica de la plaza (UPDATE condicionado a capacity > 0)
+            if not hold_seat(new_class):
+                db.session.rollback()
+                response_body["message"] = "Class is full"
+                return response_body, 409
             db.session.add(new_class)
             db.session.commit()
-            user_classes = UsersClasses.query.filter_by(user_id=id).all()
-            classes_with_trainers = []
-            for user_class in user_classes:
-                trainer_class = TrainersClasses.query.filter_by(id=user_class.class_id).first()
-                trainer = Trainers.query.filter_by(id=trainer_class.trainer_id).first()
-                trainer_details = {'name': trainer.name, 'last_name': trainer.last_name} if trainer else None
-                trainer_class_info = {'class_details': trainer_class.serialize(),
-                                      'specialization': db.session.query(Specializations).filter_by(id=trainer_class.training_type).first().serialize() if trainer_class else None,
-                                      'trainer' : trainer_details}
-                user_class_info = user_class.serialize()
-                classes_with_trainers.append({'user_class': user_class_info,
-                                              'trainer_class': trainer_class_info})
+            invalidate_response_cache('classes', f'class:{new_class.class_id}')
+            classes_with_trainers = get_user_schedule(id)
             trainer_class = {'class_details': trainer_class.serialize(),
-                             'specialization': db.session.query(Specializations).filter_by(id=trainer_class.training_type).first().serialize()}
+                             'specialization': trainer_class.specializations.serialize() if trainer_class.specializations else None}
             response_body["message"] = "Class added"
             response_body["results"] = {"user_class": new_class.serialize(),
                                         "trainer_class": trainer_class}
             response_body["user_classes"] = classes_with_trainers
-            print(response_body)
             return response_body, 201
     response_body["message"] = 'Not allowed!'
     return response_body, 405
 
 
+# Valida los datos de una clase nueva (o de la primera de una serie). Devuelve (start_date, end_date)
+def validate_trainer_class_data(id, data):
+    required_fields = ['city', 'postal_code', 'street_name', 'street_number', 'capacity', 'start_date', 'end_date', 'price', 'training_type', 'training_level']
+    if not all(field in data for field in required_fields):
+        raise APIException("Missing required fields in the request.", status_code=400)
+    if data['training_level'] not in ['Beginner', 'Intermediate', 'Advanced']:
+        raise APIException("Invalid training level", status_code=400, payload={"training_level available": ["Beginner", "Intermediate", "Advanced"]})
+    trainers_specializations = db.session.query(TrainersSpecializations).filter_by(trainer_id = id, specialization_id = data["training_type"]).first()
+    if not trainers_specializations:
+        raise APIException(f"Training type no available for the trainer with id: {str(id)}", status_code=400)
+    start_date = parse_datetime_param(data['start_date'], 'start_date')
+    end_date = parse_datetime_param(data['end_date'], 'end_date')
+    if start_date >= end_date:
+        raise APIException("start_date must be before end_date", status_code=400)
+    return start_date, end_date
+
+
+# Columnas de una clase a partir de los datos del request
+def trainer_class_values(id, data, start_date, end_date, stripe_product_id, stripe_price_id):
+    return {'trainer_id': id,
+            'class_name': data.get("class_name"),
+            'class_details': data.get("class_details"),
+            'city': data["city"],
+            'postal_code': int(data["postal_code"]),
+            'street_name': data["street_name"],
+            'street_number': int(data["street_number"]),
+            'additional_info': data.get("additional_info"),
+            'capacity': data["capacity"],
+            'start_date': start_date,
+            'end_date': end_date,
+            'price': float(data["price"]),
+            'training_type': int(data["training_type"]),
+            'training_level': data["training_level"],
+            'stripe_product_id': stripe_product_id,
+            'stripe_price_id': stripe_price_id}
+
+
 # Mostrar y crear classes trainer
 @api.route('/trainers/<int:id>/classes', methods=["GET", "POST"])
 @jwt_required()
@@ -1120,85 +1015,191 @@ def handle_trainer_classes(id):
         response_body["message"] = "Trainer not found"
         return response_body, 404
     if request.method == "GET":
+        classes_updated_at, classes_count, specializations_updated_at = db.session.query(db.func.max(TrainersClasses.updated_at),
+                                                                                         db.func.count(TrainersClasses.id),
+                                                                                         specializations_version()).filter(TrainersClasses.trainer_id == id).one()
+        headers, not_modified = conditional_headers(request, latest_update(classes_updated_at, specializations_updated_at), classes_count)
+        if not_modified:
+            return '', 304, headers
         trainer_classes = TrainersClasses.query.filter_by(trainer_id=id).all()
         if not trainer_classes:
             response_body["message"] = "Trainer has no classes available"
             return response_body, 400
         classes_with_specializations = []
         for class_trainer in trainer_classes:
-            class_specialization = Specializations.query.filter_by(id=class_trainer.training_type).first()
+            class_specialization = get_specialization(class_trainer.training_type)
             if class_specialization:
                 serialized_class = class_trainer.serialize()
-                serialized_class["specialization"] = class_specialization.serialize()
+                serialized_class["specialization"] = class_specialization
                 classes_with_specializations.append(serialized_class)
         response_body["message"] = "Trainer classes"
         response_body["classes"] = classes_with_specializations
-        return response_body, 200
+        return response_body, 200, headers
     if request.method == "POST":
         if (current_user['role'] == 'trainers' and current_user['id'] == trainer.id) or (current_user["role"] == "administrators"):
             data = request.json
             if not data:
                 response_body["message"] = "No data provided"
                 return response_body, 400
-            required_fields = ['city', 'postal_code', 'street_name', 'street_number', 'capacity', 'start_date', 'end_date', 'price', 'training_type', 'training_level']
-            if not request.json or not all(field in request.json for field in required_fields):
-                response_body["message"] = "Missing required fields in the request."
-                return response_body, 400
-            if data['training_level'] not in ['Beginner', 'Intermediate', 'Advanced']:
-                response_body["message"] = "Invalid training level"
-                response_body["training_level available"] = ["Beginner", "Intermediate", "Advanced"]
-                return response_body, 400
-            trainers_specializations = db.session.query(TrainersSpecializations).filter_by(trainer_id = id, specialization_id = data["training_type"]).all()
-            if not trainers_specializations:
-                response_body["message"] = f"Training type no available for the trainer with id: {str(id)}"
-                return response_body, 400
-            existing_class = db.session.query(TrainersClasses).filter(db.and_(TrainersClasses.trainer_id == id,
-                                                                              db.or_(db.and_(TrainersClasses.start_date >= data['start_date'],
-                                                                                             TrainersClasses.start_date < data['end_date']),
-                                                                                     db.and_(TrainersClasses.end_date > data['start_date'],
-                                                                                             TrainersClasses.end_date <= data['end_date']),
-                                                                                     db.and_(TrainersClasses.start_date <= data['start_date'],
-                                                                                             TrainersClasses.end_date >= data['end_date'])))).first()
-            if existing_class:
+            start_date, end_date = validate_trainer_class_data(id, data)
+            if find_conflicts(id, start_date, end_date):
                 response_body["message"] = "Trainer class already exists for this datetime"
                 return response_body, 400
+            location = class_location(data["city"], data["postal_code"], data["street_name"], data["street_number"])
+            search_values = class_search_values(data.get("class_name"), data.get("class_details"), get_specialization(data["training_type"]), trainer)
             try:
-                product = stripe.Product.create(name=data["start_date"])
-                price = stripe.Price.create(currency="eur",
-                                            unit_amount=data["price"],
-                                            product_data={"name": product.id})
-                new_trainer_class = TrainersClasses(trainer_id=id,
-                                                    class_name=data.get("class_name"),
-                                                    class_details=data.get("class_details"),
-                                                    city=data["city"], 
-                                                    postal_code=int(data["postal_code"]),
-                                                    street_name=data["street_name"],
-                                                    street_number=int(data["street_number"]),
-                                                    additional_info=data.get("additional_info"),
-                                                    capacity=data["capacity"], 
-                                                    start_date=data["start_date"],
-                                                    end_date=data["end_date"],
-                                                    price = float(data["price"]),
-                                                    training_type=int(data["training_type"]),
-                                                    training_level=data["training_level"],
-                                                    stripe_product_id=product.id,
-                                                    stripe_price_id=price.id)
+                # El producto se crea junto con el precio (product_data): una sola llamada a Stripe
+                price = stripe_provider.call(stripe.Price.create,
+                                             currency="eur",
+                                             unit_amount=data["price"],
+                                             product_data={"name": data["start_date"]})
+                new_trainer_class = TrainersClasses(**trainer_class_values(id, data, start_date, end_date, price.product, price.id), **location, **search_values)
                 db.session.add(new_trainer_class)
                 db.session.commit()
-                class_specialization = Specializations.query.filter(Specializations.id==new_trainer_class.training_type).first()
-                response_body["specialization"] = class_specialization.serialize()
+                invalidate_response_cache('classes')
+                response_body["specialization"] = get_specialization(new_trainer_class.training_type)
                 response_body["message"] = "New class created"
                 response_body["class"] = new_trainer_class.serialize()
                 return response_body, 201
+            except ProviderUnavailable as e:
+                response_body["message"] = e.message
+                return response_body, 503
             except stripe.error.StripeError as e:
                 response_body["message"] = "Stripe error: " + str(e)
                 db.session.rollback() 
                 return response_body, 500
+            except IntegrityError:
+                # En Postgres la restriccion de exclusion impide dos clases solapadas creadas a la vez
+                db.session.rollback()
+                response_body["message"] = "Trainer class already exists for this datetime"
+                return response_body, 400
             except Exception as e:
                 response_body["message"] = "Error: " + str(e)
                 db.session.rollback()
                 return response_body, 500
-        
+    response_body["message"] = 'Not allowed!'
+    return response_body, 405
+
+
+# Comprobar conflictos de horario para varios huecos propuestos de una vez
+@api.route('/trainers/<int:id>/classes/conflicts', methods=["POST"])
+@jwt_required()
+def handle_trainer_classes_conflicts(id):
+    response_body = {}
+    current_user = get_jwt_identity()
+    trainer = Trainers.query.get(id)
+    if not trainer:
+        response_body["message"] = "Trainer not found"
+        return response_body, 404
+    if not ((current_user['role'] == 'trainers' and current_user['id'] == trainer.id) or (current_user["role"] == "administrators")):
+        response_body["message"] = 'Not allowed!'
+        return response_body, 405
+    data = request.json
+    if not data or not isinstance(data.get('slots'), list):
+        response_body["message"] = "Missing required field 'slots'"
+        return response_body, 400
+    slots = []
+    for slot in data['slots']:
+        if not isinstance(slot, dict) or 'start_date' not in slot or 'end_date' not in slot:
+            raise APIException("Each slot needs start_date and end_date", status_code=400)
+        start_date = parse_datetime_param(slot['start_date'], 'start_date')
+        end_date = parse_datetime_param(slot['end_date'], 'end_date')
+        if start_date >= end_date:
+            raise APIException("start_date must be before end_date", status_code=400)
+        slots.append((start_date, end_date))
+    results = check_slots(id, slots, exclude_class_id=data.get('exclude_class_id'))
+    response_body["message"] = "Schedule conflicts"
+    response_body["has_conflicts"] = any(result['classes'] or result['slots'] for result in results)
+    response_body["slots"] = [{'start_date': start_date.isoformat(),
+                               'end_date': end_date.isoformat(),
+                               'conflicting_classes': result['classes'],
+                               'conflicting_slots': result['slots']} for (start_date, end_date), result in zip(slots, results)]
+    return response_body, 200
+
+
+# Crear una serie de clases recurrentes (p.ej. semanal durante N semanas) de una sola vez
+@api.route('/trainers/<int:id>/classes/recurring', methods=["POST"])
+@jwt_required()
+def handle_trainer_recurring_classes(id):
+    response_body = {}
+    current_user = get_jwt_identity()
+    trainer = Trainers.query.get(id)
+    if not trainer:
+        response_body["message"] = "Trainer not found"
+        return response_body, 404
+    if not ((current_user['role'] == 'trainers' and current_user['id'] == trainer.id) or (current_user["role"] == "administrators")):
+        response_body["message"] = 'Not allowed!'
+        return response_body, 405
+    data = request.json
+    if not data or not isinstance(data.get('recurrence'), dict):
+        response_body["message"] = "Missing required field 'recurrence'"
+        return response_body, 400
+    start_date, end_date = validate_trainer_class_data(id, data)
+    recurrence = data['recurrence']
+    until = parse_datetime_param(recurrence['until'], 'until') if recurrence.get('until') else None
+    count = parse_number_param(recurrence['count'], 'count') if recurrence.get('count') is not None else None
+    slots = expand_recurrence(start_date, end_date, recurrence.get('frequency', 'weekly'),
+                              count=count, until=until, interval=parse_number_param(recurrence.get('interval', 1), 'interval'))
+    # Todos los huecos se comprueban con una sola consulta antes de tocar Stripe
+    results = check_slots(id, slots)
+    # Clases de la propia serie que se pisan entre si (p.ej. diaria con clases de mas de un dia)
+    overlapping = [{'start_date': slot_start.isoformat(),
+                    'end_date': slot_end.isoformat(),
+                    'conflicting_slots': [slots[index][0].isoformat() for index in result['slots']]} for (slot_start, slot_end), result in zip(slots, results) if result['slots']]
+    if overlapping:
+        response_body["message"] = "Classes of the series overlap each other"
+        response_body["conflicts"] = overlapping
+        return response_body, 400
+    conflicts = [{'start_date': slot_start.isoformat(),
+                  'end_date': slot_end.isoformat(),
+                  'conflicting_classes': result['classes']} for (slot_start, slot_end), result in zip(slots, results) if result['classes']]
+    if conflicts:
+        response_body["message"] = "Trainer class already exists for this datetime"
+        response_body["conflicts"] = conflicts
+        return response_body, 400
+    # Todas las clases de la serie comparten direccion: se geocodifica una sola vez
+    location = class_location(data["city"], data["postal_code"], data["street_name"], data["street_number"])
+    search_values = class_search_values(data.get("class_name"), data.get("class_details"), get_specialization(data["training_type"]), trainer)
+    try:
+        # Un solo producto y un solo precio de Stripe para toda la serie, creados en una sola llamada
+        price = stripe_provider.call(stripe.Price.create,
+                                     currency="eur",
+                                     unit_amount=data["price"],
+                                     product_data={"name": data.get("class_name") or f"{data['start_date']} ({len(slots)} classes)"})
+        db.session.bulk_insert_mappings(TrainersClasses, [dict(trainer_class_values(id, data, slot_start, slot_end, price.product, price.id), **location, **search_values) for slot_start, slot_end in slots])
+        db.session.commit()
+    except ProviderUnavailable as e:
+        response_body["message"] = e.message
+        return response_body, 503
+    except stripe.error.StripeError as e:
+        response_body["message"] = "Stripe error: " + str(e)
+        db.session.rollback()
+        return response_body, 500
+    except IntegrityError:
+        db.session.rollback()
+        response_body["message"] = "Trainer class already exists for this datetime"
+        return response_body, 400
+    except Exception as e:
+        response_body["message"] = "Error: " + str(e)
+        db.session.rollback()
+        return response_body, 500
+    invalidate_response_cache('classes')
+    new_classes = TrainersClasses.query.filter_by(trainer_id=id, stripe_price_id=price.id).order_by(TrainersClasses.start_date).all()
+    response_body["message"] = "New classes created"
+    response_body["specialization"] = get_specialization(data["training_type"])
+    response_body["classes"] = [trainer_class.serialize() for trainer_class in new_classes]
+    return response_body, 201
+
+
+# Asistentes de una clase: join users_classes -> users en una sola consulta, solo con los campos necesarios
+def get_class_roster_query(class_id):
+    return db.session.query(Users.id,
+                            Users.name,
+                            Users.last_name,
+                            Users.email,
+                            Users.phone_number,
+                            UsersClasses.stripe_status).join(UsersClasses, UsersClasses.user_id == Users.id).filter(UsersClasses.class_id == class_id).order_by(UsersClasses.id)
+
 
 # Mostrar, crear, borrar clase trainer
 @api.route('/trainers/<int:id>/classes/<int:class_id>', methods=["GET", "DELETE", "PATCH"])
@@ -1215,17 +1216,22 @@ def handle_trainer_class(id, class_id):
             response_body["message"] = "Class doesn't exist"
             return response_body, 404
     if request.method == "GET":
-        user_in_class = UsersClasses.query.filter(UsersClasses.class_id == class_id).all()
-        specialization = Specializations.query.filter(Specializations.id==trainer_class.training_type).first()
-        users_details = []
-        for user_class in user_in_class:
-            user = Users.query.get(user_class.user_id)
-            if not user:
-                response_body["message"] = "User not found"
-                return response_body, 400
-            users_details.append(user.serialize())
-        response_body["specialization"] = specialization.serialize()
-        response_body["user_in_class"] = users_details
+        roster = get_class_roster_query(class_id)
+        # Modo streaming (NDJSON, un asistente por linea) para clases con cientos de asistentes
+        if request.args.get('stream') == 'true':
+            def generate():
+                for attendee in roster.yield_per(ROSTER_STREAM_CHUNK_SIZE):
+                    yield json.dumps(attendee._asdict()) + "\n"
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        if 'limit' in request.args or 'offset' in request.args:
+            limit = min(parse_number_param(request.args.get('limit', ROSTER_PAGE_SIZE), 'limit'), ROSTER_PAGE_SIZE)
+            offset = parse_number_param(request.args.get('offset', 0), 'offset')
+            if limit < 1 or offset < 0:
+                raise APIException("Invalid pagination parameters", status_code=400)
+            response_body["user_in_class_total"] = roster.count()
+            roster = roster.limit(limit).offset(offset)
+        response_body["specialization"] = get_specialization(trainer_class.training_type)
+        response_body["user_in_class"] = [attendee._asdict() for attendee in roster]
         response_body["message"] = "Trainer class"
         response_body["class"] = trainer_class.serialize()
         return response_body, 200
@@ -1237,7 +1243,8 @@ def handle_trainer_class(id, class_id):
                 response_body["message"] = "Unable to delete class, it has associated users with paid status"
                 return response_body, 400
             db.session.delete(trainer_class)
-            db.session.commit()       
+            db.session.commit()
+            invalidate_response_cache('classes', f'class:{class_id}')
             response_body["message"] = "Clase cancelada"
             response_body["class"] = trainer_class.serialize()
             return response_body, 200
@@ -1246,6 +1253,13 @@ def handle_trainer_class(id, class_id):
             if not data:
                 response_body["message"] = "No data provided for update"
                 return response_body, 400
+            # Si cambia la direccion se vuelve a geocodificar (antes de modificar la clase)
+            location = None
+            if any(field in data for field in ['city', 'postal_code', 'street_name', 'street_number']):
+                location = class_location(data.get("city", trainer_class.city),
+                                          data.get("postal_code", trainer_class.postal_code),
+                                          data.get("street_name", trainer_class.street_name),
+                                          data.get("street_number", trainer_class.street_number))
             if 'class_name' in data:
                 trainer_class.class_name = data["class_name"]
             if 'class_details' in data:
@@ -1260,14 +1274,35 @@ def handle_trainer_class(id, class_id):
                 trainer_class.street_number = data["street_number"]
             if 'additional_info' in data:
                 trainer_class.additional_info = data["additional_info"]
-            if 'start_date' in data:
-                trainer_class.start_date = data["start_date"]
-            if 'end_date' in data:
-                trainer_class.end_date = data["end_date"]
+            if location:
+                trainer_class.latitude = location['latitude']
+                trainer_class.longitude = location['longitude']
+                trainer_class.geohash = location['geohash']
+            if 'class_name' in data or 'class_details' in data:
+                search_values = class_search_values(trainer_class.class_name, trainer_class.class_details, get_specialization(trainer_class.training_type), trainer)
+                trainer_class.search_title = search_values['search_title']
+                trainer_class.search_body = search_values['search_body']
+            if 'start_date' in data or 'end_date' in data:
+                start_date = parse_datetime_param(data["start_date"], 'start_date') if 'start_date' in data else trainer_class.start_date
+                end_date = parse_datetime_param(data["end_date"], 'end_date') if 'end_date' in data else trainer_class.end_date
+                if start_date >= end_date:
+                    response_body["message"] = "start_date must be before end_date"
+                    return response_body, 400
+                if find_conflicts(id, start_date, end_date, exclude_class_id=class_id):
+                    response_body["message"] = "Trainer class already exists for this datetime"
+                    return response_body, 400
+                trainer_class.start_date = start_date
+                trainer_class.end_date = end_date
             if 'price' in data:
                 trainer_class.price = data["price"]
             db.session.add(trainer_class)
-            db.session.commit()
+            try:
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                response_body["message"] = "Trainer class already exists for this datetime"
+                return response_body, 400
+            invalidate_response_cache('classes', f'class:{class_id}')
             response_body["message"] = "Class updated"
             response_body["result"] = trainer_class.serialize()
             return response_body, 200
@@ -1302,20 +1337,11 @@ def handle_user_class(id, class_id):
             if user_class.stripe_status == "Paid":
                 response_body["message"] = "Unable to cancel class, user have paid it"
                 return response_body, 400
+            release_hold(user_class)
             db.session.delete(user_class)
             db.session.commit()
-            user_classes = UsersClasses.query.filter_by(user_id=id).all()
-            classes_with_trainers = []
-            for user_cls in user_classes:
-                trainer_cls = TrainersClasses.query.filter_by(id=user_cls.class_id).first()
-                trainer = Trainers.query.filter_by(id=trainer_cls.trainer_id).first()
-                trainer_details = {'name': trainer.name, 'last_name': trainer.last_name} if trainer else None
-                trainer_class_info = {'class_details': trainer_cls.serialize(),
-                                      'specialization': db.session.query(Specializations).filter_by(id=trainer_cls.training_type).first().serialize() if trainer_cls else None,
-                                      'trainer' : trainer_details}
-                user_class_info = user_cls.serialize()
-                classes_with_trainers.append({'user_class': user_class_info,
-                                              'trainer_class': trainer_class_info})
+            invalidate_response_cache('classes', f'class:{class_id}')
+            classes_with_trainers = get_user_schedule(id)
             response_body["message"] = "User unenrolled successfully"
             response_body["classes_available"] = classes_with_trainers
             return response_body, 200
@@ -1323,37 +1349,171 @@ def handle_user_class(id, class_id):
     return response_body, 405
 
 
+# Fecha de modificacion mas reciente entre las versiones dadas (ignora None)
+def latest_update(*dates):
+    dates = [date for date in dates if date is not None]
+    return max(dates) if dates else None
+
+
+def specializations_version():
+    return db.session.query(db.func.max(Specializations.updated_at)).scalar_subquery()
+
+
+# Filtros del catalogo de clases a partir de los parametros de la query string
+def filter_classes_query(query, args):
+    if args.get('city'):
+        query = query.filter(TrainersClasses.city == args['city'])
+    if args.get('postal_code'):
+        query = query.filter(TrainersClasses.postal_code == parse_number_param(args['postal_code'], 'postal_code'))
+    if args.get('training_type'):
+        query = query.filter(TrainersClasses.training_type == parse_number_param(args['training_type'], 'training_type'))
+    if args.get('training_level'):
+        if args['training_level'] not in ['Beginner', 'Intermediate', 'Advanced']:
+            raise APIException("Invalid training level", status_code=400)
+        query = query.filter(TrainersClasses.training_level == args['training_level'])
+    if args.get('min_price'):
+        query = query.filter(TrainersClasses.price >= parse_number_param(args['min_price'], 'min_price', float))
+    if args.get('max_price'):
+        query = query.filter(TrainersClasses.price <= parse_number_param(args['max_price'], 'max_price', float))
+    if args.get('start_from'):
+        query = query.filter(TrainersClasses.start_date >= parse_datetime_param(args['start_from'], 'start_from'))
+    if args.get('start_to'):
+        query = query.filter(TrainersClasses.start_date < parse_datetime_param(args['start_to'], 'start_to'))
+    return query
+
+
 # Mostrar todas las clases
+# Acepta filtros (city, postal_code, training_type, training_level, min_price, max_price, start_from, start_to)
+# y paginacion keyset con limit y cursor, ordenada por start_date, id
 @api.route('/classes', methods=['GET'])
+@cached_response(tags=['classes'], shared=True)
 def handle_show_classes():
     response_body = {}
-    all_classes = db.session.query(TrainersClasses).all()
+    classes = CatalogSerializer(class_fields.project(request.args.get('fields')))
+    # ETag / Last-Modified a partir de max(updated_at) y numero de filas, antes de cargar las clases
+    classes_updated_at, classes_count, specializations_updated_at = filter_classes_query(db.session.query(db.func.max(TrainersClasses.updated_at),
+                                                                                                          db.func.count(TrainersClasses.id),
+                                                                                                          specializations_version()), request.args).one()
+    headers, not_modified = conditional_headers(request, latest_update(classes_updated_at, specializations_updated_at), classes_count)
+    if not_modified:
+        return '', 304, headers
+    # Trainer y especializacion en la misma consulta y solo las columnas que se devuelven
+    query = filter_classes_query(classes.query(), request.args)
+    query = query.order_by(TrainersClasses.start_date, TrainersClasses.id)
+    paginated = 'limit' in request.args or 'cursor' in request.args
+    if paginated:
+        limit = min(parse_number_param(request.args.get('limit', CLASSES_PAGE_SIZE), 'limit'), CLASSES_MAX_PAGE_SIZE)
+        if limit < 1:
+            raise APIException("Invalid value for 'limit'", status_code=400)
+        if request.args.get('cursor'):
+            cursor_date, cursor_id = decode_cursor(request.args['cursor'])
+            query = query.filter(db.or_(TrainersClasses.start_date > cursor_date,
+                                        db.and_(TrainersClasses.start_date == cursor_date,
+                                                TrainersClasses.id > cursor_id)))
+        # Se pide una fila extra para saber si hay pagina siguiente
+        all_classes = query.limit(limit + 1).all()
+        has_next = len(all_classes) > limit
+        all_classes = all_classes[:limit]
+    else:
+        all_classes = query.all()
     if not all_classes:
         response_body['message'] = 'No classes available.'
         return response_body, 404
-    classes_with_specializations = []
-    for cls in all_classes:
-        trainer = db.session.query(Trainers).filter_by(id=cls.trainer_id).first()
-        specialization = db.session.query(Specializations).filter_by(id=cls.training_type).first()
-        trainer_details = {'name': trainer.name, 'last_name': trainer.last_name} if trainer else None
-        classes_with_specializations.append({'class_details': cls.serialize(),
-                                             'specialization': specialization.serialize() if specialization else None,
-                                             'trainer': trainer_details})
     response_body['message'] = 'List of classes available.'
-    response_body['results'] = classes_with_specializations
+    response_body['results'] = [classes(row) for row in all_classes]
+    if paginated:
+        last_id, last_start_date = all_classes[-1][:2]
+        response_body['next_cursor'] = encode_cursor(last_start_date, last_id) if has_next else None
+    return response_body, 200, headers
+
+
+# Buscar clases por texto (nombre y detalles de la clase, especializacion y nombre del trainer).
+# Cada palabra se busca como prefijo y las mal escritas se corrigen. Acepta limit, offset y los filtros de /classes
+@api.route('/search', methods=['GET'])
+@cached_response(tags=['classes'], shared=True)
+def handle_search():
+    response_body = {}
+    classes = CatalogSerializer(class_fields.project(request.args.get('fields')))
+    terms = search_terms(request.args.get('q', ''))
+    if not terms:
+        raise APIException("Missing search text 'q'", status_code=400)
+    limit = min(parse_number_param(request.args.get('limit', SEARCH_PAGE_SIZE), 'limit'), SEARCH_MAX_PAGE_SIZE)
+    offset = parse_number_param(request.args.get('offset', 0), 'offset')
+    if limit < 1 or offset < 0:
+        raise APIException("Invalid pagination parameters", status_code=400)
+    corrected_terms = correct_terms(terms)
+    query, rank = apply_search(filter_classes_query(db.session.query(TrainersClasses), request.args), corrected_terms)
+    # Primero solo ids y relevancia; despues se cargan completas las clases de la pagina
+    matches = query.with_entities(TrainersClasses.id, rank).limit(limit).offset(offset).all()
+    response_body['query'] = " ".join(corrected_terms)
+    if corrected_terms != terms:
+        response_body['corrected_from'] = " ".join(terms)
+    if not matches:
+        response_body['message'] = 'No classes found.'
+        response_body['results'] = []
+        return response_body, 404
+    classes_by_id = {row[0]: classes(row) for row in classes.query().filter(TrainersClasses.id.in_([id for id, score in matches]))}
+    results = []
+    for id, score in matches:
+        results.append(dict(classes_by_id[id], score=round(float(score), 4)))
+    response_body['message'] = 'Search results.'
+    response_body['results'] = results
+    return response_body, 200
+
+
+# Clases cerca de un punto (lat, lng) o de una ciudad (near), ordenadas por distancia.
+# Acepta radius (km), limit y los mismos filtros que /classes
+@api.route('/classes/nearby', methods=['GET'])
+@cached_response(tags=['classes'], shared=True)
+def handle_nearby_classes():
+    response_body = {}
+    classes = CatalogSerializer(class_fields.project(request.args.get('fields')))
+    if request.args.get('near'):
+        location = geocode_city(request.args['near'])
+        if not location:
+            response_body['message'] = 'Location not found'
+            return response_body, 404
+        lat, lng = location['lat'], location['lng']
+    elif 'lat' in request.args and 'lng' in request.args:
+        lat = parse_number_param(request.args['lat'], 'lat', float)
+        lng = parse_number_param(request.args['lng'], 'lng', float)
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+            raise APIException("Invalid coordinates", status_code=400)
+    else:
+        raise APIException("Missing lat and lng (or near)", status_code=400)
+    radius = parse_number_param(request.args.get('radius', NEARBY_RADIUS_KM), 'radius', float)
+    if not 0 < radius <= NEARBY_MAX_RADIUS_KM:
+        raise APIException(f"radius must be between 0 and {NEARBY_MAX_RADIUS_KM} km", status_code=400)
+    limit = min(parse_number_param(request.args.get('limit', CLASSES_PAGE_SIZE), 'limit'), CLASSES_MAX_PAGE_SIZE)
+    if limit < 1:
+        raise APIException("Invalid value for 'limit'", status_code=400)
+    nearby = classes_within(filter_classes_query(db.session.query(TrainersClasses), request.args), lat, lng, radius, limit)
+    if not nearby:
+        response_body['message'] = 'No classes available near the location.'
+        return response_body, 404
+    # Solo se cargan las columnas de las clases que se devuelven
+    classes_by_id = {row[0]: classes(row) for row in classes.query().filter(TrainersClasses.id.in_([id for id, distance in nearby]))}
+    results = []
+    for id, distance in nearby:
+        results.append(dict(classes_by_id[id], distance_km=round(distance, 2)))
+    response_body['message'] = 'List of classes near the location.'
+    response_body['location'] = {'lat': lat, 'lng': lng, 'radius': radius}
+    response_body['results'] = results
     return response_body, 200
 
 
 # Mostrar una clase en función de ID
 @api.route('/classes/<int:id>', methods=['GET'])
+@cached_response(tags=lambda id: [f'class:{id}'], shared=True)
 def handle_show_single_class(id):
     response_body = {}
-    single_class = db.session.query(TrainersClasses).filter_by(id=id).first()
+    fields = class_fields.project(request.args.get('fields'))
+    single_class = db.session.query(*fields.columns).filter(TrainersClasses.id == id).first()
     if not single_class:
         response_body['message'] = f'No class with id {str(id)} found!'
         return response_body, 404
     response_body['message'] = 'Class details.'
-    response_body['results'] = single_class.serialize()
+    response_body['results'] = fields(single_class)
     return response_body, 200
 
 
@@ -1387,7 +1547,7 @@ def handle_trainer_specializations(id):
             if not specialization_id:
                 response_body["message"] = "Falta el ID de especialización en la solicitud."
                 return jsonify(response_body), 400
-            specialization = db.session.query(Specializations).filter_by(id=specialization_id).first()
+            specialization = get_specialization(specialization_id)
             if not specialization:
                 response_body['message'] = f'La especialización con el ID {specialization_id} no existe!'
                 return jsonify(response_body), 404
@@ -1397,7 +1557,7 @@ def handle_trainer_specializations(id):
                 return jsonify(response_body), 409
             try:
                 # Subir la imagen a Cloudinary
-                upload_result = cloudinary.uploader.upload(file)
+                upload_result = cloudinary_upload(file)
                 # Obtener la URL de la imagen desde Cloudinary
                 certification_url = upload_result['secure_url']
                 new_trainer_specialization = TrainersSpecializations(status="Requested",
@@ -1405,104 +1565,23 @@ def handle_trainer_specializations(id):
                                                                      trainer_id=id,
                                                                      certification=certification_url)
                 db.session.add(new_trainer_specialization)
-                db.session.commit()
+                db.session.flush()
                 token = s.dumps(new_trainer_specialization.id, salt='email-confirm')
                 reject_url = f"{os.environ['BACKEND_URL']}reject/specialization/{token}"
                 confirm_url = f"{os.environ['BACKEND_URL']}confirm/specialization/{token}"
                 subject = 'Confirm Specialization'
-                html_content = f'''
-                    <!DOCTYPE html>
-                    <html lang="en">
-                    <head>
-                        <meta charset="UTF-8">
-                        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                        <title>Email Confirmation</title>
-                        <style>
-                        body {{
-                            font-family: Arial, sans-serif;
-                            background-color: #f9f9f9;
-                            margin: 0;
-                            padding: 0;
-                        }}
-                        .container {{
-                            display: flex;
-                            flex-direction: column;
-                            align-items: center;
-                            justify-content: center;
-                            max-width: 600px;
-                            margin: auto;
-                            padding: 20px;
-                            background-color: #fff;
-                            border-radius: 8px;
-                            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                        }}
-                        .message {{
-                            margin-bottom: 20px;
-                        }}
-                        .button-confirm,
-                        .button-reject {{
-                            display: inline-block;
-                            padding: 12px 24px;
-                            background-color: #007bff;
-                            color: #fff;
-                            text-decoration: none;
-                            border-radius: 5px;
-                            transition: background-color 0.3s ease;
-                            margin-right: 10px;
-                        }}
-                        .button-confirm:hover {{
-                            background-color: #0056b3;
-                        }}
-                        .button-reject {{
-                            background-color: #dc3545;
-                        }}
-                        .button-reject:hover {{
-                            background-color: #c82333;
-                        }}
-                        .cert-container {{
-                            margin-top: 10px;
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-
-                        }}
-                        .cert-link {{
-                            background-color: #007bff;
-                            color: #fff;
-                            padding: 8px 16px;
-                            border-radius: 5px;
-                            text-decoration: none;
-                            transition: background-color 0.3s ease;
-                        }}
-                        .cert-link:hover {{
-                            background-color: #0056b3;
-                        }}
-                    </style>
-                    </head>
-                    <body>
-                        <div class="container">
-                            <div class="message">
-                                <p>Por favor, aprueba o rechaza la especialización</p>
-                                <div class="cert-container">
-                                    <a class="cert-link" href="{certification_url}" target="_blank">Ver certificado</a>
-                                </div>
-                            </div>
-                            <div class="action">
-                                <a class="button-confirm" href="{confirm_url}" target="_blank">¡Haz clic aquí para confirmar!</a>
-                                <a class="button-reject" href="{reject_url}" target="_blank">¡Haz clic aquí para rechazar!</a>
-                            </div>
-                        </div>
-                    </body>
-                    </html>
-                    '''
-                msg = Message(subject, recipients=[trainer.email], html=html_content, sender=os.getenv('MAIL_DEFAULT_SENDER'))
-                mail.send(msg)
+                queue_template_email('specialization_request', subject, trainer.email, sender=os.getenv('MAIL_DEFAULT_SENDER'),
+                                     certification_url=certification_url, confirm_url=confirm_url, reject_url=reject_url)
+                db.session.commit()
                 response_body['message'] = f'Nueva especialización creada para el entrenador {id}, espere la confirmación'
                 response_body['results'] = new_trainer_specialization.serialize()
                 return jsonify(response_body), 201
+            except ProviderUnavailable as e:
+                db.session.rollback()
+                response_body['message'] = e.message
+                return jsonify(response_body), 503
             except Exception as e:
-                db.session.delete(new_trainer_specialization)
-                db.session.commit()
+                db.session.rollback()
                 response_body['message'] = 'Error al subir la imagen de certificación a Cloudinary'
                 return jsonify(response_body), 500
     response_body['message'] = '¡No permitido!'
@@ -1548,14 +1627,18 @@ def handle_trainer_specialization(id, specialization_id):
 def handle_specialization(id):
     response_body = {}
     current_user = get_jwt_identity()
+    if request.method == 'GET':
+        specialization = get_specialization(id)
+        if not specialization:
+            response_body['message'] = f'No specialization found with id: {str(id)}!'
+            return response_body, 404
+        response_body['message'] = 'Specialization details.'
+        response_body['results'] = specialization
+        return response_body, 200
     specialization = db.session.query(Specializations).filter_by(id=id).first()
     if not specialization:
         response_body['message'] = f'No specialization found with id: {str(id)}!'
         return response_body, 404
-    if request.method == 'GET':
-        response_body['message'] = 'Specialization details.'
-        response_body['results'] = specialization.serialize()
-        return response_body, 200
     if not current_user['role'] == 'administrators':
         response_body['message'] = 'Not allowed!'
         return response_body, 405
@@ -1572,6 +1655,10 @@ def handle_specialization(id):
             specialization.logo_url = data['logo_url']
         db.session.add(specialization)
         db.session.commit()
+        invalidate_specializations(id)
+        # El nombre y la descripcion forman parte del texto de busqueda de sus clases
+        refresh_search_documents(TrainersClasses.training_type == id)
+        invalidate_response_cache('specializations', 'classes')
         response_body['message'] = 'Specialization updated successfully!'
         response_body['results'] = {'Updated specialization data': specialization.serialize()}
         return response_body,200
@@ -1582,24 +1669,24 @@ def handle_specialization(id):
             return response_body,400
         db.session.delete(specialization)
         db.session.commit()
+        invalidate_specializations(id)
+        invalidate_response_cache('specializations', 'classes')
         response_body['message'] = f'Specialization with id: {str(id)}, successfully deleted'
         return response_body, 200
 
 
+# Gimnasios cerca de una ciudad (cacheado en memoria y en la tabla geo_cache)
 @api.route('/gyms/<string:city>', methods=['GET'])
 def find_gyms_near_location(city):
-    gmaps = googlemaps.Client(key=os.getenv('GOOGLE_API_KEY'))
-    geocode_result = gmaps.geocode(city)
-    if not geocode_result:
-        print("Location not found")
-        return
-    location = geocode_result[0]['geometry']['location']
-    lat = location['lat']
-    lng = location['lng']
-
-    places_result = gmaps.places_nearby(location=(lat, lng), radius=5000, type='gym')
-    if not places_result['results']:
-        print("No gyms found near the location")
-        return
-    gyms = [(place['name'], place['vicinity']) for place in places_result['results']]
-    return gyms
\ No newline at end of file
+    response_body = {}
+    radius = min(parse_number_param(request.args.get('radius', GYMS_RADIUS), 'radius'), GYMS_MAX_RADIUS)
+    if radius < 1:
+        raise APIException("Invalid value for 'radius'", status_code=400)
+    gyms = find_gyms(city, radius)
+    if gyms is None:
+        response_body["message"] = "Location not found"
+        return response_body, 404
+    if not gyms:
+        response_body["message"] = "No gyms found near the location"
+        return response_body, 404
+    return jsonify(gyms), 200
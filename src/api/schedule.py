@@ -0,0 +1,123 @@
+"""
+Schedule conflict detection for trainer classes. Single checks run one overlap query backed by the
+(trainer_id, start_date, end_date) index; bulk checks load the trainer's classes in the affected
+window once and answer every proposed slot from an in-memory interval tree
+"""
+import os
+from datetime import timedelta
+from api.models import db, TrainersClasses
+from api.utils import APIException
+
+
+# Series de clases recurrentes (tipo RRULE: FREQ=DAILY|WEEKLY;INTERVAL;COUNT|UNTIL)
+RECURRENCE_FREQUENCIES = {'daily': timedelta(days=1), 'weekly': timedelta(weeks=1)}
+RECURRING_CLASSES_MAX = int(os.getenv("RECURRING_CLASSES_MAX", 52))
+
+
+# Arbol de intervalos centrado (estatico) sobre intervalos semiabiertos [start, end)
+class IntervalTree:
+    def __init__(self, intervals):
+        self.center = None
+        self.left = self.right = None
+        # Los intervalos vacios no se solapan con nada
+        intervals = [interval for interval in intervals if interval[0] < interval[1]]
+        if not intervals:
+            return
+        # Mediana inferior de los extremos: garantiza que el centro quede dentro de algun intervalo
+        points = sorted(point for start, end, value in intervals for point in (start, end))
+        self.center = points[(len(points) - 1) // 2]
+        left, right, here = [], [], []
+        for interval in intervals:
+            if interval[1] <= self.center:
+                left.append(interval)
+            elif interval[0] > self.center:
+                right.append(interval)
+            else:
+                here.append(interval)
+        # Los intervalos que contienen el centro se guardan ordenados por inicio y por fin
+        self.by_start = sorted(here, key=lambda interval: interval[0])
+        self.by_end = sorted(here, key=lambda interval: interval[1], reverse=True)
+        self.left = IntervalTree(left) if left else None
+        self.right = IntervalTree(right) if right else None
+
+    # Devuelve los valores de los intervalos que se solapan con [start, end)
+    def overlaps(self, start, end):
+        found = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.center is None:
+                continue
+            if end <= node.center:
+                for interval in node.by_start:
+                    if interval[0] >= end:
+                        break
+                    found.append(interval[2])
+                if node.left:
+                    stack.append(node.left)
+            elif start > node.center:
+                for interval in node.by_end:
+                    if interval[1] <= start:
+                        break
+                    found.append(interval[2])
+                if node.right:
+                    stack.append(node.right)
+            else:
+                found.extend(interval[2] for interval in node.by_start)
+                if node.left:
+                    stack.append(node.left)
+                if node.right:
+                    stack.append(node.right)
+        return found
+
+
+def overlap_filter(start_date, end_date):
+    return db.and_(TrainersClasses.start_date < end_date, TrainersClasses.end_date > start_date)
+
+
+# Clases del trainer que se solapan con [start_date, end_date)
+def find_conflicts(trainer_id, start_date, end_date, exclude_class_id=None):
+    query = db.session.query(TrainersClasses).filter(TrainersClasses.trainer_id == trainer_id, overlap_filter(start_date, end_date))
+    if exclude_class_id is not None:
+        query = query.filter(TrainersClasses.id != exclude_class_id)
+    return query.all()
+
+
+# Comprueba N huecos propuestos (lista de (start_date, end_date)) con una sola consulta.
+# Devuelve, para cada hueco, los ids de las clases existentes y los indices de otros huecos con los que choca
+def check_slots(trainer_id, slots, exclude_class_id=None):
+    if not slots:
+        return []
+    window_start = min(start for start, end in slots)
+    window_end = max(end for start, end in slots)
+    query = db.session.query(TrainersClasses.id, TrainersClasses.start_date, TrainersClasses.end_date).filter(TrainersClasses.trainer_id == trainer_id,
+                                                                                                              overlap_filter(window_start, window_end))
+    if exclude_class_id is not None:
+        query = query.filter(TrainersClasses.id != exclude_class_id)
+    existing = IntervalTree([(start, end, id) for id, start, end in query.all()])
+    proposed = IntervalTree([(start, end, index) for index, (start, end) in enumerate(slots)])
+    results = []
+    for index, (start, end) in enumerate(slots):
+        results.append({'classes': sorted(existing.overlaps(start, end)),
+                        'slots': sorted(other for other in proposed.overlaps(start, end) if other != index)})
+    return results
+
+
+# Expande una serie a la lista de huecos (start_date, end_date). Hace falta count o until (inclusive)
+def expand_recurrence(start_date, end_date, frequency, count=None, until=None, interval=1):
+    if frequency not in RECURRENCE_FREQUENCIES:
+        raise APIException("Invalid recurrence frequency", status_code=400, payload={"frequency available": list(RECURRENCE_FREQUENCIES)})
+    if interval < 1:
+        raise APIException("Recurrence interval must be at least 1", status_code=400)
+    if count is None and until is None:
+        raise APIException("Recurrence needs count or until", status_code=400)
+    step = RECURRENCE_FREQUENCIES[frequency] * interval
+    slots = []
+    while (count is None or len(slots) < count) and (until is None or start_date <= until):
+        if len(slots) >= RECURRING_CLASSES_MAX:
+            raise APIException(f"A series can have at most {RECURRING_CLASSES_MAX} classes", status_code=400)
+        slots.append((start_date, end_date))
+        start_date, end_date = start_date + step, end_date + step
+    if not slots:
+        raise APIException("The recurrence does not produce any class", status_code=400)
+    return slots
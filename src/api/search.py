@@ -0,0 +1,158 @@
+"""
+Full-text search over classes. Each class keeps two denormalized text columns written by the app:
+search_title (class name, specialization name, trainer name) and search_body (class details,
+specialization description). The database indexes them: a generated, weighted tsvector with a GIN
+index on Postgres, or an FTS5 table kept in sync by triggers on SQLite. Every query term matches as
+a prefix, and terms missing from the index vocabulary are corrected to the closest indexed word
+"""
+import os
+import re
+import bisect
+import difflib
+import unicodedata
+from api.models import db, TrainersClasses, Specializations, Trainers
+from api.cache import TTLCache
+
+
+SEARCH_MAX_TERMS = 8
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 100
+SEARCH_REINDEX_BATCH_SIZE = int(os.getenv("SEARCH_REINDEX_BATCH_SIZE", 1000))
+# Similitud minima (difflib) para corregir una palabra mal escrita
+SEARCH_TYPO_CUTOFF = float(os.getenv("SEARCH_TYPO_CUTOFF", 0.75))
+# El titulo pesa mas que el cuerpo en la relevancia (bm25 en SQLite; en Postgres pesos A y B del tsvector)
+SEARCH_TITLE_WEIGHT = 10.0
+SEARCH_BODY_WEIGHT = 1.0
+
+search_vocabulary_cache = TTLCache(maxsize=4, ttl=int(os.getenv("SEARCH_VOCABULARY_TTL", 300)))
+# Backend de busqueda detectado por motor: "postgresql", "fts5" o "like" (sin indice: migracion no aplicada)
+search_backends = {}
+
+# Tabla virtual FTS5 (creada por la migracion; fuera de db.metadata para que create_all no la cree)
+classes_search = db.Table("classes_search", db.MetaData(), db.Column("rowid", db.Integer, primary_key=True))
+
+
+# Minusculas, sin tildes y solo palabras: igual para los documentos y para las consultas
+def normalize_text(text):
+    text = unicodedata.normalize('NFKD', text or "").encode('ascii', 'ignore').decode()
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def search_terms(text):
+    return normalize_text(text).split()[:SEARCH_MAX_TERMS]
+
+
+# Columnas de busqueda de una clase. specialization es el dict serializado (o None)
+def class_search_values(class_name, class_details, specialization, trainer):
+    specialization = specialization or {}
+    trainer_name = f"{trainer.name} {trainer.last_name}" if trainer else ""
+    return {'search_title': normalize_text(" ".join([class_name or "", specialization.get('name') or "", trainer_name])),
+            'search_body': normalize_text(" ".join([class_details or "", specialization.get('description') or ""]))}
+
+
+# Recalcula en lotes las columnas de busqueda de las clases que cumplen los filtros (p.ej. al cambiar una especializacion)
+def refresh_search_documents(*filters, batch_size=SEARCH_REINDEX_BATCH_SIZE):
+    refreshed = 0
+    last_id = 0
+    while True:
+        rows = db.session.query(TrainersClasses.id,
+                                TrainersClasses.class_name,
+                                TrainersClasses.class_details,
+                                Specializations.name,
+                                Specializations.description,
+                                Trainers.name,
+                                Trainers.last_name).outerjoin(Specializations, Specializations.id == TrainersClasses.training_type).outerjoin(Trainers, Trainers.id == TrainersClasses.trainer_id).filter(TrainersClasses.id > last_id,
+                                                                                                                                                                                                                *filters).order_by(TrainersClasses.id).limit(batch_size).all()
+        if not rows:
+            break
+        documents = []
+        for id, class_name, class_details, specialization_name, specialization_description, trainer_name, trainer_last_name in rows:
+            documents.append({'id': id,
+                              'search_title': normalize_text(" ".join([class_name or "", specialization_name or "", trainer_name or "", trainer_last_name or ""])),
+                              'search_body': normalize_text(" ".join([class_details or "", specialization_description or ""]))})
+        db.session.bulk_update_mappings(TrainersClasses, documents)
+        db.session.commit()
+        refreshed += len(rows)
+        last_id = rows[-1][0]
+    search_vocabulary_cache.clear()
+    return refreshed
+
+
+# Reconstruye el indice FTS5 desde trainers_classes (en Postgres el tsvector es una columna generada)
+def rebuild_search_index():
+    if search_backend() == 'fts5':
+        db.session.execute(db.text("INSERT INTO classes_search(classes_search) VALUES ('rebuild')"))
+        db.session.commit()
+    search_vocabulary_cache.clear()
+
+
+def search_backend():
+    engine = db.engine
+    backend = search_backends.get(engine.url)
+    if backend is None:
+        inspector = db.inspect(engine)
+        if engine.dialect.name == 'postgresql' and 'search_vector' in [column['name'] for column in inspector.get_columns('trainers_classes')]:
+            backend = 'postgresql'
+        elif engine.dialect.name == 'sqlite' and inspector.has_table('classes_search'):
+            backend = 'fts5'
+        else:
+            backend = 'like'
+        search_backends[engine.url] = backend
+    return backend
+
+
+# Palabras indexadas (ordenadas), para autocorregir terminos. Se cachea unos minutos
+def search_vocabulary():
+    backend = search_backend()
+    vocabulary = search_vocabulary_cache.get(backend)
+    if vocabulary is None:
+        if backend == 'postgresql':
+            rows = db.session.execute(db.text("SELECT word FROM ts_stat('SELECT search_vector FROM trainers_classes')"))
+        elif backend == 'fts5':
+            rows = db.session.execute(db.text("SELECT term FROM classes_search_vocab"))
+        else:
+            # Sin indice: las palabras se sacan de las columnas de busqueda (una pasada, y queda en cache)
+            words = set()
+            for search_title, search_body in db.session.query(TrainersClasses.search_title, TrainersClasses.search_body).yield_per(SEARCH_REINDEX_BATCH_SIZE):
+                words.update(f"{search_title or ''} {search_body or ''}".split())
+            rows = [(word,) for word in words]
+        vocabulary = sorted(row[0] for row in rows)
+        search_vocabulary_cache.set(backend, vocabulary)
+    return vocabulary
+
+
+# Un termino es valido si alguna palabra indexada empieza por el; si no, se cambia por la mas parecida
+def correct_terms(terms):
+    vocabulary = search_vocabulary()
+    if not vocabulary:
+        return terms
+    corrected = []
+    for term in terms:
+        position = bisect.bisect_left(vocabulary, term)
+        if position < len(vocabulary) and vocabulary[position].startswith(term):
+            corrected.append(term)
+            continue
+        candidates = [word for word in vocabulary if abs(len(word) - len(term)) <= 2]
+        matches = difflib.get_close_matches(term, candidates, n=1, cutoff=SEARCH_TYPO_CUTOFF)
+        corrected.append(matches[0] if matches else term)
+    return corrected
+
+
+# Aplica la busqueda a una consulta de TrainersClasses: filtra por los terminos y ordena por relevancia.
+# Devuelve (consulta, expresion de relevancia)
+def apply_search(query, terms):
+    backend = search_backend()
+    if backend == 'postgresql':
+        ts_query = db.func.to_tsquery('simple', " & ".join(f"{term}:*" for term in terms))
+        search_vector = db.literal_column("trainers_classes.search_vector")
+        rank = db.func.ts_rank_cd(search_vector, ts_query)
+        return query.filter(search_vector.op('@@')(ts_query)).order_by(rank.desc(), TrainersClasses.id), rank.label('score')
+    if backend == 'fts5':
+        # bm25 devuelve valores negativos: cuanto menor, mas relevante
+        rank = db.func.bm25(db.literal_column("classes_search"), SEARCH_TITLE_WEIGHT, SEARCH_BODY_WEIGHT)
+        match = " ".join(f'"{term}"*' for term in terms)
+        return query.join(classes_search, classes_search.c.rowid == TrainersClasses.id).filter(db.literal_column("classes_search").op('MATCH')(match)).order_by(rank, TrainersClasses.id), (-rank).label('score')
+    # Sin indice de texto completo: LIKE sobre las columnas de busqueda (lento, solo para desarrollo)
+    for term in terms:
+        query = query.filter(db.or_(TrainersClasses.search_title.like(f"%{term}%"), TrainersClasses.search_body.like(f"%{term}%")))
+    return query.order_by(TrainersClasses.start_date, TrainersClasses.id), db.literal(0).label('score')
@@ -0,0 +1,177 @@
+"""
+Fast serialization for list endpoints: only the needed columns are selected as plain rows and mapped to
+dicts through precomputed (key, column) tuples, with the same keys as Model.serialize(). A ?fields= list
+narrows those tuples (sparse fieldsets) so the projection reaches the SELECT. Datetime columns are
+formatted as HTTP dates while mapping the row, so the encoder only sees plain values. Responses are
+encoded by FastJSONProvider, which uses orjson when it is installed and the stdlib json module otherwise
+"""
+from datetime import timezone
+from flask.json.provider import DefaultJSONProvider
+from api.models import db, Users, Trainers, Administrators, Specializations, TrainersClasses, UsersClasses
+from api.utils import APIException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+HTTP_DATE_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+HTTP_DATE_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+# Igual que werkzeug.http.http_date (el formato del proveedor JSON de Flask) pero sin pasar por email.utils.
+# Las fechas sin zona horaria son UTC
+def format_http_date(value):
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return (f"{HTTP_DATE_DAYS[value.weekday()]}, {value.day:02d} {HTTP_DATE_MONTHS[value.month - 1]} {value.year:04d} "
+            f"{value.hour:02d}:{value.minute:02d}:{value.second:02d} GMT")
+
+
+# Mismo resultado que el proveedor por defecto de Flask: claves ordenadas y fechas en formato HTTP.
+# Las filas de RowSerializer ya llevan las fechas como texto; las que aun llegan como datetime
+# (p.ej. de Model.serialize()) pasan por default para no cambiar el formato que espera el front
+class FastJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        if orjson is None or set(kwargs) - {'indent', 'separators'}:
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+# Campos precalculados de un modelo: columnas a seleccionar y claves del dict, en el mismo orden.
+# Las columnas DateTime se devuelven ya formateadas como fecha HTTP
+class RowSerializer:
+    def __init__(self, *fields):
+        self.fields = fields
+        self.keys = tuple(key for key, column in fields)
+        self.columns = tuple(column for key, column in fields)
+        self.datetime_indexes = tuple(index for index, column in enumerate(self.columns) if isinstance(column.type, db.DateTime))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __call__(self, row):
+        if not self.datetime_indexes:
+            return dict(zip(self.keys, row))
+        values = list(row)
+        for index in self.datetime_indexes:
+            if values[index] is not None:
+                values[index] = format_http_date(values[index])
+        return dict(zip(self.keys, values))
+
+    # Mismo dict a partir de un objeto del ORM (p.ej. cargado con load_only(*columns))
+    def from_object(self, obj):
+        return self([getattr(obj, column.key) for column in self.columns])
+
+    # Solo los campos pedidos ("name,last_name"), en el orden del modelo; sin campos, todos.
+    # Los campos que no devuelve serialize() se rechazan
+    def project(self, fields):
+        requested = {field.strip() for field in (fields or "").split(",") if field.strip()}
+        if not requested:
+            return self
+        unknown = sorted(requested - set(self.keys))
+        if unknown:
+            raise APIException(f"Unknown fields: {', '.join(unknown)}", status_code=400, payload={"fields available": list(self.keys)})
+        return RowSerializer(*[(key, column) for key, column in self.fields if key in requested])
+
+
+user_fields = RowSerializer(('id', Users.id),
+                            ('name', Users.name),
+                            ('last_name', Users.last_name),
+                            ('email', Users.email),
+                            ('city', Users.city),
+                            ('postal_code', Users.postal_code),
+                            ('phone_number', Users.phone_number),
+                            ('gender', Users.gender),
+                            ('stripe_customer_id', Users.stripe_customer_id),
+                            ('is_active', Users.is_active))
+
+trainer_fields = RowSerializer(('id', Trainers.id),
+                               ('name', Trainers.name),
+                               ('last_name', Trainers.last_name),
+                               ('email', Trainers.email),
+                               ('city', Trainers.city),
+                               ('postal_code', Trainers.postal_code),
+                               ('phone_number', Trainers.phone_number),
+                               ('gender', Trainers.gender),
+                               ('website_url', Trainers.website_url),
+                               ('instagram_url', Trainers.instagram_url),
+                               ('facebook_url', Trainers.facebook_url),
+                               ('x_url', Trainers.x_url),
+                               ('iban', Trainers.bank_iban),
+                               ('value', Trainers.sum_value),
+                               ('is_active', Trainers.is_active))
+
+administrator_fields = RowSerializer(('id', Administrators.id),
+                                     ('name', Administrators.name),
+                                     ('email', Administrators.email),
+                                     ('is_active', Administrators.is_active))
+
+specialization_fields = RowSerializer(('id', Specializations.id),
+                                      ('name', Specializations.name),
+                                      ('description', Specializations.description),
+                                      ('logo', Specializations.logo_url))
+
+class_fields = RowSerializer(('id', TrainersClasses.id),
+                             ('class_name', TrainersClasses.class_name),
+                             ('class_details', TrainersClasses.class_details),
+                             ('trainer', TrainersClasses.trainer_id),
+                             ('city', TrainersClasses.city),
+                             ('postal_code', TrainersClasses.postal_code),
+                             ('street_name', TrainersClasses.street_name),
+                             ('street_number', TrainersClasses.street_number),
+                             ('additional_info', TrainersClasses.additional_info),
+                             ('capacity', TrainersClasses.capacity),
+                             ('start_date', TrainersClasses.start_date),
+                             ('end_date', TrainersClasses.end_date),
+                             ('price', TrainersClasses.price),
+                             ('training_type', TrainersClasses.training_type),
+                             ('training_level', TrainersClasses.training_level),
+                             ('latitude', TrainersClasses.latitude),
+                             ('longitude', TrainersClasses.longitude),
+                             ('stripe_product_id', TrainersClasses.stripe_product_id),
+                             ('stripe_price_id', TrainersClasses.stripe_price_id))
+
+user_class_fields = RowSerializer(('id', UsersClasses.id),
+                                  ('user', UsersClasses.user_id),
+                                  ('class', UsersClasses.class_id),
+                                  ('amount', UsersClasses.amount),
+                                  ('stripe_status', UsersClasses.stripe_status),
+                                  ('trainer_status', UsersClasses.trainer_status))
+
+
+# Catalogo de clases: {'class_details', 'specialization', 'trainer'} a partir de una sola fila.
+# Cada fila empieza por el id y el start_date de la clase (cursor y busqueda por id), aunque no se pidan
+class CatalogSerializer:
+    def __init__(self, classes=class_fields):
+        self.classes = classes
+        self.columns = (TrainersClasses.id, TrainersClasses.start_date) + classes.columns + specialization_fields.columns + (Trainers.id, Trainers.name, Trainers.last_name)
+        self.class_end = 2 + len(classes)
+        self.specialization_end = self.class_end + len(specialization_fields)
+
+    def __len__(self):
+        return len(self.columns)
+
+    def query(self):
+        return db.session.query(*self.columns).select_from(TrainersClasses).outerjoin(Specializations, Specializations.id == TrainersClasses.training_type).outerjoin(Trainers, Trainers.id == TrainersClasses.trainer_id)
+
+    def __call__(self, row):
+        specialization = row[self.class_end:self.specialization_end]
+        trainer_id, trainer_name, trainer_last_name = row[self.specialization_end:len(self.columns)]
+        return {'class_details': self.classes(row[2:self.class_end]),
+                'specialization': specialization_fields(specialization) if specialization[0] is not None else None,
+                'trainer': {'name': trainer_name, 'last_name': trainer_last_name} if trainer_id is not None else None}
+
+
+catalog = CatalogSerializer()
@@ -0,0 +1,143 @@
+"""
+"Classes near me": classes store latitude, longitude and a geohash. A radius search prefilters in SQL
+with the geohash cells covering the bounding box (index range scans) plus the box itself, then computes
+exact haversine distances for the candidates, vectorized with NumPy when it is installed
+"""
+import os
+import math
+from api.models import db, TrainersClasses
+from api.geo import geocode_address
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 7
+# Numero maximo de celdas por busqueda: se usa la precision mas fina que no pase de este numero
+GEOHASH_MAX_CELLS = 16
+EARTH_RADIUS_KM = 6371.0088
+NEARBY_RADIUS_KM = 10
+NEARBY_MAX_RADIUS_KM = 100
+GEOCODE_CLASSES_BATCH_SIZE = int(os.getenv("GEOCODE_CLASSES_BATCH_SIZE", 100))
+
+
+def geohash_encode(lat, lng, precision=GEOHASH_PRECISION):
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    geohash, bits, bit_count, even = [], 0, 0, True
+    while len(geohash) < precision:
+        value, value_range = (lng, lng_range) if even else (lat, lat_range)
+        middle = (value_range[0] + value_range[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            value_range[0] = middle
+        else:
+            value_range[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(GEOHASH_ALPHABET[bits])
+            bits, bit_count = 0, 0
+    return "".join(geohash)
+
+
+# Alto y ancho (en grados) de una celda de geohash de la precision dada
+def geohash_cell_size(precision):
+    lng_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+
+
+# Cajas que contienen el circulo de radius_km alrededor del punto (limites exactos sobre la esfera).
+# Si la caja cruza el antimeridiano (longitud +-180) se parte en dos: una a cada lado
+def bounding_boxes(lat, lng, radius_km):
+    angular_radius = radius_km / EARTH_RADIUS_KM
+    lat_delta = math.degrees(angular_radius)
+    min_lat, max_lat = max(lat - lat_delta, -90.0), min(lat + lat_delta, 90.0)
+    cos_lat = math.cos(math.radians(lat))
+    if abs(lat) + lat_delta >= 90 or math.sin(angular_radius) >= cos_lat:
+        return [(min_lat, max_lat, -180.0, 180.0)]
+    lng_delta = math.degrees(math.asin(math.sin(angular_radius) / cos_lat))
+    min_lng, max_lng = lng - lng_delta, lng + lng_delta
+    if min_lng < -180:
+        return [(min_lat, max_lat, min_lng + 360, 180.0), (min_lat, max_lat, -180.0, max_lng)]
+    if max_lng > 180:
+        return [(min_lat, max_lat, min_lng, 180.0), (min_lat, max_lat, -180.0, max_lng - 360)]
+    return [(min_lat, max_lat, min_lng, max_lng)]
+
+
+# Celdas de geohash que cubren la caja
+def covering_cells(min_lat, max_lat, min_lng, max_lng):
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        cell_lat, cell_lng = geohash_cell_size(precision)
+        lat_indexes = range(int((min_lat + 90) // cell_lat), int(min((max_lat + 90) // cell_lat, 180 / cell_lat - 1)) + 1)
+        lng_indexes = range(int((min_lng + 180) // cell_lng), int(min((max_lng + 180) // cell_lng, 360 / cell_lng - 1)) + 1)
+        if len(lat_indexes) * len(lng_indexes) <= GEOHASH_MAX_CELLS or precision == 1:
+            return sorted({geohash_encode(-90 + (i + 0.5) * cell_lat, -180 + (j + 0.5) * cell_lng, precision)
+                           for i in lat_indexes for j in lng_indexes})
+
+
+# Siguiente prefijo en orden lexicografico ("u33" -> "u34", "u3z" -> "u4"); None si no hay
+def geohash_successor(prefix):
+    while prefix:
+        position = GEOHASH_ALPHABET.index(prefix[-1])
+        if position < len(GEOHASH_ALPHABET) - 1:
+            return prefix[:-1] + GEOHASH_ALPHABET[position + 1]
+        prefix = prefix[:-1]
+    return None
+
+
+# geohash LIKE 'u33%' escrito como rango para que use el indice en cualquier base de datos
+def geohash_prefix_filter(prefix):
+    upper = geohash_successor(prefix)
+    if upper is None:
+        return TrainersClasses.geohash >= prefix
+    return db.and_(TrainersClasses.geohash >= prefix, TrainersClasses.geohash < upper)
+
+
+def haversine_km(lat, lng, latitudes, longitudes):
+    if np is not None:
+        latitudes, longitudes = np.radians(np.asarray(latitudes, dtype=float)), np.radians(np.asarray(longitudes, dtype=float))
+        lat, lng = math.radians(lat), math.radians(lng)
+        a = np.sin((latitudes - lat) / 2) ** 2 + math.cos(lat) * np.cos(latitudes) * np.sin((longitudes - lng) / 2) ** 2
+        return (2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))).tolist()
+    lat, lng = math.radians(lat), math.radians(lng)
+    distances = []
+    for other_lat, other_lng in zip(latitudes, longitudes):
+        other_lat, other_lng = math.radians(other_lat), math.radians(other_lng)
+        a = math.sin((other_lat - lat) / 2) ** 2 + math.cos(lat) * math.cos(other_lat) * math.sin((other_lng - lng) / 2) ** 2
+        distances.append(2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a)))
+    return distances
+
+
+# Ids de las clases de query a menos de radius_km, ordenadas por distancia: [(id, distancia_km)]
+def classes_within(query, lat, lng, radius_km, limit=None):
+    boxes = [db.and_(db.or_(*[geohash_prefix_filter(cell) for cell in covering_cells(min_lat, max_lat, min_lng, max_lng)]),
+                     TrainersClasses.latitude.between(min_lat, max_lat),
+                     TrainersClasses.longitude.between(min_lng, max_lng))
+             for min_lat, max_lat, min_lng, max_lng in bounding_boxes(lat, lng, radius_km)]
+    candidates = query.with_entities(TrainersClasses.id,
+                                     TrainersClasses.latitude,
+                                     TrainersClasses.longitude).filter(db.or_(*boxes)).all()
+    if not candidates:
+        return []
+    ids, latitudes, longitudes = zip(*candidates)
+    nearby = sorted((distance, id) for id, distance in zip(ids, haversine_km(lat, lng, latitudes, longitudes)) if distance <= radius_km)
+    return [(id, distance) for distance, id in nearby[:limit]]
+
+
+# Columnas de ubicacion de una clase; vacias si la direccion no se puede geocodificar (p.ej. Maps no disponible)
+def class_location(city, postal_code, street_name, street_number):
+    try:
+        location = geocode_address(city, postal_code, street_name, street_number)
+    except Exception as e:
+        print("Error geocoding class address: " + str(e))
+        location = None
+    if not location:
+        return {'latitude': None, 'longitude': None, 'geohash': None}
+    return {'latitude': location['lat'],
+            'longitude': location['lng'],
+            'geohash': geohash_encode(location['lat'], location['lng'])}
@@ -0,0 +1,166 @@
+"""
+Stripe webhook ingestion: the endpoint only stores the raw event (deduplicated by event id) and a
+background consumer, the "process-stripe-events" command, applies the events in order
+"""
+import os
+import json
+from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+from api.models import db, StripeEvents, TrainersClasses, Users, UsersClasses
+from api.cache import invalidate_response_cache
+from api.reservations import confirm_seat, reserve_seat
+
+
+STRIPE_EVENTS_BATCH_SIZE = int(os.getenv("STRIPE_EVENTS_BATCH_SIZE", 100))
+STRIPE_EVENTS_MAX_ATTEMPTS = int(os.getenv("STRIPE_EVENTS_MAX_ATTEMPTS", 5))
+STRIPE_EVENTS_RETRY_BASE_SECONDS = int(os.getenv("STRIPE_EVENTS_RETRY_BASE_SECONDS", 30))
+
+
+# Lo lanza un handler cuando el pago no se puede aplicar del todo (p.ej. sobreventa): los cambios se guardan,
+# pero el evento queda en "Failed" con el motivo en last_error para que lo revise un operador
+class StripeEventReview(Exception):
+    def __init__(self, message, tags=()):
+        Exception.__init__(self, message)
+        self.message = message
+        self.tags = list(tags)
+
+
+# Guarda el evento crudo. Devuelve False si ya estaba guardado (Stripe reintenta los webhooks)
+def store_stripe_event(event, payload):
+    db.session.add(StripeEvents(id=event['id'],
+                                type=event['type'],
+                                payload=payload.decode('utf-8'),
+                                created=event.get('created', 0),
+                                status="Pending",
+                                attempts=0))
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return False
+    return True
+
+
+def update_user_class_status(metadata, stripe_status):
+    if metadata.get('class_id') is None or metadata.get('user') is None:
+        print('No se encontraron las claves "class_id" / "user" en los metadatos')
+        return None
+    user_class = db.session.query(UsersClasses).filter_by(class_id=int(metadata['class_id']), user_id=int(metadata['user'])).first()
+    if not user_class:
+        return None
+    if stripe_status == "Paid":
+        # La plaza retenida en el carrito pasa a ser definitiva
+        if not confirm_seat(user_class):
+            raise StripeEventReview(f"Class {user_class.class_id} oversold: payment of user {user_class.user_id} recorded without a seat",
+                                    ['classes', f'class:{user_class.class_id}'])
+    elif user_class.stripe_status != "Paid":
+        # Un pago fallido anterior que llega tarde no deshace un pago ya confirmado
+        user_class.stripe_status = stripe_status
+    return user_class
+
+
+# Cada handler recibe el objeto del evento y devuelve los tags de la cache de respuestas a invalidar
+def handle_payment_intent_succeeded(payment_intent):
+    user_class = update_user_class_status(payment_intent.get('metadata') or {}, "Paid")
+    return ['classes', f'class:{user_class.class_id}'] if user_class else []
+
+
+def handle_payment_intent_failed(payment_intent):
+    update_user_class_status(payment_intent.get('metadata') or {}, "Reject")
+    return []
+
+
+def handle_checkout_session_completed(checkout_session):
+    # El estado del pago viene en la propia sesion: no hace falta consultar el PaymentIntent a Stripe
+    if checkout_session.get('payment_status') != 'paid':
+        return []
+    metadata = checkout_session.get('metadata') or {}
+    if metadata.get('class_id') is None:
+        print('No se encontró la clave "class_id" en los metadatos')
+        return []
+    if not update_user_class_status(metadata, "Paid"):
+        book_paid_class(metadata)
+    return ['classes', f"class:{int(metadata['class_id'])}"]
+
+
+# Pago sin clase en el carrito (p.ej. carrito ya barrido): se crea la reserva pagada y se toma la plaza
+def book_paid_class(metadata):
+    class_id = int(metadata['class_id'])
+    trainer_class = db.session.get(TrainersClasses, class_id)
+    user = db.session.get(Users, int(metadata['user'])) if metadata.get('user') is not None else None
+    if not trainer_class or not user:
+        raise StripeEventReview(f"Payment for class {metadata['class_id']} of user {metadata.get('user')} has no class or user to book")
+    db.session.add(UsersClasses(amount=trainer_class.price,
+                                stripe_status="Paid",
+                                trainer_status="Pending",
+                                value=0,
+                                user_id=user.id,
+                                class_id=class_id))
+    if not reserve_seat(class_id):
+        raise StripeEventReview(f"Class {class_id} oversold: payment of user {user.id} recorded without a seat",
+                                ['classes', f'class:{class_id}'])
+
+
+STRIPE_EVENT_HANDLERS = {'payment_intent.succeeded': handle_payment_intent_succeeded,
+                         'payment_intent.payment_failed': handle_payment_intent_failed,
+                         'checkout.session.completed': handle_checkout_session_completed,
+                         'checkout.session.async_payment_succeeded': handle_checkout_session_completed}
+
+
+# Aplica el siguiente evento pendiente en su propia transaccion: el cambio y la marca de procesado
+# se guardan juntos, asi un evento nunca se aplica dos veces
+def process_next_stripe_event():
+    stripe_event = db.session.query(StripeEvents).filter(StripeEvents.status == "Pending",
+                                                         StripeEvents.next_attempt_at <= datetime.utcnow()).order_by(StripeEvents.created, StripeEvents.received_at).with_for_update(skip_locked=True).first()
+    if not stripe_event:
+        return None
+    event_id = stripe_event.id
+    try:
+        event = json.loads(stripe_event.payload)
+        handler = STRIPE_EVENT_HANDLERS.get(event['type'])
+        tags = handler(event['data']['object']) if handler else []
+        stripe_event.status = "Processed"
+        stripe_event.attempts += 1
+        stripe_event.processed_at = datetime.utcnow()
+        db.session.commit()
+        if tags:
+            invalidate_response_cache(*tags)
+    except StripeEventReview as e:
+        stripe_event.status = "Failed"
+        stripe_event.attempts += 1
+        stripe_event.last_error = e.message[:255]
+        stripe_event.processed_at = datetime.utcnow()
+        db.session.commit()
+        print(f"Evento {stripe_event.id} pendiente de revision: {e.message}")
+        if e.tags:
+            invalidate_response_cache(*e.tags)
+    except Exception as e:
+        db.session.rollback()
+        # El rollback libera el bloqueo: se vuelve a tomar y el reintento solo se anota si otro worker
+        # no ha aplicado ya el evento
+        stripe_event = db.session.query(StripeEvents).filter(StripeEvents.id == event_id,
+                                                             StripeEvents.status == "Pending").with_for_update().first()
+        if not stripe_event:
+            return db.session.get(StripeEvents, event_id)
+        stripe_event.attempts += 1
+        stripe_event.last_error = str(e)[:255]
+        if stripe_event.attempts >= STRIPE_EVENTS_MAX_ATTEMPTS:
+            stripe_event.status = "Failed"
+        else:
+            stripe_event.next_attempt_at = datetime.utcnow() + timedelta(seconds=STRIPE_EVENTS_RETRY_BASE_SECONDS * 2 ** (stripe_event.attempts - 1))
+        db.session.commit()
+    return stripe_event
+
+
+# Procesa hasta batch_size eventos. Devuelve (procesados, fallidos)
+def process_stripe_events(batch_size=STRIPE_EVENTS_BATCH_SIZE):
+    processed = failed = 0
+    for _ in range(batch_size):
+        stripe_event = process_next_stripe_event()
+        if stripe_event is None:
+            break
+        if stripe_event.status == "Processed":
+            processed += 1
+        else:
+            failed += 1
+    return processed, failed
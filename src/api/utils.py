@@ -1,4 +1,9 @@
-from flask import jsonify, url_for
+from flask import jsonify, url_for, current_app, Response, stream_with_context
+from werkzeug.http import http_date
+from datetime import datetime, timezone
+from itertools import chain
+import hashlib
+import base64
           
 
 class APIException(Exception):
@@ -17,6 +22,79 @@ class APIException(Exception):
         return rv
 
 
+def parse_datetime_param(value, name):
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise APIException(f"Invalid datetime for '{name}', use ISO 8601 format", status_code=400)
+
+
+def parse_number_param(value, name, cast=int):
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        raise APIException(f"Invalid value for '{name}'", status_code=400)
+
+
+# Cursor opaco para paginacion keyset: codifica la clave de orden (start_date, id) de la ultima fila
+def encode_cursor(start_date, id):
+    raw = f"{start_date.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        start_date, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(start_date), int(id)
+    except ValueError:
+        raise APIException("Invalid cursor", status_code=400)
+
+
+# Cabeceras de validacion (ETag fuerte y Last-Modified) calculadas a partir de la version de los datos,
+# p.ej. max(updated_at) y numero de filas, sin necesidad de cargar ni serializar las filas
+def conditional_headers(request, last_modified, *version):
+    etag = hashlib.sha1("|".join(str(part) for part in (request.full_path, last_modified, *version)).encode()).hexdigest()
+    headers = {'ETag': f'"{etag}"', 'Cache-Control': 'no-cache'}
+    if last_modified is not None:
+        last_modified = last_modified.replace(microsecond=0, tzinfo=timezone.utc)
+        headers['Last-Modified'] = http_date(last_modified)
+    if request.if_none_match:
+        # Comparacion debil: el ETag pasa a W/ cuando la respuesta va comprimida
+        not_modified = request.if_none_match.contains_weak(etag)
+    elif request.if_modified_since and last_modified is not None:
+        if_modified_since = request.if_modified_since
+        if if_modified_since.tzinfo is None:
+            if_modified_since = if_modified_since.replace(tzinfo=timezone.utc)
+        not_modified = last_modified <= if_modified_since
+    else:
+        not_modified = False
+    return headers, not_modified
+
+
+# Respuesta {"message": ..., "results": [...]} escrita fila a fila: la memoria no crece con el numero de filas.
+# rows puede ser una consulta con yield_per (cursor de servidor en Postgres)
+def stream_json_results(message, rows, serialize):
+    def generate():
+        dumps = current_app.json.dumps
+        yield '{"message": ' + dumps(message) + ', "results": ['
+        separator = ''
+        for row in rows:
+            yield separator + dumps(serialize(row))
+            separator = ', '
+        yield ']}'
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+# Lee la primera fila sin perderla: devuelve (primera fila o None, iterador con todas las filas).
+# Sirve para responder 404 a una lista vacia sin una consulta aparte antes de transmitirla
+def peek_rows(rows):
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return None, rows
+    return first, chain((first,), rows)
+
+
 def has_no_empty_params(rule):
     defaults = rule.defaults if rule.defaults is not None else ()
     arguments = rule.arguments if rule.arguments is not None else ()
@@ -9,7 +9,12 @@ from api.utils import APIException, generate_sitemap
 from api.routes import api
 from api.admin import setup_admin
 from api.commands import setup_commands
+from api.reservations import start_cart_sweeper
 from api.models import db
+from api.serializers import FastJSONProvider
+from api.compression import compress_response
+from api.assets import StaticManifest, serve_asset
+from api.pool import engine_options
 from flask_jwt_extended import JWTManager
 from flask_bcrypt import Bcrypt
 from flask_mail import Mail
@@ -17,8 +22,12 @@ from flask_mail import Mail
 
 ENV = "development" if os.getenv("FLASK_DEBUG") == "1" else "production"
 static_file_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), '../public/')
+# Manifiesto de los estaticos (en desarrollo se relee en cada peticion para ver los cambios del build)
+static_assets = StaticManifest(static_file_dir, reload=ENV == "development")
 app = Flask(__name__)
 app.url_map.strict_slashes = False
+# Codificacion JSON rapida (orjson si esta instalado)
+app.json = FastJSONProvider(app)
 
 
 # Database condiguration
@@ -28,12 +37,14 @@ if db_url is not None:
 else:
     app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:////tmp/test.db"
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
 # Flask_mail configuration
-app.config['MAIL_SERVER']='sandbox.smtp.mailtrap.io'
-app.config['MAIL_PORT'] = 2525
+# (MAIL_SERVER, MAIL_PORT y MAIL_USE_TLS se pueden cambiar, p.ej. para un servidor SMTP local de pruebas)
+app.config['MAIL_SERVER'] = os.environ.get("MAIL_SERVER", 'sandbox.smtp.mailtrap.io')
+app.config['MAIL_PORT'] = int(os.environ.get("MAIL_PORT", 2525))
 app.config['MAIL_USERNAME'] = os.environ.get("MAIL_USERNAME")
 app.config['MAIL_PASSWORD'] =  os.environ.get("MAIL_PASSWORD")
-app.config['MAIL_USE_TLS'] = True
+app.config['MAIL_USE_TLS'] = os.environ.get("MAIL_USE_TLS", "1") == "1"
 app.config['MAIL_USE_SSL'] = False
 app.config['MAIL_DEFAULT_SENDER'] = "sandbox.smtp.mailtrap.io"
 mail = Mail(app)
@@ -49,6 +60,13 @@ setup_commands(app)  # Add the admin
 app.register_blueprint(api, url_prefix='/api')
 app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY')
 jwt = JWTManager(app)
+# Barrido de carritos abandonados en segundo plano (opcional, en segundos)
+if os.getenv("CART_SWEEPER_INTERVAL"):
+    start_cart_sweeper(app, int(os.getenv("CART_SWEEPER_INTERVAL")))
+
+
+# Compresion gzip/brotli de las respuestas de la API por encima de COMPRESSION_MIN_SIZE
+app.after_request(compress_response)
 
 
 # Handle/serialize errors like a JSON object
@@ -62,17 +80,14 @@ def handle_invalid_usage(error):
 def sitemap():
     if ENV == "development":
         return generate_sitemap(app)
-    return send_from_directory(static_file_dir, 'index.html')
+    return serve_asset(static_assets, 'index.html')
 
 
 # Any other endpoint will try to serve it like a static file
+# (ficheros con hash del build: cache de un año; index.html y el resto se revalidan)
 @app.route('/<path:path>', methods=['GET'])
 def serve_any_other_file(path):
-    if not os.path.isfile(os.path.join(static_file_dir, path)):
-        path = 'index.html'
-    response = send_from_directory(static_file_dir, path)
-    response.cache_control.max_age = 0  # Avoid cache memory
-    return response
+    return serve_asset(static_assets, path)
 
 
 # This only runs if `$ python src/main.py` is executed
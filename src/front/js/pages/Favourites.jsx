@@ -19,7 +19,7 @@ export const Favourites = () => {
     }
 
     const handleCheckout = async (stripeProductId, stripeCustomerId, classId) => {
-        const checkout = await createCheckoutSession(stripeProductId, stripeCustomerId)
+        const checkout = await createCheckoutSession(stripeProductId, stripeCustomerId, classId)
         if (checkout) {
             const updatedFavourites = favourites.filter(id => id !== classId);
             localStorage.setItem('favourites', JSON.stringify(updatedFavourites));
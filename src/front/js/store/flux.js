@@ -626,7 +626,7 @@ const getState = ({ getStore, getActions, setStore }) => {
         window.location.href = `${process.env.FRONT_URL}`
       },
 
-      createCheckoutSession: async (productId, customerId) => {
+      createCheckoutSession: async (productId, customerId, classId) => {
         try {
           const options = {
             method: 'POST',
@@ -636,6 +636,7 @@ const getState = ({ getStore, getActions, setStore }) => {
             },
             body: JSON.stringify({
               product_id: productId,
+              class_id: classId,
               stripe_customer_id: customerId
             }),
           };
@@ -0,0 +1,143 @@
+"""
+Test fixtures: the Flask app on a throwaway SQLite database built by the migrations (the same schema as
+production, including the full-text search tables), a test client, JWT headers per role, a statement
+counter and factories for the rows most tests need
+"""
+import os
+import socket
+import tempfile
+from datetime import datetime, timedelta
+import pytest
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# app.py lee la configuracion al importarse: el entorno se fija antes de importarlo
+TEST_DIR = tempfile.mkdtemp(prefix="sp54-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TEST_DIR, 'test.db')}"
+os.environ.pop("RESPONSE_CACHE_URL", None)
+os.environ.pop("CART_SWEEPER_INTERVAL", None)
+os.environ.setdefault("URL_SAFE_TIMED_SERIALIZER", "test-serializer-key")
+os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-key")
+os.environ.setdefault("BACKEND_URL", "http://backend.test/")
+os.environ.setdefault("FRONT_URL", "http://front.test/")
+os.environ["MAIL_SERVER"] = "127.0.0.1"
+os.environ["MAIL_PORT"] = str(free_port())
+os.environ["MAIL_USE_TLS"] = "0"
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "..", "migrations")
+
+from flask_migrate import upgrade
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from app import app as flask_app
+from api.models import db, Users, Trainers, Administrators, Specializations, TrainersClasses
+from api.cache import specializations_cache, response_cache
+from api.search import search_vocabulary_cache, class_search_values
+
+
+@pytest.fixture(scope="session")
+def app():
+    flask_app.config.update(TESTING=True, JWT_VERIFY_SUB=False)
+    with flask_app.app_context():
+        upgrade(directory=MIGRATIONS_DIR)
+    return flask_app
+
+
+# Cada test empieza con las tablas vacias y las caches limpias
+@pytest.fixture
+def database(app):
+    with app.app_context():
+        yield db
+        db.session.rollback()
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+        db.session.commit()
+        db.session.remove()
+    specializations_cache.clear()
+    response_cache.clear()
+    search_vocabulary_cache.clear()
+
+
+@pytest.fixture
+def client(app, database):
+    return app.test_client()
+
+
+# Cabecera Authorization para un rol ("users", "trainers", "administrators") y un id
+@pytest.fixture
+def auth(app):
+    def headers(role, id):
+        with app.app_context():
+            return {"Authorization": "Bearer " + create_access_token(identity={"role": role, "id": id})}
+    return headers
+
+
+# Sentencias SQL ejecutadas mientras el test lo mira: queries.clear() y len(queries)
+@pytest.fixture
+def queries(database):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(database.engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(database.engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def specialization(database):
+    specialization = Specializations(name="Yoga", description="Clases de yoga para todos los niveles", logo_url="")
+    database.session.add(specialization)
+    database.session.commit()
+    return specialization
+
+
+@pytest.fixture
+def trainer(database):
+    trainer = Trainers(name="Marta", last_name="Garcia", email="marta@test.com", city="Madrid", postal_code=28001,
+                       password="x", gender="Female", bank_iban="ES0000000000000000000000", is_active=True)
+    database.session.add(trainer)
+    database.session.commit()
+    return trainer
+
+
+@pytest.fixture
+def user(database):
+    user = Users(name="Luis", last_name="Lopez", email="luis@test.com", city="Madrid", postal_code=28001,
+                 password="x", gender="Male", stripe_customer_id="cus_test", is_active=True)
+    database.session.add(user)
+    database.session.commit()
+    return user
+
+
+@pytest.fixture
+def administrator(database):
+    administrator = Administrators(name="Admin", email="admin@test.com", password="x", is_active=True)
+    database.session.add(administrator)
+    database.session.commit()
+    return administrator
+
+
+# Crea count clases del entrenador, una cada dos horas a partir de manana
+@pytest.fixture
+def make_classes(database, trainer, specialization):
+    def make(count, capacity=10, **values):
+        start = datetime.utcnow().replace(microsecond=0) + timedelta(days=1)
+        classes = []
+        for index in range(count):
+            fields = dict(class_name=f"Yoga {index}", class_details="Respiracion y movilidad", city="Madrid", postal_code=28001,
+                          street_name="Gran Via", street_number=1, capacity=capacity,
+                          start_date=start + timedelta(hours=2 * index), end_date=start + timedelta(hours=2 * index + 1),
+                          price=1000, training_level="Beginner", training_type=specialization.id, trainer_id=trainer.id,
+                          stripe_product_id=f"prod_{index}", stripe_price_id=f"price_{index}")
+            fields.update(values)
+            fields.update(class_search_values(fields['class_name'], fields['class_details'], specialization.serialize(), trainer))
+            classes.append(TrainersClasses(**fields))
+        database.session.add_all(classes)
+        database.session.commit()
+        return classes
+    return make
@@ -0,0 +1,75 @@
+"""
+Admin lists (/users, /trainers, /administrators) are streamed in chunks: one query per page, empty
+pages detected from the stream itself, and memory that does not grow with the number of rows
+"""
+import json
+import tracemalloc
+import pytest
+from api.models import Users
+
+
+def add_users(database, count, start=0):
+    database.session.execute(Users.__table__.insert(), [dict(name=f"User {index}", last_name="Test", email=f"user{index}@test.com", city="Madrid",
+                                                             postal_code=28001, password="x", gender="Male", is_active=True)
+                                                        for index in range(start, start + count)])
+    database.session.commit()
+
+
+# Pico de memoria (tracemalloc) leyendo la respuesta trozo a trozo, sin guardar el cuerpo
+def streamed_peak(client, url, headers):
+    tracemalloc.start()
+    try:
+        response = client.get(url, headers=headers, buffered=False)
+        size = sum(len(chunk) for chunk in response.response)
+        response.close()
+        return size, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("url, message", [("/api/users", "No users currently registered"),
+                                          ("/api/trainers", "No trainers currently registered"),
+                                          ("/api/administrators", "No administrators currently registered")])
+def test_empty_list_is_a_single_query(client, auth, queries, url, message):
+    response = client.get(url, headers=auth("administrators", 1))
+    assert response.status_code == 404
+    assert response.json['message'] == message
+    assert len([statement for statement in queries if statement.lstrip().upper().startswith("SELECT")]) == 1
+
+
+def test_lists_stream_every_row_with_one_query(client, auth, database, queries, user, trainer, administrator):
+    add_users(database, 30)
+    queries.clear()
+    response = client.get("/api/users", headers=auth("administrators", 1))
+    assert response.status_code == 200
+    assert len(response.json['results']) == 31
+    assert len(queries) == 1
+    for url in ("/api/trainers", "/api/administrators"):
+        response = client.get(url, headers=auth("administrators", 1))
+        assert response.status_code == 200
+        assert len(response.json['results']) == 1
+
+
+def test_pages_past_the_end_are_empty(client, auth, database):
+    add_users(database, 5)
+    response = client.get("/api/users?limit=2&offset=4&fields=id,email", headers=auth("administrators", 1))
+    assert [row['email'] for row in response.json['results']] == ["user4@test.com"]
+    response = client.get("/api/users?limit=2&offset=5", headers=auth("administrators", 1))
+    assert response.status_code == 404
+
+
+def test_streamed_list_memory_does_not_grow_with_rows(client, auth, database):
+    headers = auth("administrators", 1)
+    add_users(database, 2000)
+    # La primera peticion compila y cachea la consulta (y calienta SQLite); se mide la segunda
+    streamed_peak(client, "/api/users", headers)
+    small_size, small_peak = streamed_peak(client, "/api/users", headers)
+    add_users(database, 18000, start=2000)
+    streamed_peak(client, "/api/users", headers)
+    large_size, large_peak = streamed_peak(client, "/api/users", headers)
+    assert large_size > 9 * small_size
+    # Diez veces mas filas: el pico de memoria es el de un bloque de ADMIN_LIST_CHUNK_SIZE filas, no el de la respuesta
+    assert large_peak < 1.5 * small_peak
+    assert large_peak < large_size / 3
+    body = json.loads(b"".join(client.get("/api/users?limit=1", headers=headers).response))
+    assert body['results'][0]['email'] == "user0@test.com"
@@ -0,0 +1,61 @@
+"""
+Static files: in development (reload) the manifest only rereads the files that changed on disk
+"""
+import os
+from api import assets
+from api.assets import StaticManifest
+
+
+def counting_assets(monkeypatch):
+    built = []
+
+    class CountingAsset(assets.StaticAsset):
+        def __init__(self, path, name):
+            built.append(name)
+            super().__init__(path, name)
+    monkeypatch.setattr(assets, "StaticAsset", CountingAsset)
+    return built
+
+
+# Con reload las peticiones repetidas no vuelven a leer ni a hashear el fichero
+def test_reload_reuses_unchanged_files(tmp_path, monkeypatch):
+    for index in range(50):
+        (tmp_path / f"chunk.{index:08x}.js").write_text(f"console.log({index});\n")
+    (tmp_path / "index.html").write_text("<html></html>")
+    built = counting_assets(monkeypatch)
+    manifest = StaticManifest(str(tmp_path), reload=True)
+    assert len(built) == 51
+    for _ in range(10):
+        assert manifest.get("index.html") is manifest.get("index.html")
+    assert len(built) == 51
+
+
+def test_reload_picks_up_changed_new_and_removed_files(tmp_path, monkeypatch):
+    index = tmp_path / "index.html"
+    index.write_text("<html></html>")
+    built = counting_assets(monkeypatch)
+    manifest = StaticManifest(str(tmp_path), reload=True)
+    etag = manifest.get("index.html").etag
+    index.write_text("<html><body></body></html>")
+    assert manifest.get("index.html").etag != etag
+    assert built == ["index.html", "index.html"]
+    # Una variante comprimida nueva tambien cuenta como cambio
+    (tmp_path / "index.html.gz").write_bytes(b"gzip")
+    os.utime(tmp_path / "index.html.gz", (os.path.getmtime(index) + 1,) * 2)
+    assert manifest.get("index.html").encodings == ["gzip"]
+    (tmp_path / "static").mkdir()
+    (tmp_path / "static" / "logo.png").write_bytes(b"png")
+    assert manifest.get("static/logo.png").mimetype == "image/png"
+    os.remove(tmp_path / "static" / "logo.png")
+    assert manifest.get("static/logo.png") is None
+    assert manifest.get("index.html.gz") is None
+    assert manifest.get("../index.html") is None
+
+
+# Sin reload el manifiesto de arranque no mira el disco
+def test_manifest_without_reload_is_fixed_at_startup(tmp_path):
+    (tmp_path / "index.html").write_text("<html></html>")
+    manifest = StaticManifest(str(tmp_path))
+    (tmp_path / "new.js").write_text("1")
+    assert manifest.get("new.js") is None
+    assert manifest.get("index.html").mimetype == "text/html"
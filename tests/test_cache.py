@@ -0,0 +1,51 @@
+"""
+Response cache: tag bookkeeping of the memory backend and which endpoints it caches
+"""
+import time
+from api import cache
+from api.cache import MemoryResponseCache
+
+
+def test_memory_cache_evicted_keys_leave_their_tags():
+    response_cache = MemoryResponseCache(maxsize=2, ttl=60)
+    for index in range(100):
+        response_cache.set(f"/api/search?q={index}", (b"{}", 200, "application/json", {}), ["classes", f"class:{index}"])
+    assert response_cache.get("/api/search?q=99") is not None
+    assert response_cache.get("/api/search?q=0") is None
+    assert response_cache._tags == {"classes": {"/api/search?q=98", "/api/search?q=99"},
+                                    "class:98": {"/api/search?q=98"},
+                                    "class:99": {"/api/search?q=99"}}
+    response_cache.invalidate_tags(["class:99"])
+    assert response_cache.get("/api/search?q=99") is None
+    assert response_cache._tags == {"classes": {"/api/search?q=98"}, "class:98": {"/api/search?q=98"}}
+
+
+def test_memory_cache_expired_keys_leave_their_tags():
+    response_cache = MemoryResponseCache(maxsize=10, ttl=0)
+    response_cache.set("/api/classes?", (b"{}", 200, "application/json", {}), ["classes"])
+    time.sleep(0.01)
+    assert response_cache.get("/api/classes?") is None
+    assert response_cache._tags == {}
+
+
+def test_memory_backend_caches_specializations_but_not_class_listings(client, make_classes):
+    make_classes(2)
+    assert client.get("/api/specializations").headers["X-Cache"] == "MISS"
+    assert client.get("/api/specializations").headers["X-Cache"] == "HIT"
+    for path in ["/api/classes", "/api/classes/1", "/api/search?q=yoga"]:
+        assert client.get(path).status_code == 200
+        assert "X-Cache" not in client.get(path).headers
+
+
+# Con una cache compartida las listas de clases se cachean y una reserva las invalida
+def test_shared_backend_caches_class_listings(client, monkeypatch, make_classes, user, auth):
+    monkeypatch.setattr(cache.response_cache, "shared", True)
+    classes = make_classes(2)
+    class_id = classes[0].id
+    assert client.get("/api/classes").headers["X-Cache"] == "MISS"
+    assert client.get("/api/classes").headers["X-Cache"] == "HIT"
+    response = client.post(f"/api/users/{user.id}/classes", headers=auth("users", user.id), json={"amount": 1, "class_id": class_id})
+    assert response.status_code == 201
+    response = client.get("/api/classes")
+    assert response.headers["X-Cache"] == "MISS"
+    assert response.json["results"][0]["class_details"]["capacity"] == 9
@@ -0,0 +1,68 @@
+"""
+Class catalog: GET /api/classes
+"""
+
+
+def test_classes_catalog_shape(client, make_classes, trainer, specialization):
+    make_classes(3)
+    response = client.get("/api/classes")
+    assert response.status_code == 200
+    results = response.json["results"]
+    assert len(results) == 3
+    assert results[0]["class_details"]["class_name"] == "Yoga 0"
+    assert results[0]["trainer"] == {"name": trainer.name, "last_name": trainer.last_name}
+    assert results[0]["specialization"]["name"] == specialization.name
+
+
+# El catalogo se construye con un numero fijo de sentencias, haya las clases que haya
+def test_classes_query_count_is_constant(client, make_classes, queries):
+    make_classes(5)
+    queries.clear()
+    assert client.get("/api/classes").status_code == 200
+    few = len(queries)
+    make_classes(60)
+    queries.clear()
+    response = client.get("/api/classes?limit=100")
+    assert response.status_code == 200
+    assert len(response.json["results"]) == 65
+    assert len(queries) == few
+    assert len(queries) <= 3
+
+
+# El ETag cambia al renombrar al trainer (su nombre va en el cuerpo) y la busqueda encuentra el nombre nuevo
+# El nombre de un trainer solo se cambia desde /admin (Flask-Admin)
+def test_trainer_rename_changes_etag_and_search(client, database, make_classes, trainer):
+    class_ids = [trainer_class.id for trainer_class in make_classes(2)]
+    trainer_id = trainer.id
+    # El formulario de edicion lleva todos los campos, tambien las clases del trainer (backref)
+    form = {column: getattr(trainer, column) for column in ("email", "city", "postal_code", "password", "gender", "bank_iban")}
+    form['classes'] = class_ids
+    etag = client.get("/api/classes").headers["ETag"]
+    assert client.get("/api/classes", headers={"If-None-Match": etag}).status_code == 304
+
+    response = client.post(f"/admin/trainers/edit/?id={trainer_id}", data=dict(form, name="Lucia", last_name="Sanchez"))
+    assert response.status_code == 302
+    response = client.get("/api/classes", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json["results"][0]["trainer"] == {"name": "Lucia", "last_name": "Sanchez"}
+    response = client.get("/api/search?q=sanchez")
+    assert response.status_code == 200
+    assert len(response.json["results"]) == 2
+
+    # Editar otro campo no reescribe los documentos de busqueda
+    etag = client.get("/api/classes").headers["ETag"]
+    response = client.post(f"/admin/trainers/edit/?id={trainer_id}", data=dict(form, name="Lucia", last_name="Sanchez", city="Sevilla"))
+    assert response.status_code == 302
+    assert client.get("/api/classes", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_trainer_patch_requires_data_and_keeps_name(client, auth, trainer):
+    trainer_id = trainer.id
+    headers = auth("trainers", trainer_id)
+    response = client.patch(f"/api/trainers/{trainer_id}", headers=headers, json={})
+    assert response.status_code == 400
+    assert response.json["message"] == "No data provided for update"
+    response = client.patch(f"/api/trainers/{trainer_id}", headers=headers, json={"name": "Lucia", "city": "Sevilla"})
+    assert response.status_code == 200
+    assert (response.json["trainer_update"]["name"], response.json["trainer_update"]["city"]) == ("Marta", "Sevilla")
\ No newline at end of file
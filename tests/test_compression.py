@@ -0,0 +1,61 @@
+"""
+Response compression: large API responses are sent as brotli or gzip following Accept-Encoding,
+streamed responses are compressed chunk by chunk and static files get precompressed variants
+"""
+import gzip
+import json
+import brotli
+from api.compression import precompress_static, COMPRESSION_MIN_SIZE
+
+
+def test_large_responses_use_the_best_accepted_encoding(client, make_classes):
+    make_classes(20)
+    plain = client.get("/api/classes?limit=20")
+    assert 'Content-Encoding' not in plain.headers
+    assert len(plain.data) > COMPRESSION_MIN_SIZE
+    response = client.get("/api/classes?limit=20", headers={'Accept-Encoding': "gzip, deflate, br"})
+    assert response.headers['Content-Encoding'] == "br"
+    assert response.headers['Vary'] == "Accept-Encoding"
+    assert json.loads(brotli.decompress(response.data)) == plain.json
+    assert len(response.data) < len(plain.data) / 3
+    response = client.get("/api/classes?limit=20", headers={'Accept-Encoding': "br;q=0, gzip"})
+    assert response.headers['Content-Encoding'] == "gzip"
+    assert json.loads(gzip.decompress(response.data)) == plain.json
+
+
+def test_small_responses_are_not_compressed(client):
+    response = client.get("/api/classes", headers={'Accept-Encoding': "br"})
+    assert len(response.data) < COMPRESSION_MIN_SIZE
+    assert 'Content-Encoding' not in response.headers
+
+
+# El ETag de la respuesta comprimida es debil y sigue sirviendo para responder 304
+def test_compressed_etag_is_weak_and_revalidates(client, make_classes):
+    make_classes(20)
+    response = client.get("/api/classes?limit=20", headers={'Accept-Encoding': "br"})
+    etag = response.headers['ETag']
+    assert etag.startswith('W/"')
+    response = client.get("/api/classes?limit=20", headers={'Accept-Encoding': "br", 'If-None-Match': etag})
+    assert response.status_code == 304
+
+
+def test_streamed_responses_are_compressed_chunk_by_chunk(client, auth, database, user, make_classes):
+    from test_exports import add_bookings
+    user_id, class_id = user.id, make_classes(1)[0].id
+    add_bookings(database, 5000, user_id, class_id)
+    plain = client.get("/api/exports/bookings", headers=auth("administrators", 1)).data
+    response = client.get("/api/exports/bookings", headers=dict(auth("administrators", 1), **{'Accept-Encoding': "br"}), buffered=False)
+    assert response.headers['Content-Encoding'] == "br"
+    assert 'Content-Length' not in response.headers
+    assert brotli.decompress(b"".join(response.response)) == plain
+
+
+def test_precompress_static_writes_variants_once(tmp_path):
+    (tmp_path / "bundle.js").write_text("console.log('fitness');\n" * 200)
+    (tmp_path / "tiny.css").write_text("body{}")
+    assert precompress_static(str(tmp_path)) == 2
+    assert brotli.decompress((tmp_path / "bundle.js.br").read_bytes()) == (tmp_path / "bundle.js").read_bytes()
+    assert gzip.decompress((tmp_path / "bundle.js.gz").read_bytes()) == (tmp_path / "bundle.js").read_bytes()
+    assert not (tmp_path / "tiny.css.gz").exists()
+    # Las variantes al dia no se vuelven a escribir
+    assert precompress_static(str(tmp_path)) == 0
@@ -0,0 +1,76 @@
+"""
+Email outbox: signups queue their email in the same transaction and "flask send-emails" delivers them
+to an SMTP server (a local aiosmtpd stand-in)
+"""
+from datetime import datetime
+import pytest
+from aiosmtpd.controller import Controller
+from api.models import EmailOutbox
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.messages = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.startswith("bounce"):
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append((envelope.rcpt_tos, envelope.content.decode()))
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server(app):
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname=app.config["MAIL_SERVER"], port=app.config["MAIL_PORT"])
+    controller.start()
+    yield handler
+    controller.stop()
+
+
+def signup(client, email):
+    return client.post("/api/users", json={"email": email, "password": "secret", "name": "Ana", "last_name": "Perez",
+                                           "city": "Madrid", "postal_code": 28001, "phone_number": "600000000", "gender": "Female"})
+
+
+def test_signup_queues_email_and_worker_delivers_it(app, client, database, smtp_server):
+    for index in range(3):
+        assert signup(client, f"ana{index}@test.com").status_code == 200
+    assert [email.status for email in EmailOutbox.query.order_by(EmailOutbox.id)] == ["Pending"] * 3
+    assert smtp_server.messages == []
+
+    result = app.test_cli_runner().invoke(args=["send-emails", "--batch-size", "2"])
+    assert result.exception is None
+    assert "Emails sent: 2, failed: 0" in result.output
+    assert "Emails sent: 1, failed: 0" in result.output
+    database.session.expire_all()
+    assert [email.status for email in EmailOutbox.query.order_by(EmailOutbox.id)] == ["Sent"] * 3
+    assert sorted(recipients[0] for recipients, content in smtp_server.messages) == ["ana0@test.com", "ana1@test.com", "ana2@test.com"]
+
+
+# Un destinatario rechazado no bloquea el lote: se reintenta mas tarde con backoff
+def test_rejected_recipient_is_retried_later(app, client, database, smtp_server):
+    assert signup(client, "bounce@test.com").status_code == 200
+    assert signup(client, "ok@test.com").status_code == 200
+    result = app.test_cli_runner().invoke(args=["send-emails"])
+    assert "Emails sent: 1, failed: 1" in result.output
+    database.session.expire_all()
+    bounced = EmailOutbox.query.filter_by(recipient="bounce@test.com").one()
+    assert bounced.status == "Pending"
+    assert bounced.attempts == 1
+    assert bounced.next_attempt_at > datetime.utcnow()
+    assert EmailOutbox.query.filter_by(recipient="ok@test.com").one().status == "Sent"
+
+
+# Sin servidor SMTP el registro sigue funcionando y los correos esperan en la cola
+def test_mail_server_down_keeps_emails_pending(app, client, database):
+    assert signup(client, "ana@test.com").status_code == 200
+    result = app.test_cli_runner().invoke(args=["send-emails"])
+    assert "Error connecting to the mail server" in result.output
+    database.session.expire_all()
+    email = EmailOutbox.query.one()
+    assert (email.status, email.attempts) == ("Pending", 0)
@@ -0,0 +1,78 @@
+"""
+Bookings export (endpoint and "flask export-bookings"): one joined query read in chunks, CSV or NDJSON,
+and memory that stays flat however many bookings are exported
+"""
+import csv
+import io
+import json
+import tracemalloc
+from api.models import UsersClasses
+from api.exports import EXPORT_CHUNK_SIZE
+
+
+def add_bookings(database, count, user_id, class_id, stripe_status="Paid"):
+    database.session.execute(UsersClasses.__table__.insert(), [dict(amount=1000, stripe_status=stripe_status, trainer_status="Pending",
+                                                                    user_id=user_id, class_id=class_id) for _ in range(count)])
+    database.session.commit()
+
+
+# Pico de memoria (tracemalloc) leyendo el export trozo a trozo, sin guardar el cuerpo
+def streamed_peak(client, url, headers):
+    tracemalloc.start()
+    try:
+        response = client.get(url, headers=headers, buffered=False)
+        size = sum(len(chunk) for chunk in response.response)
+        response.close()
+        return size, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_csv_export_joins_class_trainer_and_user(client, auth, database, user, make_classes):
+    user_id, class_id = user.id, make_classes(1)[0].id
+    add_bookings(database, 3, user_id, class_id)
+    add_bookings(database, 2, user_id, class_id, stripe_status="Cart")
+    response = client.get("/api/exports/bookings?stripe_status=Paid", headers=auth("administrators", 1))
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert response.headers['Content-Disposition'].startswith('attachment; filename="bookings-')
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert len(rows) == 3
+    assert {(row['stripe_status'], row['class_name'], row['trainer_name'], row['user_email']) for row in rows} == {("Paid", "Yoga 0", "Marta", "luis@test.com")}
+
+
+def test_ndjson_export_and_invalid_parameters(client, auth, database, user, make_classes):
+    user_id, class_id = user.id, make_classes(1)[0].id
+    add_bookings(database, 2, user_id, class_id)
+    response = client.get("/api/exports/bookings?format=ndjson", headers=auth("administrators", 1))
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [line['user_id'] for line in lines] == [user_id, user_id]
+    assert lines[0]['booking_id'] < lines[1]['booking_id']
+    assert client.get("/api/exports/bookings?format=xml", headers=auth("administrators", 1)).status_code == 400
+    assert client.get("/api/exports/bookings?stripe_status=Gone", headers=auth("administrators", 1)).status_code == 400
+    assert client.get("/api/exports/bookings", headers=auth("users", user_id)).status_code == 405
+
+
+def test_export_command_writes_a_file(app, database, user, make_classes, tmp_path):
+    user_id, class_id = user.id, make_classes(1)[0].id
+    add_bookings(database, 25, user_id, class_id)
+    output = tmp_path / "bookings.ndjson"
+    result = app.test_cli_runner().invoke(args=["export-bookings", "--format", "ndjson", "--output", str(output), "--chunk-size", "10"])
+    assert result.exit_code == 0, result.output
+    assert len(output.read_text().splitlines()) == 25
+
+
+def test_export_memory_does_not_grow_with_bookings(client, auth, database, user, make_classes):
+    headers = auth("administrators", 1)
+    user_id, class_id = user.id, make_classes(1)[0].id
+    # Varios bloques de EXPORT_CHUNK_SIZE en las dos medidas
+    add_bookings(database, 2 * EXPORT_CHUNK_SIZE, user_id, class_id)
+    # La primera peticion compila y cachea la consulta; se mide la segunda
+    streamed_peak(client, "/api/exports/bookings", headers)
+    small_size, small_peak = streamed_peak(client, "/api/exports/bookings", headers)
+    add_bookings(database, 10 * EXPORT_CHUNK_SIZE, user_id, class_id)
+    streamed_peak(client, "/api/exports/bookings", headers)
+    large_size, large_peak = streamed_peak(client, "/api/exports/bookings", headers)
+    assert large_size > 5 * small_size
+    # Seis veces mas reservas: el pico es el de un bloque de EXPORT_CHUNK_SIZE filas y no crece con el export
+    assert large_peak < 1.25 * small_peak
@@ -0,0 +1,188 @@
+"""
+External providers against a local fake Stripe server: the circuit breaker opens after repeated
+failures, fails fast while open and closes again once the provider answers; slow providers time out
+"""
+import json
+import time
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import stripe
+from api.integrations import stripe_provider, CircuitBreaker, Provider, ProviderUnavailable
+from api.metrics import LatencyStats
+from api.models import Users, TrainersSpecializations
+
+
+class FakeStripeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def send_json(self, body, status=200):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append(("POST", self.path))
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        if self.server.status >= 500:
+            return self.send_json({"error": {"message": "Stripe is down", "type": "api_error"}}, self.server.status)
+        number = len(self.server.requests)
+        self.send_json({"id": f"price_{number}", "object": "price", "product": f"prod_{number}"})
+
+    def do_DELETE(self):
+        self.server.requests.append(("DELETE", self.path))
+        if self.server.status >= 500:
+            return self.send_json({"error": {"message": "Stripe is down", "type": "api_error"}}, self.server.status)
+        self.send_json({"id": self.path.rsplit("/", 1)[-1], "object": "customer", "deleted": True})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_stripe(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeStripeHandler)
+    server.requests, server.status, server.delay = [], 200, 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(stripe, "api_base", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(stripe, "api_key", "sk_test_fake")
+    monkeypatch.setattr(stripe, "max_network_retries", 0)
+    monkeypatch.setattr(stripe, "default_http_client", stripe.RequestsClient(timeout=0.5))
+    monkeypatch.setattr(stripe_provider, "breaker", CircuitBreaker(failure_threshold=3, reset_seconds=0.3))
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def create_class(client, auth, database, trainer, specialization):
+    database.session.add(TrainersSpecializations(trainer_id=trainer.id, specialization_id=specialization.id, status="Approved", certification="cert-yoga"))
+    database.session.commit()
+    trainer_id, specialization_id = trainer.id, specialization.id
+    start = datetime.utcnow().replace(microsecond=0) + timedelta(days=1)
+    days = iter(range(1000))
+
+    def create():
+        day = start + timedelta(days=next(days))
+        body = {"class_name": "Yoga", "city": "Madrid", "postal_code": 28001, "street_name": "Gran Via", "street_number": 1,
+                "capacity": 5, "price": 1000, "training_type": specialization_id, "training_level": "Beginner",
+                "start_date": day.isoformat(), "end_date": (day + timedelta(hours=1)).isoformat()}
+        return client.post(f"/api/trainers/{trainer_id}/classes", headers=auth("trainers", trainer_id), json=body)
+    return create
+
+
+def test_breaker_opens_fails_fast_and_recovers(fake_stripe, create_class):
+    response = create_class()
+    assert response.status_code == 201
+    assert response.json["class"]["stripe_price_id"] == "price_1"
+
+    fake_stripe.status = 503
+    assert [create_class().status_code for _ in range(3)] == [500, 500, 500]
+    assert stripe_provider.breaker.state == "open"
+    # Con el circuito abierto no se llama a Stripe: 503 inmediato
+    calls = len(fake_stripe.requests)
+    started = time.perf_counter()
+    response = create_class()
+    assert response.status_code == 503
+    assert time.perf_counter() - started < 0.2
+    assert len(fake_stripe.requests) == calls
+
+    # Pasado reset_seconds una llamada de prueba cierra el circuito si Stripe ya responde
+    fake_stripe.status = 200
+    time.sleep(0.35)
+    assert stripe_provider.breaker.state == "half-open"
+    assert create_class().status_code == 201
+    assert stripe_provider.breaker.state == "closed"
+
+
+def test_half_open_trial_failure_reopens(fake_stripe, create_class):
+    fake_stripe.status = 503
+    for _ in range(3):
+        create_class()
+    time.sleep(0.35)
+    assert create_class().status_code == 500
+    assert stripe_provider.breaker.state == "open"
+
+
+def test_slow_provider_times_out_and_counts_as_failure(fake_stripe, create_class):
+    fake_stripe.delay = 1.5
+    started = time.perf_counter()
+    response = create_class()
+    assert response.status_code == 500
+    assert time.perf_counter() - started < 1.2
+    assert stripe_provider.breaker.failures == 1
+
+
+def test_client_errors_do_not_open_the_breaker():
+    provider = Provider("fake", timeout=1, failure_exceptions=(ConnectionError,))
+
+    def invalid_request():
+        raise ValueError("invalid amount")
+    for _ in range(10):
+        with pytest.raises(ValueError):
+            provider.call(invalid_request)
+    assert provider.breaker.state == "closed"
+    assert provider.stats()["operations"]["test_client_errors_do_not_open_the_breaker.<locals>.invalid_request"]["errors"] == 10
+
+
+def test_delete_user_deletes_stripe_customer_after_the_database(client, auth, database, user, fake_stripe):
+    user_id = user.id
+    response = client.delete(f"/api/users/{user_id}", headers=auth("users", user_id))
+    assert response.status_code == 200
+    assert fake_stripe.requests == [("DELETE", "/v1/customers/cus_test")]
+    assert database.session.get(Users, user_id) is None
+
+
+# Si Stripe falla el borrado se deshace: el usuario sigue en la base de datos
+def test_delete_user_rolls_back_when_stripe_fails(client, auth, database, user, fake_stripe):
+    user_id = user.id
+    fake_stripe.status = 503
+    with pytest.raises(stripe.APIError):
+        client.delete(f"/api/users/{user_id}", headers=auth("users", user_id))
+    database.session.expire_all()
+    assert database.session.get(Users, user_id) is not None
+
+
+def test_delete_user_with_breaker_open_answers_503(client, auth, database, user, fake_stripe):
+    user_id = user.id
+    for _ in range(3):
+        stripe_provider.breaker.record_failure()
+    response = client.delete(f"/api/users/{user_id}", headers=auth("users", user_id))
+    assert response.status_code == 503
+    assert fake_stripe.requests == []
+    database.session.expire_all()
+    assert database.session.get(Users, user_id) is not None
+
+
+# Hilos registrando llamadas mientras otros leen las metricas: sin errores y sin perder cuentas
+def test_latency_stats_are_thread_safe():
+    stats = LatencyStats()
+    failures = []
+
+    def record():
+        for index in range(5000):
+            stats.record(index % 100, error=index % 10 == 0)
+            if index % 50 == 0:
+                stats.record_rejected()
+
+    def read():
+        try:
+            for _ in range(500):
+                stats.stats()
+        except Exception as e:
+            failures.append(e)
+    threads = [threading.Thread(target=record) for _ in range(4)] + [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert failures == []
+    result = stats.stats()
+    assert (result['calls'], result['errors'], result['rejected']) == (20000, 2000, 400)
+    assert result['max_ms'] == 99
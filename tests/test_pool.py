@@ -0,0 +1,86 @@
+"""
+Connection pool: engine options from the environment, the status endpoint and the load-test-pool
+command, which counts checkout timeouts and query errors separately
+"""
+import os
+import sys
+import threading
+import subprocess
+import pytest
+from sqlalchemy import create_engine, exc
+from api.pool import engine_options, pool_status, InstrumentedQueuePool, DB_POOL_RECYCLE
+
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+
+
+@pytest.fixture
+def queue_engine(tmp_path):
+    options = engine_options("postgresql://localhost/app", pool_size=1, max_overflow=0)
+    options['pool_timeout'] = 0.1
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", connect_args={'check_same_thread': False}, **options)
+    yield engine, options
+    engine.dispose()
+
+
+def test_sqlite_options_only_recycle_and_pre_ping():
+    assert set(engine_options("sqlite:///app.db")) == {'pool_recycle', 'pool_pre_ping'}
+    options = engine_options("postgresql://localhost/app", pool_size=3, max_overflow=2)
+    assert options['poolclass'] is InstrumentedQueuePool
+    assert (options['pool_size'], options['max_overflow']) == (3, 2)
+
+
+def test_pool_status_reports_options_and_timeouts(queue_engine):
+    engine, options = queue_engine
+    with engine.connect():
+        status = pool_status(engine, options)
+        assert status['checked_out'] == 1
+        # Con la unica conexion en uso el siguiente checkout agota pool_timeout
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+    status = pool_status(engine, options)
+    assert status['class'] == "InstrumentedQueuePool"
+    assert (status['size'], status['max_overflow'], status['recycle'], status['pre_ping']) == (1, 0, DB_POOL_RECYCLE, options['pool_pre_ping'])
+    assert (status['checked_out'], status['timeouts']) == (0, 1)
+    assert (status['checkout_wait']['calls'], status['checkout_wait']['errors']) == (2, 1)
+
+
+def test_pool_endpoint(client, auth):
+    response = client.get("/api/database/pool", headers=auth("administrators", 1))
+    assert response.status_code == 200
+    assert response.json['results']['recycle'] == DB_POOL_RECYCLE
+    assert client.get("/api/database/pool", headers=auth("users", 1)).status_code == 405
+
+
+def test_load_test_pool_counts_errors(app):
+    result = app.test_cli_runner().invoke(args=["load-test-pool", "--pool-sizes", "2", "--threads", "4", "--requests", "20", "--hold-ms", "0"])
+    assert result.exit_code == 0, result.output
+    assert "timeouts 0, errors 0" in result.output
+    result = app.test_cli_runner().invoke(args=["load-test-pool", "--pool-sizes", "2", "--threads", "4", "--requests", "20", "--hold-ms", "0",
+                                                "--query", "SELECT * FROM missing_table"])
+    assert "errors 20" in result.output
+    assert "First error: (sqlite3.OperationalError) no such table: missing_table" in result.output
+
+
+# El pool no depende de las integraciones externas (stripe, cloudinary, googlemaps)
+def test_pool_module_does_not_import_integrations():
+    code = "import sys, api.pool; print(sorted(name for name in ('api.integrations', 'stripe', 'cloudinary', 'googlemaps') if name in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=SRC_DIR))
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_pool_timeouts_are_counted_across_threads(queue_engine):
+    engine, options = queue_engine
+    with engine.connect():
+        def checkout():
+            try:
+                engine.connect()
+            except exc.TimeoutError:
+                pass
+        threads = [threading.Thread(target=checkout) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert pool_status(engine, options)['timeouts'] == 8
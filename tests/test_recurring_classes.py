@@ -0,0 +1,91 @@
+"""
+Recurring classes: POST /api/trainers/<id>/classes/recurring with Stripe stubbed
+"""
+import itertools
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import pytest
+import stripe
+from api.models import TrainersClasses, TrainersSpecializations
+
+
+@pytest.fixture
+def stripe_prices(monkeypatch):
+    created = []
+    ids = itertools.count(1)
+
+    def create_price(**params):
+        created.append(params)
+        number = next(ids)
+        return SimpleNamespace(id=f"price_{number}", product=f"prod_{number}")
+    monkeypatch.setattr(stripe.Price, "create", create_price)
+    return created
+
+
+@pytest.fixture
+def certified_trainer(database, trainer, specialization):
+    database.session.add(TrainersSpecializations(trainer_id=trainer.id, specialization_id=specialization.id, status="Approved", certification="cert-yoga"))
+    database.session.commit()
+    return trainer.id, specialization.id
+
+
+def series(client, auth, trainer_id, specialization_id, start, hours=1, **recurrence):
+    body = {"class_name": "Yoga", "city": "Madrid", "postal_code": 28001, "street_name": "Gran Via", "street_number": 1,
+            "capacity": 5, "price": 1000, "training_type": specialization_id, "training_level": "Beginner",
+            "start_date": start.isoformat(), "end_date": (start + timedelta(hours=hours)).isoformat(), "recurrence": recurrence}
+    return client.post(f"/api/trainers/{trainer_id}/classes/recurring", headers=auth("trainers", trainer_id), json=body)
+
+
+def next_monday():
+    today = datetime.utcnow().replace(hour=9, minute=0, second=0, microsecond=0)
+    return today + timedelta(days=7 - today.weekday())
+
+
+def test_weekly_series_shares_one_stripe_price(client, auth, certified_trainer, stripe_prices):
+    start = next_monday()
+    response = series(client, auth, *certified_trainer, start, frequency="weekly", count=12)
+    assert response.status_code == 201
+    classes = response.json["classes"]
+    assert len(classes) == 12
+    assert len(stripe_prices) == 1
+    assert {trainer_class["stripe_price_id"] for trainer_class in classes} == {"price_1"}
+    assert TrainersClasses.query.count() == 12
+
+
+def test_daily_series_with_interval_and_until(client, auth, certified_trainer, stripe_prices):
+    start = next_monday()
+    response = series(client, auth, *certified_trainer, start, frequency="daily", interval=2, until=(start + timedelta(days=6)).isoformat())
+    assert response.status_code == 201
+    assert len(response.json["classes"]) == 4
+
+
+def test_series_conflicting_with_an_existing_class_is_rejected(client, auth, certified_trainer, stripe_prices):
+    start = next_monday()
+    assert series(client, auth, *certified_trainer, start + timedelta(weeks=2), frequency="weekly", count=1).status_code == 201
+    response = series(client, auth, *certified_trainer, start, frequency="weekly", count=4)
+    assert response.status_code == 400
+    assert response.json["message"] == "Trainer class already exists for this datetime"
+    assert [conflict["start_date"] for conflict in response.json["conflicts"]] == [(start + timedelta(weeks=2)).isoformat()]
+    assert len(stripe_prices) == 1
+    assert TrainersClasses.query.count() == 1
+
+
+# Clases diarias de 30 horas: cada una se pisa con la siguiente. Se rechaza sin llamar a Stripe
+def test_series_overlapping_itself_is_rejected(client, auth, certified_trainer, stripe_prices):
+    start = next_monday()
+    response = series(client, auth, *certified_trainer, start, hours=30, frequency="daily", count=3)
+    assert response.status_code == 400
+    assert response.json["message"] == "Classes of the series overlap each other"
+    assert [len(conflict["conflicting_slots"]) for conflict in response.json["conflicts"]] == [1, 2, 1]
+    assert stripe_prices == []
+    assert TrainersClasses.query.count() == 0
+
+
+@pytest.mark.parametrize("recurrence, message", [({"frequency": "monthly", "count": 2}, "Invalid recurrence frequency"),
+                                                 ({"frequency": "weekly"}, "Recurrence needs count or until"),
+                                                 ({"frequency": "weekly", "count": 200}, "A series can have at most 52 classes")])
+def test_invalid_recurrence(client, auth, certified_trainer, stripe_prices, recurrence, message):
+    response = series(client, auth, *certified_trainer, next_monday(), **recurrence)
+    assert response.status_code == 400
+    assert response.json["message"] == message
+    assert stripe_prices == []
@@ -0,0 +1,145 @@
+"""
+Seat reservations: concurrent bookings never oversell a class, and the seat is held for longer than
+the Stripe checkout session that pays for it
+"""
+import time
+import threading
+from datetime import datetime, timedelta
+import stripe
+from api.models import db, Users, TrainersClasses, UsersClasses
+from api.integrations import stripe_provider
+from api.reservations import (reserve_seat, checkout_session_seconds, CHECKOUT_SESSION_SECONDS, SEAT_HOLD_MINUTES,
+                              STRIPE_CHECKOUT_MIN_SECONDS, STRIPE_CHECKOUT_MAX_SECONDS, CHECKOUT_EXPIRY_MARGIN_SECONDS)
+
+
+# Como los StripeObject de la version fijada en el Pipfile: un dict con acceso por atributo
+class CheckoutSession(dict):
+    __getattr__ = dict.__getitem__
+
+
+def run_concurrently(count, target):
+    barrier = threading.Barrier(count)
+    results = []
+
+    def worker(index):
+        barrier.wait()
+        results.append(target(index))
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def make_users(database, count):
+    users = [Users(name=f"User {index}", last_name="Test", email=f"user{index}@test.com", city="Madrid", postal_code=28001,
+                   password="x", gender="Not Specified", is_active=True) for index in range(count)]
+    database.session.add_all(users)
+    database.session.commit()
+    return [user.id for user in users]
+
+
+# 50 hilos contra 10 plazas con el UPDATE condicionado: exactamente 10 consiguen plaza
+def test_reserve_seat_never_oversells(app, database, make_classes):
+    class_id = make_classes(1, capacity=10)[0].id
+
+    def reserve(index):
+        with app.app_context():
+            # SQLite serializa las escrituras: si la base esta bloqueada se reintenta
+            for _ in range(100):
+                try:
+                    reserved = reserve_seat(class_id)
+                    db.session.commit()
+                    return reserved
+                except Exception:
+                    db.session.rollback()
+                    time.sleep(0.01)
+            raise AssertionError("database stayed locked")
+    results = run_concurrently(50, reserve)
+    assert results.count(True) == 10
+    database.session.expire_all()
+    assert database.session.get(TrainersClasses, class_id).capacity == 0
+
+
+# 30 usuarios anaden a la vez la misma clase (5 plazas) al carrito: nunca hay mas reservas que plazas
+def test_concurrent_cart_bookings_never_oversell(app, database, auth, make_classes):
+    class_id = make_classes(1, capacity=5)[0].id
+    user_ids = make_users(database, 30)
+
+    def book(index):
+        client = app.test_client()
+        for _ in range(100):
+            response = client.post(f"/api/users/{user_ids[index]}/classes", headers=auth("users", user_ids[index]),
+                                   json={"amount": 1, "class_id": class_id})
+            if response.status_code != 500:
+                return response.status_code
+            time.sleep(0.01)
+        raise AssertionError("database stayed locked")
+    results = run_concurrently(30, book)
+    assert results.count(201) == 5
+    assert results.count(409) == 25
+    database.session.expire_all()
+    assert database.session.get(TrainersClasses, class_id).capacity == 0
+    assert UsersClasses.query.filter_by(class_id=class_id).count() == 5
+
+
+def test_checkout_session_seconds_stays_inside_stripe_limits():
+    assert checkout_session_seconds(30) == STRIPE_CHECKOUT_MIN_SECONDS + CHECKOUT_EXPIRY_MARGIN_SECONDS
+    assert checkout_session_seconds(0) == STRIPE_CHECKOUT_MIN_SECONDS + CHECKOUT_EXPIRY_MARGIN_SECONDS
+    assert checkout_session_seconds(60) == 60 * 60
+    assert checkout_session_seconds(48 * 60) == STRIPE_CHECKOUT_MAX_SECONDS - CHECKOUT_EXPIRY_MARGIN_SECONDS
+    assert SEAT_HOLD_MINUTES * 60 > CHECKOUT_SESSION_SECONDS + CHECKOUT_EXPIRY_MARGIN_SECONDS
+
+
+# La sesion de Stripe caduca con margen sobre su minimo de 30 minutos, y la plaza dura mas que la sesion
+def test_checkout_session_expiry_and_seat_hold(client, database, monkeypatch, user, make_classes):
+    class_id = make_classes(1, capacity=5)[0].id
+    database.session.add(UsersClasses(amount=1, stripe_status="Cart", trainer_status="Pending", value=0, user_id=user.id, class_id=class_id))
+    database.session.commit()
+    created = {}
+
+    def create_session(**params):
+        created.update(params)
+        return CheckoutSession(id="cs_test", url="https://checkout.stripe.test/cs_test")
+    monkeypatch.setattr(stripe.checkout.Session, "create", create_session)
+    now, started = int(time.time()), datetime.utcnow()
+    response = client.post("/api/create-checkout-session", json={"stripe_customer_id": user.stripe_customer_id, "class_id": class_id})
+    assert response.status_code == 200
+    assert created["expires_at"] - now >= STRIPE_CHECKOUT_MIN_SECONDS + CHECKOUT_EXPIRY_MARGIN_SECONDS
+    database.session.expire_all()
+    user_class = UsersClasses.query.filter_by(class_id=class_id).one()
+    hold_seconds = (user_class.hold_expires_at - started).total_seconds()
+    assert hold_seconds - (created["expires_at"] - now) >= CHECKOUT_EXPIRY_MARGIN_SECONDS - 5
+    assert database.session.get(TrainersClasses, class_id).capacity == 4
+
+
+# Si Stripe falla al crear la sesion, la plaza tomada para el checkout vuelve a la clase
+def test_failed_checkout_session_releases_the_seat(client, database, monkeypatch, user, make_classes):
+    class_id = make_classes(1, capacity=5)[0].id
+    database.session.add(UsersClasses(amount=1, stripe_status="Cart", trainer_status="Pending", value=0, user_id=user.id, class_id=class_id))
+    database.session.commit()
+
+    def create_session(**params):
+        raise stripe.error.InvalidRequestError("No such price", "line_items")
+    monkeypatch.setattr(stripe.checkout.Session, "create", create_session)
+    response = client.post("/api/create-checkout-session", json={"stripe_customer_id": user.stripe_customer_id, "class_id": class_id})
+    assert response.status_code == 500
+    database.session.expire_all()
+    assert UsersClasses.query.filter_by(class_id=class_id).one().hold_expires_at is None
+    assert database.session.get(TrainersClasses, class_id).capacity == 5
+
+
+# Con el circuito de Stripe abierto (503) la plaza que ya retenia el carrito se conserva con su caducidad
+def test_unavailable_checkout_keeps_the_cart_hold(client, database, monkeypatch, user, make_classes):
+    class_id = make_classes(1, capacity=4)[0].id
+    cart_hold = datetime.utcnow() + timedelta(minutes=10)
+    database.session.add(UsersClasses(amount=1, stripe_status="Cart", trainer_status="Pending", value=0, user_id=user.id,
+                                      class_id=class_id, hold_expires_at=cart_hold))
+    database.session.commit()
+    monkeypatch.setattr(stripe_provider.breaker, "allow", lambda: False)
+    response = client.post("/api/create-checkout-session", json={"stripe_customer_id": user.stripe_customer_id, "class_id": class_id})
+    assert response.status_code == 503
+    database.session.expire_all()
+    assert UsersClasses.query.filter_by(class_id=class_id).one().hold_expires_at == cart_hold
+    assert database.session.get(TrainersClasses, class_id).capacity == 4
@@ -0,0 +1,126 @@
+"""
+Full-text search on SQLite (FTS5): title matches rank above body matches, every term matches as a
+prefix and misspelled terms are corrected to the closest indexed word. A seeded 50k-class benchmark
+checks the latency of each kind of query on the FTS5 and LIKE backends
+"""
+import time
+import random
+import statistics
+from datetime import datetime, timedelta
+from flask_migrate import check
+from conftest import MIGRATIONS_DIR
+from api.models import TrainersClasses
+from api.search import class_search_values, search_backends, search_vocabulary_cache
+
+
+def result_ids(response):
+    return [row['class_details']['id'] for row in response.json['results']]
+
+
+def test_title_matches_rank_above_body_matches(client, make_classes):
+    body_match = make_classes(1, class_name="Estiramientos", class_details="Incluye ejercicios de pilates")[0].id
+    title_match = make_classes(1, class_name="Pilates suelo", class_details="Core y postura")[0].id
+    make_classes(10, class_name="Boxeo", class_details="Cardio")
+    response = client.get("/api/search?q=pilates")
+    assert response.status_code == 200
+    assert result_ids(response) == [title_match, body_match]
+    scores = [row['score'] for row in response.json['results']]
+    assert scores[0] > scores[1] > 0
+
+
+def test_terms_match_as_prefixes(client, make_classes):
+    pilates = make_classes(1, class_name="Pilates suelo", class_details="Core y postura")[0].id
+    make_classes(1, class_name="Boxeo", class_details="Cardio")
+    assert result_ids(client.get("/api/search?q=pila")) == [pilates]
+    # Todos los terminos tienen que aparecer, cada uno como prefijo, sin tildes ni mayusculas
+    assert result_ids(client.get("/api/search?q=SUEL%20post")) == [pilates]
+    assert result_ids(client.get("/api/search?q=p%C3%ADlates%20c%C3%B3re")) == [pilates]
+    response = client.get("/api/search?q=pila%20cardio")
+    assert response.status_code == 404
+    assert response.json['results'] == []
+
+
+def test_misspelled_terms_are_corrected(client, make_classes):
+    pilates = make_classes(1, class_name="Pilates suelo", class_details="Core y postura")[0].id
+    response = client.get("/api/search?q=pilatse%20postrua")
+    assert response.status_code == 200
+    assert response.json['query'] == "pilates postura"
+    assert response.json['corrected_from'] == "pilatse postrua"
+    assert result_ids(response) == [pilates]
+    # Una palabra sin parecido con el vocabulario no se cambia
+    response = client.get("/api/search?q=zzzzqx")
+    assert response.status_code == 404
+    assert 'corrected_from' not in response.json
+
+
+def test_search_index_is_updated_when_a_class_changes(client, database, make_classes):
+    yoga_class = make_classes(1, class_name="Pilates suelo", class_details="Core y postura")[0]
+    class_id = yoga_class.id
+    yoga_class.search_title = "boxeo"
+    database.session.commit()
+    assert client.get("/api/search?q=pilates").status_code == 404
+    assert result_ids(client.get("/api/search?q=boxeo")) == [class_id]
+
+
+# La tabla FTS5, su vocabulario y sus tablas internas no estan en los modelos: autogenerate no debe borrarlas
+def test_autogenerate_ignores_the_search_index(app):
+    with app.app_context():
+        check(directory=MIGRATIONS_DIR)
+
+
+# Benchmark: corpus de 50.000 clases generado con semilla fija; cada tipo de consulta tiene un objetivo de latencia
+SEARCH_CORPUS_SIZE = 50000
+SEARCH_CORPUS_WORDS = ("yoga pilates boxeo crossfit spinning zumba estiramientos movilidad fuerza cardio core postura "
+                       "respiracion meditacion equilibrio resistencia funcional kettlebell trx barre aerobic salsa "
+                       "bachata natacion running hiit tabata gluteos abdominales espalda hombros piernas suelo "
+                       "principiantes avanzado intensivo suave relajacion flexibilidad coordinacion potencia").split()
+# Una palabra que solo aparece en el 0,1% de las clases: obliga a recorrer todo el indice (o toda la tabla con LIKE)
+SEARCH_RARE_WORD = "kangoo"
+SEARCH_QUERIES = {'prefix': "pila", 'typo': "pilatse postrua", 'ranked': "yoga respiracion suave", 'rare': "kang"}
+# Milisegundos (mediana de varias vueltas, con el vocabulario ya en cache) por backend y tipo de consulta.
+# vocabulary es la primera consulta con correccion, que carga el vocabulario
+SEARCH_LATENCY_TARGETS_MS = {'fts5': {'vocabulary': 500, 'prefix': 100, 'typo': 100, 'ranked': 100, 'rare': 50},
+                             'like': {'vocabulary': 1000, 'prefix': 100, 'typo': 100, 'ranked': 100, 'rare': 100}}
+
+
+def seed_search_corpus(database, trainer, specialization, count=SEARCH_CORPUS_SIZE, seed=50):
+    rng = random.Random(seed)
+    start = datetime.utcnow().replace(microsecond=0) + timedelta(days=1)
+    rows = []
+    for index in range(count):
+        class_name = " ".join(rng.sample(SEARCH_CORPUS_WORDS, 2))
+        class_details = " ".join(rng.choices(SEARCH_CORPUS_WORDS, k=8) + ([SEARCH_RARE_WORD] if index % 1000 == 0 else []))
+        rows.append(dict(class_name=class_name, class_details=class_details, city="Madrid", postal_code=28001, street_name="Gran Via",
+                         street_number=1, capacity=10, start_date=start + timedelta(hours=index), end_date=start + timedelta(hours=index, minutes=50),
+                         price=1000, training_level="Beginner", training_type=specialization.id, trainer_id=trainer.id,
+                         **class_search_values(class_name, class_details, specialization.serialize(), trainer)))
+    database.session.execute(TrainersClasses.__table__.insert(), rows)
+    database.session.commit()
+
+
+def median_ms(client, url, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get(url)
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200
+    return statistics.median(timings)
+
+
+def test_search_latency_on_50k_classes(client, database, trainer, specialization):
+    seed_search_corpus(database, trainer, specialization)
+    engine_url = database.engine.url
+    timings = {}
+    try:
+        for backend in SEARCH_LATENCY_TARGETS_MS:
+            search_backends[engine_url] = backend
+            search_vocabulary_cache.clear()
+            timings[backend, 'vocabulary'] = median_ms(client, "/api/search?q=zumab", repeat=1)
+            for kind, text in SEARCH_QUERIES.items():
+                timings[backend, kind] = median_ms(client, f"/api/search?q={text}")
+    finally:
+        search_backends.pop(engine_url, None)
+    print("\n" + "\n".join(f"{backend} {kind}: {ms:.1f} ms" for (backend, kind), ms in timings.items()))
+    for (backend, kind), ms in timings.items():
+        assert ms < SEARCH_LATENCY_TARGETS_MS[backend][kind], f"{backend} {kind} query took {ms:.1f} ms"
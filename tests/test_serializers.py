@@ -0,0 +1,66 @@
+"""
+Row serializers and the JSON provider: same output as Model.serialize() with Flask's default provider,
+with datetimes already formatted as HTTP dates so orjson never calls back into Python
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+from api import serializers
+from api.serializers import (FastJSONProvider, user_fields, trainer_fields, administrator_fields, specialization_fields, class_fields,
+                             user_class_fields, catalog, format_http_date)
+from api.models import TrainersClasses, UsersClasses
+
+
+def test_format_http_date_matches_werkzeug():
+    rng = random.Random(3)
+    for _ in range(1000):
+        value = datetime(1970, 1, 1) + timedelta(seconds=rng.randrange(0, 4 * 10 ** 9))
+        assert format_http_date(value) == http_date(value)
+        aware = value.replace(tzinfo=timezone(timedelta(hours=rng.randrange(-12, 13))))
+        assert format_http_date(aware) == http_date(aware)
+
+
+# Cada RowSerializer tiene las mismas claves, en el mismo orden, y los mismos valores que el serialize() de su modelo
+def test_row_serializers_match_model_serialize(database, user, trainer, administrator, specialization, make_classes):
+    trainer_class = make_classes(1)[0]
+    user_class = UsersClasses(amount=1, stripe_status="Cart", trainer_status="Pending", value=0, user_id=user.id, class_id=trainer_class.id)
+    database.session.add(user_class)
+    database.session.commit()
+    for fields, obj in [(user_fields, user), (trainer_fields, trainer), (administrator_fields, administrator),
+                        (specialization_fields, specialization), (class_fields, trainer_class), (user_class_fields, user_class)]:
+        expected = {key: http_date(value) if isinstance(value, datetime) else value for key, value in obj.serialize().items()}
+        assert list(fields.keys) == list(expected), type(obj).__name__
+        assert fields.from_object(obj) == expected
+
+
+def test_row_serializer_formats_datetimes(database, make_classes):
+    class_id = make_classes(1)[0].id
+    row = database.session.query(*class_fields.columns).filter(TrainersClasses.id == class_id).one()
+    serialized = class_fields(row)
+    assert serialized['start_date'] == http_date(row.start_date)
+    assert not any(isinstance(value, datetime) for value in serialized.values())
+    fields = class_fields.project("end_date,id")
+    row = database.session.query(*fields.columns).filter(TrainersClasses.id == class_id).one()
+    assert fields(row) == {'id': class_id, 'end_date': http_date(row.end_date)}
+
+
+# El catalogo sale igual que con Model.serialize() y el proveedor por defecto, y orjson no llama a default
+def test_fast_provider_matches_flask_default(app, database, make_classes, monkeypatch):
+    make_classes(5)
+    rows = [catalog(row) for row in catalog.query().order_by(TrainersClasses.id)]
+    expected = [trainer_class.serialize() for trainer_class in TrainersClasses.query.order_by(TrainersClasses.id)]
+    fast, default = FastJSONProvider(app), DefaultJSONProvider(app)
+    calls = []
+    monkeypatch.setattr(FastJSONProvider, "default", staticmethod(lambda value: calls.append(value) or DefaultJSONProvider.default(value)))
+    assert fast.loads(fast.dumps([row['class_details'] for row in rows])) == default.loads(default.dumps(expected))
+    if serializers.orjson is not None:
+        assert calls == []
+    # Los datetime que aun llegan (p.ej. de Model.serialize()) siguen saliendo en formato HTTP
+    assert fast.loads(fast.dumps(expected)) == default.loads(default.dumps(expected))
+
+
+def test_classes_endpoint_dates_are_http_dates(client, make_classes):
+    start = make_classes(1)[0].start_date
+    response = client.get("/api/classes")
+    assert response.json['results'][0]['class_details']['start_date'] == http_date(start)
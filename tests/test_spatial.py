@@ -0,0 +1,56 @@
+"""
+Radius search: the SQL prefilter (geohash cells plus bounding box) must keep every class inside the
+radius, also near the poles and across the antimeridian
+"""
+import random
+import pytest
+from api import spatial
+from api.spatial import bounding_boxes, classes_within, geohash_encode, haversine_km
+from api.models import TrainersClasses
+
+
+def place(make_classes, name, lat, lng):
+    return make_classes(1, class_name=name, latitude=lat, longitude=lng, geohash=geohash_encode(lat, lng))[0].id
+
+
+def test_bounding_box_is_split_across_the_antimeridian():
+    assert len(bounding_boxes(40.4, -3.7, 10)) == 1
+    east, west = bounding_boxes(-17.7, 179.95, 20)
+    assert east[2] < 180 and east[3] == 180
+    assert west[2] == -180 and -180 < west[3] < -179.5
+    west, east = bounding_boxes(-17.7, -179.95, 20)
+    assert west[2] > 179.5 and west[3] == 180
+    assert east[2] == -180 and east[3] < -179.5
+    # Cerca del polo la caja cubre todas las longitudes
+    assert bounding_boxes(89.99, 10, 5) == [(pytest.approx(89.945, abs=0.01), 90.0, -180.0, 180.0)]
+
+
+def test_nearby_finds_classes_on_both_sides_of_the_antimeridian(client, make_classes):
+    east = place(make_classes, "Suva", -17.7, 179.99)
+    west = place(make_classes, "Taveuni", -17.7, -179.99)
+    place(make_classes, "Madrid", 40.4, -3.7)
+    for lng in (179.95, -179.95):
+        response = client.get(f"/api/classes/nearby?lat=-17.7&lng={lng}&radius=20")
+        assert response.status_code == 200
+        assert {row['class_details']['id'] for row in response.json['results']} == {east, west}
+        assert all(row['distance_km'] < 10 for row in response.json['results'])
+
+
+# El prefiltro no pierde candidatos: mismo resultado que calcular la distancia a todas las clases
+def test_prefilter_matches_brute_force(database, make_classes):
+    rng = random.Random(7)
+    points = [(rng.uniform(-60, 60), rng.choice([rng.uniform(-180, 180), rng.uniform(179, 180), rng.uniform(-180, -179)])) for _ in range(300)]
+    ids = [place(make_classes, f"Clase {index}", lat, lng) for index, (lat, lng) in enumerate(points)]
+    for lat, lng in points[:40]:
+        for radius in (5, 50, 100):
+            expected = sorted(id for id, distance in zip(ids, haversine_km(lat, lng, *zip(*points))) if distance <= radius)
+            found = classes_within(database.session.query(TrainersClasses), lat, lng, radius)
+            assert sorted(id for id, distance in found) == expected
+
+
+def test_haversine_without_numpy_matches_numpy(monkeypatch):
+    latitudes, longitudes = [40.4, -17.7, 89.9, -33.9], [-3.7, -179.99, 0, 151.2]
+    expected = haversine_km(-17.7, 179.99, latitudes, longitudes)
+    monkeypatch.setattr(spatial, "np", None)
+    assert haversine_km(-17.7, 179.99, latitudes, longitudes) == pytest.approx(expected)
+    assert expected[1] == pytest.approx(2.12, abs=0.01)
@@ -0,0 +1,173 @@
+"""
+Stripe webhooks: recorded event payloads are posted to /api/webhook and applied by
+"flask process-stripe-events", including duplicate deliveries and events that arrive out of order
+"""
+import os
+import json
+from datetime import datetime, timedelta
+from api import stripe_events
+from api.models import StripeEvents, TrainersClasses, UsersClasses
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "stripe")
+
+
+def recorded_event(event_type, class_id, user_id):
+    with open(os.path.join(FIXTURES_DIR, f"{event_type}.json")) as file:
+        event = json.load(file)
+    event["data"]["object"]["metadata"].update(class_id=str(class_id), user=str(user_id))
+    return json.dumps(event).encode()
+
+
+def deliver(client, payload):
+    return client.post("/api/webhook", data=payload, content_type="application/json")
+
+
+def process(app):
+    result = app.test_cli_runner().invoke(args=["process-stripe-events"])
+    assert result.exception is None
+    return result.output
+
+
+# Clase con capacity plazas y un usuario con la clase en el carrito y su plaza retenida
+def cart_booking(database, user, trainer_class):
+    trainer_class.capacity -= 1
+    database.session.add(UsersClasses(amount=1, stripe_status="Cart", trainer_status="Pending", value=0, user_id=user.id,
+                                      class_id=trainer_class.id, hold_expires_at=datetime.utcnow() + timedelta(minutes=35)))
+    database.session.commit()
+    return trainer_class.id, user.id
+
+
+def booking_state(database, class_id, user_id):
+    database.session.expire_all()
+    user_class = UsersClasses.query.filter_by(class_id=class_id, user_id=user_id).one()
+    return user_class.stripe_status, user_class.hold_expires_at, database.session.get(TrainersClasses, class_id).capacity
+
+
+def test_checkout_session_completed_confirms_the_held_seat(app, client, database, user, make_classes):
+    class_id, user_id = cart_booking(database, user, make_classes(1, capacity=5)[0])
+    assert deliver(client, recorded_event("checkout.session.completed", class_id, user_id)).status_code == 200
+    assert booking_state(database, class_id, user_id)[0] == "Cart"
+    assert "Stripe events processed: 1, failed: 0" in process(app)
+    assert booking_state(database, class_id, user_id) == ("Paid", None, 4)
+    assert StripeEvents.query.one().status == "Processed"
+
+
+# Stripe reintenta el mismo evento: se guarda una vez y la plaza se descuenta una sola vez
+def test_duplicate_delivery_is_applied_once(app, client, database, user, make_classes):
+    class_id, user_id = cart_booking(database, user, make_classes(1, capacity=5)[0])
+    payload = recorded_event("checkout.session.completed", class_id, user_id)
+    for _ in range(3):
+        assert deliver(client, payload).status_code == 200
+    process(app)
+    assert deliver(client, payload).status_code == 200
+    process(app)
+    assert StripeEvents.query.count() == 1
+    assert booking_state(database, class_id, user_id) == ("Paid", None, 4)
+
+
+# Pago sin clase en el carrito (carrito ya barrido): se crea la reserva pagada y se toma la plaza
+def test_checkout_without_cart_books_the_class(app, client, database, user, make_classes):
+    class_id, user_id = make_classes(1, capacity=5)[0].id, user.id
+    deliver(client, recorded_event("checkout.session.completed", class_id, user_id))
+    assert "Stripe events processed: 1, failed: 0" in process(app)
+    assert booking_state(database, class_id, user_id) == ("Paid", None, 4)
+
+
+# Sobreventa: el pago se registra, pero el evento queda en "Failed" con el motivo para que lo revise un operador
+def test_oversold_payment_is_flagged_for_review(app, client, database, user, make_classes):
+    trainer_class = make_classes(1, capacity=0)[0]
+    class_id, user_id = trainer_class.id, user.id
+    database.session.add(UsersClasses(amount=1, stripe_status="Cart", trainer_status="Pending", value=0, user_id=user_id, class_id=class_id))
+    database.session.commit()
+    deliver(client, recorded_event("checkout.session.completed", class_id, user_id))
+    assert "Stripe events processed: 0, failed: 1" in process(app)
+    assert booking_state(database, class_id, user_id) == ("Paid", None, 0)
+    stripe_event = StripeEvents.query.one()
+    assert stripe_event.status == "Failed"
+    assert stripe_event.last_error == f"Class {class_id} oversold: payment of user {user_id} recorded without a seat"
+
+
+def test_oversold_payment_without_cart_is_flagged_for_review(app, client, database, user, make_classes):
+    class_id, user_id = make_classes(1, capacity=0)[0].id, user.id
+    deliver(client, recorded_event("checkout.session.completed", class_id, user_id))
+    process(app)
+    assert booking_state(database, class_id, user_id) == ("Paid", None, 0)
+    assert StripeEvents.query.one().status == "Failed"
+
+
+# Un pago fallido anterior que llega despues del pago correcto no deja la reserva rechazada:
+# los eventos se aplican por su fecha de creacion en Stripe, no por orden de llegada
+def test_out_of_order_events_are_applied_by_creation_time(app, client, database, user, make_classes):
+    class_id, user_id = cart_booking(database, user, make_classes(1, capacity=5)[0])
+    deliver(client, recorded_event("checkout.session.completed", class_id, user_id))
+    deliver(client, recorded_event("payment_intent.succeeded", class_id, user_id))
+    deliver(client, recorded_event("payment_intent.payment_failed", class_id, user_id))
+    assert "Stripe events processed: 3, failed: 0" in process(app)
+    assert booking_state(database, class_id, user_id) == ("Paid", None, 4)
+
+
+# El pago fallido llega cuando el correcto ya se habia aplicado en una vuelta anterior del worker
+def test_late_failed_payment_does_not_undo_a_paid_booking(app, client, database, user, make_classes):
+    class_id, user_id = cart_booking(database, user, make_classes(1, capacity=5)[0])
+    deliver(client, recorded_event("checkout.session.completed", class_id, user_id))
+    process(app)
+    deliver(client, recorded_event("payment_intent.payment_failed", class_id, user_id))
+    process(app)
+    assert booking_state(database, class_id, user_id) == ("Paid", None, 4)
+
+
+def test_invalid_payloads_are_rejected(client, database):
+    assert deliver(client, b"not json").status_code == 400
+    assert deliver(client, json.dumps({"object": "event"}).encode()).status_code == 400
+    assert StripeEvents.query.count() == 0
+
+
+# Un handler que falla deja el evento en "Pending" con el error y el siguiente intento aplazado
+def test_failed_handler_schedules_a_retry(app, client, database, monkeypatch, user, make_classes):
+    class_id, user_id = cart_booking(database, user, make_classes(1, capacity=5)[0])
+
+    def failing_handler(checkout_session):
+        raise RuntimeError("database is gone")
+    monkeypatch.setitem(stripe_events.STRIPE_EVENT_HANDLERS, "checkout.session.completed", failing_handler)
+    deliver(client, recorded_event("checkout.session.completed", class_id, user_id))
+    assert "Stripe events processed: 0, failed: 1" in process(app)
+    database.session.expire_all()
+    stripe_event = StripeEvents.query.one()
+    assert (stripe_event.status, stripe_event.attempts, stripe_event.last_error) == ("Pending", 1, "database is gone")
+    assert stripe_event.next_attempt_at > datetime.utcnow()
+
+
+# Tras el rollback otro worker ha aplicado el evento: el reintento no pisa su estado
+def test_failed_handler_does_not_overwrite_an_event_applied_meanwhile(app, client, database, monkeypatch, user, make_classes):
+    class_id, user_id = cart_booking(database, user, make_classes(1, capacity=5)[0])
+
+    def failing_handler(checkout_session):
+        with database.engine.begin() as connection:
+            connection.execute(database.update(StripeEvents).values(status="Processed", attempts=1))
+        raise RuntimeError("lock lost")
+    monkeypatch.setitem(stripe_events.STRIPE_EVENT_HANDLERS, "checkout.session.completed", failing_handler)
+    deliver(client, recorded_event("checkout.session.completed", class_id, user_id))
+    assert "Stripe events processed: 1, failed: 0" in process(app)
+    database.session.expire_all()
+    stripe_event = StripeEvents.query.one()
+    assert (stripe_event.status, stripe_event.attempts, stripe_event.last_error) == ("Processed", 1, None)
+
+
+# Un error que no es del evento (p.ej. la base de datos) no tumba el worker en --loop
+def test_worker_loop_survives_errors(app, database, monkeypatch):
+    from api import commands
+    calls = []
+
+    def flaky_process(batch_size):
+        calls.append(batch_size)
+        if len(calls) == 1:
+            raise RuntimeError("database is gone")
+        if len(calls) == 3:
+            raise SystemExit(0)
+        return 0, 0
+    monkeypatch.setattr(commands, "process_stripe_events", flaky_process)
+    monkeypatch.setattr(commands.time, "sleep", lambda seconds: None)
+    result = app.test_cli_runner().invoke(args=["process-stripe-events", "--loop"])
+    assert len(calls) == 3
+    assert "Error processing Stripe events: database is gone" in result.output
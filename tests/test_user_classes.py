@@ -0,0 +1,49 @@
+"""
+User schedule: GET/POST /api/users/<id>/classes and DELETE /api/users/<id>/classes/<class_id>
+"""
+import time
+from api.models import UsersClasses
+
+
+def book(database, user_id, class_ids, stripe_status="Paid"):
+    database.session.add_all([UsersClasses(amount=1, stripe_status=stripe_status, trainer_status="Pending", value=0,
+                                           user_id=user_id, class_id=class_id) for class_id in class_ids])
+    database.session.commit()
+
+
+# Un usuario con 500 reservas: la agenda se carga con un numero fijo de sentencias y en poco tiempo
+def test_user_schedule_with_500_bookings(client, database, auth, user, make_classes, queries):
+    classes = make_classes(501)
+    user_id = user.id
+    class_ids = [trainer_class.id for trainer_class in classes]
+    book(database, user_id, class_ids[:5])
+    headers = auth("users", user_id)
+    queries.clear()
+    assert client.get(f"/api/users/{user_id}/classes", headers=headers).status_code == 200
+    few = len(queries)
+
+    book(database, user_id, class_ids[5:500])
+    queries.clear()
+    started = time.perf_counter()
+    response = client.get(f"/api/users/{user_id}/classes", headers=headers)
+    elapsed = time.perf_counter() - started
+    assert response.status_code == 200
+    assert len(response.json["results"]) == 500
+    assert len(queries) == few
+    assert elapsed < 1.0
+    first = response.json["results"][0]
+    assert first["user_class"]["class"] == class_ids[0]
+    assert first["trainer_class"]["trainer"] == {"name": "Marta", "last_name": "Garcia"}
+    assert first["trainer_class"]["specialization"]["name"] == "Yoga"
+
+    # Anadir y quitar una clase del carrito tampoco depende del numero de reservas
+    queries.clear()
+    response = client.post(f"/api/users/{user_id}/classes", headers=headers, json={"amount": 1, "class_id": class_ids[500]})
+    assert response.status_code == 201
+    assert len(response.json["user_classes"]) == 501
+    assert len(queries) <= 12
+    queries.clear()
+    response = client.delete(f"/api/users/{user_id}/classes/{class_ids[500]}", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json["classes_available"]) == 500
+    assert len(queries) <= 8
@@ -8,9 +8,12 @@ module.exports = {
     './src/front/js/index.js'
   ],
   output: {
-    filename: 'bundle.js',
+    // Nombres con hash del contenido: el servidor los cachea como inmutables
+    filename: 'bundle.[contenthash:8].js',
     path: path.resolve(__dirname, 'public'),
-    publicPath: '/'
+    publicPath: '/',
+    // public/ es solo salida del build: se vacia antes de cada build para no acumular bundles viejos
+    clean: true
   },
   module: {
     rules: [
@@ -29,7 +32,7 @@ module.exports = {
         {
           test: /\.(png|svg|jpg|gif|jpeg|webp)$/, use: {
             loader: 'file-loader',
-            options: { name: '[name].[ext]' }
+            options: { name: '[name].[contenthash:8].[ext]' }
           }
         }, //for images
         { test: /\.woff($|\?)|\.woff2($|\?)|\.ttf($|\?)|\.eot($|\?)|\.svg($|\?)/, use: ['file-loader'] } //for fonts